@@ -0,0 +1,100 @@
+# Memory footprint of the chat list: one QListWidgetItem holding a Telethon
+# entity per dialog (the old layout) versus DialogListModel over a DialogStore.
+#
+#   python benchmarks/dialog_memory.py [counts...]
+#
+# Each case runs in a fresh interpreter so peak RSS readings do not mix.
+import os
+import sys
+import gc
+import subprocess
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+DEFAULT_COUNTS = (1000, 10000, 50000)
+
+def synthetic_dialogs(count):
+    import datetime
+    from telethon.tl.types import User, Channel, Chat, ChatPhotoEmpty
+    class Dialog:
+        def __init__(self, entity, name, date):
+            self.entity = entity
+            self.name = name
+            self.date = date
+            self.pinned = False
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    dialogs = []
+    for i in range(1, count + 1):
+        if i % 3 == 0:
+            entity = User(id=i, access_hash=i * 7919, first_name=f"User {i}", last_name="Example",
+                          username=f"user{i}", phone="10000000000")
+        elif i % 3 == 1:
+            entity = Channel(id=i, title=f"Channel {i}", photo=ChatPhotoEmpty(), date=None,
+                             access_hash=i * 104729, megagroup=bool(i % 2), username=f"channel{i}")
+        else:
+            entity = Chat(id=i, title=f"Group {i}", photo=ChatPhotoEmpty(), participants_count=i % 200,
+                          date=None, version=1)
+        dialogs.append(Dialog(entity, getattr(entity, "title", None) or entity.first_name,
+                              start - datetime.timedelta(minutes=i)))
+    return dialogs
+
+def peak_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def run_case(layout, count):
+    from PyQt6.QtWidgets import QApplication, QListWidget, QListWidgetItem, QListView
+    from PyQt6.QtCore import Qt
+    import teletrim
+    import teletrim_core
+    app = QApplication(sys.argv[:1])
+    rss_before = peak_rss_kb()
+    tracemalloc.start()
+    dialogs = synthetic_dialogs(count)
+    if layout == "widget":
+        view = QListWidget()
+        for d in dialogs:
+            name, is_saved = teletrim_core.dialog_display_name(d)
+            item = QListWidgetItem(name)
+            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(Qt.CheckState.Unchecked)
+            item.setData(Qt.ItemDataRole.UserRole, d.entity)
+            item.setData(Qt.ItemDataRole.UserRole + 1, is_saved)
+            view.addItem(item)
+    else:
+        model = teletrim.DialogListModel()
+        model.append_records([teletrim_core.dialog_record(d) for d in dialogs])
+        view = QListView()
+        view.setUniformItemSizes(True)
+        view.setModel(model)
+    # Entities stay alive only if the list layout holds on to them.
+    del dialogs
+    gc.collect()
+    python_kb = tracemalloc.get_traced_memory()[0] // 1024
+    tracemalloc.stop()
+    rss_after = peak_rss_kb()
+    rss_kb = rss_after - rss_before if rss_before is not None else -1
+    print(f"{python_kb} {rss_kb}")
+    app.quit()
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--case":
+        run_case(sys.argv[2], int(sys.argv[3]))
+        return
+    counts = [int(arg) for arg in sys.argv[1:]] or DEFAULT_COUNTS
+    print(f"{'dialogs':>8} {'layout':>7} {'retained Python KiB':>20} {'peak RSS KiB':>13}")
+    for count in counts:
+        for layout in ("widget", "model"):
+            out = subprocess.run([sys.executable, __file__, "--case", layout, str(count)],
+                                 capture_output=True, text=True, check=True).stdout.split()
+            python_kb, rss_kb = out[-2], out[-1]
+            print(f"{count:>8} {layout:>7} {python_kb:>20} {rss_kb if rss_kb != '-1' else 'n/a':>13}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Dialog-list load time, preview latency, purge throughput and peak RSS of
+# the real MainWindow against the simulated client in teletrim_fake.
+#
+#   python benchmarks/simulated_client.py [counts...] [--latency S] [--jitter S] [--flood-rate P]
+#
+# Each dialog count runs in a fresh interpreter in an empty working
+# directory (no dialog cache), with Qt's offscreen platform.
+#   load       window shown -> last dialog page in the model
+#   preview    click on a chat -> its messages shown; median over cold
+#              clicks spread through the list, so prefetching cannot help
+#   purge      chats/s leaving PURGE_TARGETS checked chats
+#   peak RSS   of the whole run
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+DEFAULT_COUNTS = (100, 1000, 10000, 50000)
+PREVIEW_CLICKS = 15
+PURGE_TARGETS = 100
+CASE_TIMEOUT = 600
+
+def peak_rss_kb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def run_case(count, latency, jitter, flood_rate):
+    import asyncio
+    import threading
+    sys.path.insert(0, os.path.abspath(SRC))
+    os.environ["TELETRIM_FAKE"] = f"dialogs={count},latency={latency},jitter={jitter},flood_rate={flood_rate}"
+    import teletrim
+    import teletrim_core
+    from PyQt6.QtWidgets import QMessageBox
+
+    timings = {}
+
+    def wait_for(condition):
+        while not condition():
+            app.processEvents()
+            time.sleep(0.001)
+
+    # The end-of-purge summary is modal; answer it without blocking.
+    QMessageBox.exec = lambda self: QMessageBox.StandardButton.Ok
+    shown = []
+    show_messages = teletrim.MainWindow.show_messages
+    def record_shown(self, items):
+        shown.append((self.preview_token, time.perf_counter()))
+        show_messages(self, items)
+    teletrim.MainWindow.show_messages = record_shown
+
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=teletrim.start_event_loop, args=(loop,), daemon=True).start()
+    app = teletrim.create_application(sys.argv[:1], loop)
+    client = teletrim_core.create_client("bench", 0, "")
+    asyncio.run_coroutine_threadsafe(client.connect(), loop).result()
+    pool = teletrim_core.ClientPool()
+    pool.add("bench", client)
+
+    started = time.perf_counter()
+    window = teletrim.MainWindow(pool, loop)
+    window.show()
+    account = window.accounts["bench"]
+    wait_for(lambda: account.dialog_loader is None and len(window.chat_model.store) >= count)
+    timings["load"] = time.perf_counter() - started
+
+    latencies = []
+    view = window.chat_list_view
+    rows = window.chat_model.rowCount()
+    for i in range(min(PREVIEW_CLICKS, rows)):
+        row = (i * 7919) % rows
+        before = len(shown)
+        clicked = time.perf_counter()
+        view.setCurrentIndex(window.chat_model.index(row))
+        wait_for(lambda: len(shown) > before and shown[-1][0] == window.preview_token)
+        latencies.append(shown[-1][1] - clicked)
+    timings["preview"] = statistics.median(latencies)
+
+    store = window.chat_model.store
+    targets = [teletrim_core.PurgeTarget(store.record(row)) for row in range(len(store))
+               if not store.record(row).is_saved][:PURGE_TARGETS]
+    started = time.perf_counter()
+    window.start_purge(targets)
+    wait_for(lambda: window.purge_engine is None)
+    timings["purge"] = len(targets) / (time.perf_counter() - started)
+    print(f"{timings['load']} {timings['preview']} {timings['purge']} {peak_rss_kb() or -1}", flush=True)
+    os._exit(0)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="simulated_client")
+    parser.add_argument("counts", nargs="*", type=int, default=list(DEFAULT_COUNTS))
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds per simulated API call")
+    parser.add_argument("--jitter", type=float, default=0.02, help="extra random seconds per call, at most")
+    parser.add_argument("--flood-rate", type=float, default=0.0, help="chance of a FloodWaitError per call")
+    parser.add_argument("--case", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args(sys.argv[1:])
+    if args.case:
+        run_case(args.counts[0], args.latency, args.jitter, args.flood_rate)
+        return 0
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    print(f"latency {args.latency} s, jitter {args.jitter} s, FloodWait rate {args.flood_rate}")
+    print(f"{'dialogs':>8} {'load s':>8} {'preview ms':>11} {'purge chats/s':>14} {'peak RSS MiB':>13}")
+    for count in args.counts:
+        with tempfile.TemporaryDirectory() as workdir:
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", str(count),
+                                  "--latency", str(args.latency), "--jitter", str(args.jitter),
+                                  "--flood-rate", str(args.flood_rate)],
+                                 cwd=workdir, env=env, capture_output=True, text=True, check=True,
+                                 timeout=CASE_TIMEOUT).stdout.split()
+        load, preview, purge, rss_kb = (float(v) for v in out[-4:])
+        rss = f"{rss_kb / 1024:.0f}" if rss_kb >= 0 else "n/a"
+        print(f"{count:>8} {load:>8.2f} {preview * 1000:>11.0f} {purge:>14.1f} {rss:>13}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+# Time from interpreter start to the first window (the session manager) being
+# painted, and whether importing teletrim pulled in Telethon.
+#
+#   python benchmarks/startup_time.py [runs]
+#
+# Every run is a fresh interpreter in an empty working directory. The child
+# reports its own clock at the first paint; the parent subtracts the time it
+# spawned the process. Exits with status 1 if importing teletrim imported
+# Telethon, so a stray top-level import shows up as a failure.
+import os
+import sys
+import time
+import statistics
+import subprocess
+import tempfile
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+DEFAULT_RUNS = 10
+
+def run_case():
+    import asyncio
+    import threading
+    imports_start = time.time()
+    import teletrim
+    imports_done = time.time()
+    eager = "telethon" in sys.modules
+    from PyQt6.QtCore import QObject, QEvent
+
+    class FirstPaint(QObject):
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                print(f"{imports_start} {imports_done} {time.time()} {int(eager)}", flush=True)
+                app.exit(0)
+            return False
+
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=teletrim.start_event_loop, args=(loop,), daemon=True).start()
+    app = teletrim.create_application(sys.argv[:1], loop)
+    window = teletrim.SessionManager()
+    window.installEventFilter(FirstPaint(window))
+    window.show()
+    app.exec()
+
+def main():
+    if len(sys.argv) == 2 and sys.argv[1] == "--case":
+        run_case()
+        return 0
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SRC))
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    imports, windows, eager = [], [], 0
+    with tempfile.TemporaryDirectory() as workdir:
+        for _ in range(runs):
+            spawned = time.time()
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--case"], cwd=workdir, env=env,
+                                 capture_output=True, text=True, check=True).stdout.split()
+            imports_start, imports_done, painted, telethon_loaded = out[-4:]
+            imports.append((float(imports_done) - float(imports_start)) * 1000)
+            windows.append((float(painted) - spawned) * 1000)
+            eager += int(telethon_loaded)
+    print(f"{'':>22} {'median ms':>10} {'min ms':>8} {'max ms':>8}")
+    for label, values in (("import teletrim", imports), ("time to first window", windows)):
+        print(f"{label:>22} {statistics.median(values):>10.1f} {min(values):>8.1f} {max(values):>8.1f}")
+    if eager:
+        print(f"Importing teletrim pulled in Telethon in {eager} of {runs} runs.")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +0,0 @@
-ICON_DATA = '''AAABAAEAAAAAAAEAIADRdwEAFgAAAIlQTkcNChoKAAAADUlIRFIAAAEAAAABAAgGAAAAXHKoZgAAgABJREFUeNrs/XecptlZ3wl/T7jDkypX5+7pMD3TowmanEdZGgVAMhgQYIOBXduAYXe9LzZmbe86LOxrdo0NNqzfZRFoF1vCgSAJlPPkoOnJMz3Tuau6cnjSHU54/zj3/VT1SBgRpJFAR5/SdFU99YT7Ptd1rvD7/S7Bt9Y3zbrjjrvx3gsdxZGSOjK2GFMq2mWM3VUU+Q6l1Ewc61lgxjk/BUxEkR6TUnWccy3vfUMiY1cQSyl1EsdSKYXz3nnnjFSqsNYWWifD0vp+URRdpfSmEKxLKVeNMcvW2iUhxLJXbtG48iLeX1RabyJk6TUl4L/w8Q+/2pfqW+urXOLVfgPfWl953XTtzZSmFLNTMy3n7Z7SlnuI431CyEPAQTwHrbM7pZRtoGmtbXrv0yhSCsA5D3hU+BbnPN57tNRgJd6DUhIhBFrr6jEOpRQ6iimNYzAYEkcRQgisdRhjsM5aKUQmtBh46QdSip7W0YKU8rSS4vRmt3tKa32+1+vPtcY6c/t27+oPs8z//n/5D6/2Jf3W+grrWw7gG2D9Hz//L3n/+3+HX/rl/3lMRnb3+Nj4gQcffPya//Dv/8u1zvqj3pc7pZazpWNMKiUBrLUIsXX7hBA455AyfB8cwJaRW+vwUDkAgfdu5BykVERRVP29oCwNzntKY/DOIaVEKYX3Hud9eF0J4RnZen7vMaZ0UqpNY8xSoxEtmDI/Ibx/SnqetqU92x7rzO/fdWBzZX2ZD33091/tS/+XfulX+w38ZVyP3P9FpJISn46naXv3008+e/3BgztvWl1dv2bv/pkjeZ7tK42JG42m6PeHGOtRHjzgawMkGJ73fvQFUP1n2/f+0i/hECJ4CU94LmNLXOUQitwADqUViVJY6/He4byrXtMDAlNaSuMQQoycT5zECIQssnwijqOJwbB31HtzdyyVt8YXkYzOl1nx8sXFi08fOHjosRuvv/0JW5bzrTTeMNa6h594+NW+NX/p1rccwNdh3fexz1IODdOXTTacczudczfg5W1Cypu8s1cbW05rpaIiz0Wj0aQ/GPDCCy+SlyUOgZcSB0i5ZWwQHICUEmstxpjqezEySiHYFiUEh+CcAw9CgHUW7wnP4SweVzkCiXMGaw3OOZz3+G2viRB4H14LwDtLpDVFlgEQRQpnS+JEI4TE5IUQnkRrdcQ7d+TAgf1vvfnmm8pTp06t9HubzxhXPCYj+dBdt9/9JePNgrUXh1q3ePDBZ17tW/cXfn3LAXyN1qOPPoYXCOFItRJXKCFuL8v8Hu/drVKq3c67lhJOKC1ZXLxIkRdIqYmjhFOLpzl56jSlsTgBXgi8ABAItk712ui99zjnKmPfcgAQQnPgkp+Fs7+KEqqwHsCUIYy3LjgIYwqsdZVTkaPPJgA8eOfQWuOFxJiSKNJYa0mSiF6vQDqJilWoKyhNmsS8/a33ctVrrhYf+sgfxIPe5m6lxG4v1JuFFH0vmBfIh6NozxccPHjrHXe+aCCT4B994P5X+5b+hVzfcgB/juuRB58AZcGL1Fuu0lrdrSL51nw4vN5Kv0sIIiFCTh5FEu8ESklWV9cYDAYopRFScv7CHBsbm3gSPBKhNF5YvLEg5cjot6+t77fXBdjmFOqUIUQQ1tpwqguBL031Z+FvJRJBqA3Uhr+93gAhavDegfdIAVIH4z942WX8+I//GJ/81Cf5w4//IS53KBTWGF7/1nv4wb/+15ibn2dh/hymGKDiuHp20RZCHBVSHfXef4/w/qLHP6HhE0rqL95z9xufc/hMCcHnv/CZV/tW/4VZ33IAfw7r4QePg3URiCPSRa9D+Hd6/M3AbiW1jHSEcwatgzFZW4KXOG/JsiHG5GilSeIEZx1LS8sIJbEWHCCkwPkt05ZVpa8sy1FxTkpZfYkvM1bvfTB470ONoEojQgSw9Xz1ct7hvQAvR6/pqkhiq7ZQAqB16Ch47wDP7Mw0Bw4c4Kpjx/j05z7DYDgkTmJec+xqvv3bv51nnn2G3/6PH2Tx4hxpEmEBpEIoiVQKqSTGlJEzdr9A7EfwLinEvBA8Krz4A+fE5990z1teNsKXn//8p17tW/9Nv77lAP6U64ufeRDhvUhb6Sye250UfwX8PcBBJZUSIhiSNRYQKKVDTu0tssq/hdCUZUGe5UgpiOMYIRRlUYL3CBHydR/i9ZGRKxkM04pXNnF8Zdy2/q5aIRWo04T6eRwhlbDeoqRC4MOJ76g8j0BW0YZWGueDE0F4cI6yNBS5JY4TjLVIKXnq2Wf5P37xX3LllVcyOTmLc0vgPd/+7d/Gjh07eOJLj3LkyCHW1leYm58HJ1FRFN6vB+9AqRiwoeMghcSx13v2CsS3CSlPOyG/IHC/c/fdb3mwGBZLQuAfevTzr/aW+KZc33IAf8L19KPHEfjYO456+DYv5Xd4eC2Ilve+yq4tzoa83AtRVeYdUkmkqItxHimr/N07hHBEOgIr0DLC2zKcskIhvEZLhXTBQpwNebuSMuTvzoFzOMALh3UOVZ3qzlXheuUclFBQpRLWGVSkKkdh8c4jvEU4SaIaWOsorUVrQVkWoBxSOy6//CBXHLmcfrfPmTPnOD+3iFKSrDAI7XjuxEu87V3v4rIXX+b0yyfZOTtFng3Y7K3Rnmhz1XVXc9Ndd/DL//ZXuTi3gpIpoipm1pGKkjHgEF6A8hhTopRSUskj1rojwHd74Y9Hrej3pZAfvvt1bzkhlSo+/5mPvdpb5JtqfcsBfBXrsYcfZXa8zXp/2Pae2/DiryK5V8B+L9CCrb47o5YbVWgecnAXImQQEmsN1joirfF+q4evlcK5AN6RQuDwiKri5pzDlGV1yG8r9PmtXnwdEMjwJ9XvLaa0W6mCgKI06CRGCoG1Fq0kkVaYogAPzpaUjlCTwGJKx8yOabJiwNhEi5/+6Z9GOkcjbXL6zHn+r1/7Tc6cvUCaNnDeMxgMqkvhiCKFMQXve9+vs2vXLLOzO0ibbQ4cPEKaNkGtU3qPN2X1OUJtwUGV9niUVCAtDod3dQmTFoI7pRS3CiH+lrN8zBTmP911z1secnm3pxpTfPFzf/hqb51v+PUtB/BfWZ/6vY+x59ghsv5wam2Qv9FZ/wMC93rhmXLO4Z1DKLVVUd9WbBNCoFSogNtt+bOUdXGuLqxtVfDr3L0sCqB2DBbrwkkotj1OKTUy+Dqf997jbZWjOwdSoJXCYlESjHNEUcK+Xbs5P3cBncTkZYFUkjzPEc6xc2aGsXaLjbV1jHHcet1NCKm49+33cn7+PI8++hATY5NcnJ8jz0ouv/wKDh08xNlz86OUIcszhsMB1177GoQr2Dk7w6C3yWuOHeMtb30bG90uf/CHn+Cll04hVISQFiFrTIMLHkx6rHdV4dKGLsjoa3unAw3ikFLibzshvkcI+TnVmv4tY+xnXv+md61ubnT50mPfSg/+qPUtB/BHrIcfvg9j1M7N9Y23R0r/dS/Ebda6tncunEhUqLi6sEZA3YGvWmfyywy9dhJSKqBG6FmKIkdrNYLi9vp9siwDpXGIkAZUTyYInYOoypuFMJSlr7ABHqnEKJz2zuGcRUqBswbvLTPTk3z/938fv/J//p8sr62gY82w36fZSLn5xlv4/u/9XpJIsrgwxxNPPMm7vu09jI1N4gV86jOf5E1vfjPWeZKkSZEXfPCDv80DDz4EQiIQSCFJophPfeIT/OTf+du88fV3kvUH4DxlUfJ7v/shHnjoEU6dOUcUpZTOgqzSlBqjUHU6xLYqxna4cg2Gqp2ecw4pFHimhPB/xXv/VinlQ87w/7Tb4x+97U3vWHjo09+KBr7S+pYD2LYeeOAhnPdCSzkrvPw2Kezf8HCrUDIxpaE0BilACYUUcmvzSTWqtNeneG3MdVQQDD9AcKUUVZivUcpue1xVdHMOqRRIgfMV2KaqkHkEzkmMMcGw3VaFPzw/4BxpEnPTTTcSRZper8fjX3qMOFIoJdi9eyeHDx2k29tAakUcN4m05u33vo0jRw6zsjTP9TdcR9pIKcqMKNLcd/+DPPjgQ7z9He/gvi8+wCc+8QnyrGB+fgGPQgBKKjyesig4f/YsX/j851leWuDp40+RDTKEE2RZwSAvUFFMXpaISOPxeOHxApQO8GQ8SB2KnWKbwdfXt7729WOtc1VwIBCCthDizcDdAh6OrPyNu+5+x4eVNUtOSv/F+75VJ6jXtxwA8MjjD9G8IWfwkJx2+Hfh+RHv3W0ekdZAGecdXniQCi+ofuapT3Ihtgp7ddW93qR1BT6KNFRRQV0wDH8bTj+lVPV7MUoLQqcutOtCHBGcS1mWVZSxFQ7LKjLx3pHECVOTk1z1mqs4evQIH/3DvezZuxvhFa1Wize+8Q2cnzvP2sYazjrGJsaZmpygyPPwvq3j5MlTHD3a4Pjx47zvfb9BURjStEEUJXgvaLTa6Gid4bBAyijUL6QgjSPWVlf57d/+IGVRICxoESGFIo6TUPvAo5TA4ZBCgndV7cLhXVUYrS6W8OBxl1yL2vilqmHNYnS96taJ9zIRwt3jnLvFe/eDMtK/rvAfOXz4mpXdu3dz332feLW33qu+5J/9Kb551wOfvY9HHnocN6A9eLj5HoT4LSHErwKv95CGkwkqVEyVd4fAtO7P13l4yMvlyHjrUHXUb4dLQtYAsXVYZ4Oxy62UwHtw1l76ZkWNA2SbY7HUjD8pZTAKB5GO6Pf6fPhDH+blEy+ye9cOvve9380b3vA6Oq0mg26XN7zuHt75jrcHI7SGVrOJEoLPffYzDHoDfvd3PsTv/c6HMcazuLjK6uoG3gt6vT7XXnstP/Kj/w2HjxxlmBUkSSOkJN5jrUEAsdZY41AyAjRKJSgVkw2LAA+2OVKBlgJblKEzYSuwk3NI5xFVd0N6UF6gAOVAuMCNiKUilhpFiJzqtZ0bUa1UCvF6KcSvCil/68CBA+/RWrfvuede3vjGd73a2/BVXX9pI4BHHnoYJNqZ8g6U+DHgncB4fZqOjLb6Cgw4WYXpsgr5t8A5deV/W2EeqB2DwLkQrnts/YyAw1mH9yF8DXm7HwF7tq+t8HbrKziX8JpSyhAlePDOo5Xi8iMHefvb70UAzz/3LB/+8O9z+uUzfP/3/iBewJEjR3jPu99DHGt63U2stXz4Q7/Pb/eHZMOCvDBEuoExHq0ipJa8733v47WvvY6XT57iyaefRWpNaaoWopBorTAmw5QWqRVUP8NL8ryk0Uy5467bWFy9yO133UYcNXj+uRM88OADoXvg/SWfx3sfagHOBz8sQmETfEAqEq63rQkO9fWSMkQW1N0Sh5SyCf5e7/3tCP5AR+pXO53WA/e+/d3mYx/9vVd7S74q6y9dBPDIfY/w2H2PCW+4wpX+573ng3j/fd658VBMEgFoU+Xj0guEY4TBZ/vB4rf+Y6tcHO+JlEKJGkVXn0ZhI0sEwsvQy7cORwh3S2dDSqBERdKp2ntUJ7+/lPpbI/5CNBBSCakkKlJIGSKJJE25eHGBYZ7z7DPP8fCDj7C+tsmDDzzMMMs5efIk3/M9382B/fuZuzAHCK44dhW333k3O/fuIU4bfOJTn+bJp54BKfFeMMxyZnfMsmPHjlCQFArnLN5bnC3xriTWkgP7d6PwSKDMC5xzjI9P8I53vJ0bb7iBi3MXuOrKK7jzjlv5q9/5HXSaCd4W4EOx0nuH9RbrAxnJuvAlpEJJjUDhHFgL3omRs6idoEQEQLML15wKrVhFB+N4vk8K9cFsUPy8ze0Vb77lzeIt97zj1d6eX/f1lyYCePT+R3n/P30/Wutxj3+vsPInwV8lQIpqg4SCUzjdvQmG7PFoJNZ6nK2gry602wQCVEDUOeeIpALrsGUwZu8lUkm8tygRMPZKqKqeQFVTACscCI8THodHRxpfhfzSS4RQFQPPbEsrtqrgNbrPA2UVTaAkzz7/Ij/3v/0C//gf/U8cPHiUOG6jVcLKZp+xiSmee+55lpYXWV5Z4sy5c1xcWuHu172Jhx59iKldM9zxunt4//s/UHEWQt7+jne+i3e8652cO3Oep598luXlZa44coRrr76asU6LpeV59u3dwXWvvZpf+7/fx+OPH2d2Zg+vu/uNNJot3vSmN/E7v/ufWFtZ5eK5c+yenUbJEiFKpAwh1eT0NGvrmxjncB6c1EgdTnQrJMY6cOEza61BOZzNcd4RaUXdSRQECHMURVjvqzTBY2wgUeH8buvM3wXeQbvxyx7xAfnGn9p4Paf5zGf+cmgVqFf7DXw91hOPPoGQIrrxTTfeCeJfCCF+wnu/BwLSNPTrZUVw2cofQyuKbSAaOSq8OedDsYpQiIqUJlJqFFKF0wp01a5zVVFQ+FBA9IBQEuMsj3/pcXqbXd7w+tfT7rR4+pmnOHf+PAhJ1RSnJhFdAgKCbQVAGVCHVcjrbEAWmtLgnefOO+9iYmKSgwcP8/TTz9DtbbK4eJFnnnmKpaVFiqLg4Yce5otfvI9nnnmGI0cO8653fjsPP/Qw/X6fSCuUlGilOHz4IPffdx+PP/Y47XaHH/uxv8WNN1zPsWNXcP3113LF0cO020088NDDj/Dd3/09vP2d7wQku3bv5PjxL6G04J7X3cX05ATDwYDPfOYzJEnCd3zHu3nTm9/C8eNPUhamuuaBlCSFrIw4FPuUVKRpilQKISGOYxppipY6OAYfojklVTj9Ra2pEABHCAlCCCHkDoR4s/Ncu5+NC3EjmT946Jg7dfK5V3vrfs3XX2gHcPzRx/hrP/AjeO92SSH/Oynl/+Y9t3rvo+0tpa1C3aUGVofu9WPAU5YBsTb6eylGeb63rgK0U+PY0VGEx+OsrfrkghowHAg/ji996UtkvQH33HMPjWbCE8ef4OzZs4SNLhCiMgBZp7mXpgPbqb5CagQi1AG0Jk0b9Hpd9u7dxxVHr+SBBx7i1KlT5EXGj/43P8zRo5fznve8G601Tz39NFEUEynJnt27ee11r+Wh+x9idWUVJSXWlCwtLvDgAw8wMTHO299+L88+9wwXzp/n6aeeotVusWf3Lk6ceJ60kdIfDhgMM979nu/koQcfYW7uItdedx1Hjh7mDW+8hx07Z/DG0G61ufnmW3jd697A1a+5hk998tM8//wLoe4gJX70eYMFKymJ4zjk/lWxVEiq+kMoqmqtKUtDpKNRncArWYExJagtbEVIzkSEEMekUvdaZxoO9+Le3Yd61956Kyeee+rV3spfs/UX1gE88sVHcBYdRfoNzrlfklL8gBBisq7Aw6XGU0cAdctui1kXAD11j98YO+oGSCmxNRYAcMYhqiJeyCdkYPI5O4okRhj9ygmU1nD8+HE21ze58647ieKIJ554gnPnz40iAEFwABUE9stUgOrPgpBIGU4+ISTOhfrAcDjk+BNPct9993P+/HlKUyIkjI21KIqcO+64Ha0VeVbwnd/5XXzHd3w7+TBjYnyczY1N8ixj0O8F2q8QmKLku/7qd3L9ja/li1/8Ir1eDyUVB/bvY2yszf/xC7/Azp2zXH3tNVz72utptTq87zd+kxdPvMT45BhlmTM3f57OWItmo0GZFbRaHdK0ydNPPc0f/MEf0u8NUDVUuooAAo2iul9SI6uoyFiDJ3RFakwFHkxZkiaBZ6CkwkkZIjMhR8/ra80EEdiIzrkx4C4h5G061ueKfnbu0KFj7vTpF17tLf01WX/hagBfeOjzNIoOVpgZvP8J6dzf9t7vCj36LYOpgTpbJ+pWNLB91VFCqMoHAc0Rsm/0oAoDsE2hx9qgkjOKJqr0gXoTV39aV8/rqr/3DlOdalIIXIX+G4EARjp8W92GWpknwIor0EyVokgR8ArD4ZBhBbWNIkW3u8nv/u7v8prXHOMNb7yHK644ypVXHiOOUy7OzXP2zFn27d3Hj/7oD3P69Gn+zb/5t8zNzWOMQ6cRg8EAHSlmZ6d58IGHWF5c5B3vvJc0TSjKkkF/SJwkzLY7fO5z93FxYZ5eb8gv/fIvoSPBFVccYufuH2J6bAJjHP3NdZ574QQf+O3fZml5hThpjNIZ6xxUKMO6VmNtYDDGcYw0kswMqmsqgi6i9zSbTbTWWGOQkUJrRW8wGEUNNWZCiBrFOaJGx0KKNwDH4jT6P4WQ//beN/6V5XzXOJ/9D7/xam/xP9f1F8oBPPzgQ3hhpZfmDiXlP/Devw2ItNbb8ntXGYyseul+m+gloxwfamBPHSlsbRAxykN9dRpJpBcVW8+PAD2wFWUEIIsfVaOpga4VMAgPjTTFGENZFq9oRfrAiqOGEtecg7oAGF7MulACD/DfKtQNqJnwGA+gyMscHQlarSZvecub6HTaCCEpC8MnPvEhPvvpz3L+7DnuuvsuvHA02yn3vO4u/v2//w/s23cZ115zHZub6ygF4+MdtJZEcSATGWOx1vD0M89w9OoreerZZ/md//IhNjY3abU6WGuZmZ3ih374h5iemWa9u8lwkPH/+7Vf4/kXTpAVJVHawAYNtFEL1ruta1GvGhDlfUh3vHMYU1aplhoxL7WOsNbgnaXdTCmLktKUoThYQaZ1pCmNAbElgOq93yUc/5O15S1JI/n5dGXwwNvv/R730Y/99qu91f/c1l8IB/DEQ09QqhLpZds59V4v3M8IwRFZGa1SspLQ2goTt/faR8g877m0x+6r/JuRA6mVc2u2n5AVvx4qBJtHS4nQmrIC9YwEOvwWFdgLX+X3YoQKlEoB7pL2YuiDAzLEDVvhP9tagXVNQgbRT0Lf0teVbxVqGZ1Om5tuuonV1VVOnznJnXfdFozcW9bW1vmN3/hNHrj/oVB8k4rF1SXOz5/jQx/6ED/0g3+D8/NzvPENb2F9bZP5hXNoLZiYHOMtb30LE51xxsbHUEoSUHb30Sv6rHc3cc4yNt4JbbvScONNN6KU4KWXTnDl5VcxyHNePnWaQVGgdERhbQWBFqO0yXlbOdLgAqSorrcLyZSSCuv9NkcRINpaa/Isq6K9gI9IGhJjQlphJQyHBSYL4ip4hVbB4afNFCAaDobvkohjWqv/baw99oEf+J6/2TPG8MH/8uuv9tb/M69vegfw4Ke/QInFZ3av0/xDpPxBIWXTVxI6X0k+C7aUbWR1Sr5STXfbI0eKN35bzC/EtpPIB6AKzlV56hYduFbKCYq8oXItRHAiUqnQ/6+M3FlLo5USRdElmAOPr1KFrRNfSkVZFqPaRM35L01BpDXOGIQM7TtnLUePXsEP/uBfY8/uvehIc+KlF7n//i/wn//Tf+K222+l1WoxPzdHUeSkjRbOe06dPcMdd93OIB/w0umX+Dv//U/S28z4+P/16ywtnufu193Kt33bu8izkg/8+w/w0okTHDp4Ge12m+/7/u/nljtvIUoTLs4v0+tmHD/+FJ/97GeRQvDrv/7rNFsJlx04zHqvixUCGUXkxqKjJBCaQrcPBZcg/UaahHULVAS9Au8dcRSP6gNFWTDq8kiBViBlqO804gSpFMYYEi0rsRaBJyKKYrQKUulSSSKhQHBEa/2v0yS5qdGI/vny8tqFn/+nv8A/+Mc//WqbwJ9pfVM7gKcffoJYaznI87uNEP/YOf+GwJRVI4htFOnREIwokqPTu+oDB4WeSmWnzuWpmGjO+cBJ366HL0Ro49WtPBlOG2NtRVoJCrsOQjju685AVWsWgZMvlEREisJVLDjqGkOE1hECOQp2a65BkOnyFSc+vG9nLc4aJCGqiXVoR1o8WlXcelNy1bHLufo1V3LypZdpt8c4evgQH//oR/jDj3wYPPyV7/orXHbwAC++9CIIj1Ix3W6fmR07uezgYd73vvfzIz8S88wzz3P/A/fRSBQf/K0P8sM//N/yxJee5OGHH+XZ5nNcnJ/njtvv5I47bsMJg8UzdcU01sKVR4+yf+9u8nzIoNdjeWmB9Y0N5hYu0suHGOcQkcZWACJBmGOg0LgaQSl8EEr1bis1EwJHYEE6wFtLpASNNCWSmuFggEpiJiYnaMTRqJiZJCnGlORFjpCC/jCnzEPNQWtNs9kiiiLKhiHSGutd0zn33463x47OTs7807ULy1/8R//D/+L+2S/+L6+2Kfyp1zetA/jS/Y9gMheXMnuvh38K6rK6xuYrFZw6jK8rw1rXeb9BVO2kOld31uFrmWtfS2H7beW6LUiwMaGqL5SsSCtBvkspgZIVghCBk+H0VkgQYVP7AF3DWY9UEmcMzjq0inAu1CbqPreoNvWIKVh/pgqgrKWg1WlxxdGj7Nq1k+WlJSanprjmmmv56B9+jCeffJJms8Ett93OPXffSTbs8sUvfIa777oHLadYvriEFjGPP3qcd7zjnezctYvx8Q6HDl3B2XMXWbi4zNLCGu3mJAsXV/hXv/jL5EWONSXGeR67/0so9/8wLEriqMnK6ganz5zj+7/v+8iHOTqSOFvy2JOPs3vPXvbs28M7730zjz/+OP1rX8vC4hJpo83JM2cpjCFKUmzVqNdag/EoIUlkg7wssMLiMVXvSiBRAaDkBVJECCmIopgkioikIo0SmklK1mhgS4NwklgmTLTbFNmQiVaHJI1Z21wlShOsE2RdQ1EajLVEcYROYhwutGxD7UYpId/srbt8dueOfzzWbn/gV37hV4sf/+kfe7VN4k+1vukcwJcee4qy38dJNSsjfsoZ/xMeP4kUeBdUdIwtiapWnasryFWLbzvEluoUryx7FKZDlTqIkEaEk9ZVen4SpbcQ1EoH6C02SHbpqu7gRqc+VWGumtSzrcDoq24BeKI4HgF4Rsw/cWlnYpQCiJC2jHXG+JEf+RvccP31aKUpyhwdhdx2cXGRp55+iptvuYXv+d7v5syZk+zesxupY9pjk5w8fY6l1Q3S5hhra5s8/PBjvP1t7+TKo1eytrbBb/zmv2fh4kU+8fGPc/LkSQSwubHOjh072L93LwvnLnDF4cO8+z3fwdTMLB/6yEf44Ac/wOHDB0nSGFdmdDf7/O7v/Q7PPf8CP/DXf5Bde3ZVswcEq8vrvPs7vhMpIs6fm0PrpDJkGYzahRw/khItFQWglUSqGKkEURQhvCSNGkihUCYgMiOliXRErDRjnQ5pnKCkZKzdxhY5wnviJGasmZLGEePjHeJI0Gg3sMbjxyUbm10snkarjXGWjV6P3BriCleRpg3yfHiZseZfyUgebaaNX/rgr39waWV5hR//ez/+apvIn2h9UzmAz3z6ixhbkMNB1+//nDf2u521Gu+JkwR0UJf1zuErkUohBEURKr51IU9KidqmsY8QgdlXh/UVLsDZrRZggAkzQgMG/XxbGWuFybeW0gc+gBchxxdKYsoSZ0zgByhdEwtGp7kQkjiK0FEUtAK0qtiBshrAIauCoNuqRzhHaR3Ly6t8/vNf4NbbbqPTabKwNMfkxBSTU+PMzM7wtnvvZWVlld/9vQ9x5VVX8c5vfw8X5hb48Ec/SVZ4dNxgbHyGT3/qC0yMTxJFMU8ef5rNjXWEVPz+7/0ezjl2zM4yNjbGd37Xd7J71y7+39/4Db7/e9/L4csvJytK9u3fS6vdpNVpIpWnyArOz50jSjQ/9hM/xqHDRxkOczxw8uRZnn76BW6++U4+9onPceL5l0nTJsZZpA7DRFwZeBlpnBJJSZpqojTGEuDCWmkkkkaUAgLpwj2sEZm6ahE2Gg0iHdFpt2g3YpQUCGNQzjE23mFmagItHO2xNpFSFIOCdiKRUUzhPP0sJ8sVcRpX4qWh/lO91mSURD+z2eseyZYXflYIf/pf/dwv8t//7P/wapvKV72+aYBA/+bf/AZx/Dmef6G4bjgc/Ou5uQvf8fzzz6lz586xsLhId9AnN2XA5dsQlvtqnJWUalTxH52mEApJVP17pSpaXag8R7rKFStBD1kTcKhSBGvxtiLwiOAc6i/vqqp+hVUfaQb6kFKEqEDgKxDLl544ji0cd99zN1GsOX78OKdPn67xgoELQMhNhQz8Aiklg/4ApRXdXpddu3bT7jT5zff/Gq12m4OHDvOaq6/m8suP8uvvex/PPfc8Z86e4/kXT/AHH/8kL5x4GZAUhaHX7bG6ssojjzzCow89TCNNecMb3oA1BQsX5xF4rrv2at7z7u/g6tdchbMGWxQcO3YFKtKsb6xz/wP3s7i8yHd+53uYnpmgu7nOjtkZbrr1ZhqNJlEcTvhHHnmM3/2dD9HtZ7zw4sucqZSBGs0maaMZiD5e0EybJFFMI05oNdNQlIs1OtKkjQatRotm2qDdbKOlQmlJq9mk3WyRxAmtRpM4ilBS0UhT0jRhcmKc2ekpkjgKyExv6bRbTE9O0m6kNJIEWwyJtWRqagJwFGWJEII0TYMuY6WslESaONJEcSSLorjaWvOajc3NJ3/mn/7swkvHT/DU898c6MFvigjgzW9+F//u3/2KPHLk0Ft37Mx/TgpuXF5corexSaQ0aZoyMTVJs9NmZscs450O4+0OzWaTZrPF2NhY1cpTozagA6LqlBVSoFVVfKraZ0VZ4k1ZSQHU9F87EuysDd9XHQBRg8zZYuvJWtij1uyHEZUY6op+oLTqSKO3IQyrsd3UeAOPQFdpghCVWKb3nDx5CqUUb3vbvUitWN/YYJhlzMzOsmv3Ps6cPsvq6hpSKY4fP05uDCpOabU6uNICKswXkKBlxB233869b38re/ft5vX33MnKygqf/OQn+cIXvsBNN1yPOnYFzTTh5ltuJooj8rLg45/4BB/7xMeZnJxk9949RHHEiZdPcPjwYRqdNtZ5LszN88ADj/DFLzwIQjM+Po2UionxVoDtVoXTNApRVxLFREozMTZGmQ8ZDAeoKMIiEEqTRAmKID8mU0HhypGDrYVWvHOkrZThcAh4BoOIdrPB2MQEzTRhvNJGKLOMmakpvDVMjHVACApjmRwfY8fOnZy5MM/S6jrSOVItMc6gpcKUBa10Gu+s9N7d22l3Zn/1X/7Kz7792971ide98fXub/13f+vVNp0/dn3DO4Db73w93cGGHhvrvHd5eeXnF5cW9jnvkN4jXCjkbXQ3WVheAiURWgV8edrAe9i9exd79+7j4MHL2L//AGmaADFS6qBlrxT4MGTDeldBdKs+uw89dSFUdXJ7vLcVKMhVUJ4qT7cOYQMTr6af1hp5xtlK0ENWzmNLZ6Du3ydJIA0ZY0aUZO+2tx5Dp1FWyMUg+ilZ39ykmTZottoUhcFYz8WFBYSUzM3P8x8+8AHOXzgPwhMlEVES8ZrXXMP1r70eLSM+/7nPc/78OZJI8d73fhdve+ubEQI2NtaZGO+wY3aadrPB2uoKDz34ANe/9lra7Q6ddhulI5548ik+/vFP4r1ganomiJl4wRPHn+b3fv8jvPa667l4cZGV1XXKMigqpa0mSkZhFJqOabdaWG/JTUHaSMPGlJI3v+GNzExP8dnPfIqV1RUcksJ64qSBlhE4TyOOUUIiC2g0A7RZIIjjqNJurK6d86ytruNKy/hYO7QMk4Tm+ATDjQ1OnzsPzrB7xzSdTodWs4UXktI6ZqYmOXLkCJu9PotLS2x214mTJHAIyhJvDGkUMzk+caN17tfWl5b/wY4dkx/4D7/2fvN9/80Pvtom9F9d39AO4JZb7sAWRSyk/mHjyn8OYsZV1XYQYVCFCZNsa168quS3h1mOs5aXXz7J0tIy1prRydrpdGgkDdIoJm02AqNMy6oAFyruWktcUeBt0OETUoT2XfU/GeA2W9Lc2whFHh8kg6r0Al+lEDVEt/p89VwAqSQaHQBKVY7rv8L18FRS2d6N5LcEoQ0WUIAK5yT/8T/+DhcuLHH+/BwnXnyRRiMhywYg4Lve826++698FzqKwcG1x47yL37hXxBFkuuuvxqhLYsXF3jw/oe49tpr2bdvH3t27+K//6mf5NOf+hRFliFaLaw1rC/3uP/+h7BeMDY+SbPZQsiIjfUeeWYocsdDD32JOE6I0xQdSZJmTBQlGGNDemQljSTGS4isRung+LSSxJFg/96dTE11WN9YQUmF1JpGox3mHXgf2H9K0mik9AcDIqVHzM0oijDGhIIhYDLDhu2yudlFackgz+mkKTbP2TU7Q39znYXVDaJmh9nxCaIoJs8L2mMTOOtoTE3RW1slF5Ks2yVOG6RJQo5gkGes9PrMzO7Y12w0fnH54mqrt9l73//60/+k+J9+4X9+tU3pj1zfsA7gljvuxONT6dXfkkL8Y+fFFD5seFdNtRWAVkGgk6rnLaVkcmKcTqNVnfaBhBNFMYuLS3S7XWZmZpiemGTn7A6iJKbf76OiiDiJqVuJzrpQtNO6aiNWhCBCo642dTcSovCXAlaqekFoRQYnUmN+nXNYPIoAGa5bXrJqSwZE2itcQMUJcC7gCZRSFYPBj6DG42PjdNoTDPoZH/vox4miCKUU4+PjvOWtb+DQocu485ZboBhgigwdxezdPcNb3/J6HnzwPpIYsrzL+voyn/j4x9i1ayeHDx9m7sIFfud3/gvOBrHR4aDPAw89xmc+fx+DrGB8bII4TbnttjtJ0xZl1mdqepr19T7N5lhIf5TCOkez3Wbvvv2srq7S7fWg8MQ6AimIha4Kqw4pPC+++CyHLtvHwcv2s7y6jHOKrAjXOtYxouI9GFPSbrbJsyx8X0m2F0WOUtX9c9DuTAaZdRwyVhgHa/0ByjuW1jZoNVKyQZ/zi8ssrm0wPjbGkcNH2NzcYHN9PeBJ8Iy3mqSRIi8MxTDDlyUmL4ijmOXFJZRSM1j/czPTs+n05PS/+8Av/z/Ze3/yr7/aJvUV1zekA7jtttsQzqZOiJ8C+7Pe+/EwISoYj6rgt7UKjtYapARnyYZDyrTJzIEdNJoNOu0OU1OTpEmK1ppz585x8eICa8srDAZ99h84UIFvNMYa4jiuCD+yApsECW9XAYuUkpWslwUc3kvwAklIR6TYCt29AyF9GApSgVUQEi8rerAPTkYLSZw2EEJQOod1vuL2Bx2hLWXgEN5sDQUJqjm9wYD/97d+ize96Y2cO3eeJIpRiSTLMm688Xq+7/u/h8sO7cNhEdbgnUHpmNLkNNttbr/jNk6feYl+b5NmK6bb7eJ9qLQLKZlfWOTZ517g0KFDSKnx1rG0uMLGRo9Gq0OcBNDM5MQEWktW+5sILUmbMWNjbdrtDvv3X8bSygp33XU3zWaT9Y0Nnn/+Oc6ePEur2WIwHOCAsU6bZiNmY32dtZUVVpYWOXzZIZ5/7gTrmz0SHeNFwBdIAoArzw0rq0tIrQIgSwjiRJPlGXGiAzpQRWihwYFONL1+F2MNSgqWVlcox0qS5i6MVBTOE0nFubl5BoMhU5MTTE5NBmUjUzI9PcnC4gKLy8sIJcJgFaVRUpM0G6RJirN2amNz858s2oWkMzHxS//vL/1m9td+6odebdP6svUN1wW47bbbAFIhxP9HwD8QMBZCbwfeIoUPLbKqCBdFmiRNEFLQbDYAT1EYJqdmmN2xk2ajxeTkNOMTE0xPTbNzxy7arTbOO+bm51haWiKKY5RSZMMhRZYjpaqEJKKQElQEHKUkCFdJVlmcN3gRxKeC1NeWSEe4ukEPwLhAzPEIjLNVNLAlM/bUk08Txw2uueZawPHk009y9vx5QkYicZUQQI1zhxoJB0qHIubFi/M88cQT3HD99dx6y800kohrrrqC73vvd3PZgT14bylNTmkKvvjAF3n62WfZvXc/UkXEUcRwOGDHjlnGOm2ee/ZFlI654aabiZKUhx97jKXlFWamd3DdNdeTDwteOPEyw7JkbHycZrMFCOJIcejwfvKyj7EZx44dY8+enczO7uDs2XN0Oh1uvulmHnn4YR5//DGWlxbZuXMnd9xxO612g+WlJS7bt493vv1e1laXWV5cYGZ6hr279vHyiy/R6w9I0oR2u4XWodUXuiwCKy0qkiSNGKUku3btIE0STFlgipw8H9I3OZuDTcCRaB0csBIYZ6oWsqARJ3jv6PV7NNK0mt68ysb6GmVZMDk5QdpMEUqyc9cOGq0GSinK0gSHj6LIDVEcUZoybXXatwN+cW3l4Xff+x3mI5/8g1fbxC5Z31ARQGX8DSHETwN/D2h9xQdWvXutNVEco6OIqakplFIkScri4jIvvfQScRxz6OChUesvy3LSJGZ2dpaJiTHaY22effZZshee45prriVJYja7XbIiC+F0s0Oko2oACAHB5yuiTX2aOz8a/hGmBYWQXula178m9MiRZmVd+AtaAW40QAQcpiwoi3w0MzCs0K1Q1STeIIhZP2/QEEySlCRNeMMbX881Vx3jzMsvs3/fHrw3PPb4oxw6coi01aDfH/CZT3+BLMu54frbaDXGkTIiiZv0ugP03oQbrr+Ja667mT1793Hy9GlePPEyYxOTtMbGKI1lmJd4CErCSpHEMaSC4aDPoNdl986djLUbxDpmcXGFT3/qcwz6Obt27aYsc8oyp7u5hpSSdjtlx84pOuNNnnjiEcpiwFinyf79e3j5xHOsri5SlhnWloyNtZBRjBCOsbE2prC40uJ1kE4LXAiDs4GReOjQQVaWlznxwouoKMKYIKU+HAwwUjHWadNpt8jyIY1mA4FgeWmJdqvJ7p27iCPF5PgE6ysrXJyfY3H+ImWec+CyA0Q6IooipmdmmJjoU5SW8+cXiGJFo5FWI9cUUojOIBv+TCSlLPPBL/zL//n/O/y7/+Tvv9qmNlrfMKKg207+vwv8ff4I498i2XiMMRRFQb/fZ21tjW63G6bsKEW/32N+fg5jCpIk0EGzbMDa2ip5nmG9ZWJygoOHDrKyusaXnniChcUl+v0+i0vLbGxusrqxTmHLypAdWVliXMDkC6WQSteyUggpA5Cn0hEMb5ZqRl9NONo+x28LYmxdiG50mDKIrsgrIceXoRYx0ryv5+dVUmUIms0mcRyH6nUrBRx79u7G43jooQf5yIc/wtPPPBMck4xoNcdpNsaQQuMcKBVRlo6TJ88xHBimpncyObWLC/NLPPDwo3ih0HED6wWFDePQpJR4a9BKYMocgSMf9njskUc4f/YcrlI6WllaotNuhW4KDmfLEL4LT6uVsLJykfWNZaLIkzY0USoZDDeJIkG708CYHI/liisvZ2p6kn6/y9raCsvLC2xsrFYRWeB0lGU5UmxaXlpmYWEBY8wWJLwCB0VRVBVnwz1Jk5RGkmLKkmajQRon5FkWUJ3GMtZuc/TwEXbN7mBleYVTp86E66/DLEetFHt27ebYlVcwPTmJ8I6yyAI0PLC8Ws6avy+V/rtpq5n+8s/94qttbqP1DREBVMafCCF+CvgZoPlHP3pLomtrIo6kKAqklJRlGSrjSJaWFllYuMjhQ4eI4wjvPEWeh56yVkRJwuVHjzIxOcnZs2fpD/pMTU2R5zkLS0ukySbOO8bGxohiHV5ZykBGsYEvIFVIE1yN3Udu8Qjkloet5wPWtQtrzWiAp3ehHoC3pGlMu90MHP7aUUiJFFEFLFJIWY8XD0XFSGtarSZFnnPmzGkO7N2D0pLjjz/O5z//BbSOWLi4gHOeJGnRbk2SxAaI0CrGloaJ8amg7rM5ZOeevXgd8+JLJxhkA6SOuOzgQa67+hriRhpalHjazQYzM9NsbGwwzPrkaJYWL7K+uoNGkjAzPc3Byw4xOTHFFz5/P93NdQSORiOm2UpIU8XM7ARRLGi1E26//WZefP5F1jZWmZqeoChy8iKn0Ui4+eabePDRRzl34QJSSYSEIsvIC11JgxmkUkEy3EN/MODUqVO0KlGQJE7wKsK7Sisxzxn0B6RJjJaKwaCPFhKlgnNIohgpJBubGxRZxlirxcTEBO1Oh4XlZc6ePc8VVx4ljmL63T75cMjuHTtopx3m5ucZDrtB08CnTIx1aLaazdKYn0FQShH96/f/8vvyH/zJH361Te/VdwC33347QAT8GPCzQPuVj9l+cm4X4oDtOPktDr/zgSHnnOHlky9x4MB+9u3dh6oqxs4ajC1xIszSm5yaQipFt9slbYQJt0uLS+R5zrnz5zhw4AC7d++m2WxsoQa9wxsTFGq9qAZj+tHp76spv76GCVcyY/XnqY03nOwOqUJbT0eK8bFOVZQsA1BI6kDrrUgyUkpiSVDBjSLiWNPpdCjLIadOnea2m28mkoqLFxeRQpGkDYrckecOKSKSuIUURcDQK40tDCBRUrO4uMrKeh+VpGRFjlSaZrPJgQMH2H9gH889/QxaCIp8yHXXXs3lRw+zsbHBufNnWV1ZZmZmmoMHDhBFSeDoW8/ixaXR6SyEYOeOWZzNmZqeYHp2hizLyLKcg4cO0UzDkBFTSsbHp4h0grWOpaUlTp08RZ7nxI1GcKCVxqL1oaWIECitMWU56sDUh0Sg+4IWkjRJaHTGqpM6x1rDxNRkaPlmBVmek2eLNC87QKPRpBhmlKakkaQ0Ox2iRov5i3MsLS7Tbrdpt1rkWYHwnlYj5YrLDzM23qDb75IVZRjy4iy2LNs6Sn7WWlOsra3821/9uV8uf+xnf/JVtb9X1QHcfvvteO+1EOJHhRD/CBj/Stz9V67tenjb/6t1UIP1HoQOscLq6gp/+IcfYc+ePYy126GfmzboTIwTJyndbpf1jfWR1Fer1aIzNobHs7S6zNr6OmcunKPZaHHZwct47XVhZp6UMhT3REXwqVRmawWhCuUfin1S4ky5pSZcjw3fpmWvpCCOAmuw3Wow3mkj5BBPBEREcYqHEarRORvmAChJo5EQxzFpEnFxfoHVlXVmJqdxVpCmbaanZkiSNnHUoixsNcuQEYe+1W6xe/duxjrjdLt9GmkTncT0Bz201HTGOhw5fJDV5UVeeO5pTF5w1ZVHufmWm0nTmPGxBvv27UAKwQvPv0h3s8uePWPEccrCwjJPP/UcIGk12gz7Qy47cIDLDuzl9JmTfOITn8JYx84dO9mzZw9SSE6fPM/tt93OlVdcw9kzZ1lf2+TEiRNcnL9IszNG6QIOInRvYozJg/KvgKIosMaACIShJEmwpanIWB6UYHVlhXbaYO/u3bgkZm1jjX63S7PZYpANK7wHLK+tsn/3HtJ2k16vS14WjCnJ2Ngk0zPT5MMBa6urwaEkCXhJUQ7RkWLXzhmiVcH6RnAC3e6ALC9otNS4de4fjU9MZPuOXPZr//k3/6P5rh/67lfNBl81B3DTjTfS73ZF2my+V0r5z4Cpr+bvaqLOK39mrb1kzLa1NgB8RGiHPffss2ilUTKcAJ2JCVQU0+v12NzcQKngPJQKs/OiSJOXJVEas7y6yubmaZ574QXWNzc5evQos7OzOOdI4pg0jnH4CquvLsnX6zB/a6jl1hQhRO3IHFoJlIRi1IpUOGuRMgr1BaXRUURcdSy0VqPRZEkSBa0/nZJEko2NPnt27mNiYgYlz+GcopGOIQjju9rtDhsb68zNz7Fr1wx4w9raCoPhgCiK0FoxNTmB94bSGybHOoy1GphBl2YSMTQ5e3btoJFEnD9/mscef5Rrr72aI0cuZ+++vawur7FrdjcvnzzD448fp8gMcZIwNTlDI21Slhn33fc5XnrpBOiYKG6wuLDG+XOLeGORQjE5votB37C0uMH99z/MyuoyjWYbYxxRnOAcoQjoBEmc0s8H5EUWwv0kwZlKL6GKxKQKff9w/1PyPGd1dRVwlKZE4at9IEgaaeggeMvC6jLZYIAzJa1mg81el24vD+SiVgMpJXmW4S0kURq6CNJR2pyZ6Sn279/P+maXk6fOUlpPHpzRVKPd/GenXn6594nPfPS3funn/qX/qZ/9u6+KHb4qbcBbbrkF5z1RHN8rhPglYFdtyH/82hLwHP1kuzb+tqmxdehX593GlFgbikWb3S7rG5vkeV4pAEvKsiDLcjY2Nlhf32B9c4P+oE+W5TjnyPKcU6dOc/r0WZzzAeEWBwUaXE1C2jJ0IWWoGVTMRAhwhfA+q3FgzvLkE0/QbibceOMNeOFZXFrizNlz5LlBoLDWMRxmFTfAjxyVtZY4jhDVaaeVDGIYOuLQZQdZW1ljbn4BIRQ6itmzdz/nzp7n5MsvAQ5jchqNFFMWzM3NkWc5ZWGYnprm7rvu5LLL9nH61EmMKbjm6mMU2ZDnn32aSAmufs3VwUnmGUcOX8aOHTMsXJznwfsfYGpqlkajxX1ffJCFhZVwnaIE7yGu0HmPPPwwSiuUTknTNtZ6BIokbiLRXDh/kaXFVZz1FHmGVhovBCpKcF4gRZgOlCYNnHUYV2CdHUWBcRSRxHGYZaArWLCQtNttpA86A2mSYG1JkedIpRhmQzwwyIZkeYat5N82NjbIsoy19XWGw7y6J5YsG9BqNhjrdMjzAiUlSeW8dSRROhQdm40W4+OTGOvY2NxEa02332uW1tx6/bU3PPOud77j5UN7D/EHn/ro190Wv+4RwI2334WMAMt1OPtzOLdPSoncGsLHli5vnfvLkQIPghFtd/QDxGh4RJD9NgjhybIsTKKtlXKFCAo6BFUZBEgnESKuDFRWpKGQPwoE2SAjjiOkClBgax2LC3M89VREq9VicmI86P5X46hKa/BeVlgFFRiFcitKgZAyBF4/GOMQNsiGeB/wDZHWpElMmii80DgnyPOSvOyztrbJYNBARzGNtIGU4+goIk2aKAXGZPR6G3hp8cohVJg+tLy8yoP3P8r6+hrjY5M0GgkgePzxR8kGffbs2sNtt97IfV94gKy/TpI4JibH2L93hrX1VXAFzpZoHVUjzQRnzp0nThKmZ2c4efIUTz71FBvrGYgIITWDLA+nNTDMcy7Mz7HZ63LDDdeBjALqEY23oRORlxnGBVHPoI0QSDdCRxhbUjqP8EEvSKsamxE0G2OVEjXS0J7TekS3lkJgjMEah3Ge/mBILCVxkiC1opm06Q2HeFOSNhpkeRYERVQU8vrOJMgYJQTW5ui4hfHQy4bIoWNmdoaN3qBilkJeFggl0Y20UpDSVT1Is2/PHsqiYLPbZbLTppf19tls+HMf//AfzDe0evL9v/jv+MH/4etLIPq6OwCJx5b+oBDiXwgpb5RSohFgQo9dKIWsDLzG2ot6sks1ODJwboOoZk2XFSJ8lAARUAhhw8RawI5GTQNKBtntyuF44XFFjjEWKqhtHWEoGSG1wtkwkiuKNHv27aHRaLG2usHzzz3P+HiHNI2J0yax1NuEPx3Su/oTVwpEgeSTRDHOBDqxjBIaUYJWCUIECWtnHFoL4iR0C4RSNNOUojThVFJRkNLubdDvdYnilM1ml8mJDkliMa4IJ6IoiJqKVrPB2kqPs6dPBRKUyREYXv+GO5mabGOKIbGO2DG7E1cWvHTyBHHskLLg6OX7efTRBbwzgTFpIY6aOCTPvfQSF+eXmJqcZWVlDe+g1Z4iSjtYofFSY30eCnQVPbowhgvzCwgZhevvBImOKZwN90W5KnUTiDJoKOoowmaeho4qBaCwk6CarmRLjA3KyYUz5Hk5kn3XWpPnJdZYBJKizCmlxBuD9Y7xiTF0EhMnMfv270MJz/mz50K5QMVIGSFFzN69++h2uwwHAzb6PZIkQgJrm316mxtESjI5MUm7FSDow8IFjQcZg7dYG7Adhw4cCM+T9dnYlKxurN8YRfpftNvtv22tPf31tsevawpwy213IjyzQoj/HcG7pZQijSMkAmtKahXYbelz5QAk2+rr9W+qk2JLUx8YVdfZFkfUa7s8eP3YmkQUVHbVJcKfrlLrFSLg7xuNBseOHePyI1fQbLSwxiJ1GDqhqqm1dQiICCPDarKQHJ36YapN3Yc21nD8yadotZpce921OO9YXl7k5ZMnGQyHAXrrq1w/1iRxTLPRoFkV/sqyYDgcsLa2Qq/XpdvdJMsyAF588cVQG7GO7uYm3nmGwx5KCQ4dOsBNN19PmkS0W006Yx2E90RRxOLyAocvP1gpEEGSNtixYxe97oCTL59l1679HL78MC+eeIGTp06TZQVaJ7RaHYyxzMzMolXEc8+9gKuAUaFoFwOwsrJKUZSkaSOcjhUXQOjQlWg0mmgdkcYJkQ40aesczkFeFBRFMHDrLHGcUBQFWZ7h2cKGGBPm/8VxTJ7nQZ9BRxWkuxo+ag0e6A36gY7sw1CY0hiSRmM0PKTb65HlGcY6+sNBxRcJ97TTadPtdsmyjI3NDcoydG6a7c5oqEye51gTCE5aKsY6HaQUdDc38MYyPT11pNsf7FxaXvn8u97w1sFHPvPxr5tNft0cwC233I13IlaCvyel+ls60qrVaDAzPU0jSTB5EQZuKj2iyX5lByAIqtf16b81z2+rI2C/ogMYSXBvk/8e6fq/snhXtxuhUgD2lKakKMpqIo3kwGUHOXLkEFEUTv5aZzDMGgyFp1oZWIyGekJZFGFakAwFyiefepLx8XGuufZqvHcsLi3w0smX6Q+GeC9QMg4CJZVeQeAbOrRUlEVOv9elLLLQaisMCwuLLC0v473n4GUHmZ2ZZnJynGPHrmD/vj3Mz1/g0OED7N27i+NPfImJiXGSJMZ5R5zEdMZb6CgMOEmShLGxcZSM2djocfLlc7Ta4+zZu4vN7hqTU9McOXyU7mafPCuxxrO2tsHF+YtkWU6SJCRxQhTH1KKnUkjSNBh5VImg5ia06cJQFEFZGsospyhKSmMoyoKyNFXtKKqmHoWOTmkMXviR3Htt+EmSEEUR3W43TFyWYiQSoyrnrCtNg8IaNntdNrubGBO6DEhJ2mgEbQgBwzzD4SiLYjTB2HtHlmUjWHqz0aDb69EdDCo9iibeumpicaUKDWgpSLSm1WgihRBFXlw1Pj5eFsbd993vfLf9Lx/70NfFLr8uKcAbXvdmZqdnxfm589/nET+hlNJxFNFutdm3dy8RgpcKw8ra2mgq7h+5toV/9bgcN+LNVxr90ldgoK1V94TrtVWVr3V3vlwSPKQNfgtbYCznzp1lZXmNJGmwvr7J7j072blrJxhL3h8wGFQyYkoRVbWD7VqDtayXsxbnPYU1DItiJFEUUpwwDlyrCKkihIhQspLHlmFeoBcC6wxSeKzJAiLPlngdY51kfa1LrCMuO3CQG294LSvLixR5zvT0DOvryxiTE0WBMFMay4W5efqDPlcdO8bUzAwQ+ufGVoQoIdE6AaG4eHGJzc0ed999N8PMcN8XHqTX7TE+MQ1eUBQFSZLQ6XRCx6aaZJznOXll1FrroH3gPZ3xDsYYclOAlKGgphTeOZIoRkeKrMhBUKnzhuPAOscgG0I1uq0uANedgNrZJ0lCXhY4H9qDqhJalRXHwvqK1YlAqIjcWopBn0aa0vSGrMwZa4/RbLdYWlygkcSBCUr420E2QElJaaLKYRgWV9fIsoyrrjzGxNgYRZZT5kWFoLQ0Gk3SOGBPNja7NLTWy2trP5Fo+VJvuvn+/+tf/JL/b//eT33NbfNrHgHceuNtCDTr62uvF4h/pbXcLSpZ52ajwXi7Q6vRYGNtje5mFxf6ZiPyi6hkuGsr9RX1xsMlBl2nBrV8V90VGP12W4SwNRBk+yDQGlS0NQVIjE6MStq70vU31mJKy/LyCvMX54jiiGbaII3TSvc/uDBZYfeFd0EkpBpz5QmackJJ8qLgkYcfYXZmmte+9rUAnD17luPHn6Lb6+OswJbVhBsV6M8huqjFRy39fh/nLMZ7jAcvAzxYK82+vXs4cuggJ18+wdkzJzmwby9JnHD+wnkOXHYZ7c4YcZLy/Asv8sILL9JotWh3Ongv2djc5OzZCxjrWN/ocer0OTbWe+g4odvbYGFxjpdOvMzchYtVvqyI4yjoNhYZeT4gzzOKMshu50UeCoiunuQTYLRKB0h1XhpEJd8mRUittAq8ijCHWWypKykdKNtVWmesGXUA6olBtTOoDb1WcVJ1OUhIoihmmGVEcRzIVpVKU63UFCchhTC2xLlQV0obaTjx44jZHbPoKm11LoiM7Ni5k2azTZ7lLC4uYo3FFCW2KMmHGcP+gOGwzzDvkw2GIZLLc6SQDR1F18d5+aWpVvvMt7/t7fznP/zaRgJf8whARJLSZ3sR4h9KIQ4qqTGuDOo1xoQQajjElKaq0MuRAQn55ZFA+J2qDLOevMPI+IUYKel92d/VjmA7XqAeOxV+tjU3wDk3EgsN8wECFddYA77WHxCcPnOG5eVlbr3xJu649TZmpqYrMFIg6igpcTbIidXjqQPKz1YoIknhTDXHIIB7rAth5eZGF2O6IKKqK+BJ0ph2u02r00YrD5nAyzBAQ2qJrXQMldYkSYNsWIATeOvZtXMnaZrQ7W5ycW6eEy+cZO++fdx334Ocv3CO0pY88NCj3Hbrrezfu5/z5xd54YXn8UBZWJwVJHEL50ouXDiPdRlp0iRJU1aW15DS02rF+EFgHU5OTqKUZGlpmRiNUoKxsQ4ry2sjKncIiSVBknELzRmceKjJDLNhpdYU5NS1liNZ9toBaKtH99dvK8SGUWtlmA+owvO6snLIqAASMi4IkugkDIlVgiSKQjdAh3bijpkZGo2ExcUlHJ5Gq4U1JcurKxTDDC2DivTy6kroegzyQCQrDadPn2b37A5aaYOsPwh0cenwytBKm0x0xiiznEhpMmsOZtb8w7wsXmrFyYWvtX1+TR3A3XffgxCiY637R0KKN+mqLeatD7mykLSaLcrBkGG/H2CdzofxVmIkwnWpIdehmwNXSXPU8AEhfSCHOIHl0qlA9UTfV24SXw39qDsMNdsOGJ0IWyQccUn9AEK00e11eeL4cTqtNjdc91omJsYRMvTvQyFQhtmAbJstKAVeilHbKEmTUOEWleKvMVVnIsI7yLKCvChwm5votQ0ajQZJmlDYEuM9Fl91UdxINhwhWF/fpN8fsmf3HpJYsbG+yYsvngAkzz9/gudfeJnVtXUarTGaWjI5Nc7zL5zkzMl5zp0/Q54PUTrIlRsThE3K0gZNAaW44oor8V4wHA44dtXl7D+wj/m5sxRlzlVXvYZeb8DHP/4JwHDZwQNMTc7wyMZjOF+OojRZzVJUUuNqcFRVZ5FSUeYGL13FoKxYlNZtAaKE/Ir3dTS7UQXRUOtKlBA4B4mMSOMUqTTT41PEaYqMdCX4WoY5g4Uh90NsWTA/d35074TSWGewpSFSkiLLwIVhsEkU0+31WF/bZHZ6hssPH2HY69Hv9qC0THTGsKZktbtKLgqiOHSq0iiiGGbMjE2QOfsmK/w/UrH86Ud+76PdW9799m8+B3DXXXdhTE9o3f5eIcRf985LYw3Ch+KSilQ1faXJ+mCI8z5MhtEB8+781miv7Stozm3hA4T0VZFuC1tPBbN9pcHXgB/YqgnYan6flKpKAfxoppyvjCpsskC7DU+oquewVWAK6+trfOqTn6TMcu644w7GxsYCdkBKnNjqV0sp8SLg+KVQlS5hzRa0OBe6DRPjEwyGBmsF3oZJR7nJUFphvWCj24fBYDQD0BMCEyHDXATrDHG1uYrCoGXMIw8+yNLKMqubm2iVMhzmSBXjvMQ5SW+zx11338VLL77MqZfPVdj6BGuLAK1NYgqTc+TIUfbt3UOkFRcuzHP+3PnA0VcCY4a89oarEcIBiijS7No1w/j4FNdcfR333/8QZZmjdRx4CM5SFmZk+DqKKtlzjxNhPzQaDUpbjmDUobPhR1Lv27+2Dfa8pAsgpSCJVEXCEmgRkJZJnGKwNJOUzV6XYZ5hygLwJFFErJuUeaBo60hRGkeUpkRGIxG0Wp1QKylyiqIA70mSUDwMLcgsDCyt5N+sMaGIrCTtToeNzU2aUUqn3aaZNBiWBUIpiVZ/XSj56Mzk+P/9wse/6K98293fXA4gePfGnUIEdp9x4cKrWkqzyoeNdbTHx3BagqrC8spYjbVhE9RKulIghQNvgDDnrQ7/wz/kaLZm3T0QUI3e2jrBlQq6+3UNoZ6uKyt+/qjfUKnuhCUrUdC6DelGir/V+A8MnnPzc1zV6xI3UhqxJqpn0nu2JMK9R/qqxiFD1JOXBmODeGWkUybGp+gPLEIlxEmL0lqcL/A4FhcWKPM+2guQYYCIq6cJVeG+LSy2tGT9kGOura1w8eIi1jsaaZMsL0nThF6/jzUZ3c0hUaxDZbrZBOkpS0McayTR6LS+5ppruOqq15D3+7RbDcZabV564QWkEKwsLNBdX2LHRBtEkNROmy2SSHL08CFwjtWlZRpJgtIaaz2OEuMchTWVrFpIr4yxYTCKCHiMojSVE1coqXAyOIAAXdZVa2+bg6jueVEUI7SnFmDLMuAPFMRRHCb+YFlZWwkHj6uUn2U1aswDUmMxOBOiFErPYDig1WrRTNvYwuIoiaMUbxwbvXWkUmRRTJHlLC8uY4qSq664AqkDHD2KE7KsYGJiBqFiVrs9bGFotVpMj42x2e02bVn+zNriynNZlt/3tbLTr4kDuP322zHGzAghfgY4MhrqLAgtm+omFWVB6Syrq6uUuIDOc3ak4y/cFvjHXxII2MpAtzmcbf/vncPBJQw8WfH1rbWUxozYYiNDrwpz9YlazwwMsl/huQNOYDuGoAYjBqdmhWNxdYlz8+dJGilRmoT6AdX0YA+ing/gRYVLUlWkU+kLeIMSiiRuhNNFxSTNMaIkBWGIlKK32WfYGwbeAWB9iGJCtR2kV0E113qc9VycXyCNJb3+gDvvvhOhNesbGxw6dJjPfuYzZEPD7OxM+FzWkkYaZ0NnwTuDKUukUlx7zTVcd911DAYDnnnmKa696kokkkQHKLRCYLOSCM3S0gKDfMChI5fz+rtfj/eKZ545waA/rJxmPa3cEyUK7Sv8h5B4L1FxoOZ6II5jirIkrgZ21obtnCPLhkHGvfp+eyenjgpG0Z7zo5avrRz2oMgoXcAMKK1ABJl0Z0MnB1lxCHSMkJLdO3YijGVzcxMdaYaDHCU0B/ZdRjNOWFlYYhgPyYqMbDjk3PlzRErTaDXJy9AdkVrRbHVYvniB5cU19u7ZE6Yf+RJZlNDtk0QJXqkjSP8zeV788Au//+nlK7/jTd/4DuCuu+4C0MaYn5BSvh0Ysd+8E1X/Owhs5HnOhQsXWFhYIM+LkU6+qlpEQgoU1ZScGpTz1byJShN+e9W/Lv7VQiLbRTfrcHF7Dgl+NHu+DjWBEQbfVm08CNBe7z1lYZifv8iTx4+zc3YnnU4nVLmFRMmKsFQNtZSyohDX04qUHI0aj5OYNA3SVpkxmF6f1PtQxIpjhKh1AcLYbOdd6CpIGaTSlWJifJzJqWmMtZw7d46rrjwKSJ577nmss+zbv5c9u3dw7MrLKUvDsWPHeP655zj58kscOnSQ1xy7nBdffIE8L/Des3v3Pq675hhaWJYXzjMcrJM0gg7e5OQY8xfmuXjxIjt2zCArsZTBoECrBnjIhiXra12iKCFppKORaqbCGljnKEpDWTqMLQMk3DFC9NVGXFOK67Wd8lvfy9rx1wxRWUms60iPOkTGGIS1CBPAQHmejxxyvRdG0G2l8FKG/Tp3gZ3Ts3TGx+j1ukglyUvL6voaAxXRbDZod9oY7+j3+piiwAOTU5MIpRBKoaKIpYU55hYuAjA8lRHriNmpadrpGF5JvJIgFUqJt+/Zu/sn4rHG/7r48HGz49bXfuM6gDvuuKNGYL0e+NtSSl3fJO8vFcioi3Lz8/P0+wOGw4xEB/qmY2tcN1VbL5zo1cSdP87+4RKDBaqOw1Yd4JVpwaXGz6hToKpTp65QJ0kSetZ5jqxrFVwKXHrp5ZOMdR7k3nvfTpom+G0swbqmqbTGUI8Gr4phohqHrYKBl2WB8xqpwmaUI+cTuPB+hFTcPqGgphlTtUo9vf6A0llK51heXgEsr7nqSso857prr0VJyXCY0d3cYGNzk5tuup7ZHTeRJpJHHnmESCmmpzokscD7kl53jSzv431BFEW85ppj9Po9Wo0Whw4dxhiPtXDx4gqtE2fJ8pK1tS7zF5dAaIwNxVrnPHle4FyIDEtjK0q1pDQm4DmqAp/WmrIsMcaMgFb1v1/Z4t2uu1Cv+uej9GDELQmpqPOBzGUJDql2IFmW4ZyjKIoQIVjP8soyaZrS7rTRcUy318Wakn6xSU9FNBtN0JKxiTEiHTHsD1jf2GB8/xjd7iZz3R6LG6t0pibp93pYJegVGRtnTjHIM/bu3hPEZp1hvNnW1vO3B938ixub65/qPnmKznWHvjEdQHWS7gH+IRXDb9tvRzeiVte11jIYDCnyEq0ioigBwiy9Eeuvwvx7D9aBFP7S2P8rvY/qv9s3x/aTwVbsPF393hiz5Ty2Fw6dCyAR5+h0OiMwSx0ZSCkriGrVuqoovHme89RTT/Pa117P+PhYMAhKGmk6IgVJL0dOJor0aEZAAB65UYtUqWpuodz23qiBLwKhajxDVeiEirQUIMBEEhUlJI02XiiUFtx4/Q1c/ZqrwylrLS+eeIknn3ySjY0NpqamMEXO8y+8yL69uzl1cpKlpSWazbQSPHEksWYw6NIb9mm02iitmJ3dya233Mrk+ASDQY80bTF3YZHzF1YRQtNotinKEIaXWU6caISEsrQoHVq7VFOZ2ebOvA89/SzLRtj+0f3ZVuW/NJ0LyxizFR2IQNQShNB+NG9RQGkNUqutqc7V/UzTdPQ8URSR5zmR1igd0Rv0yUzOxMwk7bEOvfV1JsYnKIcZgyJjuJlRGsOeXbvYuXsXWMf5+XkG3R6R1jTbbVS7gXFhtkFvcxOH4MLyEivdLrt37cIMh0y2W0xOTe0an5j4hxMTM8/1Br25P0+b/XNzALfeeitlWWqt9Y8KIe6CrVN0ROJha9KN96HIZI1DyjD7zntRSWfVBJ/wHK5iCUohgxJPRSzZvhFqg9z+73qmm/eewWBwyePrN7IFBNr6+23eYFQsLMuSsbExlFKsrKwAoZIfCEWMQsYw6lvS7/d4+OGHwlDNVieARLQmjSNqfcD6MyRJgnNBwUhWYh/eBbUfi6zqHyGNKkeRTDV+rCpiyUrGvIZAiwrPYD0Mi5Lz8wuoKEFKz/79B4KhOc9LLwXjrweoCiHJ8pzVlRWSOOH6629gMBywd98+Tp48yYEDB5idneW22+4gTZtIFbN7z34mJ3YyHGScO/cs+/buYjDMUDoKmI1KJo1RtBV0EANLLkxpCnvDVKi+0XymIKxZFWdHUvDb7tOX3bPKYGvHUP+3dvqyLgTrEBnKqiBcO9Z6P7jKsdfgotqR1GPlkmaTKNasrK2hpWBsfBxrDJOz0xRZAUqhk5iVtTXm5ubYuWMnXsLy+ipJFJP6NiYfVs4lBqnwKnzGQVHw8tmz7JmdYWVjnfPzc+zZs+cuAT/68EMP/fxHfuU3zLt+/G984ziA0PIzRFF0u/f+bxIkvr7sxgQW35YDGJF6Rr12se1r63HCBdRciKBH5aM/cm0/6Xft2oXWmlOnTmGMIcuykHMaMwoL/ygdAu89cRV69vv9MGm2GrZhTECeebtFUaqBP/gAHnr88cdpNpq8/a33BtEQ78iLIgCWnEBGEh3pkQiHkIKyKKr2XWjneSVHtFcAU4YedW0IcRxR2ILCFiG/rXAMoY0ZWncb3S5fOv4UXmhULHnu+RNEkebYsWM0mh2UTkhEkNTq9gZ0uwN27NrLc88/z9vedi9JmvLwI4/w/LPPcsedd3LZZQe4ML/E4098gSuOHqOZtpm7cJGzp88gheDky2NYZzGuxAuLEBE6UhjnsN4FuXXhMaaogEAaawu8F5W0V9BJsM4gqutTf/7tDn87qKs28kvl47ZSvDrK244MHBlBPfzFe1Tw5uiq/ai1Jq5mMtaHiHOO0hnyYR4AYdbQc5akGiibZXmILIxBJwnGOV4+dTIYfqOJKUNnot83pGnKcJjR7/crZwZRFFGWJWfOnSMWcNWxq5icmY3OnznzN6+84thn8jz/4ukvPsXBu6/9xnAA1cUd997/j8C+VxpjiACqfr0MZJ6ab791s175RZXLhmKZ8BVE19s/9v2obWPA8zzn0KFDDIdDzpw5c8mJUW+e7RvlkuepQsv6Mb1eb7QZIEwPqsD79X+CTLexo035yKOPsm/3Xm664YbRiVJ/uNAXtqOho6LK/50PU22MKYmjBlqrwGjzdd87sONUNSVY2Br3wCiySZOUyalJ4jgNnIOiQCpNVhS8dPI0Skr27T9I2mjT62dBSssFReK8cExP72YwfIZHHjvO9PQ0p06do7SCRx87zuLSOqdPnaEoLPfd9yhKRLQaTbxXSCVYW9+gLHOanZTSOYq8BGFx3obTuQL+SKlD90MENOD2wyG0gcP7jnS8dfo6N6rnwFZuXxv4dkxAfe9qA38lbqB+zlpJ2FobwF+VatNwOKyiM1elq0FMVqqA5CxMQVOEYrFwphocElp5eVkwyCuFokYaXkMIVKQDQ7AI9QtTGrSO8F4EtaMownmI4gTpPWU2ZG1jg/HxcVrN9j7VFP/jocsOPjUYDjf+PGz3z+wA7rjjDgaDAY1G473e+3u3/267px4h56TAVg5AinqUphwZ/CvXFo67atv98SWA6rUBBN1ul2azyTXXXMPi4uKIKitrjMBXeI/1qgtGqsoZy7IM4akPPWTrXZABG32OGoxEBWZy5EXOZz/3OXbt3MnRI0co8gKlg0pNHWZuxx6Mwl0VQC1UQqNpmpCmKVrKwD4kXIftysjOO6IqnB0OBwwGA5wHpTTDYejzmzKjqSVFPmB5ZY3XvOY1RElKnDaIdER/0GdpZYP9hw7T7Exx/KkX6HTaoQDaGMM4OHNunsHA0Gx0kBgOXnaQvXt289STx3HO0O322LVrlrvfcDsOizWC+YsrPPvMCfIctFajwpupINhaa+zQ40tTtX1dQIvqLaOvnWrtRJVSNBqN0TUELqkRlGV5SWRQp3L1v+M4ptlsUM91sIAxFlc55Lq9WBTFFqtTREgt0VJjcVhjGGRDIikZazZH6k1ewPTMDGkcM+yG6DEfZrTHxnClwfR6AQdjHJ12mzRO6PZ6I0qykJJICmZ27KAzPl7hIEAode/i0tJ7j73r7n/3sf/9fdz7//mzKQv/mR2AA9Jm80o8f0cI0XilEW4P7b3XlxhwLfvhCS0/R5XvV7+rpa/jKB5VvOvpONtP6+2GWxujkkGEAi9wxrNr5y5mpqe5MDd3yYRetS0i8AR8ea0RICrV2VCUCwMnVRwRR4HI4kyJwgVqklKBAJLn5C7HC4+XYYrR3PICn73vC+zavYvp8fEAHbUOLRQRgR0mhEBHmjyzCCWJmw2SRgOhE2Qc0Wx28KVFOKocVuIILTMhCIMx6otXVdjLsqTRlBWhqppGqHToh0cxq+trGG+45/X3kCQJ9993P/3lAS+fOsPSWpe5+VUQCb2+IY4TPKrqyRcIneC8JUkUhw7sYmKijRAZ3htmd81w8+23MTU+hhQlQmhmx8eJvOexJ55iWAzxWuOEwFvDoAjhr4rqsegWfIBHx1EQAamRmkEaXY9yeqqDYfspXjvu7Y+tHYQxdiQTZ60NBl4W4fmq9qzw6hIoco1PECKkaXk+REcRkVI4Y2kkCflwSH8woJmkOMCUhu5GF5OmNNMUZy2NRoNet0er2cQL0JEklRrhLcIbIh1sIEor+TMvKXJLlhmkyJmbmwPvGhPj43/n3Pv/02fNePLCn9V+/0xswBtuvZ3cO6WF/Ht43lMXeMQoLJajr4DslSNnsIWnr1h8csvo635/HRIHEdDgbfkKJ/UrB20EKa4wNNQ5T6vVYu+evayurbC8vDxyIHV4WDsDH7KTwA0ITODq+SrFfxE057XSpGmzqjIXFQNR0Wp2cM5TGIPDhc8kPEKGwmESxxzYt28U8wgZ8spnn3mWnTt3cOzYMcqyZHVllVOnz7CwuIxDhqEcxuEKC3hWlhcoiiHgKhRjpZHgqRwWjI1N0Gp3Ki5+FPTuqlNV+nCSZvmQ1dUVhPTMzc9x7vyFcDo6T2ncqJaRJA2gnmIkSeI0FOx8yRWXH+KmG65hbu40p06eoNFscOsddzA2MYEthizOn2dlYYlWo8nePXvDkNaVVXSSIrQmTeMgohJVqkEVT79G+HkfjNoYMxryUTP96p/XbboQodnRnqijhS2sANtO8nrUGxRFDtgw2s1vScxpHaGjKADHRP1zASJc7CjSRFpjqpkUuppMnBd52Ejeh45WRWs2xlKWYR5EnER4b9E6DIHx1hJFOug8RBqhRJg3KBTLKyv0hwMKU9DLBmRlvmNtcyObW7zw6W9/873+Dz77qT+1Df+pJwNdf+ONKCmJEXd6+IHaqOoR2a8U6vzj5L63t3TqsVh1vzd49S9v8/zXlnNbp+DZs2c5c+Y0g8HgkkkxX+ZEYNtpIb4s16hDwrIMJ0ir1aLZbI42ZVEU25wQI2074cEZy7PPPsv8xYuoSAddQu+QSqF0ILXYSqrMO0eR5aPQOGxgV/EHZKV96Ld4AO4V4ifbHOJW3cGHYZ8iiHJYG55zbm6OB+57gONPHMeWBms9ZZEjXInEoKXDlkOmJtrs27OTJJKYcoC3Bbt37eSqY1eGUN44oighTtIAgJKKtbUNFhZWESohihpYA8bUDlpjCkueFaOZAVmWMRiE1GU4HDIcDkfXdDuOY3s4P5oFMao1bdHA6zbg9q+tiJSqDhHqN1prnHdYE9LMUISsuR9cwi2puwShdiNHRcY6fK9TOlPtpV6/z9r6OkrrIGZS8U1q7cJIaWIdkUQxsdJh4rC1SCWwlDQ7DcYmxxifmqTZbtHodGiPjf/A9OzuO3fvO8Av/uOf/1M7gD91ChDpCKxpC6V+TAq5G39pm6Y2mK92vRKQo7Wm1WpRliWDweASSK9z7qt6zrr4uLGxwdNPP83G5volOf2oikyl4OvDzPm6zSas/4rPmWUZWkccOLAfpT0vvXSC4SDIUtXYhZBYhkgmdBwUZ06f4f4HH2R2xw5azTRMNq6grVLIkUwY1LyBLZUhWwlz1IWsuk5QzxUIEZavAED+krzYWhsKqIJwqltHEiV0Wh16/U2KoqDRaIIPp47WgkRDmWXs372bHTtmueaaaxFS8MLzz3PixAloKG684VrGxjuUpiQrckSl3xdVJJgkaXL1tTeSxinOSS4uLHP8yadxQmMLiykdkdo6IOqwPY7jL2NxbgfxvNK51d/XJ/72Iu/22k4NuBIV1sKWplIO1pUey5aMWN3S/fKhLuEWC7klRV8/xhhDpCPiOAEX0Jm+qi/0h0P6wwG7dgZ4jDUBRFVkGVIIxjpBFCWJY6IidBGklmR2GJSlFPR6fYz3FP0hURTtNk782PzC6pc64zO9P60d/6kigNtuvg2nFAj5VinEO2vefn0DalZWjaDbbjz/NWPd7gzq/K1u/2yHfL4y5P8Kz1Y9ZuvU3tzcpCxKkiQJH3xb/rjVMw7jpqXaopi+8j3Wny3LMnq9PpOTk4yPjwdYa3Xi1KIVNd9AV97e43nuhee5cHGOIPEjMS4g/GoQSi1UIYUI4iMVlz1N0tGs+3C9w7G0nc4cCqX+FTmwGpFhBEG3MI4iXv/613H3XXfSSFPGx8ZoJClxFNFuNzl4YB/HrjjM/r07cSZDS08z1TQTzdEjB5kcb+NtTruVIITFYVldX2ej2yVNU+IoZnV5BYRCyJjl1U3OnZvn8cefpN8LstqmtEQ6vuRUrSO+7RDeVwJ8rLWXPPaV++6Veo/b27ZCiDBfQSq88xUzcMtJe8/ocNgefdYRirXBqUZRtKU0Xb1Ws9kczRxMkphGo0GapiRpSpykeCkonWV5bRUZaVpjY1gfKOKD4RAdhbZjnmV4Y3DGsLG+RpZnbHTX6Q96rKytsra+wWCYURrHMCveKaV66/TMDD//D/50UcCfLgIQgtj46dL7v+kV4/WJV1dgnQvKrjt27GB9fX0EnNlu6JcOy7g0Raj/Xed129OD7Zthu2d+xRt8RZTg6ff7RHGYFb/dQLY/X+jrg7f2y4BCQTiEiowiMMayuLRInAjarTYran2EYqsxDqPvncMUJQjY6G7y6Je+xI7dO2m3mtgKZbj98yiliHUUMAVao5VmOBiQ6JjSlFvv3W8XTQn8B0momyRJHAy70cRYEzoPUeAKxB609MzOTnL44H6efe5ZrCkYGxvniiuOccXRQ8SxYNA/xKnTpzn58kn279/N7Ows7VbKa646Sre3k/GxJqV1GGsoyjLIYUdB8PT8uXOcOXee8fFJet0e3oI1niRNybIcdMifi7xExOEz1FX7Wi6shvqO5MOqdl+dcnnvL0nB6v2xPe2suz5JkiCFIs+zwKOo95+v2aIV6EiESGP74TM+Pr6VmmKRyo84HUqGQTJFno8OkOFwSBzFYaq0lBhTVmKikqy7yVpvk6mJcaYnJ0gbDbpr6ywsLtJqtTDWkpcFyFAHKUxZjVgLMHQfQRQFeHlZlOONZuNvZkX2+X37963wp1h/4gjgTXe/qZpZJ98F/nV4X51WcmSoURSRpilHjhzh4MGDNBqN0Y3ZbvSX+pTt8lz+kirvK53DK7/+K35qW6QgGBsbY3Z2NvRat6EU601V3/RQNX9FnaDKHevTKY5jet0uF+fnyfMgfolnFHrXEGHnAuIOH1BnpTWcOX+WzX4PGemgCZhlo46DrE7pkb6dVOTDYbjGNSnG2G3XbDtsKuSuQeHIk+U5w+GwgjCHwRb9fpeNjRXOnT+NkjA9M4E1GUU5YP/+3dxwwzV4LMsrS8RpwtXXXM2OnbPc/+ADbHY3KUzBrj27OXzkIEU5xDvD5uYm65tdnK8kz7zHWcNmt8vC8jK9/oCiNBWq0oxyb2MKdKQuQezBpZX8mv23Pc/fXsOp90AURZfsh+3pQX1/8+EwRFk+MBcbSZgAlCYJ450OkxMTtFpNGo3GaAJTLSzqnGMwGNDv98N1qA4n50InIa++h1BELsoipHWV/oMXgsIarPBYASvdDeaXFjF4xqYmya2hdBYVByn6uJGSJA2c8TjjyQcZWI8tS2xZkA17NFJNFInXLS9efJd3Jf/87/+TP7ED+BNHAMYa2kl7h/HmRwSiKarx2HEchzB3W49V6zC0Mk3DDL5XOoCvZMDbv6/TiO2RxVeztncj6l55FGn27t072gyvfL2AF//ji4zBMQU56jRNyYuCtfU1QI2UaiBU4xHVoI+Kw176wC1YW1/nwvw8sztmA5TX2gpBuBXiNhsNtAwnStrqBB39qjV5qUqSGAGQRGibjKrd4VQMJJZQLPToWGCygrkLZ1lfu4JGqoii4Nj279+DtTkrq8s89/yz3HDDDUxPT4NSzF+8yDPPPcett96K944oUpTFAGTE2uY6K6srpEkrRADV+xYVzn52ehZvPdlgGODTUgCBFyCQoxN8u+LS9r2yHelXh/r1QbN9n2yhI+ORg68FQQBEEjo4RZnR6/XY2NwgSeIK9x9XoKQIYwNGpa5DDYYDTGlGB1RdkBUAjQZFUYycsBAiHAYudDRq9GMY41albyIMPekOB7x89jSTnTHGxzs0Gk02NjYCp8R72s0WsYjp9fvEOka4SjkoL4gESG/IM9OME/Ujed776O7dM4t/Unv+E0cApTVk5fDbnfe318MplZS0ms0wPrnVClXsomBtdRWtFI00HZ1q9UV6Zei+/WYDo6r6K43+q40AaicQnlMGlZ2JidHpcokwaBW9lJXe/Cg9eYUvqGsKdbupDguzYRY0/ewWu2/UBamx5duKpN1+j7n5OTY3u5gKNVhXu+sctA7tA+RYYUw5EhNVtTSVqMXRq/e3LWKqayh1Hm1M3dmAKFYYU5DnQ8YnOigNCAvCUJY53e4GS8vLDIcZG5tdXj55GoTi3Pk5CmMxNkikh9kHqjJgg440WkeUFZjn4KHDXHHFlVxx5RVVtb1qvXmHswaBv6TFt711Vx8ezWYTpRTtdpuxsbHRz5rNJnFVcEyThCQJDrlOE7YKc2WYnTAYYK2l193kheee58K5c2ilwvjwSoG4yAvyItCC69qBc25UDKydc5wkNBqNat9stSmlDCKj3oeZEEorRDXFuS7qCVVFBBJEpLDC0x8OuLi4QHfQZ3J6mqwoGGYZ83ML5EPD1NgUk51xbG5whaHTbhFHCmsKBJZGI709juJvb7Vaf1Jz/pNFALffcRcesdM6fsh5kwRevyVREc0ooaFjpHFESLLNHsPNPjPjk8yMT7KxskZWFnXpaqTS6qrvnfBI5EgNyAN5WUJV5BoZZlVcq43llTMBL3EkI0Sep9Fs0u31WFldrbTnIaoBQTXn3FqM21YfEHKkKyBlwIrXjqOWmWo0GoGxVriKsmpqhe/aE4XnqXARWkuMcTz5pWfYNb2bHdMzDPs5ztdYYkFpSowzoDxCe/pZFx2lIBTIMOmoJiAJJM7YCvgkCBiWwCX3iDASW0dB4TaOg5SWSMhyy+paj5kdO0iSJt3egP5gwJ44YnNjg8v27mdmcgdPHH+G3kZJpDt014Y88dCXuPXm6xFRjJMx3X7Gc8+/hFQxhfGsbPQpvOaKa28mjmPOnj3Hc88+Rz7MieMUIR2qokerSGOcDaPN0pQsy0YOq07NhBAUeR6gvpValLdbyMCxdocsLxlWUOAwBtzhnUUIaDUbCCxKeZaW5llbWydKInbu2BFgvj5cI+GDDoOrZsYVhalSwtDirId8eB9mPXnvK96VCH/jZFBwNiEdMWbIYBicIt4S66BuLVVo4Q6KgrJKC53SDIY53bOnGR8bZ2pyGg8UKiOKFHk2BBMxMzEZ4O1Fjikc3ofx62vrm0mn1fqhQW/44f/7X/7Kwo/+3R//2jgAaywI3oEQt9akHEEoniVxzHAwYH19I4g7VBroznnGx8dDX7+qsDvvMFWvvTY4JUPbTFZCnHhfVWYvheoKvjxa2Dqhq59LgbPB+KSSaCUprWFubo6VlZVtJ7y4pNgXUGhBFqp+arftdT11yhDQgVIq0jQlTRNWV9YpS08cx9UJVEuNyapKH9KD4MAkS0srPPrI49z02hsoMkOaNur9VJ1+baJYU9gSrEQnCVIpdNVHpiowVZ8c4YND9WJLyqooyjBdWEiU0uAdxloipTFlQVEYVDV7IMsKut0+zgmuvvpa4igmyxynTl0AEkzpSaKEky+dYuf0JJddfojcWdY3emxuDkiSBlGcsri0wqNPPEW71eHihfP0uhsY40kaVbHOmuBUjac0Fi/9CLdQpwFFBaypuz5F1QmBqkNCRdu1jmwwJK7w+qW1aKXQUmC8o5L/RypJt7fJSydfYmZmlunZaSweW93bOEnDNXNB9bmeKNxM20F2rFJEKsuC0uQYV532Og48h1F9SJDnhiwrQZYkSZiEFEcafEJWVfi9c0G2UgS6c27C4BGhFf0sY/PsWTqtDrtmZ8m6PRpRTJ4PibfBnCcmJllaW0HKUKfIC3OrgHecPnvmN/4kNv1VIwFvu+1OhBDTHv/PhBBH6+ZzFAUBBC8EK6urDPMseG/vAsrKlvSHQ9bW10MuniS0O22yPK9628Hwaqrv9kJg/WFrA32lA6jXl9cRws2otf5cJaJRC0p8mcPY1nZkm7OpDX7ERxilFFsioh7L7t27SZIG1roKemoqPHdV+PQ13dSHWYTVrMIiL0jiCLzlyiuOsG/fHpwz9Ps9zp+fY2FxGaljdJwiZYQ1HqUkK8uLlHk+Gg+OD0hEV0lnS6WYmJii2WwRx0HcoijzQB4iKBiFXNyzc9cOLi5cpCwNeVESJynNdou1jS7PPP8i5+YukjSb6CRGSIGOgsLx7K5drG1scvLkKfr9IdaFa56kKUtLy8zPzZNnwxAel7aSFg8htquwCt6F61H37i/p2W9v+7HVtg2o69AmrUP1SOtg0M4RVUpDthJblUrQ3dzkzJlz7Nixi05nDB3FKB3GrVtnyYsc7wLZpyhzVKQwtiTPhxRlRn/YDTr+wz5ZNqDf79HrdavibTB+W4HOauEQ5y1KR2gd5MyGwzBazFeOoo6Aoygm0nEYgiokwoe6RTYMSsPtVpMkiUmTML/AeENrrEWz3UTHeqSSnESRTqKk04iij7ztnjcOP/q5T35Vdv1VRQC33HoPiALv9RuEELexTbFHSolQgs1+b8R+Ms7hpWBuaYHNYb8as7T1oZM4ptVsBkHKqg/ufYCfBqXfbbLbrxzuEf5xyfu7JG9n65SmwvHXIWVdU9iOJnsl//sSjMF258OlEYCs5gUURcHy8jJ7du9nbGyCxcUliiLH2pJaiKK+Xh4XQv2Ka9Dvdzl96iSHDx+k1WpWE4gD3j5sfheq5FKNQCxaBCETa201ZTgAfJygGqqyDQvg61HicgStTtOUcjhE6gDaEVJx08230uv1WLi4yOOPH8cRRrR1exkyiSm8JR9kxDqkFfNLK9z/4CMM85y8KClyE+YDRg5T6RAqqclMiXcG76CpFIUxYbBLNd3I2BK8oNG8VKl5O4pUCLFVW6m6TQKBsRVoJ4oCgq8sglaEkyM+hxCCwTDn5VOnaaQNdu3ey8b6OsMsZ2pykvWNNXq9gM2P4zgIk3jB+sYy1hp6vT7r6+sMh8NAw673IZ5IR5WQjQ6twEaLifEJOp0xdsU7wtCX3JLEijhp4VyliVA5utKVKBGERpI4pZo+V0GHIUkTEJ75hTkmxyc4eOAyVKLpdrv0hj3csIcX0Gw2WF1ZwxqD0vo2Y+0bVjc3//P7fuFX+OGf/uNTga/KAQg83kUthP9+IUQ7oPq3atGlMeHmVqFXQEmFU26QhYigZgKXZRmqmnFMUpYMBhWmXQgUW0q92zdBvTlGTuC/wgcIvwuxn3ceqQRCVIM6atZX9RqvjC62o+fqFGG7Cs/IsbCFMivLkuWlZZSMmZ3dSZoGwE5d+HMu5Jehh+xHMGMlBHjH2voaq6udKlrYMt46rCzLEnRCrBTehA1UFgGYoqOkem/b0Ifb0rJmxWdPkgRjGygFsY7wpSGOFdmwIMsKZmZniaMGTz/1POsbvaCOEyf0hhmIUFtQcRDoLJ3HZYa1k2crNKIK+byKUDIIgEgtRjMRkIHb7giS30YEVKJ3gfFRMzJfef3rf9cV/rJS83WuVg2qSECmHAl9xCpAnmvJNGMsWZ6TpE3GJyZZXV2j2+3Rbjc5f+FCNfNAsbSyTFkWWFsyzAYURcGgP6go2HVXot6L4bSvc8S8yOm0O+zavYt9e/fRSJukaYKxdfoqSJImqroOdbFXaI0XYdahtSFlLvM8aD1U+6PMh9gypygLhkVW6ROEQap5Hkal5XkZ2sdRRLPZbJdR9P2ddvOjUaT7X41t/7EO4LZbriVEsP42gXj9ds5uXagpilBp/UqAnro3KhGjivFwOERJRRLFlDIPLZ04xkZBSnq7cV46/otLIoNXcvi3Xr821Ork9Y4wiMd/2XNQGUudu9cpQl1gfGXbcguy7CoKbijaLS4uUhSmGi9ePbcLKj0Balx1v6hJT2WYkVAULFycZ7O7UUUIjigKeIQ4jpFxE500aDRbRC7MQYi24RV8JQDifPCwvtJNrIuiI05EUVDgMKoMohVFweU7dzE+OU1eWL50/CnOXbgIKNI4RUiN0jGlDQ4dKSiLEhXpgPAjQIahVkeu21yy4m34UfgeRnuFmoUQQQg0iL+Gn2dZNoLf1td+u7hHvZx34Dy66q2zbb8JQs3IOhtmSzhLUZQsLC3RbLXpDQZoEdHudJifu4DHM8wGrK2u4Hyo+dS1n8C5EEgtcTb8LMiyCTyBndpqtSnzkomxcfbv248Uis3NTebmL7K6shLusQ3EnunpaXbMzpIkCXGSYI0lywcIFT5rbosARnJb9SYQ1UyKIF3ez3LW+n0iHdFutZgcH6fIS8qiqMBfmiIvsM68Xkp5W2n8pz/wr/8h7/3v/vmfzQEgxxGOGCn+KjC9dTO2EzC2sOx/1AldD3OsT7BYRzTSNACInKfTbKEizcrG+gi9td0RjBzANgP+SriAYBSvrBGAr27yduPfDh39SroA/pUpgKijhWq4pJJ4GwzAGMPKygpp2qg2sQ5DOspiRGuuT5LAPAzFLFOWbHY3WF9fxVXQVGstcRIH3XodIWWEM0FNSCkxAgLVl8aJWs5qG8Kyep4wqDOuRp35EWbAeYjTBAc8+9wLPP/CidBl8ArnBMJJ8EHNeCuklmgVk+gYRRi1nRcBtaakJADq3MiJRrEe4TBGcltS4C3oClxTlvkl4f72a/5KTUdrLd46ZBRVhTQxuo8Cj67a0l4InHTMzV+kPxyytLIKCPbt2sfq6hoXFxYxtiRNI6SSlJX4yhaKkxEiEyEqwVAL1o6inbW1NZTS6IHmxEsv0e32sKWtxE8CuzWMgDOcPnOKOIlpNVvs2bOHiYkJxicmkEiyrCCKQoqHVIElKmoymcI5HwRT4hgzDJHh5mDIcJjTbrZoxgnDvI+XLmAeSj/tnPurrWb6xbw4UPDHrD/eAYR3cwX4t2/9qJ6wWhmPDeOvw/7aYtFdaryiOgL9SBI8iWLG2h0G/QFaKnbu3IVXkoWFhS1W1R+BGKwdwHb9v+2/974aG/b/p+3PfizJ8jw/7HMWW+7ue6wZGblUZWUtXVVd3V1dPUuTI5EcaUYgIYGPgvggQQ8C9KAHgZAASnzTBr3pSQQEUH8AMQQ0lAhiyBFmqF6mu6u6a8vKPSNjc/fw5W52zewsevgds3vdM2vpbvICiYzw8PC418zOOb/f9/ddpHrhViHxhQdrd0NRtzYynTYpAf9k9tulCPUMtqj6ebBsALIpKlEyp01w+2/LwyuSU+8cn3/+OdfzKyajSYr5bmQj9BobM2LQZLJ+haSSHITC7uWJvUIAn8g1eS4tiWQOuq1dWoh88MFHfPbkCWdnZzK1UJaIxrfiLSjKw3TCh5BEzILBeyclvDEZSss0x2qZkSvV4L3bqcbYcuudTwst3Piz7vrvCsqKokgA8XYzIEgF1J2WVhsgMhoOiERa73EhsrwWwxwB3zzD0ZgQI59+9oTVukIRCNEREdWf0t2GKnmFgBCV1M3nOXiZZLjg8T7yqr5AI1VPbjJMJu83KrE063wsQvDMF9cs31+Q5zl3797n8OCIk5MjppMJ86srubdWeDXRO3yU51ZnFpsPUK2ndg7tPI6Aa5eEgWOU59JepVATpdU/RPNVm2U//lttAD/4wQ9YtyNKu/xHwKPdJ01ILprgxb7Kuw7A0Yn0cZvos+VcKyU9TByNme3tE3xguVgwrfYYj8es12sWi0Xfr3/BqJMtVXf3BL9pj33TXVYesi+e9rdL+xubBDsVh+paie703a0ytlWFzKflQVI6Ahqtt5thv6l1WfZaodBcXl3y6uKCMh+kj6l71lnnRyB++TrRbbuItC8yF7cEJHnPKqkSux2oq3yapmGzqVBIyGbTONlcsgyUEg8Cku1ZlJFRcB6vpLcGJOJNW1G/JZlyB+RJam5I1Vent8gg+UIohaQYJ/+9wWDQk7Q6Km/btinMI9mFJ4eezn8xeglVbX1NTONlFyPnZ2e8ePmSxgWGoxF1XfP8xXOu59fJY3GnKlUdE1QWu7byOWLYbTFIoHLcWpKl1KhI7KusGBAOB107002QOuWgYlN7nj59QgiRVxevePvttyjyjOicZELG2I+QlTGgxUpdCFgRFQK2KAkRFoslsSwYjkb4GHHBo7R+VNX1PxoN9n78H/1f/2/8T/9X/4u/2QYQo2Jg5yeg/jFdIB6phAydDSa0jSP2I7xuw+xiu7bLKSYUtCujN01NNiiY7O/x/Plznjx9Sp5cYIblkGpTyenifOofu9IISaJJqTqoLtIrPeXRbY9b3z30Xb/6RdERcAN97stAJQg8aWxljJY8wBj6eO7uROxK8A53CEESaI3O8aGVIiDE/vqpkAhQPpAVOYPBlBgsdR3QOsf7KD01EmfVImGqURui0vgYwYuDkfxMIVEFL6cNeLSOaBVSwk/AKEHQW+dRygBiHOp9K/21UhJOmk5/o3bfs9Boo4o4PLpIbYERa/Lc5NhMHpGiyPsIc+/E6aYz94jaU5a2v+bdpigR56Gn7Xa6DOccRVGySQElbVtDjL2HYpFneBVoUnVjs4ymWnNxeU6zWWFsxsnhlPl8zunpM7Ks28AD3km8+m4VqZXCO0mq1skoNPYnWBQiUojJzi4dQkoqIOj8ROJWLhx9chWKoLcy8SY2nF9L5bX+iYS3Hh4cYI0FFVBW4duASaYyhIAOAasiNs/EUt15mtDim8B1u2H/YF9Uh3VtqKp/XC/X/49I/JX04F/TAkQg/gD0d7/sT7cR3Du92M4i+rL+fdurQuNafIiMJlPK6wXz+TV10/RCDKMNjWuFyaYU3nd00R0qbIrTDskuXKVk3Bi2WvCt6ejtDe5XSYvVjT+Tfyu9+SCI/faObze4bT+7exW3v9FpE4pBwLEuIHNv74DBYMxmU7OpNmwrZNXjKyEm5Fyb9J98z3ZIqfrqR1oUIcN0KUJt63rwUilF07YJyEQsyqzt8/bEd0ClNiIXi/Ik0MmTg093Umdpnr5r1+acw0STjEck9FRr3eM7uxOebgLQKfw6I87u93lepPsRBXxrG7RJQS3DgQRwbtKoMOEtdb2hqtaMx2Myo9lUS7yv0bpjjKb3kFrWLg6etOh7MC5tCv29TPddpYOn013Ers/rqokdHkp/OHbj5yAbw+X8EmsymqalrlvW1YY7J0fMZmPatpYDIlGubaJQG6XwriUGLz/faOoksLpaLEQ7YjMC8bsxxh9ExT/5G20AP/jBD1CKLAT+HYijL1tA/VLpWHO35+hf+L7djUEmBJdXl+zN9hkOBywWC+q6wXuRyA4GQ5Ta9CWXMNoUZV5gM3Fm9cGDc3jVncKqR+J/1es2dtB9bfe1dZf1iXm3izPI3b4tRYg9k/DmprMLLN52SpIwYykjN+uK5XLZ8+pjuJlorBL6TXKV6drskKYBuxtxB2RJCvMg0VtN/2DmeU7btnQc8u77b2/inXNuV55776mqqv88RVHcMFDtRl27aTy7P3P33+k49LcNX7rvuSncon9uBlnZOwKJbfuaxWLOarXCp3CWGEUG/vOf/xzXVTm37tXuvd4VI+3eq91nd3v/bz43X/YcfZncvT8gtACxwTvaqLi8vGC9XrJaXnPv3h0ODkSCnOU5eRI9DQbl9jqmp8ukisUkAZEAroqDg8NRdOHf8df1P/1//p/+7+3/+H/9P/vrbQBJTPMW8BvlEv+qC/LlP182juur68TusskjfTtd6GTEy+UCpcBazbAcsDedEmNksVxKzx1J/aYETsjYTf+aE/6L7/32BtBZaPVONOn0locygYxqWwHcwBh2T/3OE1F9cUPw3hM1PH36lMVyyXg4SnRUWQSaJOoxFqXktDXpRO+o1rvqwM42XCWQUWtZkN5vAdXO5KKLwKqqql+onZKzLMv093wfjyV2YrZ//93XurI9z/Nt1uFOAtPtBbZ7UPRGHcm805itgUlRFP33yM/PekWgQgl56eULzs5Omc+v+/da15veQq4oCqpKWklttpvabfOQX/Y8fPmY+eY6ub1J3Oau6C95FpUSE1jX+oQ1eNbrFU+erLm6Oufdd9/h6OCI4B26yJNOQdKJtNI4nzwS49bXQMangVVV0WxqMmX+blkUb7lm9fNf9uz/yg1AScbfG7/kz3Y+vOLXrLEvXNzu11ISKoqipHNhdS7inO+59lW1JkaPsZrhcMBoNGIxn7OpKgFxdHLvVV1+4E2a7+0FvvuQ7opPvvAw3DjFu8io2w9M3Pl/+hn65sXYJRDtPijdy3vPJx9/zEcffsRvf/e7jIaj/rTvvP+lLL8pfIpR33ir/ViwPxVX5HlBXddsNhVaGzYbaQM6rfzugtx12NklYu2ap9w+nbuNYBdM3XXT2b323d/b/d5O0nvjobS/HfVLAACAAElEQVT2C7+v6zXdOMU5x9n5KZ9++inetwyHQ46Pj7m6umS1WiU14dZXoKuMbj+Dv+rUvn3/fhl2tLseftk66Z65Gz+rm+ikqZKQphRGy8b2/MVzBkVJcDLJUlomGm3b9iB7XddkSkDYGMGqDNdNorRFafVG4/0fuuh/6QbwpVqA3//930cpVQL/PvD1Hejtxmt7IfmNX7vGHx0jLKQRmzGWrWhGeihBVz3Oyzx7OplilaF1W1ZVDEEmDN0Y7NaCvi097hZ+56+3axu9+3BkZhsK2vWcMgpUX7oJ7EyMbj0IX/zaLuMts3K653nGu++8g9aGJ08+5+XpKxoXcD7gg7Ao67rm/PxU0Hu17UXVdo6FMYajo0NGoxGZzSjLAev1OgF/oV/oHQd/13Xphi5i54Hd9d7rTuXbFm2djLf7ed33dot/NwdhtwXaVlX0LkC73y/4gzggv3z5kmfPnvH8xXOstbz55hvUdc3HH3/cVzIh3Ixe60aJXZDqL6v4vmyB3/7+25vHL8O7vuzv9n8vLScf/XbKFSFLuhBjxTjl/PSU5WLBYDBgNBomWrtoWqw1yTNSpjUqCe22ORVAVLptnNusNv/kH/zBP3D/7L/+L7/wHr+0Akhv9utKqd/5zZf2X//VjQ07wkoMMr/viDZivin+8BFPkecMBiWFzmmamkFZ0rStjE6SikvoojupuTsP2O7IsGP/daEP3c3astFkdq6VTt8TvnByp6v1az7lL8dDdkGw4WAIUfzhdBTT1bZtiUZhd07ZPLdpMiEjxn7ouSNUknZJJLYdmi6JRgbobNa3D29XVu/iIrcXcFee7z7MvXtSMsTsNtVtyZ7fuPa7P2vXqw+21N/u53YLo3NFVkrx+edPOTs7xYsjFdPplM8+e8LLly+o66Z36N193/3J+2vvE/372D2kdj/vlwHcvwoXuPGU3H5u0qmOF5AwduBe9OzPZmgtysflcsFPf/oTtFbs7+/Tk8k61+yUWyCVqRYmZmqDXQx41/6Oi+7rwJ9/2ef9giFIOv1REvD5kP8WX7sX03tPnTjuJO28jIeWeN/KQ6uFzjubTrl7cpc7xyccHhxQFkVC10NPGlH6y+3HuoUnqTDD/iHe/XN5X6EHvrq03t/Ukeg3+dzdKQdCQbXWcnCwT1VVMmNXsNlscK3rT+muL+7ArG4a0n3GEJN9eCKwyDWtqes6BWL41CrEGwu32yR2K6WujdidyzdN028mHdK/2z50xJ3uPTWNZOD1wZypstgt+8uy7A0+RqNRb/oxnU6ZzWZMp1OyLOf8/Jzlcsl0OmU6ndE0LR999BFPnnyWNp+b5K3bVUSMv9m9251k3b5nXwYaf5k5zZdVA7/se222dXr2wafcypbDw4M+2Ha1WvGnf/qnnJ+fMxwOxRuwb2dlkuScl9wB53E+0DpP6wNBqYdZnv2dJ5+f8n/5D//PX3hf9sveKDBQSv0b2y92LUB3zPw3sg6EOJMQc/lnRS5pejmn6LPrjacocoZlyaAcsLc/Q6HIc8s6xUbHGGmXS+jMHaPC37rYdCVuIqn0Ro875X/fY0dJL9apGum4AL8OUPzlr53rl179YkkbTJblLJfLfjOLwePaRmiu1qSNqEWnvADVJQIndDx9xP4BllIx7++rLFa7zRTc6U87tL/7WrfQd01WOsOObnF1C3nXwVkp9QXnZa3FkWk7zVE7rj2RLvy0aVqcS1HguvNRiKyWK87PT5nNZqyWCy4uXnF1eUGMPv1doSHHGDCpdZHEpMQgZMvc/LV36Vec4ts/79SwafSquhCc3bbgyzacXRwBCPTGJdZYXAwMBiUQWC5X/NY3v8WnH3/KixcvWK3WfPrZEw4Oj7Zeg0GSoazOU2ahIbZNUpuKUCvPcojh33jz7Xv/Ud3U1e139MtAwK8C39k+uDJuEpVVB55twa5f1kv9utcuiCjMNo8ykaBEhJEpRVlkxODITcEgM+zvjRhPCoiRpsnQeOJkzMXFK3lfVjzeW9dC8uDrTEesSYCL0pR5AT4INyNhdLEDu7Tqqaa7fW638f31P28K9PS+f2CEMSdlGwryomC1WolmflPRNhvGo5w2gDUebTwhJMpRDJKYHBQ6JdD44BI9mzTr3252XZS4nBQOMP0G0LHvdmm4HQ+jawu6Sq1b2EBvwrlbtu+y5Hb75W7q0I3ndhdTCBKKGWOgrpuE3wSiFevu5WKBzTRvPn6Nzz77lCdPnlBVq2SokRSeJKk12+g4H+S+RSuRbqib/v67i333fu7mRtz2juw/1w16c4b3sc+MlMmLIuLSkg/pfuwyVEFj0NHSein7vRGH4eura4w1tK3nF++/z2uvvcZ6UxOwrNYNP3/vA7769lvpWQfXeCKitozREYNoGpSWQ6zxAUX8jnPuqzHyoy8+mTuvH/zgB92F+X3gXhoF3hgpfZlf/t/m1fHNxQYs4oJL6qyITbzo0WDAoMhwbUO1XtG6GqUig7JgOByQ5xafTuuyHPRJOB0POybItbNtHg2HzKZTjEoW3F1+gVI7/VRHbtp69P3NT3+Sy0wXdW3JssSW0wajrcSOoSjLEkLk+uqa0WiUFqdPPZ8iy2xnrZAMSLuFTlLHQSeF3eYyqB4TkOuV923Qrgdfd6LvpuGuVqv+v+Vy2c/eN5sNi8WC9XrdJ/rsRnZ1rrmdCUtd1z3e0mkmBNgT/kY39bHZ1li2dQ3L1ZzZbMr1/IqPP/mIxfIaCUwNQrVOdOfQLfiutE6fSRyaBdfZ5Rt8mQis29i69ujL9SgdKGqS1XiyZ9+JvevWzU7jiboNpEfEpFVZGROHkIxrtgnFH374Me9/8CE2y7h37x7T6R7Pnj6nqjaJfu/EQBRhZAoTU96bNSbF7QUi3FOo369dy//xP/g/3Hguv1ABGGMGIYS/F2O0vZijL41TJNVvCKj8uteXkWX0ToleFqKDv3vnmCKzXF1dcnp6ijGGw4NDcpsTcwliNNagnJcTJJ0EIQSi3pJLYoxoa7l37x53Tk745ONPbk4Adh4MkgTUWrmoIXghb4RfH0/+xZeIX2JUPUlIynf5t/I8YzQcs15tmF8t8CHy4uVLqrrFZKXQgrUAgDF6yrLEuVY2Ay0EEB0T4UbLSdzFahndeey3UmUF2VC6hd8t1g4I7PgBeZ73ZJ+eh59Ygbsnf9cSdCO3blpwmwTULaZd3EApTds2PRDcPbx5kROD5/TsFYPRkI8++Zinnz9hU2+S3VnK99sZyYb4RYR+l3DUbWxfBgrffr+7n6/7Odtqgf4wFCJW91li3x50TlH6Rq+sbj8SffydCltORVd1pcRtTl+eMpvtc//+Q/KsIPgW5z1lORC/wKbFmryPjRuPxj0N2TknIjawWPv3RtPpfxy8v9EG3NgA0sW5E2P8/vb3Aa1ulkh/m5PwC/9e2HHvTRebKKO2PMs5OTrktYcPCK6lqWsJSWwa6s2GYDybtYBcSqlUOrWEpMIKiZK5e3p3D2mRF4h7TkqW1Vvf/a5aIN1spRL/P/71P/cWZc8R7jjb3r27CcYwHc04ObrD0ydPaZqazOZcXi2pVzXz1QtAUWQFs9mUxWLei2W0VlIGps+r0qiyO3WNsb0ngNZfRO87gHGXcNOBUrsP5O4Mf3chd0h+FwZzu23aNXjpAj52AUelup8rASMuqf2qtsLkluvlnJ/95Ke4tpHNWG1TkPqVxNaso3tG+2W3U+bfBjp379HuveowlN1NovdfCAGb5WKDFyPedUYzu2vIy8nbVcs9hnaTY7JVRG5NRzovhaIocc4To+Li4pLxeMIbr7/BG288ZrWYy1SHiDWZqCCblkrJpr97AHbvPYTwfbde39Faf/JLN4B0wb4L3L1NfNiVv/YgSKS/8H8THKAjyHQgoErlnFaK6COudQwHA44Oj4i+ZXF9Tdu2yXVHGG7L5bJnuim6fjcTnXp6UGKn7CLiY+D09JToA8vF8obhyBc+QxL3hMQzCH8NwtP2Z20FUjEKct9lJqzX6x6x/9a3vslv/9Zv8dFH7/Pq1bn4Btqcjz9/xqauaZ1nGRZcXJynh0Xem1QliduOVBkdELj997fgZqel2H3tnn5dyS5jw20IZvd93dc6sk/3td2gzu57b8/idzMZtzgBCMaUFoKW+bgjsGlrPvj4I+q2liju9P0qOWp+KR/r1ut2H/9lZf1NbspNF6rbBB6txQxF64y2bXbGmNtr1AvfuusQknpUqcQm3X1OSI7IdWqDkjmpc4xGo54HMb++omk2rJZaouGDeC2KUC6Bvq6VQBKteyvzLqIuhnjXte67tzeA/kn4/ve/z3g8Bvi+Umq8e0G2JdMXy/a/zetmCSbyTtMl5EVJQbHaUOQZg3LAaDTGB9+j0dZuhSsQca5lMBwwHA3FO27n5BdHFyFLXF9fc3p2St3UN8rELwSGxG3Fo3/J6fGrXvKzkz+8iigVMFYznU0YDgeiFDOKwbDg0cP73L9/h+9977t87WtfIS9zTs9esF4vaX1DRNBinRawMYamrWmaOrUXHcFnOwbLc1FW7pJvus/atT67hKTdz74bw7aL8MOWQLS9d1vi0O4C6zaK3VN4NztSHlRH29RkmRW/ghhZ1xXnlxf8+Oc/YVEtyZIdWWR7+t9A69NCut3P355O3J7h35717zIbu4XdG4PQ6R5K8rygqjZsNsneS0nct9KIwUmyd5MBz857SoEACpM2MH3jmnQv732iQctmsLe3R9u2vLo4Z9NUgKLeNOwOGrI8w+g0ou1kzGorUXfejZVW3/+TP/8Z//v/zX/Y/72+AtBas1qtDoDf7r7WI/R937/dtXcv6F93wd/4+TuAm9BtPYrkwBIsWilJIk65d9EHMXIcDBmWI8aTCatNnXqy1GemklYlvLa3/tIGkxZ1lVJqRMkWiL5DbelHfm3bps8e/safs+sPBbRKIJ5WaRNTQm8eFAwHOZlVOAPDYYFSgcZtKIc5a1dTNw6D7k1FoZOkdiWkTidkp0TscIfYl/mixf/lTLhu4+hIOrunN9BXB11U1m5LcLst7IhDHa7Q9aS704aef5BasTzL8dGLT9/ZKZuUvSAKyM56LCaUli89h24TrLr/dinIv+x53H11FcsuWUksvXJ8K6Bl9yZkht8CgSzvtBKWEHbaUMRhCSXkMsFq5f5sNpv+nsl1l+ejbaUdOT0949Gjh9y9c0xZlLI20mQuBHFC6j0zQ8Rmqe3zAoDGVA0o1G//ve9/98C7cPGFDSBdjHtKqW9uF7/gl1F3Bg5bD7obwpe+lPvVi+JLN4D0kl6bXnnXjeRslolH/VpQ6PV6TRs8s8mU2WQvXdztA1/XDU0jnOlu9B7Tn4UkOgKJOLPWJiOMpn8/u/1gSAYgOmkNpAn4zT/nNp57m1+nlGI+nyede8FkMuHk5IQYPc5t8KFhsbjkzbcecXDniL/82Xtc/NWPsZlG+86ZSGZfx8dHHB4e8vHHH1HXFdFvDVG71dF9zl0nZJmZ73zOndHXLgi2C97tEmE6wdDu6b+rrehi3XdP393cv74NSAafbd0wnIxoK0eeFXz06cd8/uwpyqZjNNziWKcR4M1naYsn7Jbwtynev+z5271/3efcekQKGGyMZlAOoBCgs2s9RfcfuHfvHoeHB/z4xz9Os/pOqKNlwQZNjLKh7X6etnX9ZrPZbFIcXoc5pHFp9FhryHJLu2llXaZWoRM5ZTbrMSwgVZ6KqCUPIoT4zUC8F4lf3ADSh/+2UurgxgXqTuluNW2l5zc2gl//6kYht/6WApRIYlFIQEjK2cuS7lxphTIKtOzCAdXLhl3rmS8WbOpa4q9iYr2FZJyAJOkI6hrxiLVVcKlKSONHucjy+To1cdc/JbhZHsRf83l3+236707YREdKiVtp8fHxMXfu3mWQWF95kfP4jdfxBD79/ClPnj1lmGfU0RGdbEo6Pdy///3v893vfod/8k/+CR9+9AHX80V/SnYBpVqZHiPoDToyGfkVRfEFOW5Hke42rO46dJtDN17rFv0uX78Td+2qDoFeN9C1Bt3UIARPcI48z2iblrqqoVWcvjzFuxZMZ78u5io9tqFun97iz6i46Sy8u5HpnSqzqwxvVEPp3iWES7CZ5DYcQsSHiNs0tO0FhS178lJR5mzqiqO9Y37wgx/wV3/5l7TO4bs2Jyl5NIYAeCdkN6V2cRDV03ezPMPaDJtZsWZTMJmMuXj1irfffCzAYZKi53nR6x660aNsSC55TWwl1z54jLEHWWa/7Vz7k+7KaYDvfve73a73vRhjcZOyGABHpCHSIjY0KdArdsDgzZOnm0X39twRVNQYXWDsAG0LlM0IQniWcts1tG2Toq88JrOYLGM4HtNGjy0tJ3eP2T88QEXDYlExX655dX3N5XyevAFcShNSRCzBKzQWg8WQQUguONoSlKS1btqGxjn5+ymvPaiYfPYDPrqeVCIPirrxXxf7JaNb+T3KiHxXC/deJbxCaUNAGIo2y3njzTd59+tf58033mQ42UOZHE8kKwxlYXlwcsiDg32m2jJwMM4MpQYTPJbA/nTM8eEB9+/fpUwkHYmv1hRlyaAcYbOCqDSD0VAchXOZX3e03S/r3TvRUdcLN00jFOXNpq8AqqqiqsS7YLVa9VVNp69oW2H0bTabvoTeZSiC8Bhk2qKp64bMFKyu1ywv55QmQ7cOGwNahf6Kp2afbZWznb131cvumO+GNNdHdFDoqGX05iIxaFCWGA2RjBZLwKRFK+QcieeOBCw2KygyQ1lkFGWGyQ3KaA6OjvnjP/pTPvrgEwblkKARAlpaIyF6jFZYA0Z5VNxWVcaaJA4KKKsJCorhEG01w7KgWq+JIfDs2XP29g6wWYHzUo9qY1FYjM76ayEHkHAjvHdCCgotzjdFiO57qIb/5f/8399WAMmBZQJ888vPtd/klL9FF/5Ck6Z6U0ltNEpFSAGRCSbtLZi0UsQ0r27qmrauyTLFZDrm3r27LOaSNGSynKZp2dRNz48Xy67OZDJtTp1jkdJYY8kySwhiheWdZPlpY6RS6OD6X/tZf9mv1a2v36QhWyOGmmVR8PqjR7z28AF3jo7E9SaBPh3TsiwH7E33ONw7ILYXHN854fTslKZtksOyuP5417JaLbpzjBiFt79ar9FGwjq9b7FW2ICbepOuQ9YTdHargN15+bZt2Cr4diXCHamo4xLstgZd1bBbRVRV1Y/atDHoCE3iHrTOs16uqSsB0vLMppPyVrvf//6XN2RfEOdAiqOT50tpjen+vk+tnXfgRVcwGZZoFYnegzEM85zYtxiK5WqJi/Jnjx8/pmkbTs/OxHKt2QanxrQ5Zd1m6w2r5QptdzgLHeia5OzapHhxoxkOhxwdH3B6+oIPPviA45M7WJOT5TlVXRNTsrTgO1u8y/m251ioZM8XY6R17TertZtkBYt+A0iv+8Bbv8FK/xu9Isn8okObe3cd+a3NMmbjMVopFos5bVtTr1cs59dcXQjbD6K4B41OuZovWK1WMj5JQRCdIET1dD5gh6Ch0gGd5RnBgWtrAQDTjejsoVTXI+v/ZghPnZUXIRIaR2EMx/v7ZEqRaZ2soKPwFxDgSCuDyXKi0TTes3e4z7/5D/9N/uiP/4jLqys29Yar+SVKQd1UuLYhBo9Js3bvXd/CCNmnJgRDnpFwE/WFxd0t3K7077CRrrzfTVbu+BNbtiE3NoxdM5COItw98LuVBz7c+Hur9Ur61nTax/60/+u/bvP6fQeOAlbLcZSEAkAkS2Xz40ev8ejhPZrNGoI4DeflgPXG8ezFSxabGte2OCKH+/t473n+7Fl6vuVzW6XSLN5jjBh4WCM24Vme4aPb4jKhiyPPev1DU9eUmaQQ9zwXY/jFe+/x+utvMijHZNb2Fumd/btQu1u0hzwfy/314iHgQkRh3ipK7gPvwc0N4HX+W1b/gZzQ0ctDqHfiwpRSTMdTvvLmG5yfn/Lxxx+idWS9XHD6UqcI6JLJbJaspxVVvaFNqbHdCWtSndGlx/Sc+PTQeu/wrkXF0FMuVSordR+z9bcbc94+fSRIMsOgcHXNZDzkwd277E3GRNeiY4Do0UpkwJEU6e1hva65uLriwf2HzA73yMqc+XKOD4HVep245Cl1NgYs3WbXmXZEMi39orUJxGu35JzbJ/bua3dcthvbdXtM2CH+uy5AW8KPuiECAnq2Z9u0ojRJP6tp2sRFaMgKEfh07My/yR25YVhCRGcmScYjWksQR3Sew/0ZD+/dJ9OaennF3/nd7/Lag3ssrmSDreoaTMbnz19w+eqM+UoMQ0el6DfOzs8ZppTosijYNDVCDlZCbU8j4KqWQByTGfAx6RO6019iztCKTb0RUpQyhOB59eqSxeKaO3dOqKqNeASUI7SWdeHatt/w27bFpWei28ClLU5CO6seeu9etzbbbgBpcXwDKP46F/g2R3p3AdxeDPFLxFhCsBGnVefEkvpwb5/DvRmZiVzPrxgOhPb6alWhtcVFRd2xnWIgLwoa5+QkT0hw3CHsdDPz7j22raNpG8aDAXmnXVfJTy1tCoptRRB2erXbc+bbuvndOXN3onVyTa00OEduDIeTKQ+PT7h/cgwEmnoNcT9VAEIacR6ePHnGZ58/I6C4XMz5L/7Lf8Z7773HxeUFeZZzeHjYI/yZzbCmJRJ3CDckpZzEZVkr5p7WWBkRJRpw0zQ9sLf7ubr/usW8OxXYfQa63rsbmbVtm7TquqejEpKTaprjd1XKrrHser3i8vISnbz+le5IZ1t/h1+38d5+Nnu2qY5pg1VSIQbPqCx4+52v8N3f+haHe/t89vHHnD5peXh0wMFoyEAFVuslmozaB5RvqRZznJOye71eYxKgqpKrlatboo9kCWPJrFzjTiEYUdKKJC3H7akTIY0uYxq7es9wMGS9XiYhleJ6fs3R0Z2tZDtVVx37U6reSF3XvR7CuRZtM1QIxaZuvvH23ZP/vN8AgoSif5O/wWu7AH55qSagDJAW6e7N0go0FhVhsZCyfm9/wsHRAYNxQZ5nXF0vuLi6oq49V8sVq2pFTCWTSpbLkroLUl6ID7ssym4T0DjXcfkDxoi/4GKx2JpF9mqvmzPk2w/Yl20Au99zgwWWvtY2LVmMDIqccV4wyix5mmyo6MizrcQzpg3pxekrXpyes6wqqrblcnmNa1tslhNQ7B8c4p20C8PBiMWyElBNdcmNYq1mEXRYKL8Q3Bal3yV6dXP63RP+l7kpdaabTdP0vIDdkr/3ENjUghN0luTJ36DHE5I0+ez8nM8/fyb8CKPxvqWXakb1N+0CAJJWQh52gyJ6T5kZfufbv8Xf/8EPKIymrWua9QINZMZC8BLRZi2TQcmLjz7hhz/6IaPpjM3asb64EhzBGIajkeT6ERmMpezePzhiuVySFznnKXsQFfGxa1dvUqvpWgbVgbFyXq6WK4oi6+/T4eERrvVcXV1xfHRPRoh6+6xaa4n4npm4K2rC945C3/yP/5N/qoBokwJwFGP8yt/8En8Z+WW7WLz3EBRGfMrAyFjPGE1mNTq12zrtqnlp0FZjC0MgsG42zNdrqsoxr8QbzloLSoJJldZkeU67o6TazqgN1pr0gKreNSaGyHQy7XdN3wV5dp/h1qLuLuZuKfuFB23nZNw9hbcEJ0WmDPvjCXvjCYXWRBPRUTYlrSFERXCBy6trfvH+h1xezWl9wEVHnei2HbuvacUqjGjZVC1aGdogopoOWBKwTVBvmaApxFtP3XDvvS3h3f2snUaiIwltmYZ5Lx7adfAZDAby+VGoMjIcDnu9wXAwwIcgTM1u9ArkecHJyTGr9ZJmvrkhvvlN3Xx+2atTSxofiG3L3nTCN999lz/8we9zcrBHvV4Ra09oJUgUk7OqpW9eN46PP/iIH/3kp0yPTth4WJ3Nk7U3aC0TldFgiG8aovM8fPAmeT7g/fffZzKecHp22ovLfLL10tFQ2CJxXuKWeKagbhrR8hvL9fU106mU+/v7+0wmE5q6Ta3bdu1t159kTaC40f50o1M5qONXvvXOW6PvfvOdpU11+X3gzt/mIne+frsLf1eVhZKRClqjMvHzzzJLngkSXNic2XiCi5Hatam/b7hezDm/uGRZVdQN5JnG+4aSEpvnaJNAK6XxCOcieg9huwl0JIvuwW6ahrap0aMxw8FAFkL44hxjdzO7bRzyqxxjdjnzqBTyqDWT4Yg3HzzkzcePmY3HZJnBKwHoNtWaLLNEJQqvTz/7nL/8qx+zWFUoY1NrEEFrfKKU/vN//i/4kz/6V3z+5AmL+YqgZGPtBEddMnCWW0JwlGUpjEllGI1GvZ5iOBze+Ey7Kr7utN6WsVs7td1r031/t0kQhc2ZZzmZzcRcxEswrG9bPGkzRpycJ5Mxy+VquxFpiB0Y+LcAAbsq0CrIvOfenbv83u/+Dl9/56sczmbUqyV1tWKzXnB++pKje28QTMayWvDeez/j//fHf8Rkf5/f+u3f4Wq14o/++M/Y1LWkFRlJVOro2eumobAZTz9/ymK+4vD4kIODQ548fUK16cxJ0/g4boNzjdFb8xq2mossy2jajSQcF3INDw72MSaDKPfOGoNzbU9Y8z7hHTu4l6RVQ4yJWIW6ozH3o+MXNj3T9xXqBPWb7rQ7ZTHqV+7Q/YMVOvKFjHV02gk7lLfINUUhdF6iLIrzV6/YNDXz+RLvNcGD1wKc0C00NGWeo1Tb95dea7xWSfWXSBW+S4ARxyHnJUaqGAyw1RpXd3Ldzjvg5slz+4TclvpbNVrnlxCjaLuLUgIuvINcaR6/9oDv/NY3uXOwR1lYsiLDEagWGzZ1xSiMRN8dHMvFgvPzV7gQZSadQi9lTu/Is4xPPvmUmIgfGhnxRSVgZp4XkjuvxMuhKEqKciCLtND9iV4URW/i2W1w3WjvNurf0YC7jaMjEXWbxu6G0LYtBhGurFerZCYSBT1vXboPycU2BJqmxeaWwaDkep5EYnS7sRLmn0qAbXryZCGltiORyUT4EtAxYrWiLHIGRUGZZRyUA95+/Drf+9Y3JSF5tcK5hrwYsFiu2XhFzHN++uGH/PxnP+Hl2Qsevf0V3nz7bV5dz/nTP/tzlqsVMYhb9Wg6wcXAarnEO89qucIohcZA0Ny9ew8IKTYt9p4Xno4iLB4WWZajozzXPrWu3nvapsFqSYQq84JhOeBgbx/QPHnylOFgTOO6e+cJQWjg1mY3ZNfimJ3SpIjEEE5i9PdB/cL6CMrzEM1Mqa2a6ZfP/ju/Psk+F46zSIZ3xTe7ZYn8WqKmQvCEJpDlGp1nlHmGJlJkniLzWOuI0VHYksIO2aw8rpKlaBAHFJNlKGVRQVEYjTYWEyKjUY7HCyNwB+FWShMSv9oqUNaCsri0lek8JzaN2Ip3u3RXMqFuLP5dWXFXUnnn0IiZaXBi3OF8JLQtWkVmgyFvv/46f+8Hv8eDO8dE3zIoxYyjrSquXl2yf3KAMqIR964VyyvnhbVIxMeIsqmAT9ZgRV6QlyWL+Ry0SmQmueGuCSyXa1CarGmIwdEEJ/PoJHUuioL1et2DRd3n6jaBbmPYlch2voBdRbDLAuyuTR8JrwWQBdXjD6hIKgQlMi2QhDGKzBrywoohTNqII+LQJNRfiS3ruPUxavlzNDE6tJENwsbIZFDw4PiYr7z5BpPBgGFZMh4POTjYY286oK1rWh9R2ZBPnjznL3/yHs+uaz758z9ns9lQ5Blf/erbYAz/4r/+I87OzgRLSPJ11zgWVwt8DDSuxSUU3itFQBR+T54+pd4sGQ5z2nmV7LoNKloILUpHjFU43yQyWexp2lorVAhoH9Fec/fwmId37nN19krAR6XIdBBCW+sSqxW880QXEpMzT7wYoYOHpAfRVs9UUA8hYj/+4Ey9+ebJG7+50HXnRAwkfTa//m93J4xRyWdPdPDD0ZDSykglT8SUGKWUvHv3HlrnvDy9oHUhgUGJvhuk1wkpw25vNsMFT+taVCljr8Fg0M9VY4xcXV3Rtm2amQ6lT0aDD2TWELycrD5ZjH9ZQbQLdnVqr/Tx0kSDlKsnsdPT8ZC33njEH/7dv8Nbr7+Gjo62hnKQo43lcjHn8uqCu9UDQKin88Wcn/7sZ7KYXIsyIoaKLpJbC8YQvMd50ROo3hAzjb6Svr67xoNy0KvIOnmqdy4JTtovzQPoFvCXyYF31XG7G33nAFTXtbQBJoFQCcFvXZdB2MWDy0Lvyt1qs76hK+nEYjeqzo4kFgNa5b2cNRJxTUthDQ/u3+PrX3mbg/GYg+mEcVlgjaYYDgkEPvzwQ5xv+ezzZzx59pKPn7zg4nqJQxOSx0LUmr/86YesVksUAaNNimeTx7B1DdHVks2oE83dKLHm8p7Wt7w4e8FkPMAo+XoSpuyQmHbaylQ9ahMFpI30lmcd0Ki0ZrVac3p2ymsPH5JnFheQliRNXcRLMpGBuo1hZ3ojgLdSEfXGRx+dKfvo0VGmlHosQNBv5nbTSWW7S//LqoWbTCzZYrTWmEyTFwIWTSd7HO5NsUTqdcV8vqR1c8bjCY/ffAulMz759AnV1VystGzWa+B9YmlNJhOOTo5oXMvzF88gRo7295hMJtj0sNZ1zcCK2OLq6jqBWCVozeTePS4vL3m5OcMog04ThfAlzc1tmbQ2WqLAdWfR7DFKMI5vffM7/Na3vsEbrz3ktXt3wTf4JmBzjcmkdVpWS15dXSTlmyEEODs7TyeObHreeSSpM6XDIouwLEv5fLFrQ7YMSmNl8tFLpVuHtTIntmnZdCX8Lmq/KwzaxU1ujzs7BLtT+e0qBzsikaQ2iZBF6SxxbqSVEGVkhnKeMi/Z1BsGg1Ls2djJEkhee1L/08toldJpSCBsSGMV09k+b7/5Ju+89Qb7kzGDLMPXNXXbcHYx58XZS07Pzjg/fclyscBHhS1KitGM6d6UJkDVgvOB9cbJhEoXacMBpQxROaIKaCMEnlRMkRcZ5WBA0zY0tSdqWdhVu8FvHF6lZymKl79Uy+bGc+W8iHaMFRp5pjUmRIrBgGfPn/PGG29gcwGA11XFcDwW8dV4JC2ZTz4O7PgbaAV4YQzaDG0yytKjjH387rtvZFZr0gag8L+h63VXbgjQln5xa6ncAMoSqNPBbNZmjEZj9mYTjg6PKaxhs1rSush8sababPBBLpCxmZwWMaAIZFlHmdyeTKPRSBxaqhVKa4Z5xmQwwMbIdDhkPB7x4sVL1lrjgHFZcHh4wnS2h9IGYy0ffPQR56/OU4quQfLjv3zzu9kOxNQGya8lew9Ojo/4w7/3B3zzG++igidLQY7BRbLcoqyiaRzrTSWUzqiwNmdd1VxcXDK/XuCdx9gco7SImIxUPt47AfxUyohLopU6yWfzXCoAmxmKImMwGtG0KV3XOZS2Nww/blt8dfdtN/wjz/MeE+g+/+492HWf6aW36XlyzgsIbBRRTgHqpk7TgJtgoknTnf4AuYHKJmmwsuKc7CNGRfIsYzopmU0nDDLN4uqK67NTfFNzeX7O1cUrrq4vud6sQCnefPwGv/2730cpzeHxMVerNT/8q5+w3rSEixXDrCTPLG2zYVNVcsp3ZC0j5B5hMCkm4yHD8Yi9/T2GgyHPnj/j5dkFTWzRRtM4R+uarRApiqahCyqJUUBbYw2TyZBX568IwVOUkg2pWsfx8QknJyfMF0uyLO+tv8tygPMRk1rVXf6GShhY27YiKkq6Bp9kwqAfhxgya5WZAHdiUvz9ptLe7e6yuwl8ucZcaY3yEIIjuEDcBPIiw9gDrM3ZVGsuXl3RNg0XV9dCfdQ5TduCEuJEICaloMy281SuduKTdSW9bNs0mEIEG1KSe5m9DwecvWwgOO7fPeH+/dfIsgIXPBeX19SbNUWW4RI1s229KBB/xTVITW1f48RkxVzkGV9/5yu88fgRRE9mNQoZUdrcJNvzIOowFI0LtK2UbsHD9fUyoe0ZPkWRx6hovfjM6V6lFnrdglKat956E50ZnAs41/Ds2ecMyhHj6ZTJdCLTiKLA7Kgdd+/Zrox592u7IGC3EXT4wJZktTX86A1bUmSVTlTYiDAtszzDe8EslOr6VUvdiOWW9x6b7USIkb5+SwFgFMTkqltdb2gWV1yfPWc8HJFZwToyq5nMJhwcHzLcnzIaj3n7zbc5mO1T1w2rquLPfvSXnJ+/xCjDVx7cI7cZq+WSbFZysP8YYzRNU1NvNsQY0FmncwiMRiMGg5KyKDHWcpRl/LR1PL2a44IcWjYT52DSGLZLg5Iwz0AX8mqMYTyZ0LRimNo6z2w0pto0vP74jW0ISiNJwk3rJBTHub4q7PgZIQQJDE2z/07/oI1UEJu6uVPXfmKVNfcgjoFktQS/HADcXQG3y4IvWSA3NoLOFznStmLldX7+ivt37qC1RZsM52qyrGS9bpjPF6zXGwap9+kow957oZG6lvt37nDn8JBNVbFYLGic9J9NkZFntn+jeWbJc0tR5BweHnBycsKgHOJcoK0arq8vqNZrxqMRLXB1PSeqLm7rV5uBdCi7Ch3lWLE3GXPvzjF7kxHGaKxR4KWlsEYe5uV6BSajbh3X8wVV1aQZpma5WAlhhk7DH/DcdDfuXmVZcnFxwZ2TE/69f+9/wg9//Bf8/Ge/oG1gsazwHgajEZPJtK+i8LJx5HlOXdesVqsv2Hvtav13bcC63+9SgbtNomMTdnJicbUxvcZB9P/CjVdaAE1DhnMBpS3Gak7PXva+9z49uDFVmlrpxGBQEOQQmAyHTIcD9mcjjo72efz6Y/ZmM7GN02pLT7aGtW8AzagcAYbZdJ8f/+SnfPTBB+wf7fN73/setnF8+N57fPurj/naO+8Qo/D7vetyBiybusE5z2K5QEXI7ZaPn2nFm0eH1E3DZVVhtbAIsRrvRKkZnO99GohS9tfNBu8js709MudZLlc0jWNFxWq95hcffMBisUBbSzEYslyv2TSN5CekexP6zVMi50MI2MxCNLRNQ1u3ZIW0md6HsTXqnjVG3w0hDOUw66iXv379/7rXbjmiU5C9jCMUREGTLy4u+cV77zMdjjFKMRxM2NQOaze0zvPs+QsOjg5x3otcMgRoW2xmGRQlk8kEpTXL5VJQ4pRnv1qvUvkrIy4XHEWZ8/C1BxwdHQngtK6oNisur6+ZL66JKlI1NW2IuBgweZacV37tB+1nzSSTi/3ZlKODfWJwsrsHQ/DS+8WoaF0EZWhd5MnnL3hx+or1aoNznhAi19cLqThVZyWVZru3piy7r7IsuXP3Dpf/31fUdYUxg6QozFOLNJBGLTh8kvreXsy3bb7Ksuwfqg4gFLOKrfPvrsvP7t/13sv9QlqWLLPJuz4RXogYrWmDx7WSvdi6RqY9O/iCnBvpZ6Kk0NSK8XjCu2885muPH3MwHTHIxSdxOBwl4pmn9Z33gLDlxsMxWluqxZrrizk//Iu/4LMnn/LWo0cc3z1mfnFG1jr+4Pd/h4P9AxSBptmglcL7BhTkucEbIAQOpyPhtnjBTnxuKVRkU2+4O5ni6pZ5KyIgke4KwxMNwUeCTxyHCHmW9wxAuZ4GgsMmYPyHP/pLZrM9xuMxe/sHqQJTfeJT59+gjeAmfXUXtqIqHyK0Xrw0XBgaa+9apdQJMOyep/8mFn/36svIHUluUGCVnM5t2/LpZ0+YDcdYrRkOBixXa6qN0Co/+OhDxqcvWSwXsvuHQEwTgKIoxNvv2TMW8zlZkTHbm6Wf29C4Bm1UrwgcjYccHR8xm01pUvl6/uoVnz35lE+fPGXjnOgMfABtk3FHQN0aZ37pZ+wA3hAISt6bxJUl14D+BFO0tcf5SFGMePbkKT/52Xucv7piuVrTNI7NpmaxWKSNRYtcWqmbrXD6d+u6pi1l5FZVFdfXV0QC4/EI7zVaC9PPpAcvpHLaWEvcCerYpQCHxNLLdnr+3ddwOEQi21YAN0DAzmNgvV6nPxO9f9s2xCg8AB9crwOASGwVWVaQaVHCjcfjZP2dAEpCz40PQr1jOplx7+iQyXhCbg2DPMOqlk1VUa2WTCZS6ttMiGLKGDllneMX773PH/2LP+L8xTnDcsh4MqKuKqJr+a3f+gbHs32MNri2pW1qhpOZ2LGHQFNv8M5hC8NwUpLZjNViyWpRoYBNXZEVlrtHh/go8/2PX56zjNLuBBVoXSujaK3EZyJIS5ulbIjlcpUAR4XShrZ1DAbDfmJzcHDA0dERMUY2VcVwMICk1+jvV0TyFYiSiZACeG/hV0Pvw4mNMR7HGAY3E+1/7dL+ImXuS9uGzkeQnrgjlF8pN1snD+9yucRq6V9c8H2Qw3pdibsv8oG6vtNa4f+v1itWywV1U9PGQLbZ0CR9f902DEcjirwgy0VJKLrpHGMyqqJBm4z5cs1qU1N7T1QGHxEDioTUhsSs6j7yDSIQadHjRTkcI9FDtV5LWKWW9JyoFCAkjRDBN57VpuK9n7/HxatrjCmECGMtbduIkUMImEyjooBmOiZfwTSZCAo2TYMLnuFwxPnZK/6zf/r/JmrFbG+fp09f0rqWxXJJXTe0TSsiFpNMKbIMpaBxjjrFq+VFTnQOk8xWV6sVIUTyPLsh8+34ALsn/u64aTdgVBhoXa6gTtLtDkSMGCsuSc47XKIVl0VJtVlj0/crqfvRSISWbxpePH/B5vqaq/MzTg72OdwbcXiwR16UkBXUAeq6YblaUbc1Z2dn/OiHf8mLZ8/RUXO4t8+De/c5ONjjtccPufvgDoNBSVu3KDSmHECWJzZeg4+Oxhs2bcu63jB/8ZLcWo6Pjjh6+IDL81co71ltNoTgOdmfUg5LotZ88PwlXsGqdeggnV7rZKMVQxCV8iw83gvN14cg41oFzmuatmazscQYuJpfMpvOsFnn7aCxmdivtW2bMKNdq7dtmrM2QQxYI4Omdcc2RHcUoheMvu8tb4Jbt86em5vAr3jpzsgxhvQgjfo+0mhNVUHjAiEq2jSbjng8Xk4r58l1vtUTIDjwYCD01qvLK1bVSk5W36KqitFoSFlolk3NMHgyrXEhEptWKo8g81xjByyrwMV1RRO0qDOTjrsTjHjVQZvbz2206dlVndtLjE7YeqnsqpKNd+u8mERqTWi3iPpqveKHP/oJP/rRTwgRnPfM55ecv3rJ50+f8eLlC9DI+045CQAqiRWiFrJJjIFFVZEpgw+Rf/5f/UvKYUY5HFG3HhdgMjXkRSYnWt3ijabRW7GS8wHd6f+TCWXvZKQMSgWaxqXSvyPdbO9r1x7sYgLdzw5JD99vFMagY0hsNZIaMCNG0SugNGUxYDqdsVqtUUEitAwaQiAjoNyGplkRbMbZZs355SUfff6C3MBgUFAkGzhrDU1T09QVdS0b3BuPHvHOW1/hwd173Dk6YjYaSey2Am1k3FoUOYvViiZ4LubXXC0XbDY1MUTWyzXz5Zzr1QLvHXVVMZuM+b3v/TaPX3vIrG24urzk9Nnn4DdMxwPeeXyfalPx/OJaph8YXIzYgXgDBOcRx8AgI00FKtYYIkFJdNqmrkBFGldzeX3BdDpluVwwGY/7fAKVqPa9qYsPPYtTaaEsWx/T5hCwRukY1JENIRztor9fxnP/m7xuS0pBvMwn43FKthGrKW3MDsW1BS1IumbLtoNdZqGcMpvNhk0t/nOxU9HFyGAwZFBo1usNi+WKPCtYVhuiiwzLkqpuKMsBIWo+f/ac+XKJ814eguQroJNs1UXfqwO7r8mF1r2UOaqAiskOrWPCOUdVbXAuMBhkhIBYgQXP2atXvPfeL/jws09poqeNkagV8+WKly/POD07Zz5fYLT0ja2X6GjTTRxuTB6grluiib1F2aYJbNolo+mE2WjCZDrDZIb54prMWGLbAYnSz/cGLah+XJUnKunttJyewqI6n4WtncQuBtDdLxkNyvvtNs1uigNbq3KtxOxFSFo33YgkAbmLQZMpUp5biB7nWhSW9aZlqTz+oqXIMvLMUGSWuyfHfP2rX+GN119nbzbl7t07ZNpgUfhGnKbWqxUYqOqK1XLN8nrJy7MzPn/xkovFPI3xkpFNTJkKRkBoDcTW8S//xb/E/d7v8NYbj3n42mtMRwM+/eB9qmoNOudof8bFYsFqE1AeirzAa0WMGo/DGJX8ARRK7ehNEvdBxFaOg4MDmqbh6uqKEAKz2Uxowy7pAFJL4bvkJ213KjFFUeSYLGO5WuO9I8ZwZJXigP8WXruSWNlcoMgzZrMpe3szrq+vuby8EMaaVoJM74iJYJsTv/uQaa2T8eS2/NQ7qrKyLNF4rq+uJTUlKszlHNc6xuMJtijJ1xXPX5zy/PnzRM9UQjdNFyom08Vuji0P7zZYo0u48WGXK5DAuhC5vLjk7PycummYqonQPmPk+vqaP/6Tf8X7H39MG2HV1LQ6ogrL5eWcTz59wsuzc7xHeNu64xekdZSmIfJwbDdGH2KKBEubgzagM8bTKdPZFJ3pdAoqAcSUGFAoa7FIeaiMWKa7uqVRhqIs+uvbHQ67C3OXA9DNmzs3oa0BqLgw79qKdxRia5Nhie+uu7QNy+WK9XqddOzJ408FUB6tBXEfDSQ/UUdDvWmp6xaynOH+HorAIMs42pvxja99je9+65vsTcYyygsOomdT1XjX4pqa58+e8urqksVqwYvnL1lcLlgs19TO4bTCp2tvtUWjWTU1ZVkwm05lA/IeXzf82R//CVdnp7z55lt87e03GBcFP/7JT1nWLePxgPGgZLlpqBMGYI2VyUL6+THVmiGCToakMipue3LVwcEB3nuur+eE4PsEJ8w2hWlXqdk9szEEVDchgGSJFwB9YJUye0rdXKy3zvLfdMl/YQO46TSjhSGH2BeLqCTxuZWi7eid8Ys/Yxd8E3OL2P+6Z4VplRRwGb51LBcrlLKsVhXRC11yMBgyX1Zk1vL8+Usur69QxtAV+l4g2L7s7ieiSgtVk0CW5QyHo2SauaaLEKMDqSIslmsuLq9oWgG8YjLF+OTTz/jzH/2QjfNsQmTjPC56Wu+4Wiz54MNPWFWVREoFOXV0t9TTAazSE2NicheO9BJoGZ0lVF9pnPe0zlE3NaScAbxYXwnVMVFOvdiRWWOE+3CL4bdrDS4L20gijdrGiIHoBzohUbcBdO6/WWZTzmK3yaf8utYL4cuI9fauB/96vUyiLNEAZJllOhnx8P597hwck+mMarXhxYszPnt1SuNacq1RIRKd4+r0lMWrcw7Kgnbj0EWGD16ovQoa71hVK87OXlAOB8ToybOMwaBEO082HFAMBsz29pmMxxht2azXVKsVx8dH7O/PeP7sKW1TMygzXOO4ODtj8+A+BweHPHr8Os9enqKqDa89vMf1asmmjvh6I9JhAlaLUUhXK4VkUafTyFGxVWZ++umnfOtb3+Lg4IA//uM/YT6/5tHDR/jWQUy08Z2RrSwiWb/i2SBgoGRCRiJuz0Kc3vZ8v+2scjse6YstwhcBwN35sNYaFYVMIT5snvn1FSEI4UOIPiFZO8cbp/+uecSuG03HrNoCToG2dcyv52RGxm2XV/M0qvJUVY1SmidPX6C1otk0bOoakWhqXELbO/muorMx1301EAMYk0nf5SMVG7rAj/6kTtz2i8ur5MUuvd311SXvvfcei+UalefUTUsbgxhfJEqxj9swko5TEBLhSGnpuaOTURRK0TZOSB4GtLZpxCr3qchy8ZjznuBdCkxpyFTWT1RURIhFOzN/rWOSFMcv3IPuvnY0ZJ9m2buOSSGEHYWhbFbWyoRApLBbYFBMRTO0svJ/rSkHJUdHRymZeNlLg0lEtdlshjGGi8sLcGCU7bny601FYQ3j0ZDRcICKnouzU44mI6wxeN9sD5kYIXrGowF3791hval4/Y3XUa1hvd5IiW4MXgloPSgGDAdD8qMjAd2MYTyWzSgGR7Ve0tYVw+FQ8gRC4OFrDxnNJrw8P8dkGa1zfPb0jFcXc7wSXkLrXFJ6prekNCRKeAyOPC96Bab3gfl8wcHBPuPxiLOzM/Yms63/hdLMF/O+Cut4B9EHmrZFpfZHkpw9rXNTq7We7OrYd2me/U7SPdw9HnhrA1BfvgnsbiLWKMqswLcN8/kV8/lVigFX+Oill04w+e1k2Rvjt5hYmWl3k1/LIuku0GhQEHyk2mwIQXpy76Vc90FMJwvTUU4FZY9BhBMkvXZM1YVOhJXudM+znKIoqdbShjgvTC9xfBW6aFSwWCzFyMN7TPB8+umn/OznPxcap6tpghd78KQ5KMqc+w/v8+mnn1IMctbrFSpIzn1RFnjfcnx4yDe+/nUePXzEaCD05l+8/wEffPQRIbYYkxNcAA/j0YDjgwOyLGM6GqMCSaqq8a1PbkoKV20oBqWAcBFRMBqDzbIel9kVA3WLuwP/doM0uudmG0TSPRwhVQViU93lFHTmLOIKJJOFGCLDwRDvPWVZUFVVzyb1PghFunXU6w2r+RqrM7mvRS7jTSLOO2Z7e9w92mc4Krm+vkixd1nPiItePBgHg4J8eMx6swEMOQOePH3Gs9NTTi9eUbUNddOK5ZrO8K5lNBwwGY947cEDDvf2MCoyKnNG5ZAyLwREjhFrLCfHh0z3Jkz39hiNJhwd3OEnP3mfT549xViNtrLJRFQScYmYLCbPwC6LIcss8/mCTz/9FICTkxO8kwrPIDLjsiy3m4VLAS+d43GEtvd06J2CJnY6nY5uyzhvJKp0uutf1Rb8Cs+G7oEYDUcURhRgi/mC4IXbVjd175HW9ys7RJRtOsuuBn8XCEsONj6Iws3UWK0gBpra4Ttqr/O9Hz9KYfIcYzSbtqUl9ECkSqAfMaZKwKSHpsuJy5KvoPRmRWbSniiMwKDkfcyTnv9wb4INEuX9rW99i4vFmourOavNBudaVssFy+WS2XTKa48e4nzDT3/2V9hM+vU8U1gT+cHvf59//e//IQ/vP2BUDjFoqtWa6z/4fX7047/in/1X/5xnL8/IbYGPnma9xtc1mTbgYTlfSvmf57jkXFuWJS54Nk19M+LbWXSilIL0+E3T9FTfpmmo642YfOxEhBljGA6HfaZASNLZGEMa3YadeDFDTKYWZRGJUeLI67pmsVxQVZVIV3WNwETy/i6uFvgAbd2I9DZ1MoO8YDqbYPDQ1jx/8QxfLzHcI8/3KWmhFTKazfPeN29QFqzdhtFkyPn5Jc/Ozvjks8+5uL6mDo42RkxmsUVBW7fkZU7MDKdXl1wtrjne3+doNuV4f4/9yYTCWFzjCAOS26+mLHPu3zvBtRGrchaXSy6urni1XkBm+srT+R50Ejak2XoySnhoy2Kx4OLiom+zQKjWbdvK/D9VZF0lKCCho7Mcv8VlGZl/69/6h//boigG4/GY4VBGClVVyULU+sYi6379pUOCL9HOdmBQURScHB1xfHBM2zZcXV+zrip89GLjpboPrShSYk3HONt1oyWdxFpvAye7gMWOU91HZjvHpq5TPhtyyiMqvaIYcDCbkduMphUtd2dTLsSeLilIb11+lBhvEiXLrao2yK4g2IHVFmusoJ0hEINnb2/G668/RHm5ca89foNvfOvbvPvuN3j06HUe3r9PaQxNVfPg9Ud8/ZvfoCgy3nvvZ6zWCzKrGQ5L/t1/93/I/+C//9/jztE+w7xAe4+NkBlNZjRf/cpXODo+5KOPPmK5XGFTAnFZlBhlmQ7H1Osa30piUhMcm6YWsk+MokQ0hjYxLrM8I7NZn/i7G7fVXV+fItx2gcIODxDzyuT9ELqWLqXUEvufIWaxEa0t3jvm8zmbzYa67sJERMVIEDZpR3NVWlPVDXXjGM32KAYjFos5q+UCrRVf/9o7ED1Pn3zCYnlNXmaMx2OhBitFWRaYZI7TuoblekW1qXh5esbTZ6e8urrClAXXqyUmz1hXFVfXVyil+N7v/i66yDi/OBeykdEsrq+pVytMhEGWU5QF0RjyMk9gZ2qb8pLlfM3py3MBkDV4IuuqEuZpYgUaY8iMTSPnbhommErn/iOGLzmjobARY1r8zrneQFWldnbXqi4vStbVWujlITjz7te/8R9opfIsz1ktlywWCynxOhFIDEJJ7cv5bhPY8gQUYgjS7RWx/4flIRmNBjy8d483HjykriuuLi9Zb9apvtBiphHFj7/MC/b39hgNhDPgfOd0ulVP7YJ+3aLt2oZthWBoU3pKSLNn4YbD3ZMjHhwfo4NntVomYCgN/QMYLJnJ+pGfTvubNXIzxSVXbJx1CrAYDQco0txbQ+s9603F0ckJk0HBJ598youXZ1ibMx6P2d+bcefoiOPDfe7dPeHg8IDxsBSEWMGjBw94952v8oPv/x6/89vfZToZCyioOjv1NIqzQpY5PD4ky61o3ZuGw/09xuUQoxSjcgDOp9RYod0apcgTeu9alyYmcgONMmRpUTrXJKagbA7WiHrSt46QXI+7V5Zn/Xi380lQOiU/J4+CbjTY4RzeyybeesdyvaRuGupW2IlSxspmqpKZTJlnyT/PkRUlb3/lHaLWLObXDMqcRw/v885X36KtK9arBfOra9bLNXlecrC3J975w4GciFHGyShhUlbrilXVorOcTdNwfOcOb7zxBs9fvqR1jgcPX+Pdb36Dv/+Hf48Y4fMnT3BO2oPMWgZ5gVGarChogsRzZVlGkRfSRgfxe1xcX/PZk8+Y7E0ZTyZczRcobSEqrMnQQWGCAIF1m6y9fdxx+5H2azAYiCmMzZP79HZq1j3zMnKV3t05R14ULFcrvASXBnP/wcP/3eXVlTk7O+N6PpdTc8efTDalJEVJGMCW++4RPZtD69gvfpTGJSGCNZrJaMC3v/41vvr4EUVuefrscxZLke4SlUR3RUOmDYcHh7zx+A0mkwlFnoOC1XJJFw2tE0IvYNQ2g88kk1EZMRVChPEBlRmiijgvSsCj2ZSHJ0ccTSeEtuXy4hWudQLwobFYCluQmwyjIbNSHIjzqiwgoxXDQUlRZBBaDg/22D+Y9aKX1WZNNIbrdUVVN8wGI66vrvnzv/gh77//C87PT4VEExrKMuP48IA7BwcMMssgs9w7PubrX32Hr3/1Hd56/Q0GWYHaYc0prfEqEA1gFD6K7/vR8Qk2y4necXJ4wLgoyFDoKOEQyog/fSZ/jdwYXN1Qb2qMkp5dRdkAClsk0NejtLDUQhSOBkrhWi+9agh4J6CpNRlGW0lzcg6bmb5alCzBDsOJaWIjdGMUNL5lXq3YtA1VI2lFwTs5AWOL8w1GRcrcElwLMfDgwUOOj0+4vppz+eoUqyI/+P73+Lt/8H0O96esruesFxXrZY2Kmtcev8Z4NpHTNgpn3znRCYTWoZXh3oNHDIYj3n7rLb77ne8wHI549vw514sFddPw1a+8zesPXmM6HvPVr36Fum342c9/Tr2RFJ7MZpTjESozZHlBlpXktsRgaZuW4B3j4YCLizPa4GnalrNXF5isoG08mcmwAUyQa9a1sFI17Wy2Wc5sNqPICjIruJTW4g8Y0obZOQsRvfAoIhSDkmqzSaC3wV5cXOxmA9yYu+/SXkGllmBH/NIRQ+LW87zDCbW2oGI6NaUkLYqCO3fuMpvt8ez0LM3uk6ZeCbK6v7/HeDxiU29QakjTNuRFkXLpUrSy2hJNOoyBpBTsHWy1Jljxl+9KoOFwyGxvxng8Js+6UaQFmqQ97+LDTDJ9tKBjz5UH+s8BUo6VZcF0MiYvSubqmi4AQSuJhnrx4iVPnz1HBYfzjkcP7/P49Ucc7c/I8wzXNGzWa4ZlSZ5JdTAaDQVwzHOh/iZjxxB3MguilItdnoLNMsDw3/kH/4B//Q//kM1qTbVcc37+iquUn9h4l96eom5aDIHcRLwVe6nWtXKSoAGHVgFrEFRaadrWY43BGkOTyvmupdwd+XYLYdcopOMRdBkEvSgoRrzzKdW56e+dsaZnEVqb4doapcVVOHpH0zguz065c3KXr7z1mKGNjEclb7/9JvPrS54/e0bwjtl0Qrafp2tpyExBcDEZawqmY02Bmmomk32aYLi+vGa9WPDJhx/yxltv8/vf+x0O9z9iPJ3wlcdvUs2XDLIcbzYc7e1jtebs7JSBtRzt7wsN3YzYbDbsz/YEdEO0G8vFkuFwwO/+7u/wX//wRzz7+DO0FtYiSuNci7EZJhNH7LIsWK5cj790ON1yuaQoCrEJb1xKY5ZJgUru151JqGsTjTvE3stRvs9Yq5TSu3327viuK6+V2jKTlNG9ui8hPKAiIapOsCqnlBIvfJPSWF6envH63QdsmobJbIqWJ4uU6oVSkTy3DMucLDO0rWLdNlL+p8mAUVvTzl1iivREGcPhKH1NYazG1xL+qbXGpB59Np0xnc7YrNZczxfUbbsFABGqb5ZZrNYEHdCZzKebukmsrJw8z/DOo6yhzC3NZiPKweCxWjMaDGhbT/Cear3i9PSUIpOH/tFrD/nGu19jb2/Wm5W2bUtdVSzmC54+e4pSMJ3OuHPnpPfqkwho8TrUiGXVLhIfYyTLM7TVZFpzOJ2hYuDx6w9oXcvF/Iqq3uDaQLVqWK3WtG3LfL5gsVzhQ2DtW4Jv8G3AG0XrNvjgsLkYcBAcvm0x2qZ24qZP4m6MOESi172KsFv8HZjYzamFUBV7cFC+pyX4JK81GqMVmTHkRnOwv09hNS9fvGS+WPPej/9SEPZBTmgj//k//X9J8rN3DIuSe3fv0lQ1g+EQYyyuTQxElca6yiZ8p0BpTa4sJ4eHfPTpp3zw4Yf86M//gqOTOzw8Pube/ft88t57NFXNq4tXXF5d8uLlC4729mjKAdPZlKpt+Pkv3uMNn+TEIdDUIvB6/vQZJjEt3/nqVzHTCT/96D/eGqV0GzqAEWegwWCQxtWypoZDEQY1TcNqucIf+X6ddpRsH1q8jzgnHhzivmTRvjMLEU0OSmn7ZSEXuzdNvNfU1maIjgYrdhZEIVZIhLbemQgorLFphw88/fwZH073UdZweX2NMpaQ0MnMysx6NpswmQzJrKZar5hfX0ngQvLos9biCfi4/dDdZnVwcJjMKCrqWtJsG9+kvpPUn0dWqzWbTc2mbrhermickwfD+XSSCmprtaFuKxEQpbGRuO9GiizDlBLJFKMsCtc0EnWdiWCjzAuUNtRVxdVyxeF0zNHBISeHR0xGAwwRQ5T8A1MwHAyYTqcMLi64uLhgs6l6Kmx3f1TcshNUGl967zHJa6FxsgFl2uDaBquVJOFoxfHhFGVmOBcxMQdk6lNVG+bzOVW1odrU1E3Ncl2zcZGr65bNppbFj2FQFGRWgM4OC9h1D+6ovV0Vlifb9u6Zstb2f5Zl2U5lpZK1mun/vHMg1kSMznF1TZEXHMxmWCJ+bwNtiwsti7MXrIyMmvdmU4729zk6POHO8Qnr+ZJV3bA3nWG0oW1ELNZ6h3fyTGhkyiB2XZ7DvSll/jZ74zEff/oJ8/MzFheXfPrBB8QQqdcyAYHI248e8Y1vfoMsszIB2VS8997P+ZM//iOq1YpvfP3rlEXB82fPGA2HZCbDGEXTbDg42ONgf4/5qkoJVxGvZYNqQ8C1nqEac3BwwOXlJUUhbVmnyKyqSgg+eissEpu1zoELwKBUlPGw8jJmTMGoIUhYSlBK6d1yf7cS6Bca0ufpuOsatMNSS4AeSidKagKUtCFEuJzP+ZM/+3NslnExv0402gTeGcVwkPP6669xeLjParni4uKcs7Nz8qKkzHPCZiPlpxVUdpcAVJZFjwes1xWbTZXai0g3yFCIdtranDwfcH29YLXZoG2Gj12IBpSFjJPqSrzcSiOLxWmNRk6+QVFweHgoRJXQ4lzLcrlCxUhZFpR5gbZW/P3Wa64urzk5OGQ81oTQokKbBC4i+OlaLNnI9plOJ8msU3waxYXZ924yuy49JpF6SHoBrWC9nEOM2DKT/pZAVOIwnFlDljbqzFgGxYjDvREqaRW899QeNh7OXp3z+dMnPH9xStu25PkIayxa255n0S34XRZpF1mljeql393C3q0WusxAv/OZOjsrYwzRScpuR8IaFgXDPGcyyMmjI08iM2steWnIMsN4NOFgb49BMSA6sdauN2u0ihL15qUfdq4RQBWdpgzS4gbnGA1LrFYMHj/i7TfeoG4alqs188VCJhHKMhwMqZtNH9Zhc8tgOKAelnzvt7/LbDygWle0bcNifk2R5wLiZophUWAyy96w5K3Hj/jk08/QwXMwnXF2cSnpPcFT5jJSnUwmjMdjmqYhz3Nef/11fvKTnyTZtUxK2ihpV3VdY6zwaTrb+hgDvhVxmk6t2aZp8EEFG2N0SqmcW6++MtjV/e7MFnUn+gip3OtKfxJvnsQ0jeBaMSWsVhs8kdY7cUlNrDKlYFAW7O9NOTiY0dQVm80K7x2j4UDsjaPoy21uGA2HVNWmH4dobVivqz7HnoTGb009xXzC6MTycj65uyalYCLyDQYl+wf7DMsSV28Sg00koev1ShB0BaT/Hx0dEp3MZ4XhGFKIaYHJMtZrMZPYNJLx1jYVL59+zoPjffLjIzQpM1CZhHJ3vZ5GqSxtst1NTPFq3d3oOPlK9VZkJpmCxuBQIdJUKSJKRUyRid9eVDjXpJsVk8RWC6IfPdYqstxSaEs5OGE6KRgNS37+8w9YXF8yGkGeD2k2dc//73gaHVFok6yzMp3dwE92f900Te8ijJI59mq5Yr1ZE7z4BQTXElBYpXCtw2hNmWWMy5LR4SF7g7L3LjC5+OopZSizAdZk1NUGlSzrs0xOwo7Y5dqUCh27NGZFluVkhSQXDYYltmmFYzAoONjfTy1KS3ARawzr1UomHEGA1Xq9QlnDcFDyxuPHnJ+dMb++klg0K3FjlXP4tmEUZ1gd+d3vfJuL80s+/OwZzXqFiR6TW4wtKPIR3smkIs+FJ9FlL5alkLeWyxXDcpiUmS7hLhYfXBL80HsQGm3SBKbzCFTOPHj42r+vlMpvZ+Btab/bkl66z6TsMrpfDDGGNI/XSRYr5gb9Twxedinn02gupuohUuQ5k/GIvb0ZgyJjMh7QupZXry7QSvP6o9c5Oj7GuUC9kRQbY20fmdyxzqqqomnqBCz5xB/fhkqKh6NhOp5AVLw8PaVq6pQuJKfU4eEhs+kMV9fU1Rqt4OBwn9l0ymI+TyX/ts8dD4dMJyMO9vZQKJpNTVmU7M1m7O3tMRmPefXqAh8U9+7eYToeUK8W6OgYlLmU8oniGXc23a6U7rjzncW31mYLUO5Uah0cG5OBSZHnifUnDUObQLa2SXFWKZVJXITl/nXpxBAkJFWBNYrJZMRgMOD585dcXV4zKMcYnQlzTm/Zf51xaJZlbDabxNfYMko7E9LObuymqCjgg4xNRSEqykudPoNWGh0i09GA+8eHHEwnHExGTAYF40HBZFSS57LwhkVJmQ+w2lJXG+pNRdNu2NvbY29/X5R3MdK2G6xR5NYI1U2latFqTCa+jjYl6uRZTlnmZFb0DHleUGQ569USA8wmYxSQJyly9/PapuF6fk2ZZRLyYTRFlkurYTUhRu7eucvX3nkX13o+/eRTYoyUg4KvvfMOzgW834LdXZvVYQBlUXL3zl1h+bUNWZYnr4Y6TQJkfagE1novlWLdthIzF+PGGqNrUKMvlPxbeHdbAXyhQkhvzosBYb+BJNceYvIZ7Ix5kseeUkpcbvXWJ9BozWZT4VzDoMy5e+eE1bJib29GXgyYz1cSdJFenfV0H0KZDCrYgSJVmlyIPtwyS6kqp6dnXFxd4RXcu3+PxWpJtV4nOrFjvV6xWi0ZjYbs7+2RZRnDwYBNtSZ4T72pmF9fsT+bMTo6wFoZEaq0IU4mYw4Oj2idZzIesVgKCPW1tx9xPCkYFzKdqKo1hTZk5fDGDe4Q310ffmkDti0aEVwa93Tf41xgU6/JTUZhZWOLEfJ8QFU3rOsNrW+w3tEaI2QYouQzaoXVhtY10j5YoVCHEBkOSl57eJ/zsytc3aCiTe5HW/CpAzO7Z0Opm4lRu1hT9xk7wZEcDO3Wt94FvPPinKNkyrSbX5gZw6gsiVbLiCt4aqTSya1JohepkpqmTcIaBdGJ+CxteDFANN2fgdjiG/JiIItf+5Tl52maAOgtOS6KYc0gs2KyGgLKB4JvsYXY19+9e5e2blitVj2teVAO2N/bQxeWOkaW19ccHNzhH/9b/5AYFH/+479isr+3w30IvUanA+o7DYvwLlpJRUpU685y3Wi75cUoDUoqBKUEmzPGESO1zUxWCWfY932Qc07GTCRrZ70N81DJmaUsC4xSbCoQ3NJuF13aHLryvg2SlmMssqtFCcEUh1sLHo72Dvjmu2/z2usnbNYV49xycXlNJDC/vMC3Nd47msrJODBoKXEMyUFIHiylDVpHQvSpvNZ9YtFmU0kGfLWhbluysmAwHKV+09NUNZe1o16vCQEG4yFZIS6qJs/wEZp6w6ZpqFvPweFK4sVsyWAwEJumzYZROWAyHHLx6oKDyQSrNK89uMsbb77O4XRIphVNXbNpHD4o2lrAvpjGNQlzSxdbEXVMbrlpypj8B4lS5xCjRGy5hqurV/ziZ+8xyAruHd9jf/+Qg8NjRsMR5XBEG1t82ABiyBGDWJSpCEWeoxJmg09S5BApMsOjh/d4/70PaFqprkgj4RhlRGmUllYitERcMqNM3nRaXKND8Pjo8K5FW4syKb7cC0gVXEiMv6QkjKBjisp2YunliTRNjcsNg8wQUawbL6PZqDAmQ7BlIYB53zIajzg43BOHJS1jRxQ0bSMcj9xKdJ2S57JuWmIu4KlJwhrhPHRNbsS3jvV6AVlO3WxQWtHUDpUcg43SNHXN3ZO7vP/++1xdXvHg4UMGozEmLyQsBU/0LYv5KybTQ/5H//Y/Ah344z//Cx699RbHh4dcXsyTYMik2DjBTLyLtE2buDYCPLe+JSipfJUx4kHohd2m0D2LchPSpEGZymY6W3X+bGUh2XHrdtUbOHb9gkpUTqUgM4aj/QMyazh9ecrSVYCVeDAClijjP6VYVw2k0ZpSNUSFD5EYEp4dRST0+v0HfPXNNyiLQIVHH+0xyjSXizXnZ+csF3NWVYVRGToxDKOXB993XrF92RxQQSf1WeqXnWexmMuJArShJVcFzUYUir52tF5kujFxC0yWYYtc3GmMIWpNk6SmUTVcL9bUzlNEQFuJ7XZiXh2aFldtONnfFz6/FtWe1yIt1oOMMoO2EVWeVQplSgIBFxxRxe2Dl0AKhUlkmi3jQqfKwztPDC3Ves7l5Skfn13ygXmP8WjGa48ec//RI+4/fMSgKCDN2V0rLMu6rllv1ixXFUVZUgwmKJUnzEN66PGoYDjMqS7WYC0+gg/C8UixfQTnCCqAEjsz38q0xnTJRR1SpEFb8fXXSqUw14hRBqNs2vQU0QtQbBGcZFU3XK9XHI5LvC+ovSNYDVlGVliC92KhRmTT1KyrFVEFZvtTirKk47B0VnRb/ryIhIKPRB3xKhCMEK+MVX2LhlZYY9Da8+L0DHAERP9RNw3laITNc5wL5MpiVUZWFmid0TQrfFDiOxkiSndmnZ62XuFdwXR2yP3jI0LbMshK7t454hfvvU+WGUyec3F5JWU+Xesmm5gLwq2wuRFhXb+ZicGtShoXY4xs8D4QfUAptbIh+oWPkXIwYH9/n3VVUdUb8L6f9fYYYDp5jDUcHOwzHA5ZLlfMVxXOOzJrEvW0FF0BkdheSaxX06Iy8QVQiQCUWUuZZ+zvT0U1NRrS1tf4uiXPLOPxhIvFmvPLCy6vr4QIoyNtcB00lsodIydIiNshmeJGn9m9dr3sQohcXl7Q1jXVuiK3mUhkU/Jr3bRcXl2lzLYoJ0PaT30UFHyxXNI2soj29vapk04g+Au0tdy7f4/xakS9EXFNL8VNm9+2w4oYIziLT2k60SuCiimtSPc+jB2mEWNMPPDQOyJt6g0PHz5gfzJjcbXk+uqav/zxj/jgk4+4++Ahe4d7HB3vM51O+4Tg6XTKZDLZgkyuFaDUt+QWskywh7IsgRWZNcRNRURDNNIOJIOKLMv7qHWtDZqtN4DrJaoyjvOtl0UXt7bird+GWkaVTnLhC9O0LRfXC+6MR2zKAUFDZktIlFfb6T0UONfxDSzDwUiksEkok2UZbd0QIzJLbx3j8ZiiKHFpfG206acDJqUjC59Es1qJacnh0RFNJem9wtCUVmyTSEshBnJjuXvvHuuqom1a4XC0nqgjLrrkPB1ZL5Zk+YB7d+8wGY348P33Ceojmk0N1pBrnUaPsmFqrSgLEctZlSoD39JlYcaIyOyTp4TqqkZUYhQ6nPcL62Oci8giIy8KVuv1jQXT9fRbsEmRFwX7hweMhiOePHkiPYEWhl5uLdPRkMlwJCBO65PPvsZHjQ6gopzghMBkPOT4cJ/BIEMFT2g8m7WEHgSlCWguLi/F7KHIaYKn0UkcpJPE1RhM8u8XhN+D2gaVdH1q10sBZEkrP0/gnoqw8aJaszojuJbzi1coq9jfP2C9qbe9ZdpkNo0QacJoiDWG2d4ei/mCdV1zNZ9zdHDAZG+PciBy3npT40dOjH4CeBeIQSi0JHehhKwIh94aMDct2joWpk4bWEwgbERCSo3WjCZjRoMxJyewXlUslivOL695/8P38O+LB8NkMuH111/n3r17/ShrMpkIDhIVLkBVrXBNxXJZsViuGQ6HFOUcpaEc2FSiR6wGFW1fNTXOE5GFo5JjkXAA0sIymtV6TVkMwaRKLm6fud5EJkR0h+doRVCa68WK1aalbgPKarSPtMl0dDQY0lmNdX54s9k+e3sHwqRMfBKjLU45siyn3tQsFuI7kBdln7HXBa8456QiTKPOTVVx8epVD8aOJmPqpsYmoE8ZMayNWtrboGA6mzKdTnFNI+GizuERKneeAjzresPF+SuKPCPTmvPzc7A5o+EAjGFVb8Ra3sjhpCIMR0NG47FMoZIWYLVa9c+7TpOvmEburRObdRdCp6eZm4cPX/+3vffvloMBeZGzWCxpmprYP4wJAzCmH6kVRcGDBw8pi5wXL15wPV8SlEJHOJxOeHT3LgeTMfuTCbPxWBB0J667zneoszw8s9GA1+6d8MbDB1glkc1N3bCqalabhhdnr/jk86eYLMfmObVvaYPv+2OVkGwSj11OFH9DEXXb4KR3t0kBGR0jubPO7oRHrWsTwNiy2WwkGjpxHrq/Y5QizwT0KUrhWb88PeVqPqdxnjzPGQ0G5LmlLJKd1Q5IGTtGZQpy8EEEMNpqtNUSB5b48zqm8E5N768XOqWYF1DRWsPBwQGHh0dMpjMOjw+ZzmaMJ2MGZUmeZz2I2pFx5vM5V1dXaZLSCCU4s2SZZlAU5FlBiJAXBRExIN24ihgdmRWWnood6CtW1t1Ja1JwpmjaRSuglFBwM5P3JqtK654bsgUMkfGtQioiJePdvfGYSSlz/tBZpaUqyFqRawtaLpOi1157RFmUDIZDtDayESdBTceRb1snKryUrSftb+yfkw64vLi4wNUN4/GEvf29nqlnMttz4GyWEbU4WYcYJK4ty1hcXZPnNtHQJaYrISkpJyD0xienp6c4H9jb2+fuvXu8PDtNVa0Ajnt7Mx49esRoOOwPJJ+MQLNMNlsJG5Wq3KTwUZsVyRtDoY39oXXOXQgg5NlsZHwgIZVbc8K8lNl2k7zJq82Gly9fshgO8TGgUumaKcVsNuXxa68xLXPKBHbUdcXPPvyYmJR1VidOs5YHeFCUMo9tXbLh1jRt4Pzqms8+f0ZV1RydzCiGI5bPVyglCTMa8bvvBo6d3llrTUyRUzdGZTsklC60w6cQhZgkwyR7MhVBqcB8sWS5qvoNMXFuaFtRqy0WCxSBcjBgNJnw4uUpz1++pHGO86srzi9e8Z13v8adwwPaukPJQ7LygugibZA+2/vtxtYZOoaOe5FMH6QkDikgNfZMvBADwXmKrGQ62ZOZf3ooBqMJh0fHvPHYsVgsuZxfMZlOGSeDVoDNRhiBL168oAmecjRkOBhwMNtjNBxxfHzCnbsPefzWV1lWNU+eP+Xy+hVnL8948vETFlcrhsMJg9GENkRaF7huavLMoI2VIFalUuKREiA4BKL3Mv0JQcAt75PfQC1GqCFS6k4vH1nXLWcX1+wVQw5GA7CGMjNoFM7FpJTTCXVfs1yuePDgISd37kiuXiNS2LoWUk1ZDlAoqqpiuVymnl33lQiQNlnBm4Jz7M/2GI1H2CxDG0O+XvXGHUYbrNZi8pFSkIy1zKZTqv0lp6enxBiZ7e+R5RbXNuIGHKLYy+uMv/N7v8d0POU/+af/H6xWfPrRR4S2RWUZj157SF1Le3N5+SpVJlLdDAaDPlymc2wWkx2f8DuT4sKljXWtu7CReI5SKVrbCdfciE+fWIHofiQl/EIZQ3z+7KkEIyyXknEWPV4ponfgW6LTjPZn1L7FlhofW4psQJaNuF4uZcf2UTTqbaCpWrzNaLxn1TRcLVdcXs9ZVzXWWEaDIYcH+yzXC168OhfhkRyNaJuR5wUb6pRGsy39dx1rdr+u0yka0td8qkq2Yx752UFHmSqEKIY/KomdjMX5wGpdJccgOdOXVcWi2tC0TfJe85yfnZMrmIwHLOdzhkMhsLRNS9O0eCdJtEopsqJIp2Tn3OKTuEoktJ0qsrvJ2oixRttKslCZDYjB4L20ECbLQLUoJadjlufYMu9tvcQrThxmJxNhIM5XCxbVkrOzl7w6PWM4GDOeTMnLktFkxt7elPH+CKUi86sFP5r9iD/943/Fej1nvVnT+kgxGJGZJF2OLd4ptLEELxuAsZkQs+paTr5bAi9jjCgUcX2WQNSaum1ZVg11G1hv2mToqhkOhFTlXZcy1DKfX7Ne1/z0Jz8nz4diPtO2XF5csFouOdg/YDIeMRgMaVMoS9M0QrJJOEu3+IEUFtKQT6ZoJVZzRikmezOur67k+QkyIcDqNIKO6TMHRpMRL16+wF5bsrJgZEboxJb1UaLSjVHsjUd8+xtf50//7C/45Pkpxhps4uOUZcFiIVblk8mEpm2xhm0EWnrWXaqCpBIwvY7EuUC1qWlELXtuHr72+ndijP9dpVBdz+N3HIFiDJJqG0Qt5r0jxEhT16yrdRpRWCLiqT80hlxFom/QBtZtxU9+8R6L9ZLjo2NGoxGr9Sq1AGCjaJ/vHZ1QDgqCilxcz/n4s8+5XlZUm5boA3ePDnn88CHWaEnxTRffJBlqUZRyKqc4qc7r77bRae9WjL7hquJjxwhU/SInMahUGgF1ZB2F0F9jiEQvVtT3HzxAW8snn33G9fwaFwI6nQizgbjCelez2axxbcOmWrFerVgv16zXS3xoyfOMwXAg7LLMJn9CmeMabQUl152xpoBsPjiIkcV8zvX1nPF4RlGOEuYibEelNFZnfblN8nfI8/xGLFiX51eOSiazCbPZjOlkRp7lvDw94y//6se89/57XKckpizPGA1G3Du5y7e+8Q2+9s47TGdTLq8umM+vePjgDnkukezG6iQV2YaBaqOpE2koAutNxbpab52H6obgA1ZDUJGm45ygyQLgfQrFEJBS/BlUH2RyeXWFd4FnT1+yWC5xruXli+d8+umnrBZL3nvvPVbLFffu36epN6zXa0bjsQSkpM2owwC896zXa+ZX1+xNZxRFISll6YR3rWN+fc1kPEptZcBqQ2ZNP48vylJCSl6dM5sJXdk3LUYJ29EaQ5YJ0Hfn5IT7Dx7xox//mIurS2yWMTvYp3Ety+USnSLx9vcPsFoMXMqipG3alBatBeyLApb70JHALHXb0joflNb/qVVan0GsIox8FJaeC50fvvSZbSta5+B9T5t0XqShvetIlP+3bUO1qch0IF8UtDpwubiiqtcUueb4zh3qtuXlyzNQEh6xXm2YX6+4c/cYFxuevnzBsxcvGYxEwDEcDBgUJYW23Ds6ZH885sXyFG3FD051Hmeph1ch9vbZu0amN4hOaXymkrGIiWnKkchJEYRP3XXs6XPGxNnvHIRJJgvD4ZCqqliv1zTOSapvDGhrmM1mPH78mCxTaJ0IGbnBZnKDfBAa8mBYkGWW1glIaowCbQmxE2KpW5tZB3w6qqoi+EhhBxiT43VMbusyYkMpTMom1NqgExGnOzm2ArCEQxgBkvJhwWhoMTbnw48/4cnnn/P+Jx/zxvPPefToEbnNKEzO3nSf6XTM7/7Ob/Pu19+l9SIn/vyzT/n5e79gsaggCoU8amjaGq1M0jtIZdCV3R0hqvu4EWkPxDJLshKqxlHnLZtNg1kqrIJBkUMaVw/KksODQ9r6jMlkymefPaFp1ozGQ46Pj7l75y6r1ZKXz19wfnZGZrMEjJkbpKVdmXzTNJJHsdkwGI9SQSz4xWg8Yr1cslytGA0GqBiI3hGTyInMEoDju3d4cXbKcr3iYO8wfeYO1AXXNBib49qG1157wN/5gx/wn/7T/4zaeRbXc/LhgDt37nB1fS3aG1RyYk7YizZSUWpxyG6aOn0G3U+zYoAiL6qIOrMxhFONWmutR1anXqppExiREG8fiUhfbJIFl/QRHSclYnQkek+LpzWa4dExdjzis88+YbVpsTbn7skJ3/6t32I2nvBfnp5R+5bBaIAtcq7rNZVvCTqwrCrWdYXKC/YOZpydblhvVthcc7J/zP27d7h4ddHbTXnviHVFjC1KtzsL5CYDbRdJh8RHkJUuoFxETE46IUMqy7uJhVA8peqM0Se/A8PedI9BUXL++RMW13NiCmpQQWi5d+7c4cH9B4zHBXmu8b7GWiNMLu/Z1OIEXDUtrV9SFgUquv4GR6WFOBK7RRH6xa+VovEtz58/pcxLtPGEsCGgUdZgrSZ61d87paCNJmnqUxinloeDJBWViU7EZJrc5gQXWa5XXF0vKcoJFs37H3zOp09ecHV5zXK+YFgOmIzGnJwc8+3vfJd33/06Za45mM14/PobnJ6eM5+vePHilOcvTjHayFjVO5wPiWYtYzsB8SRWPeDBKzJlKTIZv65czen6Gpsr3DyCVgysJY4cmSlQLQQ8r917wGQ45eXZOXlhyAeWvYMpd05OmExGnNw55s6dO5yenoHW3Hv4gOFogE7MRpPCYKwVgM97z3yxYF1vGDY1Js+SxkSj85yTkxPOTk/JnYSTyDMWwBpMluOammFR8uDOXRbX1yxHVxRFvrWs0xIj5wk07QY7Kfnu736HP/qLf8XTFy9QBB4/esRX33mXy6s5nz35nMV8gdEZ48kEtBzMsok68BobJYJPparXaI0KnhhYa2VPbfDhhdF6jY+0oRGwIKHO3Zy9OwY7ZF1WRqT1yS/OKlRMRBcVcUrTonl1veTs7Iqm8hwd7PO1t9/mrdcfslkvmY5yLps1e7MR0QSWbcXF8pqiFHQ0IJJGk1t8DKw2FQ2BcZ5zeHBAnmXUjZcgx+CFPJPcayRUcwtk3sYAutN0a3GecnV0GrQnhl3Hpu+IN5qufZD3pxWUWcFkOEZFxauzCzZVLS2CNmLVhFhdFwlIVcqjVYbJLDqzaGuxJiO0gagMTVNRlomXHj3ENAkgXf9U/othqVQBm6ri+uoKe3iADxt0iBJwGi0kU1OdzDk7EVE3Du304d24N6apSAiCvFvtQWmqqqZuHMYOmEz2WbeREB02GzIYSTl6evaEv/rJz/mTP/0h//of/mv8wR/8HsOyYFCMePP1GU+fPuPV6SuUj7i2JtMWZyybJrUBUfXtlbABHeBRUSenIk1Qnjo6Lus1Ez9Et4rRpqWyFdUqZ5CwBRXBR8d0NESpYwKeR6/fYzqbUBQlZTGQ51grTu7eYTbbE0ONxB/o/nPeE52jy4J0wXM1v2Y0nTAtCoLz5DYDYg8Eu7YlV5LU63qfCZWUk5a7x3fYzNcslwuGoztErWm9FwUpEaMCG7fBNCuO7xzxve99m8t/dsG6dlyeveLZ6HNW6w3np2dkWclksse6qiiHA7IiJyaij0Y2fS+cQ4JzWC2bf9u4tVLmhVXE58CyA1+6cUd/ioadX0dhcamU8ea7xNHEnlMoNpuaq8tLNosldbXh6uqCuweH/J0/+H3e+cpbDIqMg9mUO8eHuGbD8vqS+/cfsLy+5vTlS2Z7kwQ2asrBCKUt2uZczRcsVhV7BweURUlmc3x0aJPjNpt+E1B6K/65jf5/AQtIcxulk7ko4n/QBXrqpFPY5vCkgUvXZqTNJSp4dXHBy5cvxcQiz+h872xKaXHOUTeKItc9k8s7J7t/BFsWFMOSupLZP9YKY1DGNUIBDrE/qbd4hjgWHRwdcnx8LO1D60SBhk/ZAqQpAsIUI/YGnp2m4kaFBFglXoPtpiazMsocD4esNoHQOsblmNY3FLakOCkgQl3XCU1f8OOfv8cnnz0hzyyHBwfs7e0nM9VKsghTfLgyYnJhfaByjk3d9JMa1QO4pM2hc2YWUOvy+prh3qFoHCaWhkDlajxtv9E1LtDUDYf7+xzu70kqTowSUqM0w7Lo48SD215XpTrvRwncXK/X1HXNvXv3evPS0Wh0w0XLe6EkX61WWAXaijUeSRQVQyDT4px85+4dId1tKsaTccpGlBasaRoZJSYPhH/w9/8udVXxo7/6KZeX5/zw1Tk6y7E2ZzjdExGS6QJcpBKXAy1NuYwWXQdSLRlrMYElqOdWoxYQXwLf6C787ghkd8H01mAIAEVnGpJI6qKIa7h+dckqRgZFzvFsj+985zv8zne+zcH+lDzPGQ9zHtw9JjQb2tbRVmumQzGuXC7XbDYtdSM0S5sPZPy3XnO9WnNQbUBryuGAdlmlKOnYu/9qVF/67xKavjTvsF9IqerXMg0I6ZSNqpNEdzRW+fmqmwcis16bZ5yen7FOIZTdSdom6/CmbVit1xg9oMiKtLEGoovoFJ3llGw6tiwhBiFNYUSV183I05uNyVe/ZwZqzcmdO1vJauvI0si1Y+KhxIGpTa6y24V0EyztHlStNHl3kjqfNAFCiyZCpm0yEg0yubCGchiZzAInSpJ518sV86s5z08/IgTPnTsn4p1oNB4JJdWNl/RmrakTgahuDJtNFPce57AqzbRVxBpwXsw158sFQ23JdORiFSknOVmwMgFJ6boxedXsTWaUWZla2YhvGqzJhIKtlMi/s0wW647fQie06jav1157jRAC6/WasiyZTCY9aNmRb5bzOcuVSIMxWmy5owjeXOsIzgmHYDTk4vISZTVFWWIUfZxXXdfk2qB9y9Fsyr/5D/419mcznp+94sc/ew9lMgbjCSd37hGi2R7GdAGg6SG+xYjdbDaC8RBfglrYqFQbfPgEttbbuw/EFxyDdPc9Cq1s0nhHFPKwWK2ZTaY8uneP1+7dhRj46le/wsF0ktRnnsl4wMnBPsurK8pyQJkXkmLTtqw2NfPrhYiEUAyGQxH0GMPV9ZxXF5cobRiNJyxWNa0PfS/fg37Sr9yoZL64ASS6MHKqxlQOhFT+i0OMAFAplifZn+3KbyO2KIhGc3p+TutcWvz0fnnVes3F+QWH0wnWBAgNRiOaf6vJixKVCWtMd6V+VDgUpKx3ETp1VuUyrTA7Y7MOaCzKEuqWpm1lHKZi0oV7jPbi67cDtn0RF+mvjACgaYwUg3AMdATftLTVhuv5CmVlhBj1mizPZAPLM1GraYUPmtnBMYPxVHgbmeHiei5VVVL6tZUDWlofWC5XIvRJRiHpBqX7k5SCUWOUoQ0NWZ6zqNYMyoyi0SyahtI31HVDaQy+cRhVMBzOJIA0tRjWmn6RQ5AxWYiSn5hlvaVdt4mHEFitVtQpK2F/f5+rqys2mw1FUfQU426iMp5MOK1WMqKLYiKTGRHthA6/UZp8MGDQNlKeK9Bsk5W894S2wVVrqRryjMIa7h0fsV5XfPDRx1RLeBGeMZrsp01YglGCUqIlSc93VKSpkgitbJahdPykbUNr789m7ely+UnHwNpNebm9+Hd1Aem4pYt9xostUVmWvP32V/j2u19jNh7R1hXHh4dMxiN0ptL3FFgrWXvHBwc8fPCQ4AMvX12wvLgk0wYVpNSejMcMhkOKVUG12XB1fcWgSBtGhE3d9MSGDqHvLL63NuHcIDZ1C3unC0hMx5jissDELhQsJfMqTVAh2S0noCwEnHc8f/mCl+dictp6h466j0CPMfLi5QtcU7E3HTIblkzHQyaTMbO9GYN8QPARo0X7jVIYm/dVQido0lonJWBqb4xOZhxtP89HaWxe4LyUvZ2fvtICLHnEK1GpL45Hu81+y6CUVq8zbu2i3nVSmWV5TtTi0Ou8xyCGGtoYarci+ICOGmMiNs9TMGmL0ZkswCDyYWU0QucTQw/jLU1bpySmKPclUbBV9x4STbcJjiwr2PiWZdNydjUXMVpoKIxmkJWUtmC1rsmKEagM71th4GlNk0xOQ5RNUWzofS9t3qWO921J8uU7OztjPp/3QShdhoVzjqIsmUynIjGPkSIv0CEKCGuknuzMasazCfVGuBAh6fc7vYp2jth6QttSWIuOgRfPnnF0eMBPfvZzrs7OUPYSm5+iM0sxHDAcjxmPR6LF0Ylt1t1f4tadmfjJO+/8QWvPq0001n6sQoghBLWd/98softqIJUWMRk5dA+n1RKNpYKcVsv1mvF4wGR/ymhvDFYTkq22tgKAdfzyw8MjQSeN4XqxwMSA8hL0qCMc7s2oltd417BYLJgvFlwvlil803edeQ/eE0OvId8NtrzxWW4WA9JvAmVKL1Khc7k1/YixA4K6xFi0Yr5asm5q6rbpNxKVFm+WF5RFyXgyYTabkhlhnFkNB/t75MYSnJfY7hTdFZUhOBLN2SafgUgHVXbvvd+cO0+FdKRqa7B5TvAe17RiDmJkihB1+rlssZFdA9iOK6+M2IjJqS9jQ5NlmNxKqlD0bFyDyTXZoEA5l0Z1Dtc48FJmi0OPjBVJYiajTe8b0FmJB2IiKlnyGGmdpWnS8xeCiKG0AhVSlSXhHiq1H3UI8v3RcLVYMbSgixzvG2ptiN7z4tWcV9eXzGaTJN0WAVNRSJCHTa1a51q0a2CyOz5WSlGWJYeHh5yfn/duPR1e0C200WTMcrmUkWFW4J0XLUAmkXQubUIoLdMEpROhLPRiseDEUNTYjGikIm6aloHSfOvbv8Wf/Ks/Y71xuLpGOTHAnezv4WPkej7HNy3DwZCyyLFG07QtWaZoXRurTf3xj3/6X0Q7GJQAn3vvr9u23dvd+boNoE8a3a6X/iEMSeEWk4a7rms++OADMh25c/eQ8d4UM8ghE9KKzTLyckg5HKVYJ0nqGY/HjIYjLl694vnTZ4zLQthPvmU2GXE5KAheZtWvXl0yXyz6JNWISrl/iRkYBcS6bUndbwId2J9+qxMpycQE9wVN8IF8YNHGsnGC7LdBmJJhJwRl41p8vemnJ1qJd4LRmtFwyHQy4e69u3z9K28zHRXEZgPBMUxsM+8crhUDTJPJderKZxGVyHkh83N5CDp+An2/l0xXtE5Bm4Dz+LYlsxZjDV6lyUaagGz9HbbVXe/Wa4R262PcqtwyKxWBEq15S2DTrslj1ttVm+gpi4JBmQvX3oK1YKJUlU3d4hLQludCtlFONiad5biqom7bpBvIUQQJagkG7wRsNmlcFoK0Q4v1mtJa2nxIvfEMJjmL1Rx8ILSR9eqKptaA+f+39+dBlmX3fR/4Ocu9973cKrP2rl7Q6EYDIAiImwCSIEhwAwFuWuyxZM+MPZqZmIhxOGazPJKlkR1jmSNrrFAo5LDHGo3G8kiWRiEvI1mkRBIiSBAggMa+dqP3rbr2zMrtLffec85v/vidc9/LrOqVDVSDxEEkqqvy5cv37rvnd37Ld+H69jYx9Zw6dRKRxNraSgYkGVZXVzm5dYJR7YfeSFEqLiXxsmjLuXPnaNuWvb09xuPxQpBzwIuoZFyf0YVVTjWrXOaFQWTWZB0OzUwHcVVsPsEVHyBG6LrA9e0dpB4xWlnFuApri7hKYDRWw9C1jXW6tqNyntl8xup4rMS79Q0whtHKeM9YcxHAj5oGkEsC10KoN2ez2WDeGOOiJ0CuJwrwwRrVCAghDI46RRN+/2Cf6zvbiLXUK2PEW4UJWxVwSBhWVtdYWV1jb/+AZjRm1IxovOPsyZOsNBVtX2OJSN9S1R5nykZAmXVdm/n/FRGdVqSoHABul/YfO/3LV/mON5YTa+t4hMmB9iDuOn+B0eoKFy9fZu/wAMERyICjPDlQg1OGZ4rZEKV43hcNt7bv6HrHxsoqKdOHlZzhQaDGYkxSnrhzCjwqSIt8ui9PI0qfw2TGXQnKsZzixuFdLgHyd4UyIj1a5pWmoLV20E/Ibij6O42hampWVldUwFMrcrqoBJ1IHODQ5AZbwcZLNqXwrkJSpgMbp0YaWTzG5tKlrmvcTIVG60o//75TUVRM1KlEW0QvokJgnSUA83lP3yZYsxjjmEznTA+nHB4G2taBWKxNzOcTLl6+hjHCaFSzur5KXXm8t5w7e5qzJzfZ2tzMvgRpAEm5pcZuyZrOnDnDlStXhk1bIMxKtok0dU1lHfPJTNsZSSc2JjsGSSx0YLVyt/lQtXlE3c5bZYvWI7DqdDVrO559/iI3Dw45nM6p/AohaLbkncNYw5Url3XUmYVIJ4cHIMJkPqepG0S4RpJLAF4jklwCrlbevb2uFQTRhZ62VY29lEEp6gpzFDpqM3jI53mzGIOpKq7t7PLi1Wvc98Bbsa5RwpAsdMpOnTrFiRMbXLl6ib29bdZXR1SN49zdp7lw11ni8xex8xlMJ1RmFZeEWR/wowbrDCYrnzivTqpKMnKIZCGQGIeT2pQMJiVMEjwQDaTSDxBwznP29ElGBvYkcM9d5/ied78TnOfrPvHsC5HkHNdv7jGLIaMCjiIOtVWwCHKzvufy9W2++fjTSISzp09z7vQpqkzxjaljZBkgrKtNjfXqZFQ5fQ59flfqNsUkCLiBS5jFH4ZJhYKanHe58ZPFWdESSwOGQ3LprXW/UqstWYQjy0qXkkckMXaes+vrPAXE+QxiVEp1yNBe56l9TW0cXQSSwQT1hkgiiFOefd/p52JMwle1dsidjvpIkSpnA5Ux3JxO6NvItJuoCo+o2Ig12a05l2kxRvbCAXUNZ06vcnLzNId7O7TtPl3fIbbhcDpVEZTC/LOG6eGc/VlHjEqjfvLpF1hfHXFya5Pz585y3713s7IyhmxGYyxUtaOpPSF01JXamt/c2ebc+fPEmHtcdUPft4OQaT1q6Prs2NMnrHiqptGsKCb6riNK9l3MnfsQAvPpTNWewiriPNOuozeGi1cuM+v7/HlGxCrOIMaWUT3mxMoKoe/pJoeDgSvGsLN9nRgTzai52jSjSyKCe/SxR3nfu7+/FysfcN79QN1UVLVX/feMqcfoLNE6P3RTy+lZUl+XYZ3OO8ViG5hMp9x99z1sbm7lQ0wGZJ0zhu0bN7j4/POcPnWS8+fOUjVOR3GhZ3Z4SJi1zCdTjLUcHE6Yth31qMEaqLNab53pmyGkgtnVQCQpI9rUP8+4shPyV66HJdvL1tZx6sQ6J1dGvOX8ad5+/93cfeE0sZtzsLdHXdWsjFY52D/UKK47I4suMtCKy/TCGqf8cl9xsLfP/v4h01nHrFUuuzjHtG/Z3ruJrSvWT2xSjUZZySWVknkh8JBrZqUFow7IZANOyOZt5f1rKVLspCRna0Wstdi3yRAcZAALGclSCgM3Qm2qGhzdpOXiCy9iq4pgLBitXdcyEGpUN5q6xqQnTR7FeVdhrcf7OjcVGV57Vfuhmemc+hXG0LN94zqTwwmh77Eu6bljcsF3y0TXkGUGOHNyk5MbG7gEK6Mx99x9L+sb65w5d4af+qmfZmVNRU4vXLjA2x58G+9597tZXVnDJENd6Ubd3r7JtWvXabuWkye31Nk4RubzKadOblF5leCqvKfrWvb391lfWxuAPnVdZSqx9mZCtgALsUzMFPdf7j3JzUOTJ1dd1xFiQGJkfW2FlfV1kvV87qtf4+uPP8Gk6/BNkwNnhqYapa/HvseSIEa6dk7oNMDN5/OMPekJffdbY2f/+9/4jX+GA3jLQ29jVFUPInxY2U/akfW+oq4q6qamrmoqX+Ocz2llPo2Moo1cJtcU11djDYeH+1y7do0H3vpWNjbWFZQSU3aEVbONZ59+hqauue/ee3WUpOceh/uHtLOWeddxMJmwc7BPyCnk2soKJ9ZPsLmxyerqGlXdMG9bbQia4uEXdSSnGEgKwL8w6VIxPBXdULUznNva5O6zp9laXWVjZQVXqwxYEo3Uu/sTdvcPNfV1uqmOk2nIk4iqqjl16jTnz53HYtjYOIHzNdPpnBvb29y4uc0LF1/giSef4C333sv5s+eyGWsps8wwjhpMUMvrpcCRZRjzlNJM/fmy2Srk+Xl2nilMxjKDMwswUQnkJk9CJI+SKIQrscxnHc9dvEQnME8J42r1UVhfxwqZ71+s1dwwNvZVZiHWaqJpnQqSgLC2tsra+pj9vV12dm5w5colrl69wv7Bnk4OUhg4G6UcXZ7uDD2ePAcaVxUnN9Qc5NzpszijGpAWw/TwgHHtObG6yubaKhvjEaujhnvP38Xm2ipvve9e7jp/jpXRiL5tsagHxKiuqJxlOpmyeeKETlWyRoC1Vg1Gh9dmsizdgn+yLIJa/rvKp33oFbRkjXoSpJjVolJiZTRia2sLUzW0MfFbv/sJrlzbxvhKOSzWYLIQiPaTFtyQouY1oBmXbNxF5O/vH0w+feXKi3iAldqDyDcM0lprmiGtRef9o6pWZ9NkSMmq+ux8xnyu9ZmzFuLCjjhEoaoa6qbh+Rde4Etf+jJnz/4sdaMpeqmZT506zdnzZ5lMDtm5uYNvHFVTs7m5xekzZ5hO56yfPEm9skL7xONcvnGdbjbn9PomK80Kh7MZI1fhNzaZTeaEPjBrW5zVQXmZOkgyDGJhZpEyG7TXUXlDZUFCh4TIaG2Npm5YW1vjxGiEcSOeu3SN3d1dTUNdnjhktNpR8kg+eZ3WiFubm6yvrrOxuqZ03MrTtTMOD3Y5ODjk9Mkz3HX+borNeemtDLV4ETEEJJb+hhxpbJqCZiwCI4M+QtKsa8B0lAPz2BGax6IpaTO0PFYKHyLP4p211E3N9v4Bk2lHskGbjEbdiCpfMZtOOdw/IPQ9rsoZWAhUdQ09tJl/oKMzx/UbV7l8+UWuXr0KQB96tWerlQrsHMOhUurs5SCwUB8WQkzsHhzQtoHYJObdnNnBISMyX+KZJ0kpceb0aTZPnGA2M0xvbpNCUIffjXVuXr/K7GCfsye3uOfuu7j//vuYHB4wn0zVWCQUuTPt74zHY06ePDlIdSvNOo+pB6s0MzTWC2gI1JC0nytZ58TGBiEEdnd3MdayMhqxsbGhUyh03K34GD0kYoia1SF0oaOY5Q6H3FLT2+bCUKcLtMaYbzQjHTV7yGKO8JwYLorwYBkrxRSJKWKTQatOTVsMKqlFEwmxz11MNzQvQK2XXNQxx2e/8EXWNtb5oR/6ftZXVyFqh3hlbY17772Pa1cuc3Pvpoo3jlW55dSZU+zs7lI3Iy7cey/rWyf42O9+nKuXr3P5+YusbmzoCKjvCcZgJbA6qhX1nKIafhS5rKRTAme0SWLyfNoacJJwklipG+46c4p7Lpzn3NYWm+tr2BVlca2f0JN2Mp3Sdi3Y/DyQmzjkEyBvvBzRT58+zdbmFrPJHGe1Hre+wiXBWM/q6gbf954fYHVlI+MXSleeAXm4vElLwElJiUEKlkHHe6KfVwpRcRTlg4/KLDT+6CTnJZcpZYCORvRmshDCoC9QNTVjHLNOT7XZbIppxpixHfQF1pCffPcAAHeASURBVDfWs2DlwgxEROgzyCelxO7uLhdffIa2mw7WYVXl8jTCDNbWMYERy+2QnQNgLTdNDyZTbu7vs17XVElwaAe9rh2ju87ivONw/4DDnetD1342mTJqRrSTfawkzp7aYjxuOHv6JE3lMasr7O/1zCYzUsxuyH5hZbayMmY+V18KY4SmqYYG8LIPYgkAIpDChBQihwcHFF9KkwVQYtL031kLzuGrioODbaaTGda4YWpgjM0MyXyLFEt2dAzN0jUqVvci6aKIPFd+xgNF0/8SwlN96B9U51B1/LFmoUCqgguBmCOg9w5MQauVX24pt9psPmdlPGb/4IB/+bGP0TQ1P/K+92WLb3V0ufvee5jPJtzY3mZ9Y52V1VWqquLMubNM5y1d27K+scr6iXVu7m7zmcnn2N/do23nnDl3lq2NDfqU6OdTRusrhNUROzd3OJgGnLNESYRBoFJPOGMcSMASqQBP4sLZ07zz7W/jvgsX2FhZZdQ09KbNGBXtQwRROnQsFfkSi67c4NZaQq/iJnVds7KyQjfL+nOhw3pHmCu19Z7zd3PX2XOqK3+EbFVS/0WmISjGQFk6YQi0zlrEGW3okV2FZNGfwRZ0YSY7FVIUmcMxBBIzMBitMThvMDbRx5RFPxXeG1JUKrQx1LUnhkiMmhGujsdKgqpV6stZFTj1xe8v6U1trOWJJ55gZ2cboaNp6uF9FxUbVaYqKk9meJ3L12dIq0VFQBJC2weu79zk1NoGq85SOYtvvCpAiaWuPRt3nWNlPKZvVRqsPntWxV9QKHYfAisrYzbW1oY+j/NeRWAnU4xXzn5ltMdSVRWjUUPXq2fybDZDxByB1YcQckCAlDra2RySELJC8c7ODgB1rTZ3fdS+QRmXbt+8yXQ608MHlb6zHrxzhLS4B0uPzdiFn+ci8TNY65+Kqb9UskRfUksx6cAZ93Uk/ZwxKjedsioORrIQSAK0QRjzyeIKZjqLEKiGWiyyw7Rdh7OOGzd2+fRnPse5s+e4/757FRpZ1ZzY3OTc+XPc3L7BtWvX9PQ/dQpf19x14TwHBwfKpHKWd73z7ayOV/jqVx9he2cHZ4Vzpzc5eeo0dVPTdh3bO9vc2LnJ4089zc7eXtbts4Xdm11uBWdhpak5s3WCc1ubvOOBB3jLfRdYHa2oHba3SITpbEYXeg4mhwPUl9wcG2ZvS8enSFrMg0u95wwp9DqWEaGuKs6cPsWD97+FrdV1VpqGmLX0y4a/Tafr6OlnlvQOTREK5XjesAgk+XGFVXjkMZkFWQKCHViQKC8hJiQkDiaHTGZTMGoaErJytM+Tj729PS0FKoWkrqyuwnzG4eQQ8igR4OrVq2xvb2vt6mqKkKcOVY6VKxQy0FF5tyMwbwwhqeJuJ4md/QMO25aVjXVV5Ok6fO3oZj03dvbZ2lL/xaauSDGxsrKCBabzOc3KCtPZlBMn1jEW2q7VyYw1zPuOw8mE0Xg1I/8Us28tWcehpevnqo+RjvohFnRh6QOEqE5MNlt6hxRpmpEiI23WSERo+56mge2dm8SS/fl8yMYFQ/T4514qQZElTQu9hl+3yR+ktXyAAHz9m9/kXQ89hEg6HWP8JQy+pA0pp5nOOh0FWqtGBKlYgjEQU0qd6L0fDB915qxpy83tm9zcucn5c+c4sbGOkYR3lrrydN2cacYg1HVNM1ZqozGW6XRCSoHV8YitkycVOeXVumrUVGxurHHu9EnOnznJ3efOcuGuu0CE2XSmvoSlQ88CJtwYuOv0Fu9624M8dP9buOvMKU6d3KRuxspWc462Vwvt7Zv7fOVr32D/cErE6vjQltk8Q6TVm7OYZTruve8trK+uadfeWRXmHI8YjxvOnznNg/few8aoprIGsYrpX6YdyuIOX9zsQ7qYN7fNjy0fQjZcMWbxZ+l7HAkq+T8TknsLmSoc08B0jKJCHJISk/0Jjz/+FM+9eAlTN7RBez3FAcoZozN+axk1DXVVs3Vyi9W1NabTKSGqbPily5d48eKLQ4BcKLCVN5w1EJLJDEAzNAAXp5gd0lprVWkoSRxOxhQiG+sbnDixhnMwmx3S9XOs9wiKxjw4PMRYRwiB6WymBrFe4eAra2Pl5UtShKezTGczrl6/znh1jfFoNetC9vR9l7UctXs/m09VZyEZlpWoi2FqkV73lfof6O/ocVXFyuqq1vXe0YxH+LrGWI+vRzz8hS/y5DPPI8ZlWe/c1C6f7dJ9eOyWYQnP24rI3xIjX/u93/7tRQYA2RXGmK+IpB2Bu4oIgokqrpDKSKeqMgq2AEoF5z19VqfV3oE2nlJWaR2AJt7y1NPP8OnPPMzZ07/AeKSU1/UTG5xuzyiy6+CAK1ev0sfAxsYGzaihbaeqnxcjxntOnd6kqgx7N28yO5ywff0ynp6777qLrc0txqMxD731Afb3DxGB7YND0qwdIqOIqM66NfSzGWE+1xQwZlMOIASV8d7b3eXSpUu0bUtVeUJY0IOHLv3SxS42WSkJ89lMLZzFsLa6CtZquopw19nTjBs1U5EUwEHowwC6Kh/iLZF9+J2LDnMSEJfzmyEolVqwOCQKaqCkGnRDFiBFW0BRZ8UCHjQd70NP3/U8/8ILPPn004oGzMjLqqoJfa+THadyYtYYNVIxMJlNaMajgRW5s7PNs89p+alpvydElf1ybvGaNGAX+HYGQZvFez+eASBa4g2bzTgO56rNSG0YrY0gBmUJSkVIib3DQ7VuW18nhchKipw4sUGdnaaMCAn0ENJOJClnCUr5Vs+9rg+080QzUq9FC3Rdj6QpMerzl3vCOc2OUhLN9ozBOEcXglq9S7ZEy5mg8kI8h9OJipaw1COSMrO9faZYmsiS+RQ5Q98xxnxl+XFDZ+j73/N9WOOj9f4nMO5ByRxyC1TZO81mjrwzDPLVIqiRgqly88qo84wr8s9ewR5oM8Z6x+UrV2lWRpw7f56qVnMQbwzNeEQnwu7BPtP5LJ8QOhtOUV1sunZOih2VMZw+scFK7Tnc22Xnxg3m7UzHl6MRrhrTth1Xrlxl/+YuVlQSy2NZqWvWxg6JLd5ZTm1ucfLkKchCj/PZjMnBPrs3trl29Ro7O7vs7h+oc5CaKuaNoiPE5SzAGpt13VAmo7VM+0Afhb5tmR/uc3JtzAP3ncf7iFSBaIOiJJdO6uWNr0MTychAKfmcfsDW5HmGUNIBs/RzMszz83MOvAI5EgScUTsrymgRtfHqU2R/MuFrjz7Gjf0pfnyCNhgqP9aOeIwqi15Xepo7cJWliz3zvqXrO1zlODjc47mLzyEpkERn/oJqAixPnfJdvkA/moEUeCyDybVuHn8q5z63SKIh9pHNjQ1OndigcY5RXbG2eYLNU1ucP3+OM6dPs7K6ymhlTD1qqEZjbO2VLIXB+0p1GmwWG02Jnd1dnPdUo4q6rmgqry5VIdBOZ8wPJxAF7yuCaA/DebV4r7xlNNb63ldWy1rUHMfkfaV4AO0JKOGqoRmvMJ23fPpzn2d3Mh3QtGJyuWR05IssssNMbs89pXzZNCJ8xor5r0Vk9vwLzxzNAOpmjU9+/Z/tvPcdP/NFielDIWjDxuaLq13ZjiRRWV8Waqune8pabc64fENCH9W0UUTNNqw1hBSYzuekGPmXv/1xVlbG/PAP/hFigno0Ys0qDXZtfZ35dMr29jbz6YT1lVWMJCaHh8znqsIbu54AnFhdJ52JvHjpEpPDKd98/HFOnDrg+vYB33jkEbavXcPESGUsda3ONVtbW6yvVayvN5w/c5bzd11gPF7VC5qy2QWGlWaEbG5RNSvM+8TkiScxkwlkZppZytNLUy2KEl9SSuzv74PzuHrMbKXD9T1V6nnn/XdhiRgnRKcQHkfF0VzitiF94AAMmcBSU69sfiEn0qX2ZzFHL2PExX9nhh8GYsrksaSbv1dWWgiR7f0Dpl2PW3GMmhW6LmCxrK9ukFLA5J6Ry5le4xpW/WoGR1kefewRJtPDLFShOA0FPGXLatLynXpkrx/vWRw53fLPqLCowdoKI4bpvOPajR3uPrPF+toKpJb1zXXVOXAV1frC6TemRBQF0lhR7QOT1LAkRi0t1sZjaqc/0/UtfegwTUVT1diqomstB10/NDoxQkqBrpszGo0UISqRJEEz5QQSVTCmqVQabvB4SGnx35LUFbquFvT1PMQukx6b2bMMGVRaXLMhegrAFyenq53xlclwLYcA8Hf+3t/hF37+F9jZ231YhENn7ZpNeoN547DG4ZsxkkEFlXeD1XHbRxKWedcRsppOkgUDL8aoIAWTEWdVxc3dPT72sd/h7MlN3vHgfTjnqXxiY20Ds27o2znTyYTJwQHTgwMM0M1adrZvcvPmTULXKybg9GlOnzrF+XMXuH5zh2eeeJrdLz7Czu6E2WxGM6o5d/d5bfycOIF3jrW1Nc6e2eLcmdMAjOqGlfFYO+q5GcVYSLLCibDJ3mRCFMP1mzfZ3t3Fip7EYtQbTz/PhWpwzGo329s77B1OmLU9q82INJvygff+AKdPn8yng5J0FIrK61xmYAsOe6acnLJkijKUKotAUBpESnk1g7+CJJWUSn3CVbUKkwRBIoQu4JxkHMictlMLbZUSNPRB7amrqqLvO+q64eLFF9je3qYoEuscPIerxYse/jyS3r9UPFwSuTBWG6fOeIz3iEFp2js3OLezSb1ylrXxmJAitbdKS0ZUGRrtmHtrcQ5S1LE4aIYdM8y8rmt8ZqeujVczg1NT+bpSYI5r9OSfdy3eFkdjnWTM550G1twcr7y6BpU+hvS98gwMVHWtCFern+p4Zcx4PM7Zktqf3dLIHeDoJgebUjppX0iEQ+Dh0fUpn/zsJ24NAACT+RRJ8iXv/RXv/NtMSTOK2UJWH7XGMsopUOU8ft6xP+syC04IKeEKICapMWffJRKJKmOTvfe8ePkSn/v8FzhzcpNzp7cQDF0/p3KOarTKajPmxMoa8+mEbj6DmOjWA7M2MAmHdP2U51+4zN7ehNNnzzCfB2bzntl0RuM9m2fPcNeF83zvu76HM2dOs7Iypg8doQ+M6oZTJ0+BgdlshrOWpmnUbSZqTRySqgQZEWpv2dxYZVx7UhtVsEOO9gFsxu2bPHqbTqe4rqMLgrQdm+OGu+86z9rKGD8wLBdIv9e1/ZeISOX4P96YNMZkwQkt0Y53htFwpui2qCmtmrIpb6CbBbq58kFErZ1VdNKoC/O4Gak/Xm4CJhFsNpVt23aQsVYnYXekq788+mR4Pa8uACz+YnDkEibX0gnDYTfnuetXWdtaZeXEOaZtm/0GnHpgiDoNYdTuzntDdD6PixSL4JzP7wm2Tpxgb/+AcTViXDV46/Ln7dRJyVaQAlaU4r2Y/y9GmNYqlsZmglGIKjve9yrkUpSFmqbBOwWUGecHqjB+EchvvW55FD2cBmboGQBXQL50/DoeCQAJgzhzNUR5uOvnb0OEytdgPdYJoZ8zbirFoeeu+ng0wjnPLCTaMMvafIU2GfHGqn1W7dXLvDCmUiIlw+e/9GXGTcXPf+hnWFsZMx4pRbZtZyBKONncPInEntXVNVY3ttg6c55+3tHP50wOJ+xs7/D0088x61pW107w1re+na3NTU5sbDAeN6xvrFJVSpzACd4aRpUn9gHfVLiqyp5uyqaTEPQ1hI5536p56OEBJgRW6kptvQ0ajRND+qo3thqepJQBI84pcSdFzp89zdsfeoC6sln0M6ftxi+dgK9h8xfxlsJoKk08FeDPY7VFl7ikgwun3iUIc1YMtrnZpcjERDfv2b6xS9+qmKnJ7znGCFboQ4fMl2rx3EQMQU+6GzduDAEgxszSjIsUtWQFS7v5VQWA43gJb1TJJ2XlZOMVtXr15i4rV67iRzV3b65zMJ2xsbKGF0OICa/2C0RJ+Pw5lK65pEjoAzEmXFVx/q4L7B08zsHhIetra9mSPI/0fEUgIWJpRiuDua5ZAngVybC2U9i6zwzBlF2RrCkw8gpfVRosga5XazqlQis0ffkaFC1AVTfKnpEsC+AYwDws0V49eq2PBQDjHL5PM7HmE8a6P42IL1G6dCdDHxEDPRaJc8Uwi/rbG6Nz9hjDgvTj7MApKnTTmPkGYJhM5zz82S/w4AMP8J53fQ/GWOrRiCRKy42hY1RpBGyaEb5ZYU1QG+4kTCcT1tbXmbZzdvf3OHn2DA/cfz8n1tapmyrPxhNd3zKfTUkpsra2Rl1Vma6qhoviLFFZTTg8EjVd6+Yt7XRCmM9YG9WcPbXFPAj9vFdRBzLgI48FRdT1xgI4M5hK2hR5x0MPsrW1rnr/JuWbIzv/LtxIXuKOZ+j8GxiQg2UzFzx87evh2g/Kv0aZf0l/QMucIUVd1Nwx6TUttXxKht29Qy5dvkoXgGwvjTPqW5gx+l3X4n2F95VmP1GDYUqBvb1dSmpSUHtHXJoQJC3k6GLSmvuoYtHS429THgwy7zEOHIYoqpVw2M554dIV6qpivRkxdhbfRWyKrFQVThJWjG7YqJs/5c+izXLtISacE0Zra6xvbTGZzZnNW039yzWNSVl5TkFD0vVLHICSAei9UPlG2aq5Sddl2bE68yVWV1fVP7CuFYDWdoOIyrI2Z/n7IhtYYqUuZQfGEMB8wniZxXT0+h3Bhz739NO89f4HMEKofP3L42Z8onIqKGEQap+NDZ0qq+oLRyWoYlB7sGyGaLNmgKSowKEQ8G6BSkspO74m1YSfTCZcuPsuTpzY0GjoNGHtQz90gMUwNBlTvlEM6gswXh1z6uwZtk5uUVWeeTtnNp9mWykVYAgxDuCjUbOi4x1vSc4QRA1RbFZmqbyOafq+J/Ydoe8yQq4iYjmYtuqCe+w0NZl/b6zFVwr8ISbWmoYf+L7v5YG3XKCuMr7dGdVJyOmrNUfTuuMBoCQJ9uhfsxxDQQa6gWe/XOcP5+rSv+mGyyKghQocVd8gpMTNvQOeef4Szz5/mS5akq0Qp5Lm6tPgwIgq1mRqOGhTqg+RyeE+N2/uDCg+52wWyzgqUyWZkwGyuIGtOfomj2VIRzIA8kka85zELCzUfFYgalsdV/qqxtoqQ7MNbdtp/8YY5n1PjIZ2ro8/OJxyY2eXNgmmbrg5m/HUc89xuL/PyVOnaBqVYiugoKLvUGT18+WmEMSsdYNmRikZRdSX0RgYj8fUdZ3doWwe3zlu7h3wqYc/y/5kpnLvSwHAZOencjULN+To5TIvGvhrGK5+6lO/e+Q6HskAAFaaMSHGx0dN82Xv/b0qkx0Y+RqRwl1XAIXB0kWIfSBKr1pvBkLSaOwrr01DkXxhBFdenB0mOYTU8/iTT/HrH/2X/PE/9kucOrmFNR7XNFQiCq3NtVKUlOWThJgSXehwleXc+XMqWSWRdj5jNpnQdQF61KLLVWxurdPUqtGvjNeIsRXWV1jRxlfoY8b3Z6CKUX73+uoKIonD2TxrZVgqr91bw4J8UUg9BlH2YwKJAWuE0yc3aaoMQzYu8x7NEMHLif5Sq8COF57vCpJR9d+8+UyGApfOXIy3ogNLQBjmyYsxnKCiFYfTCS9cvsyTzz7Ljd09jF8hOU2Lx16vM73iHZz3g525t55Z29F1gd3dPebzeZYeLwQmRZYuNvArp/u3W8uSdclYvHGZmKaHhDFFN8ESupa9mwd89eBxXrx0hQfvewunN9bZWlvD20Tdeaquo6lHtNMps6li/qfTGdO2I01mXH/6aZ679CL7N29y76lTPPDg21gLgcprH0AdlCN9F4ZT2VpL3/cZNu8H8dAQwpCtFN9DvYZ2mNZ0fQfOMarU5HQymbziNVkcHsd5JPJlEXn8dlXmrQFgvILHzyLxo4j8sss1mhg9LULf4asmzyKdasEYkNQTstOuszlFFRiPFGap8tIZNFKgn/kC1Lm2+cY3v8k73vl23vfe9+KsOuK4ptYUPQba+Vyhl5pfkvpA6HqsMzSjCj9qkNxvaJqKrtcgVdcjqqqmaUZqvGktEns1ZFxCMUqemTpvmc9aur5XjYNRw3yuIyBEONzfJ+YAiIiKnRSinlHUoUQhmpj5Ez3rq6c5dfLkYgfaI/XZsbnX7TdF2bjGmEUpJ7eCkUQWzL6ScQ3ApSFdzHXikCkkJGkDdDqfs7N/yOVrNziYzGlW10jURByjFVUFWl9fJ4Q2g7wKiSfjDQT1y8sAsIIYlSUCE0MqazFGXjrzeZXBQJZOPWOMdvmt1UmG0c8tCVy+vsPBwYSTq6tsra8xbiqapsY6GNcjUpc4PJgoLz8E9ieHHLRz9mdTWknUvmLn4JCrN25wYmOdOutBSAxHAr9koZKmaY7QgcvrtXniJCLUTaP9k1Le5WtRfCBDCLm86l8SGPYytw0YPlo3bjafh1cOAP/tP/3H/Kk/+acBfi+EdNFac0+S7DYqKtYh03luGi1QGlKUaJwjRO1mjuqacV0PdfIsRIVOUlJWldZqUyR0CYfw1a98g7c/9E5ObKxnKyuH9Wi6LJHGCiH2dNOWlAJiVG4KC33ocN5TVzW1r9QvXZICmioHToioaYatHJWtcsaScoc7KJwUCEC0iZ6OEFsm3ZxOEjcPD9k/OKRvE8l6Zczpp5BTMTvc9KSgtagRzp87y6gZYXBZDCItZQ1ZzHRpQ1NupiU8t7EOm0d+VrQbvyhBdA6eJGFFZ9iFGFzES0wBGYnBSBreqUjCRHApELue/b0pz7ywzTMXd+hTxbyL+EaxDe1shq8cs9l0GPeJU1MWMIxGFm8VGty1U6zyTRevcAnWO9yvS/0PDaqZgmIWae7yzX6cEKR/yb9BhNRr/U+BGeemdRLBVjXTEJnd3OPyzT3tUeXXZMTgUlEhVlOVPgZc5RBbYVPE2YpZLzx3eYczZ88r78NGFbIVoXIVzjvmfavjXecwVsvUvo0KVHNKe4+99soqUyTIA7GPzCYz1RlEMCjMWBucBmXlLsxlFOR1VLz32LoI/F7XRT7zmd975QAAKLsIeaSP4fMmcU+XxRFBxz9HI01JRVUEwcZI7V2WlgqEPltTGaMXx6mmWsqGj2WILCiJ6IUXLvH1rz/K9/2R93D61CbtbJIJKmR2n8NIUGstABNxXqNninqBh1FLZpMpjVbHkCZjvI2rlOSUsi8gWpd76+i7WSY+pQxwSfQiTNqOqze2mbUdYiqtZK2ebNpOWS6+MoY9RCprWBmNVGXJOFXJBcTphrBW5b8G2S+OQq0LUiyIbpaFHlM+0VnQg6VstpcweBk2HGboOSR0ctG1Le285cUXr3Dt+h7zLtHFRDKe0HUYA1WlrlCzySw7JKNuz8BoNKLL2vmHh4f0QWff5G536ZEcfS3HgsERHOPR5t9xQtByUGA5+xXJjEijWIuojMWi0mOtw1SK7gsiWeY5/1xSeXvjqwxaUiM4byxNUxMjtCHw9AuXOXVqi7p29L3lxIoChVISCAriMSX1LcI5XnEjCpY12VdBP0vnVCE5hEA3b6lcRd/12KzFOBo3yN50uCwiCxfrV8idPp8Sj7zUN29LEn/0sW9w9sy5gDGbfQg/3/e9DaHPIolp6B7HmDePzRBUo+nKIDFli5hDwZYn+hjpU8jikouIXhp689mcne1t7rv3XjbW1zMRSZvsio5SpJaEoMi1mNQyK6dT3iskudBKbeaZm0xDLY44CISgTr3qlKITjNB3Km8OpK6ln8+ZTmfM2pZrN3Z4/OlnOewCVA1pCbc/5PVLHWyT4Z2VdbzjbQ/yPe94O03j86bQxlNRdZGlO1i5RkYfN5xwWSOw3NwFBVdwPaVBWAJHlp6y2fIs96Ly/lgYnRpJpCjEkIgRdvcO+eqjT3Bjd8Js3hES+LrWki8lmqbGWUvbzhdjSGMW8mz57zdv3mTeToA0KBAPm/VVrOPMv9tNAF7u74MN/JLJze2e88jPG4VUR7LWpAikyNrKqgqFGsts3hKyH+X17euMxiO2Njepq1pPZlHPBOuzC7N1gzSaKUFe1G1Jjnfks9eDNhYdrq5oVsb4ZszFS1e5eOUqYqyaxdqSV5nb1P5S7osI/GfAw5/5zCdve51fEoHivCOE/uMpxWeW/QIXMkcy/BlDpM90YecVGdaHkHXQYqZHSlEkOUrlLIyu3IRKxnDtxjZf+erXmUynQ2k81I/ZI690rCXz1WPfE/tA33b0bXdE0tz7ahCPPMIpJ+FcPoFjIMWeFHokqVecxETfBvoQETzbuwdM+4j4KouKltR9qZmHGXZjabI5a7NOouRsobAoS7f61hSueC4OMlJHrtuSCtGx/oEcfZJbEGP672pdnULIG1/og3A4bXnm4mW29w4ISUjWItbQ9qrio54HmlkVDn9R6AGGhpey3qaIyKCzvywz/0as4/fQ8b+X1xaz0QcsgsHxxy9+EMRZ8BoIrLesra+zurqq2asot0W8pzOGnemcbzz5DC/e2GUaIIinTybbuevmd87TNOM8MagHPEAxZykejXr9tCTwGZyg+AChrive9tADeKeHQplypGWMx+3XM8DHXy7mvmQAiGIJ+KdCjJ9cRhkNP2jNELFMljwKMZbWUj5tjIKCUhpMN5VX4IaOKCzMEFKCtk9Mu8DjTz/N5atXmc/bRfomib5rmU+ntLM53WxON5/TZWcVK1oh+azUsuhPLF7/EBispcr1mFMmhoKUrB2IR/281fGlb5h3kWs7e4Sk8uZBdNY83Dm5F59KXy2RJcAU1jkajZDMjdCbtGxkNag4bspaXu9w7Y+p4Rw38zx6suWfvyWxzm3EcqImQYKqAIcIF69c5/Gnn+dg2iLZqCUZQzKGLte0MfakGG7pOJXXX8w0S6OrfM63S91fbh23LVs+KI5fm5e8uZeMYY6b3y4Hg+UTNFnVi4zkkXYm5VS+Ym1tXbEhMWAqD1XFxevbfPJzX+TRJ5/loA0kW5GwQ9lhjKWua6oq62naQpJzAw4lZlUf5cxkmrPJNnBJBXTf8bYHObm5BrFHYp9NX1+aDZjXJyE99XIAk5cMAB//+G9CmPci6Z+ATG4HO1zWO0si4BZAHz3nVO00xPwVVNSzlBLFRDNlIoS6WteEBFev3eDJp55mOpsPdk0iCssl9xdirpdSF3Tzm2yIWWbxx26Gpq4HC6eU4oB5N6Jzf0MeaYag6L/5TBl2zvPsCy9y6ep1ejFEMZBBHVpv6+ZSAItf+BqOx6ysrLC1tcnGiXWWZbtFyuReFlORY2u55h1GdhQQkBlOt4IkKxtQEWf5xhYGZyORNBi5Soq5hALEsrN7wNceeYIXr+/QiSEZS2IhOokh23l1tN2MEPslzTs7UH7LhtfPdSFE+Xo2/3LgKBt2OQjclhq8tJZf3/FgUF5T4eyXubvNmZnakAm7e3vM5nPlRPgqYx30s3NVTXIVV3Zu8uVHv8mzL17iYDajj1pQFt5+jDJMoUajMd7XOh3K93TBzSyJdurP9eoVUBvHhTOnecuFC3iTqL0tF4qX6QBMMPJPwPaf+tTvvdRjbt8EPHoX8mngS8AHFjdmuTnLHNkusmCrM/qUtHEWjRJjvLXYpECQmCJBcgezWIsX62vUDrvte7729W9weusEb33LBcaVju5S3xP6nnY2p5+3SBeoVuxgiRx6RW/5pqZ2ddYlUO500cUb9AlykFLWojLU+r6lm8/ourm+Pme5dm2bJ559nnlEO/9YrArxZdLFcOsON+zKyip3X7gHa4R7Tp9ka+vE0FC0LDKARfZw682bJA2NOmsyRHXp2nP0N+fmkAy4fp0FHh0DZt5oRq9JZi1OefbZi1y9cRNxDa4Zg/NgCobAZNRiYeCpEOxAPi1jrZzyK4ZCsmfgSzfvXvHWexWn/GtZ5TUe94ss39OJSc7QcuckxMju3h7Oeg729lV0tjLE0KG3vgUqLt24zlce/QajyrG+di9NBs0tBysVjM2IRYxOt5Yg2KCya4vSyhNmHd54qtGYH/zed/HY409yEKKCx6xXbsZtrhvIlwzm0690TV42ANgE0xWujeb8KvCj5Kbh8uc4SFJZBThIErzP9XzQjd6bXqWirPrAJYlDE1AyNNVIJqrkZiLWs72zyxe/9CVMajlzapPGG6QPtJMZk/0DuumMcTPCYvLpn3X+7a0EE8VaM0T8QiGNOTtJmYLZzmd0c1UYtt4jzvHitetc37lJRBswg+S2QJQyQ1hAMb2vOH36DPfddx/OwoVTm6ysruQbCxYp2UtvCHNLdNdgoaMffa+D9VnZ3kuYAB1t2QV4YPnmyCOrGCLzWcvzz73Ao49+k1kXSL7BGKeCH6MxEgKj0UgVf/o50s9xTtlxjasHvbty+oM2swo0/PgmfrVB4KUaf6/1eY7cz0sBYFmybcEqLIYz+TUk3aBdjLx49YoGPm+xRJwx9CZrFhqDr2qef/FFzp3a4u7zp1gbrakBbh6Xq3SYHXwEAyj1MLefiwWZz1Msa9WeLnU99aqlNobv/9538YWvfI3Pfe0xqvGIENVF6GiKL4gQjeFXY++uWd+/7DV5WanYZ194lgcv3A+wB/wCsJWv/pH0zBjLgt4hmU2XGWZpoSZk8uiivO2Soir4wSopxnpAqLyhrhyxb+m6Ge1sqvP/ecvkYMLB/gExRJqcWlVNA0bTOF+rS63Ka+svMAOEOEf9qI2wEKOqsKZI7LWkkJwhJAddSnzjsce5fGMHMV4DQNapU9us/Px5PlvXDVtbm5w6dYr77ruPEyfW2dxYYX1lhfGooWkcBT6RMa8IKpJqcyZVTguWSi2BwcjkSIFjNABofZ6bi7l2LCShmOLgHBRDyHWkOghv39znK1//pvY3jEJ9uxDzdVEzzr7vdDeU0iEl2q7Lza6F+GVhshlrOTw4ZN5OtdH5GgPA7cZ8y/X6ay0njpcMt/te2Tw6ZVmUT1VO+xUoZvUQyQpZGEU/GgOhb3FGJe7uOnuaEysrA/nH5vtwcb+bpcmI6kh2XU8fgnoV2iLkrRobK+MxVVXjq5q9gwmPPvkkvRgSLt8Lt5j4Pofwl41J1z7zmU+97PV5xRIg47sfB35dkH+7dPIZpgFpgHO6fA0H4w0BIy5fbEc0TtPOMuu2i0aHoNRbJRYZbOVJ1jJP8PzVG+wcHnBmf4sV63AhMaprjEC9ItQpYaJQGRjXOS0yql6bnME39WApLVFvYJ3wREI3J6ReT6tepaBI0IzGtLQ8+9QTvHj1IsZrMyYlyXBkR5SEmJjfn5I8mqZic/MEqysj1lbGSAo0dcPKyoqq5IZE1fic9RgMDokKnDEobVdlt4Rki0iIKRcWm4UmY4qU8x+jp65IwER9TEQylqGMYnOqTkRiR9/DtAs89eI1HnvhKsF4fDOi7yKu9lS1lmGCZGMUIXY9o6rK9WvCWin4G1JMzFOLzOfD75eyoY5NC15p3S5gvJ5S4PjPvtRzlMxAHe9dRloWcE6vBJ9cn6vku45yVXpbm9MmE5BuHhxw83DGwbynGo+oG0uQgG3Qky8ZUg/Wj0g2ErLHZT3OwcWKPjBpyRqsYdK29GJoVtf4we//IT76iYd5dnuHaPVeIS1LqAHw6wl5/GUFZl5tALhv9zzPbV3qjJj/DvhTwKnlMWCOBbfUU8ustcJNVqSaEJMywJJh8KDLn5D23KzTut3abCXuiGLY2TtgN0QajEZF5/HjFZpVocnRUox+UF3bkSy4piJ5BX0YyK65HRanTcnYg1FKZ+iVb+CrGu9rpl3L9vZNptO5Sk3ZRV+9jGL0xM5sPpQQs76+zqmTpxk1I7p2SgiRyWSKtysqb5abU4p6ywaZw/gwQ4l14LY05htwvYtWYknn87dLUjFQf8zRayspQRRSSMzbwLXtXZ6/dJl5SFQrDWIs3ikByvqMaEyqBWGNxXivIhrGY20c3HP1Qz/GLizsyPTG1/LfqmWN3kMlbTckVXgqn3nGYERBM0Gz6L3E3PSctR3bu3tMT5/ixNY6IamJKaL6ghIM03mrfhqVG3ormo0kJb9F5dUYdEowm891etC2rK2ucOGu8zx340aGby9l0/oat60x/53Fd73sveJ7fsUA8Pe++g/44Ad+GjE8LMjHgX9lefMvXxxY2COJFD23kikUxFwGubiMHHQsTgjURspbg0ivlN9RPXSy521EQqA1hmmMVM4xT4k+QR+FjbU1koGRtyABsUaDR9fRh14FHFLSvydlsTnnaFtVY0kxYm1FXY0wtuLatX2ef/4601lEbI2Iy++ruPhYjGuwxmHEUlUj1lbXWVvdYH19Q92RKo81XbZp9pisnVhOZZXFKpFaTxWx5MgoSxDZpaZrDq5lnDdsflkE4+UaumRqIQQIka4NzLvIs8+/wLXrO6qHYCxd1w/9BI/JVt2K9jNW8MapvoNkPXoWDVXvvLpFty2hbQcPvNviEN5E63ivqAiSHEceDtcSLWXJLE6b+RzGKH2364WdnV0OpnNOTOd4P8LWFp9dnBGTJcQVauysUR1AifQp4p2hrhu9G5LgXLa5M5pxeePZ2tzASKJxalEmR1/jx8XwsEH43MNfecX3/8pTADKWOoUJxv5D4OeAtaOjGhgUafO/+6WOuwYM8mmlsNYBwZTlqAd2W4oZzz+izl7txmQpconMUyQYQ+o7TCvsHByydzjl+s1dTm1tcc+FC2yujVlpvOLURXRk2LaqwgIYiXqExkSSQOg6QgjUzYiqGpMizNue7Z1Ddvc7MGNSskSU8GJdxtxbTeGNUdPN8XiNra3TrK6u4X2dywKLSYEQOubzOf3I42yN93mKkBIaBReIfm1kllLr2IeRjTstGUItC1+/4oZ8/MQtgJgQAhIih7OOq9u7XLpynVnXY12Vdf51+9dVhTeWfhgYRC3lJCk1XLTBO9S1Jl+PbBiDyKCDEN847M8bvm43TlxWJFoOAMPILgN4FLod1bXI2OxvAH3fcmPngHkfaLuolulk8lbUz6qpK+WBLGEyfFZKSqJmLAXLYrKM3ryd4ZoGV9esra5SWaPuV5B5DgngEPiH1sgkhFdXbr2qAPC7v/tbfPDHfxrgdzA8bAw/cxxcsIwJKNJH5c8yHTC5vkopqwSXUZc1g2MMRgkwdfack5iw3msKLtBHEK8iJKHvSF3P/uE1Xrh8ldXRmItXrnHP+dOc2TrBya1NxqOayqoyqy+bJKncVd93+lry63S+0hFk29N2icNpz/5hR4yOLo8o9WYnwzlVztk7FYIYj1ZZW1unrkeZYWYBjfRGoO+7nDL7TItlYMYJWSAz/7fNDLYBwLOcccni54wUE2d52Yqv3MxdFCbzyLMvXGEy77G+IonD4nAm0nf9gF703hOyWIe1ltT1VCOv0OuoHolDgy6Xd8ZaUujpctZll+6P5dfxplumTFBufW1Hst0McBvETLSQUwxJFEQce/uH7O5POHMqMJ22NK6hynWAtQxOPhKDHopIVtE2g5BucXAOIRJNxIlQx0htDGfPnqH2FX0XsM4P5aAx5mGD+R1Jhs9+7hOv6m2/qgAA8PFPfIwPvP+nto3jvwE+AKYBTVOWN74xmsKUho+m2GrBZCSbhkTtfCpgJhuMZEddl5VXm7rSTZLT/2mnZpKKh9fOakgdbYiEtieGwMG8ZefgkGvb13nb/ffRRmFcOU6srtB4i6m98sVTJASt14uzigI0Gtou0Ue1mLq2vc2867H1iNo6VNFfuYxQTl8zoL0U8eVBVA7NeZOVdmPOepKOQGPEVzb7vNmcHeUTwZSGjlu68VLWAmAxGdB7aLj5jgyC5OgJVmDQMUa6kLh8/SbXd/awfsRoVe27Ehbr9KSzgnrapzgQYrq+Vwp2Dg7WWUIu6SQVwXJRabW0ANIUYY7bwXXv9DoCaDOWSFEmMkeu4XEYPCaSTOGyMAQCI2ouEpKalM77nukksdGoC1YJnG0bsnKwBg1X9DWMypGrJ6cQUodzFSEJnQSqGIh9r+YkzQoH0/1BOMda2wL/jYhsf+bhT77qa/CqAwAo5Vci/8IY81lj+PFi4CCi88vSLS3WWMuwV2ct3laAwWa0mPfaLwgxYI0KM6pmoNZLKRuBFEhlyg3SkNPZ0CeSWIKoKEQQUf+67ZvM2p7r23vcf9dduPMeM66xJunmjCGnXCpHbZ1ivNuuZ94mYnI8/czzPPv886Qs72ydzZtaJxkFzlk1K6xvbHLXubu4+8LdnDt7jo2NVZrasbY2om+FkXf0swnGpAUQKhjqWl1tSp9pSDn1L7kDXxh0QooLpmCxWl/mfyzDnsvzDaIZKTGfz9ne3ufZ5y9x7cYufrzGLAT6lBAxWKc1aeW8jvkQNQOtK6RJmJgwXhWHXOWz8q1CrkNU2zRVXtIMTzUhjkKY3+zNwFcMUkbpQrn3l7H4irkQCyShj5Ht3f1MNrNKpQ9xsEz3vrj4BgVKOaMGrOi93XYtVd2oc5EoHyPEyNcefZydgynNeIO7772fG7uP5gZ0BPgs8C9ea2B9lZaxul544Tneev8DEwRrrPmwMcYXOKVzXk0hc+23fDFVBVhVU8iw26au1STB2yHd9Nn8chCQSEouAmWbSRJCnzDJkoI6zbZdjxirnAMMeJ3Vt23PwcEB8+mM2OUGoOiFxBqaqiLlwFNckGbzjrpZ4/KVa/z6b/5Lbk72MLWqzIq1A/Y/ZRakNQbj9XQdj9XLfWVljK8sTeMZjbzyuVOkqTyjxmPJY067AFQlyZOEPAjQk9QuQFLGDKIqervlhmBMyo4ULWuKC9BxjkUxptzf3+fpZ1/g2ReusXcwxfiKadsznbcISgfu+la56qgLjpp7qGJt13U5uFsODg4WVt0ZqkxmBcaYmEwntPPpgnV4G2z/m2UtN/oGQtfSvx/9EsSGIfUSI0MGUYw5FKsBDz34ABvjEbURamdVRp8la/kcrPtsNlMMVMkZpeCYznsee/JJPvHpz/DFr36V3cMp49UT1M0azzz3QhZBldYY81dE5BOv5fSH15gBDMuaf2aM+TeNMR9U6WSX56TK+ivafzk1yTeJOgtrNqDsu9JAqgpCK9dEMcYBXSwp4ipP1yvhx3tP30XVbk9aA0uGINuBgKQ1eS/C9Zt79G3HweEBZ05tsrY2Yn1jlW40orKWqq6IRjnfxnp29/f44le+zN7kACrNYnxVDSSnGGPeiCr3ZTCMRw0bGxvKlc8KqF07p+88fTdnrfasr6/hiIR2qq4wRTNeFhTeUkMf4fBl6q8p04fSOCr8evK0wBoWEKvCBhIVn4yRg4NDrl69xrXr2yprVjf0UTkE3qvLrUJ91QHZLnEPCo/AZx03QWg7hayWnx/IXsaoFkDXZ2Sixqffzzz/27mK5dYRjYHl7w/gaP0/7cGIYmEy+FJEmPc9bQgIhnnbM0UY1aqwXXA0BqfkuErt9DCGGHr29g+48fxFtnf2eeKZ53jqmWfAObZOn6GPhhs3dzlz5gInNk9wc38Hgc8kkX/2et7vaw4AicTaeHSt68N/5bx7r7V2xWDyTZ2pjELWXdcOv7P5JokqElqEIZ1RTq0UoAogVrJ9klN0m3Tq8Z4C1hlCaNV1iARGzSUNZE69BgDnVSMODHMRrk5mHKTAC/vbrK5VnD97itMrG6zWY8bNmNFojIhhMmv5yiOP8NXHv8ncRLxVNSMrNtd4aNfXOiX9GEPjRpzZOsP5M2o+UVvLyFU0dcXIj5E2MKpqVpuGFFrEGlKIVOOxuhCj9k4ub66QdQISqmrjMLioJKhcaVKchwSVwkoFi2+1Y5+CWmF7k3kQQWinLZcuXuHilRv0bqQjUu+x2f/PlKZCAvqEq8FmfobJ0wo1drGazmaC0PK0J+aMYz6bDZlc4SfoPX97Lfs3Qzaw8EdQBN4yt6K8Ri15jW6bjOirBndTk01KhYThIPTszebcU5+hmwfakGi7yHhFDUZijJjKE/uero/MJHDxyjUee/IpnnzmWfYPD5m1gS4kjB/jvWPSC3UU9qcT1roJm1ur7OxcmVZ19V/ZyLXOx9f8vl9zAPjkJz7Ohz70IZw3v2YMv2ut+Yh3Hm8MVVUj2U66cmqWANB1etRpmqsKNEXVJpEgKdlFspz9YEmGMq9UtCOoDXXS8sA5S98vQDBFX806n5lyhdShJ+wsRLppx6Sd0oWe/dEhjamoXUVTN/R9ZPfggEefeJJ56LF1pfp2yQwKxjqaNxnyqhiClfEqG2snaJoRqyurVJWnrpVVlrEwqgKTSwZrCh69NO8UICX5xBnO7+NknyX6gOR/KKdUcdCVDCrSG5YslAKzecv1G9tcunKVEBMhKyENtmE5uEn+xUXJWEsMNaKqmyZzLYofYDVAhVm8tIG2rIeCw5h42w3+ZsoIbvcapACvbvO6jzxcFsGhMDLFWOZ9y6Xr13jg3rtY8RW9NczFQNQbYxoTh5M9dnZ3uXLtBo8+8SQvXrnG3uGUPonyUIzDVApD7qLg+kBIia5tmUwOWVtbQST9bt/Nfw0xfOZzn33N7/31lQCAc347pfS3nXM/2tT1iULH7TNN1zmdF4cQsiONYtILDr6MCb0zQ3kQQ8S4Be7be6dYedGuu7WaGfTZQNFXFbHr8/dluIG1kZsyaEepsbGP4LR3sLfb0tqggBbrqXzFZDpj//CQ5LQXkUodnRuHRlSTTUNXItlEXTesb5xgbX0D7yqaZkRTWbquY319hZR6un4OjDL4x2ZIcsxoQKvKnYt7SW8yljZ8/veFbJ4MXwMGI5cJNjMzg2gX2aKN072DCY8/9QxXt3eZiyV4zTqKUm1pFC5OObJUGnnsqf0BZy0yGg/UWl8tbp/SD1iIb+hoN0kcHv9ysl53ai33S45Dhl/utS73twaYcL5mReb8y1/7Cns3rvKjP/D9vOXCBW52icoEXrx8hc9/6YtcvnqZw+mE+bwjoYYfzqtdfMykNjEc6VG0bcvG2jp7e3tUVbV3YvPE3z55enP7iW8+87re/+sKAB/96Ef5yEc+goh81Bjzz4F/I8U4uAAPHnu50+69J8rCp1wDwaKzL6RBKMS6BXe7jMVS3uAxRhBHUVgtWvOKH7BDBE5Jm3uuqL8kg4hCWI1RCawgSuToga6PBOtw41V8DKTQZ7ktUVntwm+QhK0qcILzhtX1MZtbm6yvbzAejwmhZ1SPBjJHIgCJvu8wdkWVg5dBJgPMTzkAw025KCeHlQaIr/6pgEBNV0VSViVOGFv0+Q0xCNNZy7MvvMiVGzsk60hxIY9VmoPLOH1JmnGZfENLToN7EYIIXdPRzeZKXFlCegJ5xBsXXykSQj+wBMvvXf4qAeNOrNtJjt0uM3mpYHV8RFjeZ8x4yj4GnnzuOS5dvsLd5+9iZXWVg8mE69s7zNs5SXrAYqwnBsG5igwDVSHRFLTJaJcwFPl3j8djUkr//KEHHvzotWvX+PzXPv+6rsHrzgC89zRNcwj8lymln+zb9q4iSDGYP+YJgQqEGMjzTks2pJCU37jLphs+NxLTME0QIiaRlVQgBIWhJhFi12n9PJgwas2ZMppwkIYSvbhNM9LTHPUuxFqM0xPZZNPQcVYSjkHLjpAZg8obUJRWXTvWNlbY2Fhhc3OD0ahibX2FlVFN5S115TA2UXk1jWjbdtHNz9iD3Bmj6CUWFCBZIMIMvIB8CmAGEhVDxpP1AgozPyVSClSuJgq0MfDilat89gtf4sVr17F1g6lGqkZr07D53YA6y9ZUXsuoqqpU7jrDWG2+/ZqmIYQwiIAUDkDXdUsnoc7Tl2G0y5up8CHu5LqdjNjx9VL/tpwdHGcpSkwYh0J0q4Zpn3jsuYuDlTvZHMTaJn+cgq/VrjSmJfBXPoQKOjHGyLxtCWoVdjnG+F9eu3L18Ed+/P3843/2P7y+ffx6L96v/uqv8tM//dOsbp74lAnpHyTk3ys2TxIy/TZl3j2Saa8ZNFHQgk7lt3JNkEENuTIu7D3UHrmwnQyqTVdbPfHbrs9NQmX4Wa8yzNZpw9GgN3flvdJZcy3ufJWBRaKGFpmyWXnLOMt2h74fGDYhFXqsauc7EzHSk1KL89C2UzbWx3in0dsapwGjD9ioQhnO2yEgJZHhhNf6Ua+DGJSQYk1WjF2UAKmM+ZYCgEqZar2qHg7qWquO7ZYnn36GFy5dptOwS+znID1Fk658LevmRV8p/z+PI713Sq8WaEYjUtfTjEbqiJvT367riDEOTjlqZSXD949vqDdD7b+8XmswOq5adBzsJFHvW21O29wrsEOjsLR089YgClmqPZd1QxAdfiMAoe8zRbv/B/feffen7jp/nj//F/78637frzsAAHzsYx/jwz/3kWgtfwfDR7D23WCIVk9hK9koxOtFCK2CRWLUWl8viH6/qqq8147WXSZLJcWYIapegSdd12GtZTQaDeKJi5GjjmZc7fGu0m6+MYTQ4Z3i81MIpGRwdUYjGq1bJUSIkco4fKUgJOscq+OxZhcig7aAtYbJZJdLl1vOnDnD1uYa1lTKlqu0U0xyhNQOCi+FrJPy3B6jls9p+eRPebYsmS6d4cEywIYzFsBmeym95Y5MCayF6WzCCy9eposgVUWbrbNsOnp6OecWrD4geK/oNEnYSu221VXXUlmHTULfdWDNkWyvlBUp3V7o9A/aWt70C2q8OTqxkaymJEUDIvsxSGF/Li2z0NTQJtAtPH+iArq+Pq5Hf+epp5+O/5//79//fb2H1+9LnZerLGfe+q7HbFX957byM5wKgYYU6SXRxsC0a5l1HWJVp91n0YMo2kgSdGMVhF+fvdKNMVS+ym/+WL2ZZajrumI0UsVVm+W+SyAY5JU9at7gBF8Jzifq2g9da7VxTopNIJJCh5GoAqPW6qgnBKTvGVWe2llGtcekSNsekqSjD3N2d3f05MszXoOnD0pNDvmEXQZKFSqxtRlZ533OXJKSbbLCqBSer+qODo3UBRErlw6At44U00BBvrm3T0SFTXq0iRnjQhcvJeW8lxM8xkDfhxygFiCiVLQH858p92FiXNCCY4zM53OKhPxtB+nf4eu4UtHxvsGgL6iyMYrXiDlrSwGbepz0WAnY3LjVTyVlDkBCbCTZqGIzx1ZKaTZv5//53/n7/+/H2rZ/Ta/9dus1IQFvt5544gnuOX8K4EmE91jsO4vIYV3V2awSsg4KLkOEVTlWkX7WGN3MVU7TMxKwNAMR0UZa5vzHPJ4ymT5cygVjwLtsWW50DKXMNN1ktVcuQEoRk5uASVJuyES1t4oRnxltMST6LmQFYT+QlyAzDFOkD4HJdMLk8FBRcCEOPm/eeSaTQ/p2yon1NZXSRvsfzis+3LhKPfwwA2Aq301DT8MMRqtqbqK9ggQxDtJeMYXcXFWyUt8nLl25zhe+/GUmbUcwaGdZEk7KFIGh0QqZlp3fn/eOKNkn0eZ+RLawlpSNYUVfmxiDcXZQtSmBQkSboMvrOCLwO2HdDr9wvIRZFhodBEetz0JKxaMBdXbKwC6K3gOLz8EUglj53cOfJoPE+LXQdb/ylvve0v7ab/7a7/u9/b5KgLIOtm9y7vz5vRjCXwf7R5Oke0QEq+I7GLFgXEbrKbbZVbkL3EeqUU3btkp9dOq154zypI1RbLozjtD2OleWgodXSe9oIFUOl4OGE4OIU9yAlAteRnpafyeTsKKahZGs9iOaiXjrcN7nsgNEjNb+SWXEymltUmTedyRBvQS7Jzlz+jRRAufP34VxiWSDkp7EAS5j+z0ijiR6TqhVgBJvijtxEXkY/icZICQLJ+DaqCVocpYuRTAGh2oG4gyT+ZTZfEYMrar7Gu1NlJGDMV6nJyGrCKXs2myEPrZKULEWFwS8J8RE7zxUhjg0JsisQP0MLBXSdzlw5VlGSY2NOTJuezONA8t6rZJlyzoY5e/lTFcJPA22WgI6EA+pICoX2xuKozMLmCFHxV+TpIsIf12s3TvYfWWxj1ezft8ZAMBzF1/g3e98F5Wzl8CsGGM+YIxxyzLVy4w1kxFkWj9KJlikI/PoVLTSnfL6U/YGKNlF8ZA3BVaLTiZsRr8VE0xVrFVocL6IWSOPzLhKWc1G82qbOQgWBXz4SpmN8/lcHVtzfZ1SUusmo/0LZyyxD0wnE3Zv3sQAa6srtLMZlTWcPLFBU1cZn6B6cqaUA1qLaJd96QQZdPCWbpMyLrQYqlyTG2uJPjsFp0TfRzCeJ556hi9/9RtZuHSByZfCZ16IBQ2NKeusTkiOfB4aOEpWB3n+7SuFSRvoYxzs3tv5nNB3SAoZp3D7ht93UgB4udd5vCFIpvIOzM2idVGYnxRY9y3PNHwNjITFr+2Bv5ES/0hE0he+9PrGfsfXGxIAAL7xzUd559vflUTkySTpvcba+yn1UIaNZuIYxuopk1JQXTmbs2AYDDObphlQc6VOBTXbqOtCqsiBIqOzCqXSsBitwUI1tw/doGDjyqy8wJKdKrN6a2mqSsVBi9EnOtMtH3JMIXfNhaYeZYTiQht4OplwsLfPyc1N+q7DSGJra4O6cgvNNxImYxiK7Pey5v2tllZHUYIWcCnPAIwQikFk0MnHvI989euP8PgTT0MRsEDRmOX62Dx1QIoIdgFoLTAGR0U1Ld5XhKCuxyrSkghJewSSomoBtHNiryo3y6KgryzK+eZcr+Z1HvcwMMYOo1+39LnKcMob5FX87qUA8AmQv2QMe68k9Pla1htSApQVYiQQLlnsrzjMO62z59U6LIBJ2Sgip7h5JCcixC5kGWkdmyioZ0F4SahOH1Jm3xZrdMIQWJhiFF16ixsIKkVkIcFgW6ZNM0UgOgMhqWpREQ4tNXoSw3Q+V322gjUYOAx5xBUjIaYMUso1YIjMJhMefeRRNtbXOHtmi3k/Y1WqTKhZ2HErLsEeucGWM6HFzZel1SSPVVPBpWedxRzIKucJIoQQmU5mdF2Pa1xuTC5OnvJcOkFcnFylk+3ylKYgNkUW9OIYo2oHhJDh28XP0A6krNIJfyVBzjfbOv46X02AeqmSpngNlMc4axFrc7BMubfySk9uAK5g+BWwl473VH6/6/c9BVhe/+TX/olKIDv5OMb8LaWhaKpZNM9Lk0Oj5FEZJus1WwgxMWtbul6diNVfMItN5FGTc1qnl656waSnlGj7jj6qqYXy02P2LXRZorkwaJe74SmbPCjd11qrWgBW0+6QnYdFULuvqlZ6clAh0RjUTqyYknrvmU4mbN+4wc3dmxxMDgkpZCGUnIZnzYNC5S2vf3mstPwaJWP7TXadGYoDUR4ARnUNyMjF2XSWpca1yShSpK1SuSspGoN6Ay+yjKMOPKrzX1U6kalrnfU7a6grz6iptbxBszojmuEtq+vcnlp754FAx79uC+w51vk/LlN+fJkBn20WvZzc0wKyLsCrAUIZwAawf8vZ9HFrEp/+9O/xRq43rAQo67HHHuNd73hXEuQbxth3O2vfnkQGKu+RwjODHorun6oGL06ecuqUMkA7qYp8s84Pbr/LaD1gIARZW9yBdeOHEAaVGgUZlXoNCviI7A9oUTtuySQnkwFETV1nJJ6ukCmfKQeZsvnrptFSxZB19YW11VVGo4ZuPscAla/z5iWXSeaW02S4yZTyr3gF7/I8PqOVEaLNZUNUDsRs1vOFL3+Ny9duKBil1Kalviw337GbtDSfCiKzkKpsdliKSa3EYwg4s7C6rusKa1U6vOs6UggK8R5+zVF9/ju9+V9qvZYm4PJYelkReSB7DWSrjIq1jqZuFiItr4oNaf45mP+LiDv81KdfnczXa1lveAAA+OZj3+Td737P1FjzvMAHU0wnhZwiLjU6rHHDBYshksRk/T8d8S1mrCafrJbK2aFeLvZTKnqxdIIniJmK6r0bRDJUASiP12Rpk+VsRN2BFKpsrSEoqCBDifNI0Tu6dk6KgdCHLBHNsJFcJjAtM/tiiuzv72EEtk6cwDtH4xu8rxX7nQFRZukmutW8MqfhGbjjjFERTjQAJKdmrfQRcEymLV/88te4em0b43xm/plcChy5m4Gl3zH8/4JcVVaMUY0ynGM+mw1j0bZr6fqO+XzGfDaja+fqemNe3t3nzbhe7xTgCBbA5kwsLQQ/x2PVibz7wgWccxwcHII52ve5zXrKiP33MPLYpz/zu9+S9/uG9gCWVwiBqln5VD8//KvA33TOrSAZBZgBQZISKRlSMlhXYb2OCkPXYasaX3lCHzLfXzdi1/c4BBtVOcUMX7oxUkq0XRgw9opMi3kaYen7QIg9lS0pqwx02lLDW1vw6kJyEPueYKDxXhmL1iIhG5Z6R8pZTJWNPLpePQnEGpw4jPXMZi3PPvc8jbO89d778CcrnJM8nlsIO75kzTyoARUD1qQgEmOXoMHkxmmGES+BVF5p6a/LG9aZQeVnoLpmUlT5s3g6StZmCEm1CMgj1VDez/D8bx7u/8ut46/v1QavW8oE1CtAZd6Fum646/x5rLXs7+/pwZQPDVnCECytqWD+quvNp2L1rQug35IMAOCxx77JQw8+gEGeMMadQ/hBSWLKCA8YFINTSrjspW4zdtzmEzkUFSHnh0YbxtJ2HSH7CxZAirGl11BlFx7tThtrBlls7yvqqh709YxVNSD9nSobJgnVcctzd2tVnTiVTZ8ju3WeZPSDxnAEKecrT5/13WKeYMymU65cvgpJOHXyFHXV4Kyi/1TcRJuLw4hOyqlCzjAUFWjJeolFCMRAL8qO9EYhpgeHUx559DGuXb+hlmao8ArcLgNgaEgV41GTtRlsSXNlMVotlOYQQ0Y+ZtZmTNmWLBKyzFUJKm+Wuv/VrCLFxku81tuBgo78G+oS5Kxe6xgDxqo/4M3dm3RdT9e1lFLLULwcpSTHCcPfBfM3kkvtZx5+41P/sr5lAQC0H/DQg+/oJMmXRNL3AQ8kUWXckiCX1F5HXnrzFARfGurPxbzcGE9CZb9SbhDmFvQgMV47hxWd+Ttn82mlTRnvFUnY9T2CZg8paiZQ+Tr3BaxqC2YSvrOq3ptiJjUlwDo11MgmmM4o9NMbg3cOwdAFtRyLsccZSwhCO++ZzwPnz51jbW1MUzsQZeep9162+bZumBubLBgSs4R0hg8RRbH9Gi2BKFlP3jObzXjyiae4eOmyIh6NCqearF23uJsZrptSr4NSip3J3Xz9SikqiQqyU7EMdvCCdv0VQZkGeDBD1fHy6L/jqjvfriBxvNEHSmVv6nrwlECWrV9Lh+T2zzEwHclsQNXrG9CRfd/Td0EDAgvBGG3xFNYnYMxvgfy7xqQbn/nMG9v0O76+pQEA4B1vewfjtdEBwvPO2Z9MKW2WTnn5c5if5obccOq85AdWzBYXtfswScipvC21svdDEyaEOJBrSt27rC2wbHE94AWKZ3sh0KDZiOIIUKBbli93xuKtRwS60Gsd7zMdOu8UJTaFTJ2NbGxu4Cu7xPlOubnpFiIgQz8hDTCRhVONDPJUNk9XYgiEkHjhhRd56plnEWNJRrEAJo/oFhc1/zGMpMwCgyAMm6Dyan6iOAIzmGUOIxV084TQZ7+FmN12b9PQPPaZwlHcw51cxcF3oLG/StrykWCS/3cE21GyuFR6UDLc78c+i2eNMf+ucXxNkuPixee/pe/3Wx4AHn/yMb73Hd/DyfX152ddd1NEPmiMGZeRUpfFJb33uaEXh4tWNmFhmcUYiSGj6DI4JmZxUZGFP4FuiNxQy1h69XpfgHlESgBgCALLAcl7VTke/A1yTyGGkHEM2ZFXikKwZhoxhIHuKzYLnmQqmLFOlXYMzOYz5t2cc3edZWV1JWvtu4xutCzrBOQXrRsKMwTIYYQnsnQjiZYvSbh0+SqPPf4kEaOvZehKHwsASzevzQrNAwhJDNYpq7IYlRpjtL41ZSqTf3MxqkN7FMYeeQfDtb/d35dptXdqFdBOIUfd7vW+1M8dWTajMsuhJsuYgNIAvwXpB0ZuGsxfqN34f5QkfPpb0PU/vr7lAQDgkW8+wn1veSsWHo1JxiLyfsDeHkctt0TegRSE3uvOuUFerGx6yeL6IonQhzz/NjloBIpirc9CITGoIpF3OppMWbPQO58baIBAO291vJhn68boFKLg9CnU4HwKa5mw4BUYZ0lAFwKSSrZiiBIJsWd9c4Otk1t469Vfb2kTSEHR5WCnjUq9prIEFion9aCQZAwhJC5dusoj33ycIALOU0zbj/YAyN38LEiSTy2AFHNH2zqc9cMPWKs9BesclauoKpVR874wEUMO5GYoAV6u/n8pdt23e/1+iEpHAtgyOGqp51VSuSHbZTlwEzDmbzhr/4soIX7qU9/6zQ/fpgAA8M3Hv8n9b30wCnw9pXgf8G7AHPEQMAsATLmoy6mhzfUtptiQQZnflyxB7Zq1Jo4pDhuoCF54r9wCazwub/aCqCsCHup2VFiHi+9LWnIuzmM5lYFO6jugL0dn5RRnZMO8a7Pl06Jh2fVz2q5lNG44d+4cJ1bXhk1W5vJDDY0MtXYB7wwbJQcEhTcvwFUpwcHhlK898ihtHzVdt1kAZfmDKRmANQMseYALZ1i1yaw1I6rM5LwnpJR5GIpfKEKuIqL2YkkWDYRXsY4Laxz/XrlHjtftb3SwOF5+vp5AkDGuOLN86uc/j+ADhgAgwD82Rv4jEQ7eaLDPy61vWwAAePLJJ3jobW+fGmO+YIz9HpC3lTS/qipSisOJURB+pRQYpKcGO+TyrGVDKMkHDN46EEMf+gGp57y615bMQsktflDdKavU/QohliNSWQaGDII8cjNeg5Fk0cMBbpunA/Ou1Wwl06FTkrxRJUOUIxfuuovzp84O98gwACgRpTSIchNvkYHo6W1YIPd0tCpUVc10Ouer33iEg8kUMVa/5NYAUEhV5aIOEOAhVTUYWWgs2Kzl6Jw6PRXuvzZvtayLKYJJvNr983IZwvGT+TgSbxmE8/tebwhTUYZe1lBeyQDBKpd9OQD8Jsj/Cbj06TcQ5/9q1re966INe/OsSPpzIvLFQhEtenLLJ3456UoJUFLL0kgpc+rSD7CZgVWaerCQGC9lBcB83uYaT73YFHWozUXdZFn33zqsdTo69A3WOlJUtd3C6dAJgpYHIUT6XtWN1dzTULkKbzxSxhaZH+6cCqFcunSFy5evqhVXTPnkLYCpctEWlNKhbHqZbnrXd4TQc/LkSVZX1xRLcazbfeQmMNzy/QUq0A6OuHpd3JCJlc/KWTe42TJ4HXKr4s0bdg+9/lT9ldbtkJiv4wUC2hyWJZj3S6wvGsOfc5Znzbf3PAbuQAD4tX/xq0QJbJzY+qp15i9aay+WBt9yM+44PlsywSXGNLjQpBQX8N7cG1B1H4ZIPqDxYqRt24wFUCbgAgavH3RVVVlRd9EYDCF/ZZvzkiKXwFG+L0s9AkX/pQHqWWc5LW89ta+1TAhpCGQ3rt9gPmuxzmfO+NHeUHkXy6ix2554InjvGY9GGKMiK6urK0cCqrlNpz3JrTf+IhiqDFEhBYFStJ0tJYLJmotVLh3K9bRv+OZcvE257X+/Eeul8P+v6TnK88gC7vsS66KBv5gkfZVk+dRnvj11//L69occ4Mknn+SBB+/nxKn1pw/3p9eMMT9RV9VKUdgh36hHbtx8Qw3WTDljXSbPWLt0oxqbxUhVfBSrG7xw1svnosGnH5qJLotgphSRGKi8U5prDIjEAjnAOUOMGWVoHSlGnLWMRk2e32sajqg9lyTB+0r9D7PU8yDHLcL9d1/g5MnN4b0Vq7XhJBYg6/LqpDMNmc/yqM3naYQxDl81PP7kU7zw4iVCVBPUoiy04AKQr/eCEWiN2oVrINJmlssOQNY6NYAxJnf67eAPkDIGoO263FDUCcmrWa+1BHhZ1OTrWEdg4cuv+hh0+tVSeMsocOjRmNIMHEqAGwb5P5PSPzHG8nsPf/vq/uV1RwIAKEjo7rvfirHuEZA9MbxfxIyBfOoU0VCXSUIFm17ssxe9gnyJl4wZCmCw+IaZ4Xtlfl8Uh1MKdN0c77JTL5EYe1IKOAPekl1wIcUe79XQNISOGHtMRuU5V+bHNtfrefNIlikbj3BevQits9qgzCIJXddzemudk1ubwxx6cPrB5hPXZxyDoiZjLoWyTJT+mYTURUQMIQoBeP7FizzyyKOZveeUpLOU3pYb2mbZNFCuk0koXVmpRrkMKXRi/TxC0qBSVZXWvM7S9R2z+ZyEqO4DZXrz0lDgl/q3l2oGvtzPLa9XS+09jlO43Wst1+rVNB6Lwas9gpPI9b8+9Y7AXxJr/54Ymz79Gg0938h1xwIAwJNPPMZDb397SiJfqbyfWWt+VERGsMwCXOCky2loMv01Bm0+KWrTajreR1IsbKwcSLBap8eUiXx2UBYChvn/ggMQswy2YTQaKwsuFlXfornXk+KCLVfVdaYy53Fkft7SZGvqatDsM1aFOMq8v+86rl56ke3tHTZPnqRqRrRdT0jQhcjhdMbu3gEHh1P2DyZMpnMOJzP29w/Y2d3j6rXrXL58hStXrnJjd5ftvT0OpioIen17m7YLHE6mQ6AwuadSNAcL2KhcY+c83vrBo7GqdGLifaVkIJvVkvP1Cn2Pz94OkqL2c7LWgUg6clq/2rLgjSgfXi/1+JWCzys+Vx7ZWlMUncqfBjB7wF8muf8nQvhWwnxf1Xu9o789rz/+J/4kztmm68L/Iab4H0iSNcgjlSXjCn3BltDHYTIAHOkTQMEVZMMPsyAJlY2uqTc4rx3/okBcblRfSD9iWFtZ09GgKJ25y30Em6W0nTOMmlrHkEtAooInt051+4fmZt40tjjqArHvkPkMa+Dee+7lHe94B8UGqus6ZrMp0+mMvusIfa+CotlwZD6bMW/nTCZTEolqXFFVFePxqvoX2grnKra3d7h69Tpt32Oc6vupCm2eqgxjQC2jPB6MyqkV01fnaio/whqPoJmOy6VMkoQ1MGun7O7u6rUnwIDPOIr5eMUb8+V6Ha/25j62UV/Lcy3fD8fLjlfOAER1EvPpL2U6hDlEzH9s4G8C7Z08+Yf3eadfQFm/8Iu/DIYRwp8Vkb9ojFlZngtrU66oAWk6rGMpn+f33dCZLhsdOALxNXmUpujBpC7C3g+a+MviG9ZavK2RCFVV0YxGSkwCdWcJiumua4fPhh+hqALldFxNQfUiqzGIo24aVfBJKWcEWnO6tLDIqio1Hu1DIPS9Nkb7QOj0v8fjMaurq/R9p65DIrRtR7KJVOeusxgqXzNuxqyMVql8xe7OLpPZjD73VFJKGcnI0C/RTMhTGY+gkl76bw5rPFU1oq7GAzRZFZ6ylVWMzKYT9vb3cpkmqPzZa2cD3qkAUD778t+vNwCIZQgAGZk6BfNXjJi/LjB/+E2w+eEOlwDL64knHueht70jGGs+n1KSEML7Ukr1gErLVmKSBMsCI6BgnnSLGcXReX4m2AwuNXrDuowLKAGjZBSF8mrQsqLYjJWJgzFmkDWv6iVGYy4BCqKxGDnErE4UU9KT16ggqEjWGjQAFusqBetkE1IVPfFgHWItIaG06aoiJCEkoY/6JcaSrKFNkYTVRp7zGd1Y0WcGWtv3iFFSVFVXg/FKeY9DQxUo/RZrtTkq6PXWsqVVoxXvMvpyrv2QFGnnMw0eKBz4pdLn40G6BOrjhhvHa/OjakWvrnl4u/VSAeF4c/GVSohbSg2jAVVZowBmYoz5T3Xzy/zhO9Twu9160wQA0CBw371vCSmmh5NiXd8bY2yAQY4qhoWFFajaTjnddS2p3w4DaV1HHpO7tH2vJhZ+yUtQQUkpjxz152MMyicIvSoQpZgbZ7lUyfj/AvBO+YQPMQ7P04dIH3ratqPr9Xm6rieG4j2orr59CLRtp4/LWvsxKcQ5NxWyUGoYwE4pJdUCTAGT8Qsqya6BS4VU4XAyJQm0bVdofHptrFWJNa+wXp0kQF37zAy0WQ8gjxIly38ZMFnj0DkLJjGbTrR8cEdP0sXncGt9ffzEP977ORKcjpURL8UhuJ3c1+tZrxQAlkFJxpihCZhf0wHwf7fYvybI/LMPf/pbsHNe/3pTBQCAZ555igff9rZgjf2siLQxxvdVVTUaXrArDSzV14sx5JM/DTdi+UopZEy2ZJHLUtNCkgUD8PhYCcgSVzrq07EdkE+4GNXwwjmrTj4lkOTRXIjhiJ5fynr7IQT6GHP6r9lA1/W0XUfsA32rHfTZbEbXdQMpRb96dVvKwSekqMYdctQ5yBhL7SqlMIsaqZZsCANt16mfYu59lMA12FrZglpjoAiXhqnLQSWlxfUIoYN8jeu60pIlB4bjG7CsZQRfuUbHN9lxYVS4lXv/cil9ef7jz/F61qv5+SPvNSM3EdkD/m/A30ik+ecffvjbs4lew3rTBQCAp59+ivvecl9IMXzBOX9grX2fiIwXlF9Bk6zSxVaNAf17yQDAe6sb3wJGtOa2i+8bs5DdKjdcSUXrqlJiUgoYCyH2xNgTYo8Mp79OjMvPll5CQR0ONlo5CBRx0oIaTIWEo8yh26ecuZlYNnrK3AaFPg8CEgM+YkDuD/NnpaBWtZJ2ur4nxSU9ukIDztiCkBVrVZAlDlLq5NNf+wQuB1MzZAF93zGbTRAiTdNo+WW1ZHBOvROaprkFzHQ7h51lqG9Zy5/RMu12ECkpjy/YiNuApr5VGcDxlWHcO0bkP7IS/x8YM//Cw5/7Nuyc1/He7vQLeLn1oQ99GEmpNs79L73zv5JSOh1CzyjfSG2mEscQspYdOF8NvADvXYbMmmEj+soPnH7JEleDyUj+vaNGhRvn7VxNN7KYQ1lDh99m05Ncu7ZtO1zUmE/6ImoCNttuZQhxDmY6qhSsLEAzw4cy4MgzGSgDjBZ23oX8oz9V8OWlBLJZzbdpGqqq4sKFCzz4wANIgse++U3NSELPiy++qGYpkjR7ERVWVePR8vpVT8G6BeKvqrRsct6pdVseA/bZG7DYtheKMZhBU7C8x5gSIfQDAjSEmAFei/KtBP4B3p09IJezloI6HsqDcs2WaNPHVbgLxCcdIZi8DCahMCZlEXCXCVnD/WG4IVb+kkj4u0ZM97nPfPZOb6WXXG/qAADwcz/38wh4i/nXReQ/iTHdM6S0edsPKqsZWVdO7OJcW05g52ze+DKYNaQQB/EQgwaTpq5JKTHrOqz3xxp/+juPjiGLiWY88pokq8kcT1RvOfkGJ9jlR5YbTANEKtTDAr2tapzLvYpQTDzAmmUatTY9x+MR3lecOnWSH3//B3jX2x6ibWdUvmI2n3Lz5k0mk0OuXLnElatX2JtMafvE4eSQg8PDzGLMhqCZ1ShZ0CIMDdTFrNtYqzoP+f0PNuciOFeptoDJ1GxnMlMy06gzcWrgPWRyVBqCad7YSbTkyhlAEG20el+AXou+kEFLGccikGhg0gcUpqgxFrVwu3WLHC1F0iAss5jvD+uiGPkLycg/MmLC5x7+9pJ7Xut60wcAgA9/+Bdx3tlu3n3IOfdXROQHl8d7ZVMWvLyYlKG41eA2XNLQI7UlSxE86xIWuq0BeoUTDq+jzyM5n5WLS/qv2YE5kqYuN7DKv5V1PCXVg+dow1IK28gs/p7y+1SxkiaPNDOsWXKPw2Q+gqTB5cc5T11XrKys8oEffT/vfujtxBiw1lBVfkBFWqulRRcSXdQexWw24/DwgNl0xuF0wo0bN9jb32c6nXD9xo3BQbjrOx2p9urZYJ1apZUaJcaUN2K5niYbiUhmcXLkhC/BNaU0NICXyzTNgFR4JIReJyHZjj6lRU+DRYWDLWXj0u8qmQSljOAYEevYWv5MbykthC8K8hex8lHEpDdTt/8l38+dfgGvdv3MT/8yP/fBdT7+6cM/guE/FZEPxRjtciNJ63dDyNZdyzdOOXEKunBZ9ipGFQ+tsp9A2TzquKO/vxCUynOVseSt2vnpyI16+w71QirLZqHO4485IvlFgaJmOLNThmLKAiMGuygl8ty+KCsVfkRVVZw4cYL3/eAP8Z53fg8W6EOX6/hEHzrqusI5SxcifdANuzJeoao8fa/9jTrDfg8O9pn3cw4PDpi3LTvbO1y8+AI3d3fZ29vL/Q9hmgVVVE7MDAGroDRxsnTSLyY3MSWVE8hqTiXrKJ9jXddLGZ5qNki+rikm+tAPJ32ZDHlnc+M4C87khmfRarhdnX/8M1w+eMrnAiQR+SjCn3vk9OWvft+1e/jE5z9+p7fMq1rfMQEA4EM/94tsra0xadv7U4x/JYTwrwG+gH+G+s/KErx3QQcG/UBLs84s1f2kNDjz+ixCGop5KOTO/8JZZyFVFvPJKUtp51E8+WIcuTjxj/LalXG3wOXmlyTLozDownwgAek8PuMapGyshLMlAOgTVZVXUhJw8uRJ3vX2d/K+H/gBXD7tU0o65rOLVFxv8IVnoeRTtjgE+dzgC1GFP/0STqLrFJx0eHjI/uGEWddzsH/AzZu7zGYtBwcH7O3uM5vPNaMSneKYLGhSLtARhyTy4HYpkypksaHHk+nc5Tli9pZQb8ryXhiyAt242QI+dDmIl1IMYGHucbspUbmXnLMhJflvk6S/iMRnsRWf+fS3RsP/W7G+owIAwC/84p9gPpng6/pM6Pv/vbX233HObZWaXEQIqR8+rNKAKiKPQy2f330xISluQJIkM/ZMdsKRIym8jh2PUnN15l42jxuoystlgL6+orW3UBSyWVVHueBHZ90l2xiNRgiJg8nNIXgpbXlhnqpwUxlwCSXIqAJSjYjQNA1vu/+t/OxPfDC7M7s81lQyU0z63M65LF8m1FWlBqTlRCZfMwt96o+ArVLxbcwnZLIW66sBmg2WGCIHB4dcunyZS5cucePGNfb299jf32c6mxKjNg9TVD5G3TRYXzFvO/q+ywKrS+VfVnuOgQHURM7iSi9m0IqkKExr47LKr60AvLTX0i+ykCEomCOZXQnyxpibdV39FyL8Z5X31yfzOZ/+1HfGyV/Wd1wAKOvDP/thQvR1VfGvC/zlGONbnHOZkhoIWSy0BIVyow7Yf6fAl5C9A+qqJvS9cupzBzzGNASAsqm0voxHAkzRECg3WXl8OWELnXlQNZJyM5mhm59bChk5uggwzjmapgYjzOcT2q4dvOZVg4CBzWOMwBJTslCoTUb+1XXDPefv4ud/9kM0Od0vKbGvtKla0vGYa5+mWJ93vTIbs8ZdMkI/XGOfAyNDSZNS0tatK0hOzVTqZpQFMjTwzbsZ83bGZDLh8PCQ2WymfYeDA27c2ObGzjZtr9Lv0+mM+Xymz5fl2sxw4me4cpaBT1kdqnwu2kMpblHVsKEr74frrSvlvokbSsG6rofP1nt9r7PZ/Lm2a//Dytl/lBLdJ37vd+70lnhd6zs2AAB85CO/iPfWtm38gKT0HxpjflJEXJn5w3KjTf8cjUa0bYut/MDJL8p3KUY164RhM6YkR078kgEM+gRL31sGn8Ctxia3SyMXgeRoBlBO70Gh1whdP18Cwhi6LgyBRJtXiRQX48pFeaHAptFoxJmtU/zShz/M5okT+SQTuq7D5m58jCH3PrSMGlU1K6MRsQuYJLicVidM7o8IRxud5ZYSosnmhcaQ6Y/UvlJhpLyBZ92Muq7Uf3EJwVnQhleuXuP6zg7zthtq+vl8zs3dm9y4foODgwO6vqMPque4OM1ZEMjKc2bqcpF+L9e6NIkL8GsZNr5opurnMR6Po/f+d5q6/suhDZ+03qb/4Z/+t3d6K7zu9R0dAAB+9mc+otA+kbsR+UuC/FuCrCz3c+zg6+eHdDwavclSBrn4/JjYh6HZV4w7dbpQUt3l1N7mmnxBNrJ59g1Hu9opE3/KTVU2ccrW5N5X+dUupholawEZau4SZEQghJJhZA6/AUM8cn3K62waNbs4sbrOh37yp7j3nruHTrqI9gEKgjKSCFni3GJoqgqJCekDxKJn7xDjhhFhsVeTpaCAjcTUq7pwdi72vsojUz1pQwy4asFDKH+WBp86NynzUGQxCYgx0meE5MHkkN29XeazOYeTQ6bT6fB1eDhRs9KUCJIGkJKIDIhLDdJHQUOLhq5mEjlwTPvQ/70U46+cPn32xa9+7UtcunTxTm+B39f6jg8AAD/9Mx/BhADGrGHNvy6S/n1r7YPGGGKKVHmuX8aAIZtWJBJGzNAfIJ965aIYsaS4PGGwQzcaOALCgaMnYLmJy8hQ2YpuyQ4tDqdzOXHKWibHDEIm2eS0nFzL4y7JlNPCcTjyAefSo5QS6+MVfuSHfoi3P/R26rpBVY4szhdp9YSrlJQEDAxIiQliwibBJOijuhKV039AVubMSN2GMnQ6LZqmVVVlNGSiDwGJ5GukgauqqgwqKq/fEI2CsTSTUnJTEqHvI1XVZBDWHO+dKheJKkKnlGjnLfv7++wfHHBj9ya7u3vs7e8xnUw5nBwymUyGDCDlfoLNrkzls8hEr6cw5q/uHez/o5NbW4ePPPpNrl194U7f+r/v9QciAJT1wQ/+DFGwjeVHDfwF69zPxZQq61QOW+fT2XEnhQIdGDa0yooXVZyEEQdpWab8lXXubsdwKyeJHdSIIrd2lN2Rn71FBssuTthSvy43r/QHM+98OfsZpNW0mbg6aviBd72L97znj9A04yG4OWdIqUcIub/gMF6bodY5JEYcBo/FCoQUhk1bNoliJLSU0SAnA0jIWpXLbkY1XTfPiEOhkhqnPloDsSjEsJBcA5IpYS0NExjvayQ5qmpEijBvp/njlAGh6YayLaqFm3N0oWc2mzGfzzk8POTGjRvs7u4ym82YTKcqoQ4cHk6YzWaEEPsQ4m9a6/6T1dHqp7vQpd/87V+707f6G7b+QAUAgJ/5uZ+GuUVsOl1X9b8j8L/tQn/eZucdYwyR4kG4hEmH4fSXTOVUh+tFB1n9Ao5uzEWHm+G5GJpKS4jAgfyy2Py3EmTssedwQ7qaRIZxVskoFtqGed4tkkdfS3ZrObCICHVdM64qfuB7v5cf+qEfomnG6GgzaAPRRP0SQxKrdOLcLO3mLVa0B+BEdRatO0rUWUZHFqFUu2S9HlOkGdWE0A+w6caP1G/B6XSk61rV1B8oyBDynB5i9pUE72qsVYESZUV2+TNKwygwZcRngVQrBLs0X5dm+cP4EfqkvpEHBwfcuLFz5Zlnnv1bn//Sl/6LM5vnbzx55ct8/cuP3+lb/A1df+ACQFk///M/T+W9b9v+J+Zt+x9gzPudc3Uzamj7nhh6Ku8G2CksbmLIqW1c4MXLuG15c90OwLOsPVAYcWUjlvq/pB5Dr4FbWW/Lm3foYmfk4dFxFMPPiN7hR8aAiymFov5qa3nnA2/lve/9YTY2TjCULEScKyIeigOQTG313quMetASwJbXa5d/dzntXcYUCN7VOF/lPkc5vRWWK3lsSLKEkLLoqNC2s6Wmah6XInmGn9meiMq2mwrvG2VKhn7Y1MW7MKVIVdXDqG+Y5xe9vuWVO/9JUaSdde5Tzvn/eH3zxO8iEn7w/T96p2/pb8l6U7IB34j15JNPcur82TSuxs+EGH6jrqqJ9/7tMcWNgjJzg9llWYZivAHZZ4DsWpxT+tKsW+gVLgArx+WqY0xHMOkaXGQ46cvjMleFZfJLSfUL8EhEBrERWICJyuP11S8Clv77IpsoNbpBWB2NOH/+POvrJwa5NGU4MtiCi5hB32DokSR1Ji4WZkOzj6MoOtVQjHR9UPpxO1cZNQMkoZu3kD8DQYVfzVJg9V5HlDFbuzvjBu/FJDFrO+pFc9YhKdG1rXI6is022twkOyqLAhuwxuRRpmTN/qTZhrWk2JNS/2Ll3d9IMf7FejT62o3nnk4f/KVfvtO387ds+d//U7x516d+V2WXfvmP/fErdVX91cPDyW/HEP+sSPqwwYwHJSBbTq3iOVAIJGbYfFDGSYumoDHp2KY/+vuPp8fl+4vaebkMMEf+XtSNFjPsowGm1NeDku9SCfBSSjZ6OtrcFV9kICkV1aOYWXOLWcLAQRiyFztMC0rqvJxBLbvqDlmECEYiMQi+qiElZrM5o2YEDmKZFOZAlVLEZ+6Guj1nqW5riaJqxSXjiLFHhEG+vbACC+GLpSzLOY1uaXh9eYSp/pGzGONvYNNfH6+tPJzmXf9jH/rZO30Lf8vXH9gMYHk9/thjnDt7V7r3t+LzO/fLrwvyosW81WBOk8Qokm6BZBvqxYw6gwW6bjHGK5t1aQO+xFpg0hebfrH5bq9yc3QtJKkXzye3bHB95NEeRRkllsc5axhVFWfPnmVj48SQbnuXcQQS83MUl2Ido6YYkZgGztKyCtNyWbJc1oiRAV/QzudZJThiJCFRBUMlqeaCdxZSRFLAIiCRFHtC32Mkn/45g8pVBNYa6kqVir33A9TXoDoI3uXsLsWs4KxiKoIoVdxZUooppPBIiukvi8ivSHr2iXY6Sj/3p/61O33bflvWH+gMYHn9zsd/C4CfCB/aC4m/7Svz2yLpf2OQ/5kx9i5EO/9iC0w3K/nIYrxnzCIYLIxDlxGBC07A8no55ZpXo5J7RGlm6Xfe0j+4HTc94xSWg8F8PufmzV3uuy8tqeaoxZkkIXuC6JTBgK/rpexkOatJS+jGRRArjcsoIQuvBVLq6DogOpBE6DRlt64hJrBJN3eMPepjqrwDaywSE1EMIkFHi6KszNFoTNEgGODcdiHyAgzu0FGEZGTgCOAMIlw2zvwDZ93/y0l8QoyVn/3X/v07fat+W9cf2CbgK62f+vGfRiR5a/2PAv+2MeYXwJw4QvN0ZphZAwPU1Tk3KPrcbh3f8C+lTvtySjPHT/tlntBxZtpAKoIjY83lZqDamTlq5xg7x0MPvZ0f+eH3s7q6qo+1AqghinIbbHa5Nfi6opu3SAjU1uONipuEpI21KrMsQ1xoK/R9T5c6rBNqX+GtRUKPzzV4CgFvHYJjNm/zqNBmcZCePIshiSGmEcZWOC84DyJhaPApsKh4QSzhKcyi01/ilvGuXMM9Ef55Sum/nE8nn/a+Ch/503/6Tt+Sd2T9oSgBbreeff4Z7rlwf3ImPd/38Tcw5qsYtpKkC0A1nKi3iIoW1ZiilVfq8CI2sdjYx9Vsy1o+xW/3mNtlDAnRehqG7jzD3wc6wJClFGFK5d2ralESdJNaSz0acd9b7mM0aoZm2YBdwGGxuTdS0mhtoLlscWW8BojBiFUk6whmsdbQ5ytlcSJUFg739nj++We5dPEFkiTWNta16eosq6tjrBeakWc0qqnrmqYZU9cN3hma2jEaVVS1jh+RROg7+rYl9p2qEIny/WMMeUyqLk8x9lmMtZ8K8jFr7V/yzv1NUnpyvLqWfuZP/sk7fTvesfWHNgAAPH/xWZ55/llOnznbffqzn/zm3Rfu+RdYHsdw0lhzPqXkX0pt9ujY7ghD7DYB4Pa/f5lDcPz54WjmIJBtfJcmACUAkLl2S5OB8qM2OwHZPPGw1lFlOOxb7n8L6+treQNnDQNjsRhcaSqahaVVcbcjCYFEF9V63WKwsuDzh5RyNuCovKdylpWmxhKz3Ziwc3OXw8kkm6gG+tgxm0+Yt1NiCkRJdH3A+4rGW+raUtceVxnqulLRVgMuCd4a+jwxkBQJQSXbvbNZGkzmBn6v6/pfEexffe7R575kKtP9wr/xb/B3/+E/vNO34R1df2hLgNutH//xnySlZLxzZ4yxvxRj+jMi8j6gWX7c8gjueL0PL1/zH+8b3E7h9hbxyzIFcMcafuaoUKazml4vSgRwrhrgyt75bOQhrK+u8DM/9VO89S1vydJdC7qvEXRDOwtOZZS7rtMJQf5ebxKBiMfijYVsg+28I6Hqw8aqWakhMPIGUo8xSsgar66xd3AAIqyvr+lEhchsNsUYw8HBlOlkzsbaCU6sruGdJ2U0YVExTn3AZEGUPpN9ikS6Mixja637rHPuvw4p/CpBrmON/MS/+qfu9K32plnfDQAvsT74Yz9JhHMCH0Hk3wR+GFg7fsKWAPByEOHlxy6f7nYJ2rv8HC8ZAI71C49Koi063+VnlHLrKaIhRY/AWdhYW+VHf+RHeNc73qHd8qJeHCNODFWGTB8PAE6Ud1gCQIEHS4zEoLwLMTDvWoUmi9DUltXGgwQMgq8qfFWzsrZKU1fM51MOD/ezExG5WelIyUAC02spIcboNSjNThHlJmCYZ7+G3Ow8tNY+HCX9/aqqfv3yte2rv/xn/ld3+pZ6U64/1CXAy63nXniW8+cvTJz3XxGRXzXwFaACzhljxmVTL4/4lkExx7/0seVxyzDiW1P+l5KxHkQ3WXD9tT2/6Ewcl68q3XuzgO3hncVby8mtLe46fz4r7SSt77MKkDM26+MsYNIUye7SRTcGkyQ3H/V1pCwtngqjT4SqclTekEKvjkRVpUaj2U15Pp/S9S19P8dXltWVFWazOZPJhBgiDgeijceiz6BS6ioUmmKi61um08lO3/e/Lin9x33X/rW6aT7z1Fe/NvlX/3f/xzt9O71p1x+aMeDrWZ/9nCq6/tj7f3wHN/7vSd1vAD8syP9EEh8G7jXG+gUmoJz2x5t+i9N/ERRuVQc+LiN2nCuQlkhCBh1bLptqLJcmy8+5LEtWGoaT6ZS9/X26rmXUjAbQjMGQYsDWHlBizuCiXKS+i1qOy0Esn8KFbi0xZAGQZbagy56HGmTmbcsTTz3FdHrI+fNnOXV6E2thNp3Qth0vPP8iG+ubrK1uYCtPU48JkrTxmCJ910MURnUd+nb+QkzxN1JK/13j7cMXTp44fOLiZX7yf/q/uNO30Jt+fTcAvIr1e58aLJwPf/RHfvy3MHzCiHnIGH4JY/4Y8H3A6ss9x3FEngyb49XbVg01euYhFAxxObWPB55lzoIZGpSZYpzhs8KioYjIoJEfYwS7lGnAguqbogquGDtkDZiFF6KxVsE8OciFPhC8wRJJaWHiMW9buq4fpM1n8zkf+9jv4JzjwQcfQsTw/PMXWWnWWBmvUq+MacYjrHeIsxNr+UozHv+PxphfnXaTJ0a+6X7q3/ozd/p2+Y5a3+0BvM71kff/DMZgDolnBH5ERP6kMebHgft5idJqoR+wWMuovtv9+/F/WwiJZneguHDSSbd4C6iLjy7t4Ttnqb3DWcOZ06f5+Z/7OU5srOOzKGfXttikUmDqoa5juuJUbAUcho44NAEdWgrEoCg7W3l1GxbJPxNYG1e4DCNcWVnVV2q0MZlSJISW6fSQp595kvX1Dd7xju9h+8ZNPv2ph+nawOFkxrSdxY3NzWff+uADn3j72x76/104e/Yzh9P+egL54Q9/6E7fEt+R67sB4A1YP/ZjPwmkyoh9ECM/IcIvAH8UuAtlEw0swgVxSH+2/H1ZEAQWrMLltawxUFCHMS7ASEnikuJtOfHz80pB6ZlMiDGsrazyUx/8Cd724AOYDIOOBexjLWKNTgKMJeSRHzHpZncQiEjQpqEzdpiHFu9Cg0FipPKwNq4w2UZMXYmzo1IyhD7gK8O8nRFCz8rKCilB6BP7+4fJuurypSuXP//Io9/8548+9tjvvnD16lPnz5zp/+Wb2HHnO2V9NwC8gevH3v9BTDRgGInle0A+YKz5EML3A+eNMRXIkWnAEAD8gpOu8Nasa7hA3yKJQXX3+ARBnydmO26LMQ5rvZKGyI3HLF1gjcU7y7gZ8b4/+kN833veg6RI5VQp2CYhdWoc4usa5z1t1zOYaIiiJMUIfdcpS3BJYr0Pgb4POOsxIjgimxsjkA5rE85rRx9j6NqIs8qw9N7R9R0pxn46nV2x1n+5bkYfPXXmzCdXN048uv3ixfkf/aU/+arKpe+uV7e+2wN4A9fvLSSh5z/10z/zJeP4cur4OzGktwvyIyLy48D70MxglcXWPuIBYHOjTb+zMMA01gxgm5RuhRRrYAmZzWiX6MG5ny86M/d1jXpiqLz34nkTfR9xouCaOAiaOlQcIasW2WLhJXjrMO7o+DLr5evoLkYdz+ULo1imhHWaVSjjzwkw8c5fBj5rKj5hjP3M5atXHn/xxYvzjY0T8r/+8//XO/3x/oFc3w0A36L12x/7LdCdN/vFd//AV8Zt/5VrZ8/8PUHOJZEfQHEFPwR8L3BKRCoRMS8FCdYR4FGduuHfS5POWkIsv3bhgLR4rhwIskCmQehDYDQaUVcem0U0YtuS2qxhaCyS3Y+cdwsKsAh2SQ+gaCAum52kCG3ssna5NhSrymO9lUTqHXY7BL7R9+ELQnrYwJcwcnVmd2b1+gp/6l/9s3f6Y/wDv74bAL4N69e+/iX9jyeYAc++970feFYM/7Ry9gRwlxi+H5EfAt6N4UHgHhGpyRnCsMlfAmC4rCGg5YNmDkeVgxb03WUNgulkwnQ6hdFo2NAqRa5qSYLO+4dAkn30BuHUI0IgC8Ve9R6ssN5BtJKM6VKIF33iKYv9OmK+YK37clXby90he97Z9N5f/Ffu9Ef1h259NwDcgfW5z30SVEb4JnDzvR/4sUc6b/7huGPDwF3GmPtE5N2IvAdjHgLOicgZRDZyJX+bsWKWurKGhOrwLzcdrcvb2RTqrrL45vM5bdtSuYIDEFzT4L0jdIEuRK3X9TdlVx6TLboX4qRZORdjTBKR/ZTS9SThqkh8AviatfbrUczzXR8vW8J+Hw0/8if+53f6o/hDv74bAN4E63OfHFxk9/PXY+//0R/7qDHGJO9WReSCpHQB4R6wbzVwP4b7Jck5a+2aMWbFGLMiwkgkDJzX5SDhrMkzfhlm/8XGW2t9S105YsjmGjFlGy2rEtyhx/saY0w0xsytc1NSnDrnDkGuxsizIvIs8Ixz7mIf+kvzrr0UU5wYY+T9f/wPL+Puzby+GwDepOtTn/490KT/EHgcePyPvu/9QDRe2+aVMWwInDdwHjgLnBbhDIbTBnMSYzYNbAiyLrAqImOQWkTqlJLvus7u7e0zb9skSBCkSyl1kuJMhInHHFjv9w1m13TdDnBDUroeRW6YylwzxlxJkq4YY/d9Zfq1tbU+pSQf+IWfv9OX77vrVa7/PzqshoK4CqKhAAAAAElFTkSuQmCC'''
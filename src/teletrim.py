@@ -1,111 +1,656 @@
 import sys
-import base64
 import os
 import asyncio
 import threading
-import glob
-import json
 import time
+import sqlite3
+from array import array
+from bisect import bisect_left
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QDialog, QWidget, QPushButton, QLineEdit, QLabel,
     QVBoxLayout, QHBoxLayout, QMessageBox, QListWidget, QListWidgetItem, QCheckBox,
-    QSplitter, QScrollArea, QInputDialog, QFrame
+    QSplitter, QInputDialog, QProgressDialog, QListView, QStyledItemDelegate, QAbstractItemView,
+    QComboBox, QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog
 )
-from PyQt6.QtGui import QFont, QBrush, QColor, QIcon, QPixmap
-from PyQt6.QtCore import Qt, QTimer, QByteArray
-
-from icon_data import ICON_DATA
+from PyQt6.QtGui import QFont, QBrush, QColor, QIcon, QImage, QPainter, QFontMetrics
+from PyQt6.QtCore import (
+    Qt, QTimer, QObject, pyqtSignal, QAbstractListModel, QModelIndex, QRect, QRectF, QSize, QSizeF, QPoint
+)
+from PyQt6 import sip
 
-from telethon import TelegramClient, errors
-from telethon.tl.functions.messages import DeleteHistoryRequest
-from telethon.tl.functions.channels import LeaveChannelRequest
-from telethon.tl.types import User
+from teletrim_core import (
+    PREVIEW_MESSAGE_LIMIT, PREVIEW_PREFETCH_ROWS, HISTORY_PAGE_SIZE, HISTORY_WINDOW, THUMB_CACHE_BYTES,
+    PRIORITY_INTERACTIVE, FLAG_CHECKED, FLAG_SAVED, FLAG_PINNED,
+    start_event_loop, preload_telethon, connect_authorized,
+    load_session_config, save_session_config, get_cache_path, get_journal_path, get_thumb_path, list_session_names,
+    create_client,
+    SessionError, ClientPool, SessionCatalog, catalog_update, record_account,
+    SESSION_HEALTH_OK, SESSION_HEALTH_LOGGED_OUT, SESSION_HEALTH_ERROR, get_scheduler, get_metrics, DialogStore, DialogFilter, DialogIndex, DialogCache,
+    DialogLoader, DialogUpdates, PreviewCache, ThumbnailCache, ImpactEstimator, ActivityAnalyzer, marked_peer_id, drop_peer_cache, PurgeTarget, PurgeJournal, merge_jobs, PoolPurge
+)
 
 ###############################################################################
 # Global Warning Preference Flags
 WARN_SESSION_DELETE = True   
 WARN_CHANNEL_DELETE = True   
+EXPORT_BEFORE_DELETE = False   # Save each chat's history to exports/ before deleting it.
 ###############################################################################
 
-# Async helper functions.
-def start_event_loop(loop):
-    asyncio.set_event_loop(loop)
-    loop.run_forever()
+ICON_FILE = "teletrim.png"
+CHAT_UPDATE_BATCH_MS = 500   # Live chat-list updates are applied at most this often.
 
-async def safe_disconnect_async(client):
-    if client.is_connected():
-        await client.disconnect()
+# Chat list filter choices: (label, value) pairs for the filter bar.
+FILTER_TYPES = (("user", "Users"), ("group", "Groups"), ("supergroup", "Supergroups"), ("channel", "Channels"))
+FILTER_UNREAD = (("Any unread", (None, None)), ("Unread only", (1, None)), ("No unread", (None, 0)))
+FILTER_AGE = (
+    ("Any activity", (None, None)),
+    ("Active within 7 days", (None, 7)),
+    ("Active within 30 days", (None, 30)),
+    ("Inactive 30+ days", (30, None)),
+    ("Inactive 90+ days", (90, None)),
+    ("Inactive 1+ year", (365, None))
+)
+# Chat list orderings: (label, key into SORT_VALUES). All but the first need
+# chat activity, which is fetched when one is picked.
+SORT_CHOICES = (
+    ("Telegram order", None),
+    ("Stalest first", "staleness"),
+    ("Oldest last message", "last_date"),
+    ("Oldest message of mine", "my_date"),
+    ("Most unread", "unread"),
+    ("Muted first", "muted"),
+    ("Most members", "members")
+)
+SORT_VALUES = {
+    "staleness": lambda activity, now: -activity.staleness(now),
+    "last_date": lambda activity, now: activity.last_date,
+    "my_date": lambda activity, now: activity.my_date or 0,
+    "unread": lambda activity, now: -activity.unread,
+    "muted": lambda activity, now: not activity.muted,
+    "members": lambda activity, now: -activity.members
+}
 
-def safe_connect(client, loop, retries=3, delay=0.5):
-    for attempt in range(retries):
-        try:
-            fut = asyncio.run_coroutine_threadsafe(client.connect(), loop)
-            fut.result(timeout=30)
-            return True
-        except Exception as e:
-            if "database is locked" in str(e):
-                print(f"Database is locked, retrying in {delay} seconds... (attempt {attempt+1})")
-                time.sleep(delay)
-            else:
-                raise e
-    return False
+###############################################################################
+# Qt signal bridges: Emitted from the asyncio thread; Qt queues delivery
+# onto the GUI thread.
+###############################################################################
+
+class DialogLoaderSignals(QObject):
+    page = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+
+class DialogUpdateSignals(QObject):
+    diff = pyqtSignal(object)
+
+class ImpactSignals(QObject):
+    progress = pyqtSignal(int, int)
+
+class ActivitySignals(QObject):
+    progress = pyqtSignal(int, int)
+
+class PurgeSignals(QObject):
+    result = pyqtSignal(object)
+    progress = pyqtSignal(int, int)
+    flood_wait = pyqtSignal(int)
+    deleted = pyqtSignal(object)
+    exported = pyqtSignal(object)
+
+###############################################################################
+# AsyncBridge: Runs coroutines on the asyncio loop and hands each finished
+# future to a callback on the GUI thread, so no slot waits on the network.
+###############################################################################
+
+BRIDGE_TIMEOUT = 30          # Seconds before a login or connect step gives up.
+BRIDGE_CLOSE_TIMEOUT = 10    # Seconds to wait for every client to disconnect.
+
+class AsyncBridge(QObject):
+    done = pyqtSignal(object, object)
+
+    def __init__(self, loop, parent=None):
+        super().__init__(parent)
+        self.loop = loop
+        self.pending = set()
+        # Always queued, so a callback never runs before run() has returned.
+        self.done.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    def run(self, coro, callback=None, timeout=None):
+        # Returns the concurrent future at once; callback(fut) follows on the
+        # GUI thread. Past the timeout the coroutine is cancelled and the
+        # future raises TimeoutError.
+        if timeout is not None:
+            coro = asyncio.wait_for(coro, timeout)
+        return self.watch(asyncio.run_coroutine_threadsafe(coro, self.loop), callback)
+
+    def watch(self, fut, callback=None):
+        # For futures the core engines start themselves (loader, purge).
+        self.pending.add(fut)
+        fut.add_done_callback(lambda f: self._finished(callback, f))
+        return fut
+
+    def _finished(self, callback, fut):
+        # On the loop thread. A bridge deleted along with its owner (a closed
+        # dialog, say) has no one left to tell.
+        if not sip.isdeleted(self):
+            self.done.emit(callback, fut)
+
+    def call_soon(self, fn, *args):
+        self.loop.call_soon_threadsafe(fn, *args)
+
+    def cancel_all(self):
+        # Results that are in but not yet delivered are dropped as well.
+        pending, self.pending = self.pending, set()
+        for fut in pending:
+            fut.cancel()
+
+    def _deliver(self, callback, fut):
+        # Cancelled futures were abandoned by whoever cancelled them.
+        if fut not in self.pending:
+            return
+        self.pending.discard(fut)
+        if callback is not None and not fut.cancelled():
+            callback(fut)
 
 ###############################################################################
-# Configuration persistence functions.
+# DialogListModel: Qt model over a DialogStore for the virtualized chat list.
 ###############################################################################
 
-def get_config_path(session_name):
-    session_dir = os.path.join(os.getcwd(), "sessions")
-    return os.path.join(session_dir, session_name + ".json")
+def activity_summary(activity, now):
+    # "last 230 d ago, mine never, 12 unread, muted, 4,852 members"
+    def ago(date):
+        return f"{max(0, int((now - date) // 86400))} d ago" if date else "never"
+    parts = [f"last {ago(activity.last_date)}", f"mine {ago(activity.my_date)}"]
+    if activity.unread:
+        parts.append(f"{activity.unread:,} unread")
+    if activity.muted:
+        parts.append("muted")
+    if activity.members:
+        parts.append(f"{activity.members:,} members")
+    return ", ".join(parts)
+
+class DialogListModel(QAbstractListModel):
+    # While a filter or sort is set, view rows map to store rows through self.visible;
+    # changes to the store then refilter with a model reset instead of
+    # per-row signals.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = DialogStore()
+        self.index_ = DialogIndex(self.store)
+        self.filter = None
+        self.visible = None
+        self.sort = None       # SORT_VALUES key, or None for the store's own order
+        self.activity = {}     # record key -> ChatActivity
+        self.show_accounts = False
+        self.foreground = QBrush(QColor("#FFFFFF"))
+
+    def rowCount(self, parent=QModelIndex()):
+        # The view asks for every row on each relayout; keep this cheap.
+        if parent.isValid():
+            return 0
+        return len(self.store.names) if self.visible is None else len(self.visible)
+
+    def store_row(self, row):
+        return row if self.visible is None else self.visible[row]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.store_row(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = self.store.names[row]
+            if self.show_accounts:
+                text = f"{text}  ·  {self.store.accounts[row]}"
+            if self.sort is not None:
+                activity = self.activity.get(self.store_key(row))
+                if activity is not None:
+                    text = f"{text}  ·  {activity_summary(activity, time.time())}"
+            return text
+        if role == Qt.ItemDataRole.CheckStateRole:
+            checked = self.store.flags[row] & FLAG_CHECKED
+            return Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.foreground
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = value in (Qt.CheckState.Checked, Qt.CheckState.Checked.value)
+        self.store.set_flag(self.store_row(index.row()), FLAG_CHECKED, checked)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsUserCheckable
+
+    def record(self, row):
+        return self.store.record(self.store_row(row))
+
+    def store_key(self, row):
+        store = self.store
+        return store.accounts[row], marked_peer_id(store.kinds[row], store.peer_ids[row])
+
+    def set_show_accounts(self, show):
+        # With more than one account open, each row names its account.
+        if show == self.show_accounts:
+            return
+        self.show_accounts = show
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0), self.index(self.rowCount() - 1), [Qt.ItemDataRole.DisplayRole])
+
+    def set_filter(self, dialog_filter):
+        self.beginResetModel()
+        self.filter = None if dialog_filter is None or dialog_filter.is_empty() else dialog_filter
+        self.visible = None if self.filter is None else self.index_.search(self.filter)
+        if self.sort is not None:
+            self.visible = self.sorted_rows(range(len(self.store)) if self.visible is None else self.visible)
+        self.endResetModel()
+
+    def set_sort(self, sort):
+        self.sort = sort
+        self.refilter()
+
+    def sort_key(self):
+        value = SORT_VALUES[self.sort]
+        activity = self.activity
+        key_of = self.store_key
+        now = time.time()
+
+        def sort_key(row):
+            entry = activity.get(key_of(row))
+            return (1, 0) if entry is None else (0, value(entry, now))
+        return sort_key
+
+    def sorted_rows(self, rows):
+        # Stable, so ties (and chats not analyzed yet, which go last) keep
+        # the store's order.
+        return array("l", sorted(rows, key=self.sort_key()))
+
+    def refilter(self):
+        self.set_filter(self.filter)
+
+    def set_checked_all(self, checked):
+        # One flag pass and a single dataChanged for every visible row.
+        # Saved Messages is left alone; it needs its own confirmation.
+        count = self.rowCount()
+        if not count:
+            return
+        store = self.store
+        for row in range(count):
+            row = self.store_row(row)
+            if not store.flags[row] & FLAG_SAVED:
+                store.set_flag(row, FLAG_CHECKED, checked)
+        self.dataChanged.emit(self.index(0), self.index(count - 1), [Qt.ItemDataRole.CheckStateRole])
+
+    def append_records(self, records):
+        if not records:
+            return
+        if self.visible is not None:
+            self.store.append(records)
+            self.refilter()
+            return
+        first = len(self.store)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self.store.append(records)
+        self.endInsertRows()
+
+    def merge_records(self, records, after=None):
+        # Moves already-known dialogs to their fresh position and inserts new
+        # ones at the same place: the top of the list, or right below the
+        # dialog keyed `after`. Returns the key the next page should follow,
+        # which stays valid while other accounts merge their own pages.
+        if not records:
+            return after
+        store = self.store
+        filtered = self.visible is not None
+        existing = []
+        for record in records:
+            row = store.row_of(record.key)
+            if row is not None:
+                record.flags |= store.flags[row] & FLAG_CHECKED
+                existing.append(row)
+        existing.sort(reverse=True)
+        anchor = store.row_of(after) if after is not None else None
+        if anchor in existing:
+            anchor = None
+        for row in existing:
+            if not filtered:
+                self.beginRemoveRows(QModelIndex(), row, row)
+            store.remove_row(row)
+            if not filtered:
+                self.endRemoveRows()
+        # Work out where the anchor went instead of reindexing twice; insert()
+        # reindexes unless it appends.
+        position = 0 if anchor is None else anchor + 1 - sum(1 for row in existing if row < anchor)
+        if existing and position == len(store):
+            store.reindex()
+        if filtered:
+            store.insert(position, records)
+            self.refilter()
+        else:
+            self.beginInsertRows(QModelIndex(), position, position + len(records) - 1)
+            store.insert(position, records)
+            self.endInsertRows()
+        return records[-1].key
+
+    def apply_diffs(self, diffs):
+        # Live changes from DialogUpdates, oldest first. Pinned chats are
+        # patched where they are; others move to just below the pinned block.
+        # Returns the records as they now stand and the keys removed.
+        store = self.store
+        latest = {}
+        own = {}   # key -> date of our newest message in the batch
+        for diff in diffs:
+            record = diff.record
+            key = record.key
+            if diff.removed:
+                latest[key] = None
+                continue
+            previous = latest.get(key)
+            row = store.row_of(key)
+            if previous is not None:
+                record.flags |= previous.flags & (FLAG_CHECKED | FLAG_PINNED)
+                unread = previous.unread
+            elif row is not None:
+                record.flags |= store.flags[row] & (FLAG_CHECKED | FLAG_PINNED)
+                unread = store.unread[row]
+            else:
+                unread = 0
+            record.unread = 0 if diff.unread is None else unread + diff.unread
+            latest[key] = record
+            if diff.unread is None:
+                own[key] = record.date
+        removed = [key for key, record in latest.items() if record is None]
+        self.remove_keys(removed)
+        records = [record for record in latest.values() if record is not None]
+        pinned = 0
+        while pinned < len(store) and store.flags[pinned] & FLAG_PINNED:
+            pinned += 1
+        # Oldest first, each to the top of the unpinned block, so the newest
+        # ends up on top. A chat's activity changes only as it is placed, so
+        # the sort order of the rest stays as the visible rows have it.
+        for record in sorted(records, key=lambda r: r.date):
+            activity = self.activity.get(record.key)
+            if activity is not None:
+                activity.last_date = max(activity.last_date, record.date)
+                activity.unread = record.unread
+                if record.key in own:
+                    activity.my_date = own[record.key]
+            row = store.row_of(record.key)
+            self.place_row(row, row if row is not None and record.flags & FLAG_PINNED else pinned, record)
+        return records, removed
+
+    def place_row(self, row, position, record):
+        # One live change, signalled as one row: a new dialog (row None) is
+        # inserted at position, a known one is rewritten and moved there.
+        # Under a filter or sort only that row's visible place is worked out
+        # again; the rest of the visible rows are just renumbered.
+        store = self.store
+        if self.visible is None:
+            if row is None:
+                self.beginInsertRows(QModelIndex(), position, position)
+                store.insert(position, [record])
+                self.endInsertRows()
+                return
+            if row != position:
+                self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), position if position < row else position + 1)
+                store.move(row, position, record)
+                self.endMoveRows()
+            else:
+                store.update(row, record)
+            self.dataChanged.emit(self.index(position), self.index(position))
+            return
+        shown = self.visible_row(record.key) if row is not None else None
+        if row is None:
+            store.insert(position, [record])
+            self.shift_visible(position, len(store), 1)
+        elif row < position:
+            store.move(row, position, record)
+            self.shift_visible(row + 1, position + 1, -1)
+        elif row > position:
+            store.move(row, position, record)
+            self.shift_visible(position, row, 1)
+        else:
+            store.update(row, record)
+        visible = self.visible
+        rest = visible if shown is None else visible[:shown] + visible[shown + 1:]
+        matches = self.filter is None or self.filter.matches(store, position)
+        target = self.visible_position(rest, position)
+        placed = rest[:target] + array("l", (position,)) + rest[target:]
+        if shown is None:
+            if matches:
+                self.beginInsertRows(QModelIndex(), target, target)
+                self.visible = placed
+                self.endInsertRows()
+        elif not matches:
+            self.beginRemoveRows(QModelIndex(), shown, shown)
+            self.visible = rest
+            self.endRemoveRows()
+        else:
+            if target != shown:
+                self.beginMoveRows(QModelIndex(), shown, shown, QModelIndex(), target if target < shown else target + 1)
+                self.visible = placed
+                self.endMoveRows()
+            else:
+                self.visible = placed
+            self.dataChanged.emit(self.index(target), self.index(target))
+
+    def shift_visible(self, low, high, delta):
+        # Store rows low..high-1 have moved by delta.
+        visible = self.visible
+        if self.sort is None:
+            # Without a sort the visible rows ascend, so those are one run.
+            for i in range(bisect_left(visible, low), bisect_left(visible, high)):
+                visible[i] += delta
+        else:
+            for i, row in enumerate(visible):
+                if low <= row < high:
+                    visible[i] = row + delta
+
+    def visible_position(self, rows, row):
+        # Where row goes among visible rows: store order, or sort order with
+        # ties in store order as sorted_rows leaves them.
+        if self.sort is None:
+            return bisect_left(rows, row)
+        sort_key = self.sort_key()
+        wanted = (sort_key(row), row)
+        low, high = 0, len(rows)
+        while low < high:
+            middle = (low + high) // 2
+            if (sort_key(rows[middle]), rows[middle]) < wanted:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def remove_keys(self, keys):
+        store = self.store
+        filtered = self.visible is not None
+        rows = sorted((row for row in (store.row_of(key) for key in keys) if row is not None), reverse=True)
+        for row in rows:
+            if not filtered:
+                self.beginRemoveRows(QModelIndex(), row, row)
+            store.remove_row(row)
+            if not filtered:
+                self.endRemoveRows()
+        if rows:
+            store.reindex()
+            if filtered:
+                self.refilter()
 
-def load_session_config(session_name):
-    cfg_path = get_config_path(session_name)
-    if os.path.exists(cfg_path):
+    def visible_row(self, key):
+        row = self.store.row_of(key)
+        if row is None or self.visible is None:
+            return row
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading session config: {e}")
-    return None
-
-def save_session_config(session_name, config):
-    session_dir = os.path.join(os.getcwd(), "sessions")
-    if not os.path.exists(session_dir):
-        os.makedirs(session_dir)
-    cfg_path = os.path.join(session_dir, session_name + ".json")
-    try:
-        with open(cfg_path, "w", encoding="utf-8") as f:
-            json.dump(config, f)
-    except Exception as e:
-        print(f"Error saving session config: {e}")
+            return self.visible.index(row)
+        except ValueError:
+            return None
+
+    def clear(self):
+        self.beginResetModel()
+        self.store.clear()
+        if self.filter is not None or self.sort is not None:
+            self.visible = array("l")
+        self.endResetModel()
 
 ###############################################################################
-# MessageBubble: Displays a single message bubble.
+# Message preview: A list model of message texts and a delegate that paints
+# each one as a bubble, so no widget or stylesheet is created per message.
 ###############################################################################
 
-class MessageBubble(QFrame):
-    def __init__(self, message_text=None, parent=None):
+THUMB_BOX = 100   # Thumbnails are shown at most this many pixels wide and high.
+
+def decode_thumbnail(data):
+    # Runs on a worker thread: QImage, unlike QPixmap, may be used off the
+    # GUI thread.
+    image = QImage.fromData(data)
+    if image.isNull():
+        return None
+    if image.width() > THUMB_BOX or image.height() > THUMB_BOX:
+        image = image.scaled(THUMB_BOX, THUMB_BOX, Qt.AspectRatioMode.KeepAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+    return image
+
+async def load_thumbnail(thumbnails, record, message_id, media):
+    data = await thumbnails.get(record, message_id, media)
+    if data is None:
+        return None
+    return await asyncio.get_running_loop().run_in_executor(None, decode_thumbnail, data)
+
+class MessageListModel(QAbstractListModel):
+    # Rows are (message id, text, media), oldest first. Rows with media get a
+    # thumbnail in images once the view asks for it.
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFrameShape(QFrame.Shape.NoFrame)
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #3A3A3A;
-                border: none;
-                border-radius: 10px;
-                padding: 8px;
-            }
-            QLabel {
-                font-size: 14px;
-                color: #FFFFFF;
-            }
-        """)
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(10, 5, 10, 5)
-        layout.setSpacing(5)
-        label = QLabel(message_text)
-        label.setWordWrap(True)
-        layout.addWidget(label)
+        self.messages = []
+        self.images = {}   # message id -> QImage, or None while loading or if there is none
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.messages)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.messages[index.row()][1]
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self.images.get(self.messages[index.row()][0])
+        if role == Qt.ItemDataRole.UserRole:
+            return self.messages[index.row()][2] is not None
+        return None
+
+    def set_messages(self, messages):
+        self.beginResetModel()
+        self.messages = list(messages)
+        self.images = {}
+        self.endResetModel()
+
+    def set_image(self, message_id, image):
+        self.images[message_id] = image
+        for row, message in enumerate(self.messages):
+            if message[0] == message_id:
+                index = self.index(row)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+                break
+
+    def oldest_id(self):
+        return self.messages[0][0] if self.messages else 0
+
+    def newest_id(self):
+        return self.messages[-1][0] if self.messages else 0
+
+    def prepend(self, messages):
+        self.beginInsertRows(QModelIndex(), 0, len(messages) - 1)
+        self.messages[0:0] = messages
+        self.endInsertRows()
+
+    def append(self, messages):
+        first = len(self.messages)
+        self.beginInsertRows(QModelIndex(), first, first + len(messages) - 1)
+        self.messages.extend(messages)
+        self.endInsertRows()
+
+    def remove_head(self, count):
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        for message in self.messages[:count]:
+            self.images.pop(message[0], None)
+        del self.messages[:count]
+        self.endRemoveRows()
+
+    def remove_tail(self, count):
+        first = len(self.messages) - count
+        self.beginRemoveRows(QModelIndex(), first, len(self.messages) - 1)
+        for message in self.messages[first:]:
+            self.images.pop(message[0], None)
+        del self.messages[first:]
+        self.endRemoveRows()
+
+class MessageBubbleDelegate(QStyledItemDelegate):
+    MARGIN = 10     # Between the bubble and the view edge.
+    SPACING = 10    # Between bubbles.
+    PAD_X = 14
+    PAD_Y = 10
+    RADIUS = 10
+    TEXT_FLAGS = Qt.TextFlag.TextWordWrap.value | Qt.AlignmentFlag.AlignLeft.value | Qt.AlignmentFlag.AlignTop.value
+
+    def __init__(self, view, on_missing_image=None):
+        super().__init__(view)
+        self.view = view
+        # Called with the index of a media row painted without its thumbnail;
+        # only rows that scroll into view ever fetch one.
+        self.on_missing_image = on_missing_image
+        self.font = QFont()
+        self.font.setPixelSize(14)
+        self.metrics = QFontMetrics(self.font)
+        self.background = QColor("#3A3A3A")
+        self.placeholder = QColor("#4A4A4A")
+        self.text_color = QColor("#FFFFFF")
+
+    def text_width(self):
+        return max(1, self.view.viewport().width() - 2 * (self.MARGIN + self.PAD_X))
+
+    def image_height(self, index):
+        # The box is reserved before the thumbnail arrives, so rows never
+        # change height under the reader.
+        if not index.data(Qt.ItemDataRole.UserRole):
+            return 0
+        return THUMB_BOX + self.PAD_Y if index.data() else THUMB_BOX
+
+    def sizeHint(self, option, index):
+        text = index.data() or ""
+        height = self.image_height(index)
+        if text or not height:
+            bounds = self.metrics.boundingRect(QRect(0, 0, self.text_width(), 1 << 20), self.TEXT_FLAGS, text)
+            height += bounds.height()
+        return QSize(self.view.viewport().width(), height + 2 * self.PAD_Y + self.SPACING)
+
+    def paint(self, painter, option, index):
+        text = index.data() or ""
+        bubble = QRectF(option.rect.adjusted(self.MARGIN, self.SPACING // 2, -self.MARGIN, -(self.SPACING - self.SPACING // 2)))
+        content = bubble.adjusted(self.PAD_X, self.PAD_Y, -self.PAD_X, -self.PAD_Y)
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self.background)
+        painter.drawRoundedRect(bubble, self.RADIUS, self.RADIUS)
+        image_height = self.image_height(index)
+        if image_height:
+            image = index.data(Qt.ItemDataRole.DecorationRole)
+            if image is not None:
+                painter.drawImage(QRectF(content.topLeft(), QSizeF(image.size())), image)
+            else:
+                painter.setBrush(self.placeholder)
+                painter.drawRoundedRect(QRectF(content.left(), content.top(), THUMB_BOX, THUMB_BOX), 4, 4)
+                if self.on_missing_image:
+                    self.on_missing_image(index)
+            content.setTop(content.top() + image_height)
+        painter.setPen(self.text_color)
+        painter.setFont(self.font)
+        painter.drawText(content, self.TEXT_FLAGS, text)
+        painter.restore()
 
 ###############################################################################
 # PreferencesDialog: Allows toggling warnings for deletion actions.
@@ -124,8 +669,11 @@ class PreferencesDialog(QDialog):
         self.session_warn_cb.setChecked(WARN_SESSION_DELETE)
         self.channel_warn_cb = QCheckBox("Warn before deleting channels")
         self.channel_warn_cb.setChecked(WARN_CHANNEL_DELETE)
+        self.export_cb = QCheckBox("Export chat history before deleting it")
+        self.export_cb.setChecked(EXPORT_BEFORE_DELETE)
         layout.addWidget(self.session_warn_cb)
         layout.addWidget(self.channel_warn_cb)
+        layout.addWidget(self.export_cb)
         btn_layout = QHBoxLayout()
         ok_btn = QPushButton("OK")
         cancel_btn = QPushButton("Cancel")
@@ -138,18 +686,115 @@ class PreferencesDialog(QDialog):
         cancel_btn.clicked.connect(self.reject)
 
     def get_preferences(self):
-        return (self.session_warn_cb.isChecked(), self.channel_warn_cb.isChecked())
+        return (self.session_warn_cb.isChecked(), self.channel_warn_cb.isChecked(), self.export_cb.isChecked())
+
+###############################################################################
+# MetricsDialog: Live table of Telegram API call statistics, with export.
+###############################################################################
+
+METRICS_REFRESH_MS = 1000
+METRICS_COLUMNS = ("Method", "Calls", "Errors", "FloodWaits", "Flood s", "Avg ms", "p50 ms", "p95 ms", "Max ms")
+
+class MetricsDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("API Metrics")
+        self.resize(760, 360)
+        self.setup_ui()
+        self.refresh()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(METRICS_REFRESH_MS)
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        self.table = QTableWidget(0, len(METRICS_COLUMNS))
+        self.table.setHorizontalHeaderLabels(METRICS_COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.setStyleSheet("background-color: #2D2D2D; color: #FFFFFF;")
+        layout.addWidget(self.table)
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        btn_layout = QHBoxLayout()
+        export_btn = QPushButton("Export...")
+        export_btn.clicked.connect(self.export)
+        btn_layout.addWidget(export_btn)
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset)
+        btn_layout.addWidget(reset_btn)
+        btn_layout.addStretch()
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+
+    def refresh(self):
+        methods = get_metrics().snapshot()["methods"]
+        self.table.setRowCount(len(methods))
+        for row, (key, stats) in enumerate(methods.items()):
+            avg = stats["total_seconds"] / stats["calls"] if stats["calls"] else 0.0
+            values = (key, stats["calls"], stats["errors"], stats["flood_waits"], stats["flood_wait_seconds"],
+                      f"{avg * 1000:.0f}", f"{stats['p50_seconds'] * 1000:.0f}",
+                      f"{stats['p95_seconds'] * 1000:.0f}", f"{stats['max_seconds'] * 1000:.0f}")
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column:
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self.table.setItem(row, column, item)
+        calls = sum(stats["calls"] for stats in methods.values())
+        errors = sum(stats["errors"] for stats in methods.values())
+        flood_seconds = sum(stats["flood_wait_seconds"] for stats in methods.values())
+        self.summary_label.setText(f"{calls} calls, {errors} errors, {flood_seconds} s of FloodWait")
+
+    def export(self):
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Export Metrics", "teletrim-metrics.json", "JSON (*.json);;Prometheus textfile (*.prom)")
+        if not path:
+            return
+        if selected.startswith("Prometheus") and not path.endswith(".prom"):
+            path += ".prom"
+        try:
+            get_metrics().export(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Export Failed", f"Could not write {path}: {e}")
+
+    def reset(self):
+        get_metrics().reset()
+        self.refresh()
 
 ###############################################################################
 # SessionManager: Dialog for selecting, creating, and deleting sessions.
 ###############################################################################
 
+SESSION_SORT_KEYS = (("Last used", "last_used"), ("Name", "name"), ("Chats", "dialogs"), ("Problems first", "health"))
+
+def session_search_text(name, entry):
+    return " ".join(str(part) for part in (
+        name, entry.get("display_name", ""), entry.get("username", ""), entry.get("user_id", ""))).casefold()
+
+def session_summary(name, entry):
+    parts = [name]
+    if entry.get("display_name"):
+        account = entry["display_name"]
+        if entry.get("username"):
+            account += f" (@{entry['username']})"
+        parts.append(account)
+    if entry.get("dialogs") is not None:
+        parts.append(f"{entry['dialogs']} chats")
+    if entry.get("last_used"):
+        parts.append("used " + time.strftime("%Y-%m-%d", time.localtime(entry["last_used"])))
+    if entry.get("health") and entry["health"] != SESSION_HEALTH_OK:
+        parts.append(entry["health"])
+    return "  ·  ".join(parts)
+
 class SessionManager(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.selected_session = None
         self.setWindowTitle("Session Manager")
-        self.resize(400, 300)
+        self.resize(560, 400)
         self.setup_ui()
         self.populate_sessions()
         
@@ -161,8 +806,22 @@ class SessionManager(QDialog):
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
         header.setStyleSheet("color: #FFFFFF;")
         layout.addWidget(header)
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search by session, name, username or user id")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.show_sessions)
+        search_layout.addWidget(self.search_input)
+        self.sort_combo = QComboBox()
+        for label, key in SESSION_SORT_KEYS:
+            self.sort_combo.addItem(label, key)
+        self.sort_combo.currentIndexChanged.connect(self.show_sessions)
+        search_layout.addWidget(self.sort_combo)
+        layout.addLayout(search_layout)
         self.list_widget = QListWidget()
         self.list_widget.setStyleSheet("background-color: #2D2D2D; color: #FFFFFF;")
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.itemDoubleClicked.connect(self.load_session)
         layout.addWidget(self.list_widget)
         btn_layout = QHBoxLayout()
         self.load_btn = QPushButton("Load Session")
@@ -180,21 +839,35 @@ class SessionManager(QDialog):
         self.setLayout(layout)
     
     def populate_sessions(self):
+        # Reads only sessions/catalog.json and the directory listing; no
+        # session database is opened and nothing connects.
+        self.sessions = SessionCatalog().entries()
+        self.show_sessions()
+
+    def show_sessions(self):
+        text = self.search_input.text().strip().casefold()
+        key = self.sort_combo.currentData()
+        names = [name for name, entry in self.sessions.items()
+                 if not text or text in session_search_text(name, entry)]
+        if key == "name":
+            names.sort(key=str.casefold)
+        elif key == "health":
+            names.sort(key=lambda name: (self.sessions[name].get("health", SESSION_HEALTH_OK) == SESSION_HEALTH_OK,
+                                         name.casefold()))
+        else:
+            names.sort(key=lambda name: self.sessions[name].get(key) or 0, reverse=True)
         self.list_widget.clear()
-        session_dir = os.path.join(os.getcwd(), "sessions")
-        if not os.path.exists(session_dir):
-            os.makedirs(session_dir)
-        session_files = glob.glob(os.path.join(session_dir, "*.session"))
-        for filepath in session_files:
-            name = os.path.splitext(os.path.basename(filepath))[0]
-            self.list_widget.addItem(name)
+        for name in names:
+            item = QListWidgetItem(session_summary(name, self.sessions[name]))
+            item.setData(Qt.ItemDataRole.UserRole, name)
+            self.list_widget.addItem(item)
     
     def load_session(self):
         item = self.list_widget.currentItem()
         if item is None:
             QMessageBox.information(self, "No Session Selected", "Please select a session.")
             return
-        self.selected_session = item.text()
+        self.selected_session = item.data(Qt.ItemDataRole.UserRole)
         self.accept()
     
     def new_session(self):
@@ -206,7 +879,7 @@ class SessionManager(QDialog):
         if item is None:
             QMessageBox.information(self, "No Session Selected", "Please select a session to delete.")
             return
-        session_name = item.text()
+        session_name = item.data(Qt.ItemDataRole.UserRole)
         msg_box = QMessageBox(self)
         msg_box.setIcon(QMessageBox.Icon.Warning)
         msg_box.setText(f"Are you sure you want to delete session '{session_name}'?")
@@ -222,11 +895,16 @@ class SessionManager(QDialog):
         session_dir = os.path.join(os.getcwd(), "sessions")
         session_path = os.path.join(session_dir, session_name + ".session")
         cfg_path = os.path.join(session_dir, session_name + ".json")
+        cache_path = get_cache_path(session_name)
+        journal_path = get_journal_path(session_name)
+        thumb_path = get_thumb_path(session_name)
         try:
-            if os.path.exists(session_path):
-                os.remove(session_path)
-            if os.path.exists(cfg_path):
-                os.remove(cfg_path)
+            for path in (session_path, session_path + "-wal", session_path + "-shm", cfg_path, cache_path,
+                         journal_path, thumb_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            SessionCatalog().remove(session_name)
+            drop_peer_cache(session_name)
             QMessageBox.information(self, "Deleted", f"Session '{session_name}' has been deleted.")
             self.populate_sessions()
         except Exception as e:
@@ -244,6 +922,8 @@ class LoginDialog(QDialog):
         self.api_ready = False
         self.session_name = session_name
         self.back_pressed = False
+        self.bridge = AsyncBridge(loop, self)
+        self.pending_login = None
         self.setWindowTitle("Teletrim Login")
         self.resize(450, 500)
         self.setup_styles()
@@ -420,6 +1100,10 @@ class LoginDialog(QDialog):
         creds_layout.addWidget(self.login_btn)
         self.layout.addWidget(self.creds_widget)
         self.creds_widget.hide()
+        self.status_label = QLabel()
+        self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.layout.addWidget(self.status_label)
+        self.status_label.hide()
 
     def handle_yes(self):
         self.question_widget.hide()
@@ -439,30 +1123,39 @@ class LoginDialog(QDialog):
         self.back_pressed = True
         self.reject()
 
+    def set_busy(self, message):
+        # While a login step is on the network the form stays up but inert.
+        busy = message is not None
+        self.status_label.setText(message or "")
+        self.status_label.setVisible(busy)
+        self.login_btn.setEnabled(not busy)
+        self.back_btn.setEnabled(not busy)
+
+    def done(self, result):
+        self.bridge.cancel_all()
+        super().done(result)
+
     def attempt_auto_login(self):
         try:
             api_id = int(self.api_id_input.text().strip())
             api_hash = self.api_hash_input.text().strip()
         except ValueError:
             return
-        phone = self.phone_input.text().strip()
-        session_dir = os.path.join(os.getcwd(), "sessions")
-        if not os.path.exists(session_dir):
-            os.makedirs(session_dir)
-        session_path = os.path.join("sessions", self.session_name)
-        self.client = TelegramClient(session_path, api_id, api_hash, loop=self.loop)
+        self.client = create_client(self.session_name, api_id, api_hash, loop=self.loop)
+        self.set_busy(f"Connecting {self.session_name}...")
+        self.bridge.run(connect_authorized(self.client), self.auto_login_checked, timeout=BRIDGE_TIMEOUT)
+
+    def auto_login_checked(self, fut):
+        self.set_busy(None)
         try:
-            if not safe_connect(self.client, self.loop):
-                print("Auto-connect failed: database is locked or connection error.")
-                self.creds_widget.show()
-                return
-            fut = asyncio.run_coroutine_threadsafe(self.client.is_user_authorized(), self.loop)
-            is_auth = fut.result(timeout=30)
-            if is_auth:
+            if fut.result():
                 self.api_ready = True
                 self.accept()
+            else:
+                catalog_update(self.session_name, health=SESSION_HEALTH_LOGGED_OUT)
         except Exception as e:
             print("Auto-login failed:", e)
+            catalog_update(self.session_name, health=SESSION_HEALTH_ERROR)
             self.creds_widget.show()
 
     def do_login(self):
@@ -487,31 +1180,53 @@ class LoginDialog(QDialog):
         if not (api_hash and phone):
             QMessageBox.critical(self, "Input Error", "Please fill in all required fields.")
             return
-        session_dir = os.path.join(os.getcwd(), "sessions")
-        if not os.path.exists(session_dir):
-            os.makedirs(session_dir)
-        session_path = os.path.join("sessions", session_name)
-        self.client = TelegramClient(session_path, api_id, api_hash, loop=self.loop)
+        # Each step below runs on the asyncio loop and hands over to the next
+        # from its callback; the details travel along in pending_login.
+        self.pending_login = {
+            "session_name": session_name,
+            "api_id": api_id,
+            "api_hash": api_hash,
+            "phone": phone,
+            "password": provided_password
+        }
+        self.client = create_client(session_name, api_id, api_hash, loop=self.loop)
+        self.set_busy("Connecting...")
+        self.bridge.run(self.client.connect(), self.login_connected, timeout=BRIDGE_TIMEOUT)
+
+    def login_step(self, message, fn, *args, callback, **kwargs):
+        self.set_busy(message)
+        scheduler = get_scheduler(self.client)
+        self.bridge.run(scheduler.call(PRIORITY_INTERACTIVE, fn, *args, **kwargs), callback, timeout=BRIDGE_TIMEOUT)
+
+    def login_connected(self, fut):
+        self.set_busy(None)
         try:
-            if not safe_connect(self.client, self.loop):
-                QMessageBox.critical(self, "Connection Failed", "Could not connect: database is locked or error.")
-                return
+            fut.result()
         except Exception as e:
             QMessageBox.critical(self, "Connection Failed", f"Could not connect: {e}")
             return
+        self.login_step("Checking authorization...", self.client.is_user_authorized,
+                        callback=self.login_authorized)
+
+    def login_authorized(self, fut):
+        self.set_busy(None)
         try:
-            fut = asyncio.run_coroutine_threadsafe(self.client.is_user_authorized(), self.loop)
-            is_auth = fut.result(timeout=30)
+            is_auth = fut.result()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Authorization check failed: {e}")
             return
         if is_auth:
             self.api_ready = True
+            self.session_name = self.pending_login["session_name"]
             self.accept()
             return
+        self.login_step("Sending login code...", self.client.send_code_request, self.pending_login["phone"],
+                        callback=self.login_code_sent)
+
+    def login_code_sent(self, fut):
+        self.set_busy(None)
         try:
-            fut = asyncio.run_coroutine_threadsafe(self.client.send_code_request(phone), self.loop)
-            fut.result(timeout=30)
+            fut.result()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to send login code: {e}")
             return
@@ -519,62 +1234,131 @@ class LoginDialog(QDialog):
         if not ok or not code:
             QMessageBox.critical(self, "Input Error", "No login code provided.")
             return
+        self.login_step("Signing in...", self.client.sign_in, self.pending_login["phone"], code,
+                        callback=self.login_signed_in)
+
+    def login_signed_in(self, fut):
+        from telethon import errors
+        self.set_busy(None)
         try:
-            fut = asyncio.run_coroutine_threadsafe(self.client.sign_in(phone, code), self.loop)
-            fut.result(timeout=30)
+            fut.result()
         except errors.SessionPasswordNeededError:
-            if provided_password:
-                pwd = provided_password
+            if self.pending_login["password"]:
+                pwd = self.pending_login["password"]
             else:
                 pwd, ok = QInputDialog.getText(self, "2FA Required", "Enter your 2FA password:", QLineEdit.EchoMode.Password)
                 if not ok or not pwd:
                     QMessageBox.critical(self, "Error", "2FA password required.")
                     return
-            try:
-                fut = asyncio.run_coroutine_threadsafe(self.client.sign_in(password=pwd), self.loop)
-                fut.result(timeout=30)
-            except Exception as e:
-                QMessageBox.critical(self, "Login Failed", f"Could not log in: {e}")
-                return
+            self.login_step("Signing in...", self.client.sign_in, password=pwd, callback=self.login_signed_in)
+            return
         except Exception as e:
             QMessageBox.critical(self, "Login Failed", f"Could not log in: {e}")
             return
+        login = self.pending_login
         self.api_ready = True
         cfg = {
-            "api_id": api_id,
-            "api_hash": api_hash,
-            "phone": phone,
-            "twofa": provided_password or ""
+            "api_id": login["api_id"],
+            "api_hash": login["api_hash"],
+            "phone": login["phone"],
+            "twofa": login["password"] or ""
         }
-        save_session_config(session_name, cfg)
+        save_session_config(login["session_name"], cfg)
+        self.session_name = login["session_name"]
         self.accept()
 
 ###############################################################################
 # MainWindow: The primary window for chats and message history.
 ###############################################################################
 
+IMPACT_TYPE_LABELS = (("user", "private chats"), ("group", "groups"), ("supergroup", "supergroups"),
+                      ("channel", "channels"), ("saved", "Saved Messages"))
+
+def impact_summary(estimate):
+    types = ", ".join(f"{estimate.types[kind]} {label}" for kind, label in IMPACT_TYPE_LABELS
+                      if estimate.types.get(kind))
+    text = (f"{estimate.chats} chats ({types}).\n"
+            f"About {estimate.messages:,} messages, {estimate.own_messages:,} of them yours.")
+    if estimate.unknown:
+        text += f"\nCould not count {estimate.unknown} chats."
+    return text
+
+class Account:
+    # Per-session state of the main window: one per client in the pool.
+    def __init__(self, name, client):
+        self.name = name
+        self.client = client
+        self.preview_cache = PreviewCache(client)
+        config = load_session_config(name) or {}
+        self.thumbnails = ThumbnailCache(client, get_thumb_path(name),
+                                         int(config.get("thumb_cache_bytes") or THUMB_CACHE_BYTES))
+        self.dialog_cache = None
+        try:
+            self.dialog_cache = DialogCache(get_cache_path(name))
+        except sqlite3.Error as e:
+            print(f"Error opening dialog cache: {e}")
+        self.journal = PurgeJournal(get_journal_path(name))
+        self.dialog_loader = None
+        self.dialog_signals = None
+        self.merge_after = None
+        self.updates = None
+
 class MainWindow(QMainWindow):
-    def __init__(self, client, loop):
+    def __init__(self, pool, loop):
         super().__init__()
-        self.client = client
+        self.pool = pool
         self.loop = loop
+        self.bridge = AsyncBridge(loop, self)
+        self.accounts = {name: Account(name, pool.get(name)) for name in pool.names()}
         self.suppress_warning = False
         self.session_switch_requested = False
-        self.setWindowTitle("Teletrim")
+        self.purge_engine = None
+        self.metrics_dialog = None
+        self.impact_estimator = ImpactEstimator(pool)
+        self.impact_signals = ImpactSignals()
+        self.impact_signals.progress.connect(self.impact_progress)
+        self.impact_future = None
+        self.impact = None   # (selected keys, ImpactEstimate) of the last estimate
+        self.activity_analyzer = ActivityAnalyzer(pool)
+        self.activity_signals = ActivitySignals()
+        self.activity_signals.progress.connect(self.activity_progress)
+        self.activity_future = None
+        self.update_signals = DialogUpdateSignals()
+        self.update_signals.diff.connect(self.queue_chat_diff)
+        self.pending_diffs = []
+        self.diff_timer = QTimer(self)
+        self.diff_timer.setSingleShot(True)
+        self.diff_timer.setInterval(CHAT_UPDATE_BATCH_MS)
+        self.diff_timer.timeout.connect(self.apply_chat_diffs)
+        self.restoring_current = False
+        self.history_peer = None
+        self.history_account = None
+        self.history_loading = False
+        self.history_has_older = False
+        self.history_has_newer = False
+        self.preview_future = None
+        self.preview_token = 0
+        self.thumb_futures = {}   # message id -> pending thumbnail of the shown chat
+        self.preview_peer = None
+        self.preview_account = None
         self.resize(900, 600)
         self.setup_styles()
         self.init_ui()
+        self.accounts_changed()
         self.load_chats()
+        for account in self.accounts.values():
+            self.start_updates(account)
+        QTimer.singleShot(0, lambda: self.offer_resume(list(self.accounts.values())))
 
     def setup_styles(self):
         style = """
             QMainWindow { background-color: #2D2D2D; }
-            QListWidget { font-size: 14px; background-color: #2D2D2D; color: #FFFFFF; }
+            QListView { font-size: 14px; background-color: #2D2D2D; color: #FFFFFF; }
             QPushButton { background-color: #555555; color: #FFFFFF; border: 1px solid #777777; padding: 6px 10px; border-radius: 6px; }
             QPushButton:hover { background-color: #666666; }
             QLabel { font-size: 14px; color: #FFFFFF; }
-            QScrollArea { border: none; background-color: #2D2D2D; }
             QLineEdit { background-color: #444444; color: #FFFFFF; border: none; border-radius: 4px; }
+            QStatusBar { color: #FFFFFF; }
         """
         self.setStyleSheet(style)
 
@@ -584,27 +1368,101 @@ class MainWindow(QMainWindow):
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
         splitter = QSplitter(Qt.Orientation.Horizontal)
-        self.chat_list_widget = QListWidget()
-        self.chat_list_widget.itemChanged.connect(self.chat_item_changed)
-        self.chat_list_widget.currentItemChanged.connect(self.chat_selection_changed)
-        splitter.addWidget(self.chat_list_widget)
-        self.message_widget = QWidget()
-        self.message_layout = QVBoxLayout(self.message_widget)
-        self.message_layout.setContentsMargins(10, 10, 10, 10)
-        self.message_layout.setSpacing(10)
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setStyleSheet("background-color: #2D2D2D; border: none;")
-        self.scroll.setWidget(self.message_widget)
-        splitter.addWidget(self.scroll)
+        self.chat_model = DialogListModel(self)
+        self.chat_model.dataChanged.connect(self.chat_item_changed)
+        self.chat_list_view = QListView()
+        self.chat_list_view.setUniformItemSizes(True)
+        self.chat_list_view.setModel(self.chat_model)
+        self.chat_list_view.selectionModel().currentChanged.connect(self.chat_selection_changed)
+        chat_panel = QWidget()
+        chat_layout = QVBoxLayout(chat_panel)
+        chat_layout.setContentsMargins(0, 0, 0, 0)
+        chat_layout.setSpacing(5)
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search chats")
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self.apply_filter)
+        chat_layout.addWidget(self.search_input)
+        type_layout = QHBoxLayout()
+        self.type_checkboxes = {}
+        for type_name, label in FILTER_TYPES:
+            checkbox = QCheckBox(label)
+            checkbox.setChecked(True)
+            checkbox.toggled.connect(self.apply_filter)
+            type_layout.addWidget(checkbox)
+            self.type_checkboxes[type_name] = checkbox
+        type_layout.addStretch()
+        chat_layout.addLayout(type_layout)
+        combo_layout = QHBoxLayout()
+        self.unread_combo = QComboBox()
+        for label, value in FILTER_UNREAD:
+            self.unread_combo.addItem(label, value)
+        self.unread_combo.currentIndexChanged.connect(self.apply_filter)
+        combo_layout.addWidget(self.unread_combo)
+        self.age_combo = QComboBox()
+        for label, value in FILTER_AGE:
+            self.age_combo.addItem(label, value)
+        self.age_combo.currentIndexChanged.connect(self.apply_filter)
+        combo_layout.addWidget(self.age_combo)
+        self.account_combo = QComboBox()
+        self.account_combo.currentIndexChanged.connect(self.apply_filter)
+        combo_layout.addWidget(self.account_combo)
+        self.sort_combo = QComboBox()
+        for label, value in SORT_CHOICES:
+            self.sort_combo.addItem(label, value)
+        self.sort_combo.currentIndexChanged.connect(self.sort_changed)
+        combo_layout.addWidget(self.sort_combo)
+        chat_layout.addLayout(combo_layout)
+        chat_layout.addWidget(self.chat_list_view)
+        check_layout = QHBoxLayout()
+        self.check_matching_btn = QPushButton("Check All Matching")
+        self.check_matching_btn.clicked.connect(lambda: self.check_matching(True))
+        check_layout.addWidget(self.check_matching_btn)
+        self.uncheck_matching_btn = QPushButton("Uncheck All Matching")
+        self.uncheck_matching_btn.clicked.connect(lambda: self.check_matching(False))
+        check_layout.addWidget(self.uncheck_matching_btn)
+        chat_layout.addLayout(check_layout)
+        self.filter_label = QLabel()
+        chat_layout.addWidget(self.filter_label)
+        # Counting checked rows is a pass over the store; do it once per burst
+        # of row changes, not once per row.
+        self.filter_label_timer = QTimer(self)
+        self.filter_label_timer.setSingleShot(True)
+        self.filter_label_timer.setInterval(0)
+        self.filter_label_timer.timeout.connect(self.update_filter_label)
+        for signal in (self.chat_model.modelReset, self.chat_model.rowsInserted, self.chat_model.rowsRemoved,
+                       self.chat_model.dataChanged):
+            signal.connect(lambda *args: self.filter_label_timer.start())
+        splitter.addWidget(chat_panel)
+        self.message_model = MessageListModel(self)
+        self.message_view = QListView()
+        self.message_view.setModel(self.message_model)
+        self.message_view.setItemDelegate(MessageBubbleDelegate(self.message_view, self.request_thumbnail))
+        self.message_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.message_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.message_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.message_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.message_view.setResizeMode(QListView.ResizeMode.Adjust)
+        self.message_view.setStyleSheet("QListView { border: none; padding-top: 5px; }")
+        self.message_view.verticalScrollBar().valueChanged.connect(self.history_scrolled)
+        splitter.addWidget(self.message_view)
         main_layout.addWidget(splitter)
         btn_layout = QHBoxLayout()
         self.leave_btn = QPushButton("Leave Selected and Delete History")
         self.leave_btn.clicked.connect(self.leave_selected)
         btn_layout.addWidget(self.leave_btn)
+        self.refresh_btn = QPushButton("Refresh")
+        self.refresh_btn.clicked.connect(lambda: self.load_chats(full=True))
+        btn_layout.addWidget(self.refresh_btn)
+        self.add_account_btn = QPushButton("Add Account")
+        self.add_account_btn.clicked.connect(self.add_account)
+        btn_layout.addWidget(self.add_account_btn)
         self.session_mgr_btn = QPushButton("Session Manager")
         self.session_mgr_btn.clicked.connect(self.show_session_manager)
         btn_layout.addWidget(self.session_mgr_btn)
+        self.metrics_btn = QPushButton("Metrics")
+        self.metrics_btn.clicked.connect(self.show_metrics)
+        btn_layout.addWidget(self.metrics_btn)
         self.pref_btn = QPushButton("Preferences")
         self.pref_btn.clicked.connect(self.show_preferences)
         btn_layout.addWidget(self.pref_btn)
@@ -615,50 +1473,274 @@ class MainWindow(QMainWindow):
         main_layout.addLayout(btn_layout)
         self.setCentralWidget(central_widget)
 
-    def load_chats(self):
-        async def get_dialogs():
-            return await self.client.get_dialogs()
-        me = None
+    def apply_filter(self):
+        types = {name for name, checkbox in self.type_checkboxes.items() if checkbox.isChecked()}
+        if len(types) == len(self.type_checkboxes):
+            types = None
+        elif "user" in types:
+            # Saved Messages is listed with the user chats.
+            types.add("saved")
+        self.chat_model.set_filter(DialogFilter(
+            self.search_input.text(),
+            types=types,
+            unread=tuple(self.unread_combo.currentData()),
+            age_days=tuple(self.age_combo.currentData()),
+            account=self.account_combo.currentData()
+        ))
+
+    def sort_changed(self):
+        # Activity is fetched for chats that have none yet (cached per
+        # session, so usually only new ones); the list is sorted once it is in.
+        sort = self.sort_combo.currentData()
+        store = self.chat_model.store
+        activity = self.chat_model.activity
+        missing = [record for record in map(store.record, range(len(store))) if record.key not in activity]
+        if sort is None or not missing:
+            self.chat_model.set_sort(sort)
+            return
+        if self.activity_future is not None:
+            return
+        self.statusBar().showMessage(f"Analyzing chat activity... 0 of {len(missing)}")
+        self.activity_future = self.bridge.run(
+            self.activity_analyzer.analyze(missing, on_progress=self.activity_signals.progress.emit),
+            self.activity_finished)
+
+    def activity_progress(self, done, total):
+        self.statusBar().showMessage(f"Analyzing chat activity... {done} of {total}")
+
+    def activity_finished(self, fut):
+        self.activity_future = None
         try:
-            me = asyncio.run_coroutine_threadsafe(self.client.get_me(), self.loop).result(timeout=10)
-            print("Current user ID:", me.id)
+            activity = fut.result()
         except Exception as e:
-            print("Error getting current user:", e)
+            self.statusBar().showMessage(f"Failed to analyze chat activity: {e}", 5000)
+            return
+        self.chat_model.activity.update(activity)
+        self.statusBar().showMessage(f"Activity of {len(self.chat_model.activity)} chats.", 5000)
+        self.chat_model.set_sort(self.sort_combo.currentData())
+
+    def check_matching(self, checked):
+        self.chat_model.set_checked_all(checked)
+
+    def update_filter_label(self):
+        total = len(self.chat_model.store)
+        checked = len(self.chat_model.store.rows_with(FLAG_CHECKED))
+        self.filter_label.setText(f"{self.chat_model.rowCount()} of {total} chats, {checked} checked")
+
+    def accounts_changed(self):
+        names = list(self.accounts)
+        self.setWindowTitle("Teletrim" if len(names) < 2 else f"Teletrim — {', '.join(names)}")
+        self.chat_model.set_show_accounts(len(names) > 1)
+        current = self.account_combo.currentData()
+        self.account_combo.blockSignals(True)
+        self.account_combo.clear()
+        self.account_combo.addItem("All accounts", None)
+        for name in names:
+            self.account_combo.addItem(name, name)
+        self.account_combo.setCurrentIndex(max(0, self.account_combo.findData(current)))
+        self.account_combo.blockSignals(False)
+        self.account_combo.setVisible(len(names) > 1)
+
+    def add_account(self):
+        names = [name for name in list_session_names() if name not in self.accounts]
+        if not names:
+            QMessageBox.information(self, "Add Account", "Every saved session is already open.")
+            return
+        name, ok = QInputDialog.getItem(self, "Add Account", "Session to open alongside the current ones:",
+                                        names, 0, False)
+        if not ok:
+            return
+        self.statusBar().showMessage(f"Connecting {name}...")
+        self.bridge.run(self.pool.open(name), lambda f: self.account_opened(name, f), timeout=BRIDGE_TIMEOUT)
+
+    def account_opened(self, name, fut):
         try:
-            fut = asyncio.run_coroutine_threadsafe(get_dialogs(), self.loop)
-            dialogs = fut.result(timeout=30)
+            client = fut.result()
+        except SessionError as e:
+            self.statusBar().clearMessage()
+            QMessageBox.warning(self, "Add Account", f"{e} Open it from the Session Manager once to log in.")
+            return
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to retrieve chats: {e}")
-            return
-        self.chat_list_widget.clear()
-        for d in dialogs:
-            entity = d.entity
-            is_saved = False
-            # If the entity has an id and it matches the current user's id, it's Saved Messages.
-            if hasattr(entity, "id") and me and entity.id == me.id:
-                name = "Saved Messages"
-                is_saved = True
-            else:
-                name = d.name.strip() if d.name and d.name.strip() else ""
-                if not name and isinstance(entity, User):
-                    if (not getattr(entity, "first_name", None) and not getattr(entity, "last_name", None)) or (getattr(entity, "first_name", "") == "Deleted Account"):
-                        name = "[Deleted Account]"
-                    else:
-                        name = "[Unknown]"
-                elif not name:
-                    name = "[Unknown]"
-            item = QListWidgetItem(name)
-            item.setForeground(QBrush(QColor("#FFFFFF")))
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            item.setCheckState(Qt.CheckState.Unchecked)
-            item.setData(Qt.ItemDataRole.UserRole, entity)
-            item.setData(Qt.ItemDataRole.UserRole + 1, is_saved)
-            self.chat_list_widget.addItem(item)
-
-    def chat_item_changed(self, item):
-        is_saved = item.data(Qt.ItemDataRole.UserRole + 1)
-        if is_saved:
-            if item.checkState() == Qt.CheckState.Checked:
+            self.statusBar().clearMessage()
+            QMessageBox.critical(self, "Add Account", f"Could not connect {name}: {e}")
+            return
+        if name in self.accounts:
+            return
+        account = Account(name, client)
+        self.accounts[name] = account
+        self.accounts_changed()
+        self.load_account_chats(account)
+        self.start_updates(account)
+        self.offer_resume([account])
+
+    def load_chats(self, full=False):
+        if full:
+            for account in self.accounts.values():
+                if account.dialog_loader is not None:
+                    account.dialog_loader.cancel()
+            self.chat_model.clear()
+        for account in self.accounts.values():
+            self.load_account_chats(account)
+
+    def load_account_chats(self, account):
+        # Shows the cached list straight away, then only asks Telegram for
+        # dialogs that changed since the newest one we already have.
+        if account.dialog_loader is not None:
+            account.dialog_loader.cancel()
+        store = self.chat_model.store
+        if not store.count(account.name) and account.dialog_cache is not None:
+            try:
+                self.chat_model.append_records(account.dialog_cache.load(account.name))
+            except sqlite3.Error as e:
+                print(f"Error reading dialog cache: {e}")
+        until_date = None
+        if store.count(account.name):
+            until_date = store.top_date(account.name)
+            self.statusBar().showMessage("Updating chats...")
+        else:
+            self.statusBar().showMessage("Loading chats...")
+        account.merge_after = None
+        account.dialog_signals = DialogLoaderSignals()
+        account.dialog_signals.page.connect(self.dialog_page_loaded)
+        account.dialog_signals.progress.connect(self.dialog_load_progress)
+        account.dialog_loader = DialogLoader(
+            account.client, self.loop,
+            until_date=until_date,
+            cache=account.dialog_cache,
+            on_page=account.dialog_signals.page.emit,
+            on_progress=account.dialog_signals.progress.emit,
+            account=account.name
+        )
+        self.bridge.watch(account.dialog_loader.start(), lambda f: self.dialog_load_finished(account, f))
+
+    def start_updates(self, account):
+        # New messages, joins and removals elsewhere arrive as diffs, so the
+        # list never has to be fetched again to stay current.
+        account.updates = DialogUpdates(account.client, account.name, on_diff=self.update_signals.diff.emit)
+        self.bridge.run(account.updates.start(), lambda f: self.updates_started(account, f))
+
+    def updates_started(self, account, fut):
+        try:
+            fut.result()
+        except Exception as e:
+            print(f"Error subscribing to updates for {account.name}: {e}")
+
+    def queue_chat_diff(self, diff):
+        # A busy group sends many updates a second; apply them in batches.
+        self.pending_diffs.append(diff)
+        if not self.diff_timer.isActive():
+            self.diff_timer.start()
+
+    def apply_chat_diffs(self):
+        diffs, self.pending_diffs = self.pending_diffs, []
+        model = self.chat_model
+        view = self.chat_list_view
+        current = view.currentIndex()
+        current_key = model.record(current.row()).key if current.isValid() else None
+        bar = view.verticalScrollBar()
+        top = view.indexAt(QPoint(0, 0))
+        top_key = model.record(top.row()).key if top.isValid() and bar.value() else None
+        # Rows move under the view; keep the chat and the scroll position the
+        # user had rather than whatever row ends up in their place.
+        self.restoring_current = True
+        try:
+            records, removed = model.apply_diffs(diffs)
+            if current_key is not None:
+                row = model.visible_row(current_key)
+                if row is not None:
+                    view.setCurrentIndex(model.index(row))
+                else:
+                    view.selectionModel().clearCurrentIndex()
+        finally:
+            self.restoring_current = False
+        if top_key is not None:
+            # The chat list scrolls per item, so the scroll value is the top row.
+            row = model.visible_row(top_key)
+            if row is not None:
+                view.doItemsLayout()
+                bar.setValue(row)
+        if current_key in removed:
+            self.preview_peer = self.history_peer = None
+            self.message_model.set_messages([])
+        generation = int(time.time() * 1000)
+        for account in self.accounts.values():
+            changed = [r for r in records if r.account == account.name]
+            gone = [marked_id for name, marked_id in removed if name == account.name]
+            if changed or gone:
+                self.bridge.call_soon(account.preview_cache.invalidate,
+                                      [r.marked_id for r in changed] + gone)
+            if account.dialog_cache is not None:
+                try:
+                    if changed:
+                        account.dialog_cache.upsert(changed, generation)
+                    if gone:
+                        account.dialog_cache.remove(gone)
+                except sqlite3.Error as e:
+                    print(f"Error updating dialog cache: {e}")
+        if current_key is not None and any(r.key == current_key for r in records):
+            self.history_updated(current_key)
+
+    def history_updated(self, key):
+        # New messages in the chat being read. Keep the loaded pages; follow
+        # the chat only when its newest message is in view, otherwise let
+        # scrolling down page them in.
+        if self.history_peer is None or self.history_peer.key != key or self.history_has_newer:
+            return
+        viewport = self.message_view.viewport()
+        last = self.message_view.indexAt(QPoint(0, viewport.height() - 1)).row()
+        self.history_has_newer = True
+        if last in (-1, self.message_model.rowCount() - 1) and not self.history_loading:
+            self.load_history(older=False, follow=True)
+
+    def sender_account(self):
+        # The account whose current loader sent the signal; None for stale loads.
+        sender = self.sender()
+        for account in self.accounts.values():
+            if account.dialog_signals is sender:
+                return account
+        return None
+
+    def dialog_page_loaded(self, page):
+        account = self.sender_account()
+        if account is None:
+            return
+        if account.dialog_loader.until_date is None:
+            self.chat_model.append_records(page)
+        else:
+            account.merge_after = self.chat_model.merge_records(page, account.merge_after)
+            # These chats have new activity, so their cached previews are stale.
+            self.bridge.call_soon(account.preview_cache.invalidate, [r.marked_id for r in page])
+
+    def dialog_load_progress(self, loaded, total):
+        account = self.sender_account()
+        if account is None:
+            return
+        prefix = f"{account.name}: " if len(self.accounts) > 1 else ""
+        if account.dialog_loader.until_date is None:
+            self.statusBar().showMessage(f"{prefix}Loading chats... {loaded} of {total}")
+        else:
+            self.statusBar().showMessage(f"{prefix}Updating chats... {loaded} changed")
+
+    def dialog_load_finished(self, account, fut):
+        if account.dialog_loader is None or account.dialog_loader.future is not fut:
+            return
+        account.dialog_loader = None
+        try:
+            fut.result()
+        except Exception as e:
+            self.statusBar().showMessage("Failed to load chats.")
+            QMessageBox.critical(self, "Error", f"Failed to retrieve chats for {account.name}: {e}")
+            return
+        catalog_update(account.name, dialogs=self.chat_model.store.count(account.name), last_used=int(time.time()))
+        if all(a.dialog_loader is None for a in self.accounts.values()):
+            self.statusBar().showMessage(f"{len(self.chat_model.store)} chats.", 5000)
+
+    def chat_item_changed(self, top_left, bottom_right, roles=()):
+        if Qt.ItemDataRole.CheckStateRole not in roles or top_left.row() != bottom_right.row():
+            return
+        record = self.chat_model.record(top_left.row())
+        if record.is_saved:
+            if record.flags & FLAG_CHECKED:
                 reply = QMessageBox.question(
                     self,
                     "Warning: Saved Messages",
@@ -666,108 +1748,385 @@ class MainWindow(QMainWindow):
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
                 )
                 if reply != QMessageBox.StandardButton.Yes:
-                    item.setCheckState(Qt.CheckState.Unchecked)
+                    self.chat_model.setData(top_left, Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
 
     def chat_selection_changed(self, current, previous):
-        if not current:
+        if not current.isValid() or self.restoring_current:
+            return
+        row = current.row()
+        record = self.chat_model.record(row)
+        account = self.accounts.get(record.account)
+        if account is None:
+            return
+        neighbours = []
+        for offset in range(1, PREVIEW_PREFETCH_ROWS + 1):
+            for near in (row + offset, row - offset):
+                if 0 <= near < self.chat_model.rowCount():
+                    near_record = self.chat_model.record(near)
+                    if near_record.account == record.account:
+                        neighbours.append((near_record.marked_id, near_record))
+        if self.preview_future is not None:
+            self.preview_future.cancel()
+        for fut in self.thumb_futures.values():
+            fut.cancel()
+        self.thumb_futures = {}
+        self.preview_token += 1
+        token = self.preview_token
+        self.preview_peer = record
+        self.preview_account = account
+        self.history_peer = None
+        self.preview_future = self.bridge.run(account.preview_cache.show(record.marked_id, record, neighbours),
+                                              lambda f: self.preview_loaded(token, f))
+
+    def preview_loaded(self, token, fut):
+        if token != self.preview_token:
             return
-        entity = current.data(Qt.ItemDataRole.UserRole)
-        async def get_messages():
-            return await self.client.get_messages(entity, limit=10)
+        self.preview_future = None
         try:
-            fut = asyncio.run_coroutine_threadsafe(get_messages(), self.loop)
-            messages = fut.result(timeout=30)
+            items = fut.result()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load messages: {e}")
             return
-        while self.message_layout.count():
-            child = self.message_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        for msg in reversed(messages):
-            if msg.photo:
-                bubble = MessageBubble("[Image]")
-            elif msg.voice:
-                bubble = MessageBubble("[Voice Message]")
-            elif msg.document:
-                bubble = MessageBubble("[File Message]")
-            else:
-                bubble = MessageBubble(msg.message or "[No Text]")
-            self.message_layout.addWidget(bubble)
-        self.message_layout.addStretch()
+        self.show_messages(items)
+
+    def show_messages(self, items):
+        self.history_peer = self.preview_peer
+        self.history_account = self.preview_account
+        self.history_loading = False
+        self.history_has_older = len(items) >= PREVIEW_MESSAGE_LIMIT
+        self.history_has_newer = False
+        self.message_model.set_messages(items)
+        self.message_view.scrollToBottom()
+        if self.message_view.verticalScrollBar().maximum() == 0:
+            # Nothing to scroll yet, so fetch the next page up front.
+            self.history_scrolled()
+
+    def request_thumbnail(self, index):
+        # From the delegate's paint: fetch (or read from the disk cache) and
+        # decode the row's thumbnail off the GUI thread, once per shown chat.
+        model = self.message_model
+        message_id, _, media = model.messages[index.row()]
+        if message_id in model.images or self.history_peer is None:
+            return
+        model.images[message_id] = None
+        token = self.preview_token
+        self.thumb_futures[message_id] = self.bridge.run(
+            load_thumbnail(self.history_account.thumbnails, self.history_peer, message_id, media),
+            lambda f: self.thumbnail_loaded(token, message_id, f))
+
+    def thumbnail_loaded(self, token, message_id, fut):
+        if token != self.preview_token:
+            return
+        self.thumb_futures.pop(message_id, None)
+        try:
+            image = fut.result()
+        except Exception as e:
+            print(f"Error loading thumbnail: {e}")
+            return
+        if image is not None and message_id in self.message_model.images:
+            self.message_model.set_image(message_id, image)
+
+    def history_scrolled(self, value=None):
+        # Keeps a page of rows loaded beyond either edge of what is visible.
+        if self.history_peer is None or self.history_loading:
+            return
+        viewport = self.message_view.viewport()
+        first = self.message_view.indexAt(QPoint(0, 0)).row()
+        last = self.message_view.indexAt(QPoint(0, viewport.height() - 1)).row()
+        if last < 0:
+            last = self.message_model.rowCount() - 1
+        if self.history_has_older and first < HISTORY_PAGE_SIZE:
+            self.load_history(older=True)
+        elif self.history_has_newer and last >= self.message_model.rowCount() - HISTORY_PAGE_SIZE:
+            self.load_history(older=False)
+
+    def load_history(self, older, follow=False):
+        # follow: scroll to the newest message once the page is in.
+        self.history_loading = True
+        offset_id = self.message_model.oldest_id() if older else self.message_model.newest_id()
+        token = self.preview_token
+        self.bridge.run(self.history_account.preview_cache.history_page(self.history_peer, offset_id, older),
+                        lambda f: self.history_loaded(token, older, f, follow))
+
+    def history_loaded(self, token, older, fut, follow=False):
+        if token != self.preview_token:
+            return
+        self.history_loading = False
+        try:
+            items = fut.result()
+        except Exception as e:
+            self.statusBar().showMessage(f"Failed to load messages: {e}", 5000)
+            return
+        model = self.message_model
+        view = self.message_view
+        bar = view.verticalScrollBar()
+        if older:
+            self.history_has_older = len(items) >= HISTORY_PAGE_SIZE
+        else:
+            self.history_has_newer = len(items) >= HISTORY_PAGE_SIZE
+        if not items:
+            return
+        value = bar.value()
+        # Rows added above, or dropped from above, move the content; shift the
+        # scroll value by their height so the visible messages stay put.
+        if older:
+            model.prepend(items)
+            value += sum(view.sizeHintForIndex(model.index(row)).height() for row in range(len(items)))
+            excess = model.rowCount() - HISTORY_WINDOW
+            if excess > 0:
+                model.remove_tail(excess)
+                self.history_has_newer = True
+        else:
+            model.append(items)
+            excess = model.rowCount() - HISTORY_WINDOW
+            if excess > 0:
+                value -= sum(view.sizeHintForIndex(model.index(row)).height() for row in range(excess))
+                model.remove_head(excess)
+                self.history_has_older = True
+        view.doItemsLayout()
+        if follow and not self.history_has_newer:
+            view.scrollToBottom()
+        else:
+            bar.setValue(max(0, value))
 
     def leave_selected(self):
-        selected = []
-        for idx in range(self.chat_list_widget.count()):
-            item = self.chat_list_widget.item(idx)
-            if item.checkState() == Qt.CheckState.Checked:
-                selected.append(item)
+        store = self.chat_model.store
+        selected = [store.record(row) for row in store.rows_with(FLAG_CHECKED)]
         if not selected:
             QMessageBox.information(self, "No Chats Selected", "Please select at least one chat or channel.")
             return
+        if not WARN_CHANNEL_DELETE:
+            self.leave_records(selected)
+            return
+        keys = frozenset(r.key for r in selected)
+        if self.impact is not None and self.impact[0] == keys:
+            self.confirm_leave(selected, self.impact[1])
+            return
+        # Count what would go before asking; the dialog can be skipped.
+        self.impact_dialog = QProgressDialog("Estimating what will be deleted...", "Skip", 0, len(selected), self)
+        self.impact_dialog.setWindowTitle("Leaving Chats")
+        self.impact_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.impact_dialog.setMinimumDuration(0)
+        self.impact_dialog.canceled.connect(lambda: self.impact_skipped(selected))
+        self.impact_future = self.bridge.run(
+            self.impact_estimator.estimate(selected, on_progress=self.impact_signals.progress.emit),
+            lambda f: self.impact_finished(selected, f))
+
+    def impact_progress(self, done, total):
+        if self.impact_future is not None:
+            self.impact_dialog.setValue(done)
+
+    def impact_skipped(self, selected):
+        if self.impact_future is None:
+            return
+        self.impact_future.cancel()
+        self.impact_future = None
+        self.confirm_leave(selected, None)
+
+    def impact_finished(self, selected, fut):
+        if fut is not self.impact_future:
+            return
+        self.impact_future = None
+        self.impact_dialog.close()
+        estimate = None
+        try:
+            estimate = fut.result()
+            self.impact = (frozenset(r.key for r in selected), estimate)
+        except Exception as e:
+            print(f"Error estimating impact: {e}")
+        self.confirm_leave(selected, estimate)
+
+    def confirm_leave(self, selected, estimate):
         global WARN_CHANNEL_DELETE
-        if WARN_CHANNEL_DELETE:
-            msg_box = QMessageBox(self)
-            msg_box.setIcon(QMessageBox.Icon.Warning)
-            msg_box.setText("The selected chats/channels will be left and their message history deleted permanently.")
-            msg_box.setWindowTitle("Confirm Leave")
-            msg_box.setStandardButtons(QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel)
-            check_box = QCheckBox("Don't show this warning again")
-            check_box.setStyleSheet("color: #ffffff;")
-            msg_box.setCheckBox(check_box)
-            response = msg_box.exec()
-            if response != QMessageBox.StandardButton.Ok:
-                return
-            if check_box.isChecked():
-                WARN_CHANNEL_DELETE = False
-        for item in selected:
-            entity = item.data(Qt.ItemDataRole.UserRole)
-            is_saved = item.data(Qt.ItemDataRole.UserRole + 1)
-            if is_saved:
+        msg_box = QMessageBox(self)
+        msg_box.setIcon(QMessageBox.Icon.Warning)
+        msg_box.setText("The selected chats/channels will be left and their message history deleted permanently.")
+        msg_box.setInformativeText(impact_summary(estimate) if estimate is not None
+                                   else f"{len(selected)} chats selected.")
+        msg_box.setWindowTitle("Confirm Leave")
+        msg_box.setStandardButtons(QMessageBox.StandardButton.Ok | QMessageBox.StandardButton.Cancel)
+        export_btn = None
+        if not EXPORT_BEFORE_DELETE:
+            export_btn = msg_box.addButton("Export First", QMessageBox.ButtonRole.AcceptRole)
+        check_box = QCheckBox("Don't show this warning again")
+        check_box.setStyleSheet("color: #ffffff;")
+        msg_box.setCheckBox(check_box)
+        response = msg_box.exec()
+        export = export_btn is not None and msg_box.clickedButton() is export_btn
+        if response != QMessageBox.StandardButton.Ok and not export:
+            return
+        if check_box.isChecked():
+            WARN_CHANNEL_DELETE = False
+        self.leave_records(selected, export or EXPORT_BEFORE_DELETE)
+
+    def leave_records(self, selected, export=None):
+        export = EXPORT_BEFORE_DELETE if export is None else export
+        targets = []
+        for record in selected:
+            if record.is_saved:
                 reply = QMessageBox.question(
                     self,
                     "Warning: Saved Messages",
                     "Saved Messages cannot be left. Would you like to clear its history instead?",
                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
                 )
-                if reply == QMessageBox.StandardButton.Yes:
-                    async def clear_saved():
-                        try:
-                            await self.client(DeleteHistoryRequest(peer=entity, max_id=0, revoke=True))
-                        except Exception as e:
-                            print(f"Error clearing history for Saved Messages: {e}")
-                    try:
-                        asyncio.run_coroutine_threadsafe(clear_saved(), self.loop).result(timeout=30)
-                    except Exception as e:
-                        print(f"Failed to clear history for Saved Messages: {e}")
+                if reply != QMessageBox.StandardButton.Yes:
+                    continue
+            targets.append(PurgeTarget(record, export))
+        if not targets:
+            return
+        self.start_purge(targets)
+
+    def offer_resume(self, accounts):
+        # A purge that was cut short (crash, cancel, closed window) is still
+        # open in the account's journal; offer to pick it up where it stopped.
+        if self.purge_engine is not None:
+            return
+        jobs = {}
+        for account in accounts:
+            try:
+                unfinished = account.journal.unfinished()
+            except OSError as e:
+                print(f"Error reading purge journal: {e}")
                 continue
-            else:
-                async def delete_history(entity):
-                    try:
-                        await self.client(DeleteHistoryRequest(peer=entity, max_id=0, revoke=True))
-                    except Exception as e:
-                        print(f"Error deleting history for {entity}: {e}")
-                try:
-                    asyncio.run_coroutine_threadsafe(delete_history(entity), self.loop).result(timeout=30)
-                except Exception as e:
-                    print(f"Failed to delete history: {e}")
-                async def leave_chat(entity):
-                    try:
-                        await self.client(LeaveChannelRequest(entity))
-                    except Exception as e:
-                        print(f"Error leaving channel {entity}: {e}")
+            if unfinished:
+                jobs[account.name] = unfinished
+        if not jobs:
+            return
+        count = sum(len(merge_jobs(unfinished).records) for unfinished in jobs.values())
+        reply = QMessageBox.question(
+            self, "Resume Purge",
+            f"An earlier purge did not finish: {count} chats are left to process. Resume it now?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        resume = reply == QMessageBox.StandardButton.Yes and count
+        resumed = {}
+        for name, unfinished in jobs.items():
+            # Declined jobs are closed so we stop asking; resumed ones fold
+            # into a single job the resumed run finishes.
+            journal = self.accounts[name].journal
+            try:
+                if resume:
+                    resumed[name] = journal.merge(unfinished)
+                else:
+                    for job in unfinished:
+                        journal.finish(job)
+            except OSError as e:
+                print(f"Error writing purge journal: {e}")
+                if resume:
+                    resumed[name] = merge_jobs(unfinished)
+        if resume:
+            self.start_purge([PurgeTarget(r, r.marked_id in job.export)
+                              for job in resumed.values() for r in job.records], resumed)
+
+    def start_purge(self, targets, jobs=None):
+        self.purge_results = []
+        self.purge_signals = PurgeSignals()
+        self.purge_signals.result.connect(self.purge_result)
+        self.purge_signals.progress.connect(self.purge_progress)
+        self.purge_signals.flood_wait.connect(self.purge_flood_wait)
+        self.purge_signals.deleted.connect(self.purge_deleted)
+        self.purge_signals.exported.connect(self.purge_exported)
+        self.purge_engine = PoolPurge(
+            self.pool, self.loop,
+            on_result=self.purge_signals.result.emit,
+            on_progress=self.purge_signals.progress.emit,
+            on_flood_wait=self.purge_signals.flood_wait.emit,
+            on_deleted=self.purge_signals.deleted.emit,
+            on_exported=self.purge_signals.exported.emit,
+            journals={name: account.journal for name, account in self.accounts.items()}
+        )
+        self.purge_dialog = QProgressDialog("Processing selected chats...", "Cancel", 0, len(targets), self)
+        self.purge_dialog.setWindowTitle("Leaving Chats")
+        self.purge_dialog.setWindowModality(Qt.WindowModality.NonModal)
+        self.purge_dialog.setAutoClose(False)
+        self.purge_dialog.setAutoReset(False)
+        self.purge_dialog.setMinimumDuration(0)
+        self.purge_dialog.canceled.connect(self.purge_engine.cancel)
+        self.purge_dialog.show()
+        self.leave_btn.setEnabled(False)
+        self.bridge.watch(self.purge_engine.start(targets, jobs), self.purge_finished)
+
+    def purge_result(self, result):
+        self.purge_results.append(result)
+        if result.status == "failed":
+            print(f"Error processing {result.target.name}: {'; '.join(result.errors)}")
+
+    def purge_progress(self, completed, total):
+        self.purge_dialog.setValue(completed)
+        self.purge_dialog.setLabelText(f"Processed {completed} of {total} chats...")
+
+    def purge_deleted(self, result):
+        # One page of a chat's history is gone; big chats take several.
+        self.purge_dialog.setLabelText(
+            f"Processed {self.purge_dialog.value()} of {self.purge_dialog.maximum()} chats...\n"
+            f"{result.target.name}: {result.messages_deleted} messages deleted")
+
+    def purge_exported(self, result):
+        self.purge_dialog.setLabelText(
+            f"Processed {self.purge_dialog.value()} of {self.purge_dialog.maximum()} chats...\n"
+            f"{result.target.name}: {result.messages_exported} messages exported")
+
+    def purge_flood_wait(self, seconds):
+        self.purge_dialog.setLabelText(f"Telegram asked to slow down; some chats are waiting {seconds} s...")
+
+    def purge_finished(self, fut):
+        self.purge_dialog.close()
+        self.leave_btn.setEnabled(True)
+        self.purge_engine = None
+        try:
+            fut.result()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Purge failed: {e}")
+        # Drop what we just left; anything else that changed arrives as updates.
+        removed = [r.target.record.key for r in self.purge_results
+                   if r.status == "done" and not r.target.is_saved]
+        self.chat_model.remove_keys(removed)
+        self.impact_estimator.invalidate([r.target.record.key for r in self.purge_results])
+        self.impact = None
+        for account in self.accounts.values():
+            self.bridge.call_soon(account.preview_cache.invalidate, [
+                r.target.record.marked_id for r in self.purge_results if r.target.account == account.name])
+            if account.dialog_cache is not None:
                 try:
-                    asyncio.run_coroutine_threadsafe(leave_chat(entity), self.loop).result(timeout=30)
-                except Exception as e:
-                    print(f"Failed to leave chat: {e}")
-        self.load_chats()
-        QMessageBox.information(self, "Operation Completed", "Selected chats/channels have been processed.")
+                    account.dialog_cache.remove([marked_id for name, marked_id in removed if name == account.name])
+                except sqlite3.Error as e:
+                    print(f"Error updating dialog cache: {e}")
+            if any(r.target.account == account.name for r in self.purge_results):
+                catalog_update(account.name, dialogs=self.chat_model.store.count(account.name),
+                               last_used=int(time.time()))
+        done = sum(1 for r in self.purge_results if r.status == "done")
+        failed = [r for r in self.purge_results if r.status == "failed"]
+        cancelled = sum(1 for r in self.purge_results if r.status == "cancelled")
+        msg_box = QMessageBox(self)
+        msg_box.setWindowTitle("Operation Completed")
+        messages = sum(r.messages_deleted for r in self.purge_results)
+        exported = sum(r.messages_exported for r in self.purge_results)
+        msg_box.setText(f"{done} chats processed, {len(failed)} failed, {cancelled} cancelled.\n"
+                        f"{messages} messages deleted.")
+        if any(r.target.export for r in self.purge_results):
+            msg_box.setInformativeText(f"{exported} messages exported to {os.path.join(os.getcwd(), 'exports')}.")
+        retry_btn = None
+        if failed:
+            msg_box.setIcon(QMessageBox.Icon.Warning)
+            msg_box.setDetailedText("\n".join(f"{r.target.name}: {'; '.join(r.errors)}" for r in failed))
+            msg_box.addButton(QMessageBox.StandardButton.Ok)
+            retry_btn = msg_box.addButton("Retry Failed", QMessageBox.ButtonRole.ActionRole)
+        msg_box.exec()
+        if retry_btn is not None and msg_box.clickedButton() is retry_btn:
+            self.start_purge([r.target for r in failed])
+
+    def show_metrics(self):
+        if self.metrics_dialog is None:
+            self.metrics_dialog = MetricsDialog(self)
+        self.metrics_dialog.show()
+        self.metrics_dialog.raise_()
 
     def show_preferences(self):
         pref_dialog = PreferencesDialog(self)
         if pref_dialog.exec() == QDialog.DialogCode.Accepted:
-            global WARN_SESSION_DELETE, WARN_CHANNEL_DELETE
-            WARN_SESSION_DELETE, WARN_CHANNEL_DELETE = pref_dialog.get_preferences()
+            global WARN_SESSION_DELETE, WARN_CHANNEL_DELETE, EXPORT_BEFORE_DELETE
+            WARN_SESSION_DELETE, WARN_CHANNEL_DELETE, EXPORT_BEFORE_DELETE = pref_dialog.get_preferences()
 
     def show_about(self):
         about_html = """
@@ -804,29 +2163,45 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                asyncio.run_coroutine_threadsafe(safe_disconnect_async(self.client), self.loop).result(timeout=10)
-            except Exception as e:
-                print("Error during disconnect:", e)
-            self.session_switch_requested = True
-            self.close()
-            QApplication.quit()
+            self.bridge.cancel_all()
+            self.setEnabled(False)
+            self.statusBar().showMessage("Disconnecting...")
+            self.bridge.run(self.pool.close_all(), self.sessions_closed, timeout=BRIDGE_CLOSE_TIMEOUT)
+
+    def sessions_closed(self, fut):
+        try:
+            fut.result()
+        except Exception as e:
+            print("Error during disconnect:", e)
+        self.session_switch_requested = True
+        self.close()
+        QApplication.quit()
 
 ###############################################################################
 # Main entry point.
 ###############################################################################
 
+def resource_path(name):
+    # Frozen builds keep data files under sys._MEIPASS (onefile unpack dir or
+    # the onedir _internal folder).
+    base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base, name)
+
+def create_application(argv, loop):
+    app = QApplication(argv)
+    app.setWindowIcon(QIcon(resource_path(ICON_FILE)))
+    # Telethon is only needed once a session is opened; import it on the
+    # asyncio thread once the first window is up and the user is reading it.
+    QTimer.singleShot(0, lambda: loop.call_soon_threadsafe(preload_telethon))
+    return app
+
 def main():
     loop = asyncio.new_event_loop()
     t = threading.Thread(target=start_event_loop, args=(loop,), daemon=True)
     t.start()
-    app = QApplication(sys.argv)
-    # Convert base64 to QIcon
-    icon_bytes = QByteArray.fromBase64(ICON_DATA.encode('utf-8'))
-    pixmap = QPixmap()
-    pixmap.loadFromData(icon_bytes)
-    icon = QIcon(pixmap)
-    app.setWindowIcon(icon)
+    app = create_application(sys.argv, loop)
+    bridge = AsyncBridge(loop)
+    pool = ClientPool()
     while True:
         session_mgr = SessionManager()
         if session_mgr.exec() == QDialog.DialogCode.Accepted:
@@ -837,13 +2212,15 @@ def main():
         login_dialog.back_pressed = False
         result = login_dialog.exec()
         if result == QDialog.DialogCode.Accepted and login_dialog.api_ready:
-            main_window = MainWindow(login_dialog.client, loop)
+            pool.add(login_dialog.session_name, login_dialog.client)
+            bridge.run(record_account(login_dialog.session_name, login_dialog.client))
+            main_window = MainWindow(pool, loop)
             main_window.show()
             ret = app.exec()
             if ret == 42 or main_window.session_switch_requested:
                 continue
             else:
-                asyncio.run_coroutine_threadsafe(safe_disconnect_async(login_dialog.client), loop)
+                bridge.run(pool.close_all())
                 sys.exit(ret)
         else:
             if login_dialog.back_pressed:
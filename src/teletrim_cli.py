@@ -0,0 +1,308 @@
+import sys
+import os
+import re
+import json
+import time
+import asyncio
+import argparse
+
+from teletrim_core import (
+    PURGE_CONCURRENCY, FLAG_SAVED,
+    SessionError, ClientPool, get_metrics, load_session_config, catalog_update,
+    get_cache_path, get_journal_path, ImpactEstimator, DialogCache, DialogLoader, PurgeTarget, PurgeJournal, merge_jobs, PoolPurge,
+    record_type_name
+)
+
+# Headless batch mode: select dialogs with a rule file and purge them without
+# the GUI. Uses the same sessions/<name>.session + .json as the GUI. Several
+# sessions can be given; they are loaded and purged in parallel.
+#
+# Rule file (JSON):
+#   {
+#     "rules": [
+#       {"types": ["channel", "supergroup"], "name": "(?i)airdrop|giveaway", "inactive_days": 90},
+#       {"types": ["user"], "name": "^\\[Deleted Account\\]$"}
+#     ],
+#     "exclude": [{"name": "(?i)family"}]
+#   }
+#
+# A dialog is selected when it matches any entry in "rules" and none in
+# "exclude". Within one entry every given condition must hold. Types are
+# user, group, supergroup, channel and saved; Saved Messages is only ever
+# selected by a rule that names the "saved" type.
+#
+# Every purge is journalled to sessions/<name>.jobs. --resume carries on with
+# an interrupted run (steps already done are skipped) and --retry-failed runs
+# the chats that failed in the last run again; neither needs --rules.
+#
+# --export saves each chat's history to exports/<name>/<chat id>.jsonl.gz
+# before deleting it (see HistoryExporter); a chat whose export fails is left
+# alone. Resumed and retried chats keep the choice made when they were planned.
+
+RULE_TYPES = ("user", "group", "supergroup", "channel", "saved")
+
+###############################################################################
+# Rules
+###############################################################################
+
+class RuleError(Exception):
+    pass
+
+class DialogRule:
+    def __init__(self, spec):
+        if not isinstance(spec, dict):
+            raise RuleError(f"Rule must be an object, got {spec!r}.")
+        unknown = set(spec) - {"types", "name", "inactive_days"}
+        if unknown:
+            raise RuleError(f"Unknown rule keys: {', '.join(sorted(unknown))}.")
+        self.types = set(spec.get("types") or ())
+        bad_types = self.types - set(RULE_TYPES)
+        if bad_types:
+            raise RuleError(f"Unknown types: {', '.join(sorted(bad_types))}.")
+        try:
+            self.name = re.compile(spec["name"]) if spec.get("name") else None
+        except re.error as e:
+            raise RuleError(f"Bad name pattern {spec['name']!r}: {e}")
+        self.inactive_days = spec.get("inactive_days")
+
+    def matches(self, record, now):
+        record_type = record_type_name(record)
+        if self.types and record_type not in self.types:
+            return False
+        if record_type == "saved" and "saved" not in self.types:
+            return False
+        if self.name is not None and not self.name.search(record.name):
+            return False
+        if self.inactive_days is not None and record.date > now - self.inactive_days * 86400:
+            return False
+        return True
+
+def load_rules(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RuleError(f"Could not read rule file: {e}")
+    if not isinstance(spec, dict) or not spec.get("rules"):
+        raise RuleError("Rule file needs a non-empty \"rules\" list.")
+    return [DialogRule(r) for r in spec["rules"]], [DialogRule(r) for r in spec.get("exclude", [])]
+
+def select_records(records, rules, excludes, now=None):
+    now = time.time() if now is None else now
+    return [r for r in records
+            if any(rule.matches(r, now) for rule in rules)
+            and not any(rule.matches(r, now) for rule in excludes)]
+
+###############################################################################
+# Batch run
+###############################################################################
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+def record_report(record):
+    return {"id": record.marked_id, "name": record.name, "type": record_type_name(record), "date": record.date}
+
+async def load_records(client, cache, use_cache, account=""):
+    records = {}
+    until_date = None
+    prefix = f"{account}: " if account else ""
+    if use_cache and cache is not None:
+        for record in cache.load(account):
+            records[record.marked_id] = record
+        until_date = max((r.date for r in records.values()), default=0) or None
+    def on_page(page):
+        for record in page:
+            records[record.marked_id] = record
+    def on_progress(loaded, total):
+        log(f"{prefix}Loaded {loaded} of {total} dialogs")
+    loader = DialogLoader(client, asyncio.get_running_loop(), until_date=until_date, cache=cache,
+                          on_page=on_page, on_progress=on_progress, account=account)
+    await loader.run()
+    return list(records.values())
+
+async def plan_account(pool, session, rules, excludes, args):
+    report = {"session": session, "dry_run": args.dry_run, "started": int(time.time())}
+    cache = None
+    try:
+        cache = DialogCache(get_cache_path(session))
+    except Exception as e:
+        log(f"{session}: dialog cache unavailable: {e}")
+    records = await load_records(pool.get(session), cache, args.cached, session)
+    selected = select_records(records, rules, excludes)
+    catalog_update(session, dialogs=len(records), last_used=int(time.time()))
+    log(f"{session}: {len(selected)} of {len(records)} dialogs match the rules")
+    report["dialogs"] = len(records)
+    report["planned"] = [record_report(r) for r in selected]
+    report["results"] = []
+    return report, cache, selected
+
+def plan_journal(session, journal, args):
+    # --resume / --retry-failed: the chats come from the journal, not the rules.
+    report = {"session": session, "dry_run": args.dry_run, "started": int(time.time()), "results": []}
+    job = None
+    export = set()
+    if args.resume:
+        unfinished = journal.unfinished()
+        if unfinished:
+            job = merge_jobs(unfinished) if args.dry_run else journal.merge(unfinished)
+        selected = job.records if job is not None else []
+        export = job.export if job is not None else export
+        log(f"{session}: {len(selected)} chats left in the interrupted purge")
+    else:
+        last = journal.last_job()
+        selected = last.failed() if last is not None else []
+        export = last.export if last is not None else export
+        log(f"{session}: {len(selected)} chats failed in the last purge")
+    for record in selected:
+        record.account = session
+    report["planned"] = [record_report(r) for r in selected]
+    return report, job, selected, export
+
+async def run_batch(args):
+    if args.resume or args.retry_failed:
+        rules = excludes = None
+    else:
+        rules, excludes = load_rules(args.rules)
+    journals = {session: PurgeJournal(get_journal_path(session)) for session in args.sessions}
+    jobs = {}
+    exports = {}   # session -> marked ids exported first, from the journal
+    pool = ClientPool(args.concurrency)
+    try:
+        if args.login:
+            # Login prompts share the terminal, so open those one at a time.
+            for session in args.sessions:
+                await pool.open(session, interactive=True)
+        else:
+            await asyncio.gather(*(pool.open(session) for session in args.sessions))
+        if rules is None:
+            plans = []
+            for session in args.sessions:
+                report, job, selected, exports[session] = plan_journal(session, journals[session], args)
+                if job is not None:
+                    jobs[session] = job
+                cache = None
+                try:
+                    cache = DialogCache(get_cache_path(session))
+                except Exception as e:
+                    log(f"{session}: dialog cache unavailable: {e}")
+                report["dialogs"] = len(cache.load(session)) if cache is not None else 0
+                plans.append((report, cache, selected))
+        else:
+            plans = await asyncio.gather(*(plan_account(pool, s, rules, excludes, args) for s in args.sessions))
+        reports = [report for report, cache, selected in plans]
+        selected = [record for report, cache, records in plans for record in records]
+        if args.estimate and selected:
+            log(f"Counting messages in {len(selected)} chats...")
+            estimator = ImpactEstimator(pool)
+            estimate = await estimator.estimate(selected)
+            for report, cache, records in plans:
+                # Counts are cached by now; this only adds them up per account.
+                mine = await estimator.estimate(records)
+                report["estimate"] = {"chats": mine.chats, "messages": mine.messages,
+                                      "own_messages": mine.own_messages, "types": mine.types,
+                                      "unknown": mine.unknown}
+            log(f"About {estimate.messages} messages ({estimate.own_messages} of them yours) in "
+                f"{estimate.chats} chats")
+        if args.dry_run or not selected:
+            return reports
+        if not args.yes:
+            answer = await asyncio.get_running_loop().run_in_executor(None, input, (
+                f"{len(selected)} chats will be left and their history deleted permanently. Continue? [y/N] "))
+            if answer.strip().lower() not in ("y", "yes"):
+                for report in reports:
+                    report["aborted"] = True
+                return reports
+        def on_result(result):
+            status = result.status if not result.errors else f"{result.status}: {'; '.join(result.errors)}"
+            deleted = f", {result.messages_deleted} messages deleted" if result.messages_deleted else ""
+            exported = f", {result.messages_exported} messages exported" if result.target.export else ""
+            log(f"{result.target.account}: {result.target.name}: {status}{exported}{deleted}")
+        purge = PoolPurge(pool, asyncio.get_running_loop(), on_result=on_result,
+                          on_flood_wait=lambda s: log(f"FloodWait: waiting {s} s"), journals=journals)
+        results = await purge.run([PurgeTarget(r, args.export or r.marked_id in exports.get(r.account, ()))
+                                   for r in selected], jobs)
+        for report, cache, records in plans:
+            mine = [r for r in results if r.target.account == report["session"]]
+            report["results"] = [dict(record_report(r.target.record), status=r.status, deleted=r.deleted,
+                                      left=r.left, messages_deleted=r.messages_deleted,
+                                      messages_exported=r.messages_exported, errors=r.errors) for r in mine]
+            removed = [r.target.record.marked_id for r in mine
+                       if r.status == "done" and not r.target.record.flags & FLAG_SAVED]
+            if cache is not None:
+                try:
+                    cache.remove(removed)
+                except Exception as e:
+                    log(f"Error updating dialog cache: {e}")
+            catalog_update(report["session"], dialogs=report["dialogs"] - len(removed), last_used=int(time.time()))
+        return reports
+    finally:
+        await pool.close_all()
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="teletrim_cli",
+        description="Leave Telegram chats and delete their history in bulk, selected by a rule file.")
+    parser.add_argument("sessions", nargs="+", metavar="session",
+                        help="session name under sessions/ (created with the GUI); give several to run in parallel")
+    parser.add_argument("--rules", help="JSON rule file selecting dialogs to purge")
+    parser.add_argument("--resume", action="store_true",
+                        help="finish an interrupted purge from the session's job journal instead of using rules")
+    parser.add_argument("--retry-failed", action="store_true",
+                        help="purge again only the chats that failed in the last run")
+    parser.add_argument("--dry-run", action="store_true", help="only report what would be purged")
+    parser.add_argument("--export", action="store_true",
+                        help="save each chat's history to exports/<session>/ (gzipped JSON lines) before deleting it")
+    parser.add_argument("--yes", action="store_true", help="purge without asking (required when not on a terminal)")
+    parser.add_argument("--report", help="write the JSON report here instead of stdout")
+    parser.add_argument("--concurrency", type=int, default=PURGE_CONCURRENCY,
+                        help="delete/leave calls in flight per account (a session's \"purge_concurrency\" wins)")
+    parser.add_argument("--cached", action="store_true",
+                        help="start from the on-disk dialog cache and fetch only newer dialogs")
+    parser.add_argument("--login", action="store_true", help="prompt for a login code if the session is logged out")
+    parser.add_argument("--estimate", action="store_true",
+                        help="count the messages (and your own messages) in the selected chats first")
+    parser.add_argument("--metrics", help="write Telegram API call metrics here (.prom for Prometheus, else JSON)")
+    args = parser.parse_args(argv)
+    if args.resume and args.retry_failed:
+        parser.error("--resume and --retry-failed cannot be combined")
+    if not (args.rules or args.resume or args.retry_failed):
+        parser.error("--rules is required unless --resume or --retry-failed is given")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    for session in args.sessions:
+        if not load_session_config(session):
+            log(f"No session named '{session}' in {os.path.join(os.getcwd(), 'sessions')}")
+            return 2
+    if not args.dry_run and not args.yes and not sys.stdin.isatty():
+        log("Refusing to purge without --yes when not running on a terminal.")
+        return 2
+    try:
+        reports = asyncio.run(run_batch(args))
+    except (RuleError, SessionError) as e:
+        log(str(e))
+        return 2
+    finally:
+        if args.metrics:
+            try:
+                get_metrics().export(args.metrics)
+            except OSError as e:
+                log(f"Could not write metrics: {e}")
+    finished = int(time.time())
+    for report in reports:
+        report["finished"] = finished
+    # One session keeps the single-account report layout.
+    report = reports[0] if len(reports) == 1 else {"accounts": reports}
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    failed = [r for report in reports for r in report["results"] if r["status"] != "done"]
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,2385 @@
+import os
+import gzip
+import asyncio
+import json
+import time
+import heapq
+import sqlite3
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AsyncExitStack
+
+# Session, dialog and purge logic shared by the GUI (teletrim.py) and the
+# command line (teletrim_cli.py). Nothing in here may import PyQt6.
+#
+# Telethon takes most of the startup time, so it is imported inside the
+# functions that need it. The GUI shows its first window first and warms the
+# import up on the asyncio thread (preload_telethon).
+
+###############################################################################
+# Tuning
+# Number of delete/leave requests the purge engine keeps in flight at once.
+PURGE_CONCURRENCY = 4
+# RPC scheduler limits: total calls in flight, how many of those bulk work may
+# take, and the longest FloodWait that is retried automatically.
+RPC_MAX_IN_FLIGHT = 6
+RPC_BULK_IN_FLIGHT = 4
+FLOOD_RETRY_LIMIT = 60
+# Dialogs fetched per page by the streaming loader (Telegram returns at most 100).
+DIALOG_PAGE_SIZE = 100
+# Message preview: messages shown per chat, chats kept in memory, and how many
+# rows above and below the current one are fetched ahead of time.
+PREVIEW_MESSAGE_LIMIT = 10
+PREVIEW_CACHE_SIZE = 200
+PREVIEW_PREFETCH_ROWS = 2
+# History scrolling: messages per page, and the most rows the preview keeps.
+HISTORY_PAGE_SIZE = 50
+HISTORY_WINDOW = 400
+# Preview thumbnails: default byte cap of a session's disk cache, which
+# "thumb_cache_bytes" in sessions/<name>.json overrides.
+THUMB_CACHE_BYTES = 64 << 20
+# Impact estimate: chats per batched call (two count queries each), and how
+# long a chat's counts are reused before being asked again.
+IMPACT_BATCH_SIZE = 100
+IMPACT_CACHE_TTL = 300
+ACTIVITY_BATCH_SIZE = 100        # Peers per GetPeerDialogs call, the server's limit.
+ACTIVITY_CACHE_TTL = 6 * 3600    # Seconds a chat's activity is reused before asking again.
+STALE_NEVER_DAYS = 3650          # "Never" scores as ten years.
+STALE_MUTED_DAYS = 30            # A muted chat scores as if a month older...
+STALE_UNREAD_PER_DAY = 10        # ...and every 10 unread messages as a day older,
+STALE_UNREAD_MAX_DAYS = 100      # up to this many days.
+# History export before a purge: messages per history call (Telegram's limit).
+EXPORT_PAGE_SIZE = 100
+
+###############################################################################
+
+# Async helper functions.
+def start_event_loop(loop):
+    asyncio.set_event_loop(loop)
+    loop.run_forever()
+
+async def safe_disconnect_async(client):
+    if client.is_connected():
+        await client.disconnect()
+
+async def connect_authorized(client):
+    # The session file never holds a lock across calls (see
+    # teletrim_session), so there is nothing to retry here.
+    await client.connect()
+    return await get_scheduler(client).call(PRIORITY_INTERACTIVE, client.is_user_authorized)
+
+###############################################################################
+# Configuration persistence functions.
+###############################################################################
+
+def get_config_path(session_name):
+    session_dir = os.path.join(os.getcwd(), "sessions")
+    return os.path.join(session_dir, session_name + ".json")
+
+def load_session_config(session_name):
+    cfg_path = get_config_path(session_name)
+    if os.path.exists(cfg_path):
+        try:
+            with open(cfg_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading session config: {e}")
+    return None
+
+def get_cache_path(session_name):
+    session_dir = os.path.join(os.getcwd(), "sessions")
+    return os.path.join(session_dir, session_name + ".cache")
+
+def get_thumb_path(session_name):
+    session_dir = os.path.join(os.getcwd(), "sessions")
+    return os.path.join(session_dir, session_name + ".thumbs")
+
+def get_journal_path(session_name):
+    session_dir = os.path.join(os.getcwd(), "sessions")
+    return os.path.join(session_dir, session_name + ".jobs")
+
+def get_export_dir(session_name):
+    return os.path.join(os.getcwd(), "exports", session_name)
+
+def list_session_names():
+    session_dir = os.path.join(os.getcwd(), "sessions")
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(session_dir)
+                  if name.endswith(".session")) if os.path.isdir(session_dir) else []
+
+def save_session_config(session_name, config):
+    session_dir = os.path.join(os.getcwd(), "sessions")
+    if not os.path.exists(session_dir):
+        os.makedirs(session_dir)
+    cfg_path = os.path.join(session_dir, session_name + ".json")
+    try:
+        with open(cfg_path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+    except Exception as e:
+        print(f"Error saving session config: {e}")
+
+###############################################################################
+# SessionCatalog: One JSON file describing every saved session.
+###############################################################################
+
+SESSION_HEALTH_OK = "ok"
+SESSION_HEALTH_LOGGED_OUT = "logged out"
+SESSION_HEALTH_ERROR = "error"
+
+def get_catalog_path():
+    return os.path.join(os.getcwd(), "sessions", "catalog.json")
+
+class SessionCatalog:
+    # sessions/catalog.json maps session name to display_name, username,
+    # user_id, dialogs, last_used (Unix time) and health, so the session
+    # manager can list hundreds of sessions without opening any of them.
+    # Updated on login, after loading dialogs and after a purge.
+    _lock = threading.Lock()
+
+    def __init__(self, path=None):
+        self.path = path or get_catalog_path()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Error reading session catalog: {e}")
+            return {}
+        return catalog if isinstance(catalog, dict) else {}
+
+    def entries(self):
+        # Every session file on disk, with whatever the catalog knows about it.
+        catalog = self.load()
+        return {name: catalog.get(name, {}) for name in list_session_names()}
+
+    def update(self, session_name, **fields):
+        with self._lock:
+            catalog = self.load()
+            catalog.setdefault(session_name, {}).update(fields)
+            self._write(catalog)
+
+    def remove(self, session_name):
+        with self._lock:
+            catalog = self.load()
+            if catalog.pop(session_name, None) is not None:
+                self._write(catalog)
+
+    def _write(self, catalog):
+        # Write-then-rename, so a reader never sees half a file.
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(catalog, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Error saving session catalog: {e}")
+
+def catalog_update(session_name, **fields):
+    SessionCatalog().update(session_name, **fields)
+
+###############################################################################
+# Sessions: Opening clients from sessions/<name>.session + .json.
+###############################################################################
+
+class SessionError(Exception):
+    pass
+
+def preload_telethon():
+    # Pulls in the client and all generated TL types.
+    import telethon
+    return telethon
+
+# Set to fake client options (even "") to get a simulated account instead of
+# connecting to Telegram.
+FAKE_CLIENT_ENV = "TELETRIM_FAKE"
+
+def create_client(session_name, api_id, api_hash, loop=None):
+    session_dir = os.path.join(os.getcwd(), "sessions")
+    if not os.path.exists(session_dir):
+        os.makedirs(session_dir)
+    fake = os.environ.get(FAKE_CLIENT_ENV)
+    if fake is not None:
+        # Simulated account for benchmarks and demos; see teletrim_fake.
+        from teletrim_fake import FakeTelegramClient, parse_fake_options
+        return FakeTelegramClient(**parse_fake_options(fake))
+    from telethon import TelegramClient
+    from teletrim_session import BufferedSession
+    session_path = os.path.join("sessions", session_name)
+    return TelegramClient(BufferedSession(session_path), api_id, api_hash, loop=loop)
+
+async def open_session(session_name, interactive=False):
+    # For use inside a running loop (the CLI); the GUI goes through LoginDialog.
+    config = load_session_config(session_name)
+    if not config:
+        raise SessionError(f"No saved configuration for session '{session_name}'.")
+    client = create_client(session_name, int(config["api_id"]), config["api_hash"])
+    try:
+        await client.connect()
+    except Exception as e:
+        catalog_update(session_name, health=SESSION_HEALTH_ERROR, last_used=int(time.time()))
+        raise SessionError(f"Could not connect session '{session_name}': {e}")
+    if not await get_scheduler(client).call(PRIORITY_INTERACTIVE, client.is_user_authorized):
+        if not interactive:
+            await safe_disconnect_async(client)
+            catalog_update(session_name, health=SESSION_HEALTH_LOGGED_OUT, last_used=int(time.time()))
+            raise SessionError(f"Session '{session_name}' is not logged in.")
+        await client.start(phone=config.get("phone"), password=config.get("twofa") or None)
+    await record_account(session_name, client)
+    return client
+
+async def record_account(session_name, client):
+    # Refreshes the catalog entry of a logged-in session.
+    from telethon import utils
+    fields = {"health": SESSION_HEALTH_OK, "last_used": int(time.time())}
+    try:
+        me = await get_scheduler(client).call(PRIORITY_LISTING, client.get_me)
+        if me is not None:
+            fields.update(display_name=utils.get_display_name(me), username=me.username or "", user_id=me.id)
+    except Exception as e:
+        print(f"Error reading account details: {e}")
+    catalog_update(session_name, **fields)
+
+class ClientPool:
+    # Logged-in clients keyed by session name, all on one asyncio loop and
+    # kept connected between uses. Each client has its own RpcScheduler, so
+    # rate budgets are per account; purge concurrency is per account too and
+    # can be set with "purge_concurrency" in sessions/<name>.json.
+    def __init__(self, concurrency=PURGE_CONCURRENCY):
+        self.clients = {}
+        self.limits = {}
+        self.default_concurrency = concurrency
+        self._opening = {}
+
+    def __contains__(self, session_name):
+        return session_name in self.clients
+
+    def __len__(self):
+        return len(self.clients)
+
+    def names(self):
+        return list(self.clients)
+
+    def get(self, session_name):
+        return self.clients[session_name]
+
+    def add(self, session_name, client):
+        self.clients[session_name] = client
+        config = load_session_config(session_name) or {}
+        if config.get("purge_concurrency"):
+            self.limits[session_name] = int(config["purge_concurrency"])
+
+    def concurrency(self, session_name):
+        return self.limits.get(session_name, self.default_concurrency)
+
+    async def open(self, session_name, interactive=False):
+        # Concurrent opens of the same session share one connect/login.
+        client = self.clients.get(session_name)
+        if client is not None:
+            if not client.is_connected():
+                await client.connect()
+            return client
+        task = self._opening.get(session_name)
+        if task is None:
+            task = asyncio.ensure_future(self._open(session_name, interactive))
+            self._opening[session_name] = task
+        return await asyncio.shield(task)
+
+    async def _open(self, session_name, interactive):
+        try:
+            client = await open_session(session_name, interactive)
+            self.add(session_name, client)
+            return client
+        finally:
+            self._opening.pop(session_name, None)
+
+    async def close(self, session_name):
+        client = self.clients.pop(session_name, None)
+        self.limits.pop(session_name, None)
+        if client is not None:
+            await safe_disconnect_async(client)
+
+    async def close_all(self):
+        await asyncio.gather(*(self.close(name) for name in self.names()), return_exceptions=True)
+
+###############################################################################
+# RpcMetrics: Per-method latency histograms, call/error counts and FloodWaits.
+###############################################################################
+
+# Upper bounds (seconds) of the latency histogram buckets; the last one
+# catches everything slower.
+RPC_LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
+
+class RpcMethodStats:
+    __slots__ = ("calls", "errors", "error_types", "floods", "flood_seconds", "total_seconds", "max_seconds",
+                 "buckets")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.error_types = {}
+        self.floods = 0
+        self.flood_seconds = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = array("L", [0]) * len(RPC_LATENCY_BUCKETS)
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-th call; good enough to see
+        # which side of a bucket boundary a change moved things.
+        if not self.calls:
+            return 0.0
+        rank = q * self.calls
+        seen = 0
+        for bound, count in zip(RPC_LATENCY_BUCKETS, self.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max_seconds)
+        return self.max_seconds
+
+class RpcMetrics:
+    # Filled in by every RpcScheduler on the asyncio thread; read from the GUI
+    # thread or at exit, hence the lock. Latency is the time the call itself
+    # took, without the time spent queued for a slot or a budget.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.methods = {}
+        self.started = time.time()
+
+    def _stats(self, key):
+        stats = self.methods.get(key)
+        if stats is None:
+            stats = self.methods[key] = RpcMethodStats()
+        return stats
+
+    def record(self, key, seconds, error=None):
+        with self.lock:
+            stats = self._stats(key)
+            stats.calls += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.buckets[bisect_left(RPC_LATENCY_BUCKETS, seconds)] += 1
+            if error is not None:
+                stats.errors += 1
+                name = type(error).__name__
+                stats.error_types[name] = stats.error_types.get(name, 0) + 1
+
+    def record_flood(self, key, seconds):
+        with self.lock:
+            stats = self._stats(key)
+            stats.floods += 1
+            stats.flood_seconds += seconds
+
+    def reset(self):
+        with self.lock:
+            self.methods.clear()
+            self.started = time.time()
+
+    def snapshot(self):
+        with self.lock:
+            methods = {}
+            for key, stats in sorted(self.methods.items()):
+                methods[key] = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_types": dict(stats.error_types),
+                    "flood_waits": stats.floods,
+                    "flood_wait_seconds": stats.flood_seconds,
+                    "total_seconds": round(stats.total_seconds, 6),
+                    "max_seconds": round(stats.max_seconds, 6),
+                    "p50_seconds": stats.quantile(0.5),
+                    "p95_seconds": stats.quantile(0.95),
+                    "buckets": list(stats.buckets),
+                }
+            return {"started": int(self.started), "time": int(time.time()),
+                    "bucket_bounds": [str(b) if b == float("inf") else b for b in RPC_LATENCY_BUCKETS],
+                    "methods": methods}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self):
+        # Text exposition format, for node_exporter's textfile collector.
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP teletrim_rpc_duration_seconds Time spent in Telegram API calls.",
+            "# TYPE teletrim_rpc_duration_seconds histogram",
+        ]
+        for key, stats in snapshot["methods"].items():
+            cumulative = 0
+            for bound, count in zip(RPC_LATENCY_BUCKETS, stats["buckets"]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'teletrim_rpc_duration_seconds_bucket{{method="{key}",le="{le}"}} {cumulative}')
+            lines.append(f'teletrim_rpc_duration_seconds_sum{{method="{key}"}} {stats["total_seconds"]}')
+            lines.append(f'teletrim_rpc_duration_seconds_count{{method="{key}"}} {stats["calls"]}')
+        for name, field, help_text in (
+            ("teletrim_rpc_errors_total", "errors", "Telegram API calls that raised, FloodWaits included."),
+            ("teletrim_rpc_flood_waits_total", "flood_waits", "FloodWait errors received."),
+            ("teletrim_rpc_flood_wait_seconds_total", "flood_wait_seconds", "Seconds Telegram asked us to wait."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, stats in snapshot["methods"].items():
+                lines.append(f'{name}{{method="{key}"}} {stats[field]}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        # .prom files get the Prometheus text format, anything else JSON.
+        text = self.to_prometheus() if path.endswith(".prom") else self.to_json() + "\n"
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+_metrics = RpcMetrics()
+
+def get_metrics():
+    return _metrics
+
+###############################################################################
+# RpcScheduler: Single gate for every Telegram call made by a client.
+###############################################################################
+
+# Priority classes; lower values are served first.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_LISTING = 1
+PRIORITY_BULK = 2
+
+# Per-method budgets as (calls per second, burst). Keys are either the client
+# method name or "<namespace>.<RequestName>" for raw requests.
+RPC_RATE_BUDGETS = {
+    "messages.DeleteHistoryRequest": (3.0, 5),
+    "channels.DeleteHistoryRequest": (3.0, 5),
+    "channels.LeaveChannelRequest": (3.0, 5),
+    "messages.DeleteChatUserRequest": (3.0, 5),
+    "get_dialogs": (5.0, 5),
+    "get_messages": (10.0, 10),
+    "prefetch_messages": (5.0, 5),   # Neighbour previews; never spends the get_messages tokens.
+    "iter_messages": (5.0, 5),
+    "count_messages": (2.0, 4),
+    "messages.GetPeerDialogsRequest": (10.0, 10),
+    "last_own_message": (5.0, 10),
+    "download_media": (10.0, 10),
+}
+RPC_DEFAULT_BUDGET = (5.0, 5)
+
+def request_key(request):
+    return type(request).__module__.rsplit(".", 1)[-1] + "." + type(request).__name__
+
+class RpcBudget:
+    # Token bucket whose rate is halved on every FloodWait and creeps back up
+    # on success, so it settles just under the limit the server enforces.
+    def __init__(self, rate, burst):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.stamp = time.monotonic()
+        self.blocked_until = 0.0
+        self.flood_count = 0
+        self.flood_avg = 0.0
+
+    def delay(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1
+
+    def on_success(self):
+        self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def on_flood(self, seconds):
+        self.flood_count += 1
+        self.flood_avg = seconds if self.flood_count == 1 else 0.7 * self.flood_avg + 0.3 * seconds
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        # Longer waits mean the server wants a much lower rate; never plan to
+        # spend more than one burst per observed wait window.
+        self.rate = max(0.01, min(self.rate / 2, self.burst / max(self.flood_avg, 1)))
+        self.tokens = 0.0
+
+class RpcScheduler:
+    def __init__(self, client, max_in_flight=RPC_MAX_IN_FLIGHT, bulk_in_flight=RPC_BULK_IN_FLIGHT):
+        self.client = client
+        self.max_in_flight = max_in_flight
+        self.bulk_in_flight = bulk_in_flight
+        self.budgets = {}
+        self._waiters = []
+        self._seq = 0
+        self._in_flight = 0
+        self._bulk_running = 0
+        self._timer = None
+        # Floods are handled here instead of sleeping inside Telethon while
+        # holding a slot.
+        client.flood_sleep_threshold = 0
+
+    def budget(self, key):
+        if key not in self.budgets:
+            self.budgets[key] = RpcBudget(*RPC_RATE_BUDGETS.get(key, RPC_DEFAULT_BUDGET))
+        return self.budgets[key]
+
+    async def request(self, priority, request, retry_flood=True):
+        return await self.call(priority, self.client, request, key=request_key(request), retry_flood=retry_flood)
+
+    async def call(self, priority, fn, *args, key=None, retry_flood=True, **kwargs):
+        from telethon import errors
+        key = key or fn.__name__
+        budget = self.budget(key)
+        metrics = get_metrics()
+        while True:
+            await self._acquire(priority, key)
+            started = time.perf_counter()
+            try:
+                result = await fn(*args, **kwargs)
+            except errors.FloodWaitError as e:
+                metrics.record(key, time.perf_counter() - started, e)
+                metrics.record_flood(key, e.seconds)
+                budget.on_flood(e.seconds)
+                if retry_flood and e.seconds <= FLOOD_RETRY_LIMIT:
+                    continue
+                raise
+            except Exception as e:
+                metrics.record(key, time.perf_counter() - started, e)
+                raise
+            finally:
+                self._release(priority)
+            metrics.record(key, time.perf_counter() - started)
+            budget.on_success()
+            return result
+
+    async def _acquire(self, priority, key):
+        fut = asyncio.get_running_loop().create_future()
+        self._seq += 1
+        heapq.heappush(self._waiters, (priority, self._seq, key, fut))
+        self._dispatch()
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                self._release(priority)
+            raise
+
+    def _release(self, priority):
+        self._in_flight -= 1
+        if priority == PRIORITY_BULK:
+            self._bulk_running -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        now = time.monotonic()
+        next_delay = None
+        pending = []
+        while self._waiters and self._in_flight < self.max_in_flight:
+            waiter = heapq.heappop(self._waiters)
+            priority, _, key, fut = waiter
+            if fut.done():
+                continue
+            if priority == PRIORITY_BULK and self._bulk_running >= self.bulk_in_flight:
+                pending.append(waiter)
+                continue
+            delay = self.budget(key).delay(now)
+            if delay > 0:
+                # Only this method is throttled; keep serving the others.
+                pending.append(waiter)
+                next_delay = delay if next_delay is None else min(next_delay, delay)
+                continue
+            self.budget(key).take()
+            self._in_flight += 1
+            if priority == PRIORITY_BULK:
+                self._bulk_running += 1
+            fut.set_result(None)
+        for waiter in pending:
+            heapq.heappush(self._waiters, waiter)
+        if next_delay is not None:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = asyncio.get_running_loop().call_later(next_delay, self._dispatch)
+
+def get_scheduler(client):
+    scheduler = getattr(client, "teletrim_scheduler", None)
+    if scheduler is None:
+        scheduler = RpcScheduler(client)
+        client.teletrim_scheduler = scheduler
+    return scheduler
+
+###############################################################################
+# Dialog records: Compact per-dialog data kept instead of Telethon entities.
+###############################################################################
+
+KIND_USER = 0
+KIND_CHAT = 1
+KIND_CHANNEL = 2
+
+FLAG_SAVED = 1
+FLAG_CHECKED = 2
+FLAG_MEGAGROUP = 4
+FLAG_LEFT = 8
+FLAG_INACTIVE = 16   # Deactivated basic group, or a chat/channel we were removed from.
+FLAG_PINNED = 32
+
+def marked_peer_id(kind, peer_id):
+    # Same numbering as telethon.utils.get_peer_id, so ids never collide across kinds.
+    if kind == KIND_USER:
+        return peer_id
+    if kind == KIND_CHAT:
+        return -peer_id
+    return -(1000000000000 + peer_id)
+
+def unmark_peer_id(marked_id):
+    # Inverse of marked_peer_id: (kind, peer_id).
+    if marked_id >= 0:
+        return KIND_USER, marked_id
+    if marked_id > -1000000000000:
+        return KIND_CHAT, -marked_id
+    return KIND_CHANNEL, -marked_id - 1000000000000
+
+class DialogRecord:
+    __slots__ = ("peer_id", "access_hash", "kind", "name", "flags", "date", "unread", "account")
+
+    def __init__(self, peer_id, access_hash, kind, name, flags=0, date=0, unread=0, account=""):
+        self.peer_id = peer_id
+        self.access_hash = access_hash
+        self.kind = kind
+        self.name = name
+        self.flags = flags
+        self.date = date   # Unix time of the last message.
+        self.unread = unread
+        self.account = account   # Session name the dialog belongs to.
+
+    @property
+    def is_saved(self):
+        return bool(self.flags & FLAG_SAVED)
+
+    @property
+    def marked_id(self):
+        return marked_peer_id(self.kind, self.peer_id)
+
+    @property
+    def key(self):
+        # The same chat can show up once per account.
+        return (self.account, self.marked_id)
+
+    def input_peer(self):
+        from telethon.tl.types import InputPeerSelf, InputPeerUser, InputPeerChat, InputPeerChannel
+        if self.flags & FLAG_SAVED:
+            return InputPeerSelf()
+        if self.kind == KIND_USER:
+            return InputPeerUser(self.peer_id, self.access_hash)
+        if self.kind == KIND_CHAT:
+            return InputPeerChat(self.peer_id)
+        return InputPeerChannel(self.peer_id, self.access_hash)
+
+def record_type_name(record):
+    return type_name(record.kind, record.flags)
+
+def type_name(kind, flags):
+    if flags & FLAG_SAVED:
+        return "saved"
+    if kind == KIND_USER:
+        return "user"
+    if kind == KIND_CHAT:
+        return "group"
+    return "supergroup" if flags & FLAG_MEGAGROUP else "channel"
+
+def dialog_record(dialog, account=""):
+    name, is_saved = dialog_display_name(dialog)
+    record = entity_record(dialog.entity, name, dialog.date, getattr(dialog, "unread_count", 0) or 0, account)
+    if is_saved:
+        record.flags |= FLAG_SAVED
+    if dialog.pinned:
+        record.flags |= FLAG_PINNED
+    return record
+
+def entity_record(entity, name, date, unread=0, account=""):
+    # A record for a chat we only know the entity of (dialogs, live updates).
+    from telethon.tl.types import Chat, Channel, ChatForbidden, ChannelForbidden
+    flags = 0
+    if isinstance(entity, (Channel, ChannelForbidden)):
+        kind = KIND_CHANNEL
+        if entity.megagroup:
+            flags |= FLAG_MEGAGROUP
+        if isinstance(entity, ChannelForbidden):
+            flags |= FLAG_INACTIVE
+        elif entity.left:
+            flags |= FLAG_LEFT
+    elif isinstance(entity, (Chat, ChatForbidden)):
+        kind = KIND_CHAT
+        if isinstance(entity, ChatForbidden) or entity.deactivated:
+            flags |= FLAG_INACTIVE
+        elif entity.left:
+            flags |= FLAG_LEFT
+    else:
+        kind = KIND_USER
+    date = int(date.timestamp()) if date else 0
+    return DialogRecord(entity.id, getattr(entity, "access_hash", None) or 0, kind, name, flags, date,
+                        unread, account)
+
+class DialogStore:
+    # Column-oriented: one array per field rather than one object per dialog.
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.peer_ids = array("q")
+        self.access_hashes = array("q")
+        self.kinds = array("b")
+        self.flags = array("B")
+        self.dates = array("q")
+        self.unread = array("l")
+        self.names = []
+        self.accounts = []
+        self.rows = {}
+        # Bumped whenever rows are added or removed, so indexes know to rebuild.
+        self.version = getattr(self, "version", 0) + 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def append(self, records):
+        self.insert(len(self.names), records)
+
+    def insert(self, position, records):
+        self.peer_ids[position:position] = array("q", (r.peer_id for r in records))
+        self.access_hashes[position:position] = array("q", (r.access_hash for r in records))
+        self.kinds[position:position] = array("b", (r.kind for r in records))
+        self.flags[position:position] = array("B", (r.flags for r in records))
+        self.dates[position:position] = array("q", (r.date for r in records))
+        self.unread[position:position] = array("l", (r.unread for r in records))
+        self.names[position:position] = [r.name for r in records]
+        self.accounts[position:position] = [r.account for r in records]
+        self.version += 1
+        if position == len(self.names) - len(records):
+            for offset, record in enumerate(records):
+                self.rows[record.key] = position + offset
+        else:
+            self.reindex()
+
+    def remove_row(self, row):
+        # Leaves the id index stale; call reindex() once a batch of removals is done.
+        del self.peer_ids[row]
+        del self.access_hashes[row]
+        del self.kinds[row]
+        del self.flags[row]
+        del self.dates[row]
+        del self.unread[row]
+        del self.names[row]
+        del self.accounts[row]
+        self.version += 1
+
+    def reindex(self):
+        self.rows = {(account, marked_peer_id(kind, peer_id)): row
+                     for row, (account, kind, peer_id) in enumerate(zip(self.accounts, self.kinds, self.peer_ids))}
+
+    def record(self, row):
+        return DialogRecord(self.peer_ids[row], self.access_hashes[row], self.kinds[row],
+                            self.names[row], self.flags[row], self.dates[row], self.unread[row],
+                            self.accounts[row])
+
+    def records(self):
+        return [self.record(row) for row in range(len(self.names))]
+
+    def row_of(self, key):
+        return self.rows.get(key)
+
+    def top_date(self, account=""):
+        # Newest activity among the account's unpinned dialogs; pinned ones
+        # are always resent.
+        return max((date for date, flags, owner in zip(self.dates, self.flags, self.accounts)
+                    if owner == account and not flags & FLAG_PINNED), default=0)
+
+    def count(self, account):
+        return sum(1 for owner in self.accounts if owner == account)
+
+    def move(self, row, position, record):
+        # The dialog at row goes to position, rewritten from record. Only the
+        # rows in between shift, so only they are reindexed.
+        columns = (self.peer_ids, self.access_hashes, self.kinds, self.names, self.flags, self.dates,
+                   self.unread, self.accounts)
+        for column, field in zip(columns, DialogRecord.__slots__):
+            del column[row]
+            column.insert(position, getattr(record, field))
+        self.version += 1
+        for shifted in range(min(row, position), max(row, position) + 1):
+            self.rows[(self.accounts[shifted], marked_peer_id(self.kinds[shifted], self.peer_ids[shifted]))] = shifted
+
+    def update(self, row, record):
+        # Overwrites a row in place; the row keeps its position and key.
+        self.access_hashes[row] = record.access_hash
+        self.flags[row] = record.flags
+        self.dates[row] = record.date
+        self.unread[row] = record.unread
+        if self.names[row] != record.name:
+            self.names[row] = record.name
+            self.version += 1
+
+    def set_flag(self, row, flag, on):
+        if on:
+            self.flags[row] |= flag
+        else:
+            self.flags[row] &= ~flag & 0xFF
+
+    def rows_with(self, flag):
+        return [row for row, value in enumerate(self.flags) if value & flag]
+
+    def type_name(self, row):
+        return type_name(self.kinds[row], self.flags[row])
+
+###############################################################################
+# DialogIndex: Fast name search and facet filtering over a DialogStore.
+###############################################################################
+
+class DialogFilter:
+    # Empty/None fields match everything. Ranges are inclusive (low, high)
+    # pairs where either end may be None; ages are in days since last activity.
+    def __init__(self, text="", types=None, unread=(None, None), age_days=(None, None), account=None):
+        self.text = text.strip().casefold()
+        self.types = set(types) if types is not None else None
+        self.unread = unread
+        self.age_days = age_days
+        self.account = account
+
+    def is_empty(self):
+        return (not self.text and self.types is None and self.unread == (None, None)
+                and self.age_days == (None, None) and self.account is None)
+
+    def checks(self, store, now):
+        # Row predicates for everything but the text, which DialogIndex
+        # matches against all names at once.
+        checks = []
+        if self.account is not None:
+            account = self.account
+            checks.append(lambda row: store.accounts[row] == account)
+        if self.types is not None:
+            types = self.types
+            checks.append(lambda row: store.type_name(row) in types)
+        low, high = self.unread
+        if low is not None:
+            checks.append(lambda row: store.unread[row] >= low)
+        if high is not None:
+            checks.append(lambda row: store.unread[row] <= high)
+        young, old = self.age_days
+        if young is not None:
+            newest = now - young * 86400
+            checks.append(lambda row: store.dates[row] <= newest)
+        if old is not None:
+            oldest = now - old * 86400
+            checks.append(lambda row: store.dates[row] >= oldest)
+        return checks
+
+    def matches(self, store, row, now=None):
+        # The same test as DialogIndex.search, for a single row.
+        now = time.time() if now is None else now
+        return (self.text in store.names[row].casefold()
+                and all(check(row) for check in self.checks(store, now)))
+
+class DialogIndex:
+    def __init__(self, store):
+        self.store = store
+        self.version = None
+        self._last_text = None
+        self._last_rows = None
+
+    def _rebuild(self):
+        # All folded names in one string: a substring search is a C-level
+        # str.find() over it instead of a Python loop over every row.
+        folded = [name.casefold() for name in self.store.names]
+        self.folded = folded
+        self.offsets = array("l")
+        position = 0
+        for name in folded:
+            self.offsets.append(position)
+            position += len(name) + 1
+        self.haystack = "\n".join(folded)
+        self.version = self.store.version
+        self._last_text = None
+        self._last_rows = None
+
+    def text_rows(self, text):
+        if self.version != self.store.version:
+            self._rebuild()
+        if not text:
+            return range(len(self.folded))
+        if self._last_text and text.startswith(self._last_text):
+            # Typing one more character can only narrow the previous result.
+            rows = [row for row in self._last_rows if text in self.folded[row]]
+        else:
+            rows = []
+            offsets = self.offsets
+            find = self.haystack.find
+            position = find(text)
+            while position != -1:
+                row = bisect_right(offsets, position) - 1
+                rows.append(row)
+                if row + 1 >= len(offsets):
+                    break
+                position = find(text, offsets[row + 1])
+        self._last_text = text
+        self._last_rows = rows
+        return rows
+
+    def search(self, dialog_filter, now=None):
+        now = time.time() if now is None else now
+        rows = self.text_rows(dialog_filter.text)
+        checks = dialog_filter.checks(self.store, now)
+        if checks:
+            rows = [row for row in rows if all(check(row) for check in checks)]
+        return array("l", rows)
+
+###############################################################################
+# DialogCache: Per-session SQLite copy of the dialog list for instant startup.
+###############################################################################
+
+def _sqlite_execute(path, fn):
+    # A short-lived connection per operation lets the GUI thread and the
+    # asyncio thread both use the session's cache files.
+    db = sqlite3.connect(path, timeout=10)
+    try:
+        with db:
+            return fn(db)
+    finally:
+        db.close()
+
+class DialogCache:
+    def __init__(self, path):
+        self.path = path
+        _sqlite_execute(self.path, self._create)
+
+    def _create(self, db):
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS dialogs ("
+            "marked_id INTEGER PRIMARY KEY, peer_id INTEGER, access_hash INTEGER, kind INTEGER, "
+            "name TEXT, flags INTEGER, date INTEGER, generation INTEGER, unread INTEGER NOT NULL DEFAULT 0)")
+        columns = {row[1] for row in db.execute("PRAGMA table_info(dialogs)")}
+        if "unread" not in columns:
+            db.execute("ALTER TABLE dialogs ADD COLUMN unread INTEGER NOT NULL DEFAULT 0")
+
+    def load(self, account=""):
+        rows = _sqlite_execute(self.path, lambda db: db.execute(
+            "SELECT peer_id, access_hash, kind, name, flags, date, unread FROM dialogs "
+            "ORDER BY (flags & ?) DESC, date DESC", (FLAG_PINNED,)).fetchall())
+        return [DialogRecord(*row, account=account) for row in rows]
+
+    def upsert(self, records, generation=0):
+        # Check state is a per-window choice and is never persisted.
+        rows = [(r.marked_id, r.peer_id, r.access_hash, r.kind, r.name, r.flags & ~FLAG_CHECKED, r.date, generation,
+                 r.unread) for r in records]
+        _sqlite_execute(self.path, lambda db: db.executemany(
+            "INSERT OR REPLACE INTO dialogs "
+            "(marked_id, peer_id, access_hash, kind, name, flags, date, generation, unread) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows))
+
+    def prune(self, generation):
+        # Drops everything a completed full load did not see. Generations
+        # are start times, so rows live updates wrote during the load stay.
+        _sqlite_execute(self.path, lambda db: db.execute("DELETE FROM dialogs WHERE generation < ?", (generation,)))
+
+    def remove(self, marked_ids):
+        _sqlite_execute(self.path, lambda db: db.executemany(
+            "DELETE FROM dialogs WHERE marked_id = ?", [(marked_id,) for marked_id in marked_ids]))
+
+###############################################################################
+# PeerCache: Persistent peer id -> (kind, access_hash) for building InputPeers.
+###############################################################################
+
+def rejected_peer_errors():
+    # The server does not accept the InputPeer we sent (stale access_hash or
+    # unknown id), as opposed to the chat refusing us.
+    from telethon import errors
+    return (errors.PeerIdInvalidError, errors.ChannelInvalidError, errors.ChatIdInvalidError,
+            errors.UserIdInvalidError)
+
+class PeerCache:
+    # Dialog loading, preview, purge and the CLI all build InputPeers from
+    # here instead of handing Telethon something to resolve. Entries come
+    # from dialog pages and live in a table of the session's .cache file;
+    # unlike the dialog list they are never pruned, so a chat that has left
+    # the list (say, one in a purge journal) can still be addressed. An entry
+    # the server rejects is dropped and looked up once more.
+    # Used on the asyncio loop only.
+    def __init__(self, path=None):
+        self.path = path
+        self.peers = {}   # marked id -> access_hash
+        if path is None:
+            return
+        try:
+            _sqlite_execute(self.path, lambda db: db.execute(
+                "CREATE TABLE IF NOT EXISTS peers (marked_id INTEGER PRIMARY KEY, access_hash INTEGER)"))
+            self.peers = dict(_sqlite_execute(self.path, lambda db: db.execute(
+                "SELECT marked_id, access_hash FROM peers").fetchall()))
+        except sqlite3.Error as e:
+            print(f"Error opening peer cache: {e}")
+            self.path = None
+
+    def _write(self, sql, rows):
+        if self.path is None or not rows:
+            return
+        try:
+            _sqlite_execute(self.path, lambda db: db.executemany(sql, rows))
+        except sqlite3.Error as e:
+            print(f"Error updating peer cache: {e}")
+
+    def remember(self, records):
+        changed = [(r.marked_id, r.access_hash) for r in records
+                   if not r.is_saved and self.peers.get(r.marked_id) != r.access_hash]
+        self.peers.update(changed)
+        self._write("INSERT OR REPLACE INTO peers (marked_id, access_hash) VALUES (?, ?)", changed)
+
+    def forget(self, marked_ids):
+        for marked_id in marked_ids:
+            self.peers.pop(marked_id, None)
+        self._write("DELETE FROM peers WHERE marked_id = ?", [(marked_id,) for marked_id in marked_ids])
+
+    def input_peer(self, record):
+        # A record from an older cache or journal may carry an outdated hash.
+        access_hash = self.peers.get(record.marked_id)
+        if access_hash is None:
+            self.remember([record])
+        elif access_hash != record.access_hash:
+            record.access_hash = access_hash
+        return record.input_peer()
+
+    async def call(self, client, record, fn):
+        # fn(peer) -> awaitable. Retried once with a fresh hash if the server
+        # rejects the peer; other errors pass through.
+        try:
+            return await fn(self.input_peer(record))
+        except rejected_peer_errors():
+            if record.is_saved:
+                raise
+            self.forget([record.marked_id])
+            if not await self.refresh(client, record):
+                raise
+        return await fn(record.input_peer())
+
+    async def refresh(self, client, record):
+        # Telethon's session may have seen a newer hash in an update; failing
+        # that it asks the server (GetUsers/GetChannels) for this one peer.
+        from telethon import errors
+        try:
+            peer = await get_scheduler(client).call(PRIORITY_INTERACTIVE, client.get_input_entity, record.marked_id)
+        except (ValueError, TypeError, errors.RPCError):
+            return False
+        access_hash = getattr(peer, "access_hash", None) or 0
+        if access_hash == record.access_hash:
+            return False
+        record.access_hash = access_hash
+        self.remember([record])
+        return True
+
+_peer_caches = {}
+_peer_caches_lock = threading.Lock()
+
+def get_peer_cache(account=""):
+    # One per session name; "" (no account) is kept in memory only.
+    with _peer_caches_lock:
+        peers = _peer_caches.get(account)
+        if peers is None:
+            peers = _peer_caches[account] = PeerCache(get_cache_path(account) if account else None)
+        return peers
+
+def drop_peer_cache(account):
+    with _peer_caches_lock:
+        _peer_caches.pop(account, None)
+
+###############################################################################
+# DialogLoader: Streams the dialog list page by page on the asyncio loop.
+###############################################################################
+
+def dialog_display_name(dialog):
+    # Returns (name, is_saved) for a Telethon Dialog.
+    return display_name(dialog.entity, dialog.name)
+
+def display_name(entity, name):
+    from telethon.tl.types import User
+    if isinstance(entity, User) and entity.is_self:
+        return "Saved Messages", True
+    name = name.strip() if name and name.strip() else ""
+    if not name and isinstance(entity, User):
+        if (not getattr(entity, "first_name", None) and not getattr(entity, "last_name", None)) or (getattr(entity, "first_name", "") == "Deleted Account"):
+            name = "[Deleted Account]"
+        else:
+            name = "[Unknown]"
+    elif not name:
+        name = "[Unknown]"
+    return name, False
+
+class DialogLoader:
+    # With until_date set, only dialogs active since then (plus pinned ones)
+    # are fetched; otherwise the whole list is streamed.
+    def __init__(self, client, loop, page_size=DIALOG_PAGE_SIZE, until_date=None, cache=None,
+                 on_page=None, on_progress=None, account=""):
+        self.client = client
+        self.loop = loop
+        self.account = account
+        self.scheduler = get_scheduler(client)
+        self.page_size = page_size
+        self.until_date = until_date
+        self.cache = cache
+        self._reached_cached = False
+        self._pending = []   # The page being built, kept across a FloodWait retry.
+        self.on_page = on_page
+        self.on_progress = on_progress
+        self.future = None
+
+    def start(self):
+        self.future = asyncio.run_coroutine_threadsafe(self.run(), self.loop)
+        return self.future
+
+    def cancel(self):
+        if self.future is not None:
+            self.future.cancel()
+
+    async def run(self):
+        dialogs = self.client.iter_dialogs()
+        generation = int(time.time() * 1000)
+        loaded = 0
+        while True:
+            # Each page is one scheduled call, so a preview click can still
+            # jump ahead of a long listing.
+            page = await self.scheduler.call(PRIORITY_LISTING, self._next_page, dialogs, key="get_dialogs")
+            if not page:
+                break
+            loaded += len(page)
+            get_peer_cache(self.account).remember(page)
+            if self.cache is not None:
+                self._update_cache(self.cache.upsert, page, generation)
+            if self.on_page:
+                self.on_page(page)
+            if self.on_progress:
+                total = loaded if self.until_date is not None else max(dialogs.total or 0, loaded)
+                self.on_progress(loaded, total)
+            if len(page) < self.page_size or self._reached_cached:
+                break
+        if self.cache is not None and self.until_date is None:
+            self._update_cache(self.cache.prune, generation)
+        return loaded
+
+    def _update_cache(self, fn, *args):
+        try:
+            fn(*args)
+        except sqlite3.Error as e:
+            print(f"Error updating dialog cache: {e}")
+
+    async def _next_page(self, dialogs):
+        # Telethon's chunks need not line up with our pages, so a FloodWait
+        # can hit with part of a page already pulled from the iterator; the
+        # scheduler's retry carries on with those records instead of losing them.
+        page = self._pending
+        while len(page) < self.page_size:
+            try:
+                dialog = await dialogs.__anext__()
+            except StopAsyncIteration:
+                break
+            record = dialog_record(dialog, self.account)
+            if (self.until_date is not None and not record.flags & FLAG_PINNED
+                    and record.date < self.until_date):
+                self._reached_cached = True
+                break
+            page.append(record)
+        self._pending = []
+        return page
+
+###############################################################################
+# DialogUpdates: Turns Telethon update events into small dialog-list diffs.
+###############################################################################
+
+class DialogDiff:
+    # One chat changed: it moves up with the fresh record, or it is gone.
+    # unread is added to the chat's count; None means we wrote last, so the
+    # chat is read.
+    __slots__ = ("record", "unread", "removed")
+
+    def __init__(self, record, unread=0, removed=False):
+        self.record = record
+        self.unread = unread
+        self.removed = removed
+
+class DialogUpdates:
+    # Event handlers for one client. on_diff is called on the asyncio thread,
+    # once per change, and nothing is refetched: entities come with the
+    # update, or from Telethon's entity cache.
+    def __init__(self, client, account="", on_diff=None):
+        self.client = client
+        self.account = account
+        self.on_diff = on_diff
+        self.scheduler = get_scheduler(client)
+        self.self_id = None
+        self.handlers = []
+
+    async def start(self):
+        from telethon import events
+        from telethon.tl.types import UpdateChannel
+        me = await self.scheduler.call(PRIORITY_LISTING, self.client.get_me)
+        self.self_id = me.id
+        self.handlers = [
+            (self._new_message, events.NewMessage()),
+            (self._chat_action, events.ChatAction()),
+            (self._channel_changed, events.Raw(UpdateChannel)),
+        ]
+        for callback, event in self.handlers:
+            self.client.add_event_handler(callback, event)
+
+    def stop(self):
+        for callback, event in self.handlers:
+            self.client.remove_event_handler(callback)
+        self.handlers = []
+
+    def _emit(self, diff):
+        if not diff.removed:
+            get_peer_cache(self.account).remember([diff.record])
+        if self.on_diff:
+            self.on_diff(diff)
+
+    async def _record(self, event, date, name=None):
+        # None when the chat cannot be resolved without a network round trip
+        # that fails, e.g. a channel we were just removed from.
+        from telethon import utils
+        entity = event.chat
+        if entity is None:
+            try:
+                entity = await self.scheduler.call(PRIORITY_LISTING, event.get_chat)
+            except Exception as e:
+                print(f"Error resolving chat {event.chat_id}: {e}")
+                return None
+        if entity is None:
+            return None
+        name, _ = display_name(entity, name or utils.get_display_name(entity))
+        record = entity_record(entity, name, date, account=self.account)
+        if record.marked_id == self.self_id:
+            record.flags |= FLAG_SAVED
+        return record
+
+    def _removed(self, marked_id):
+        kind, peer_id = unmark_peer_id(marked_id)
+        return DialogDiff(DialogRecord(peer_id, 0, kind, "", account=self.account), removed=True)
+
+    async def _new_message(self, event):
+        record = await self._record(event, event.message.date)
+        if record is not None:
+            self._emit(DialogDiff(record, None if event.out else 1))
+
+    async def _chat_action(self, event):
+        # Telethon gives None rather than an empty list for actions without users.
+        ours = self.self_id in (event.user_ids or ())
+        if ours and (event.user_left or event.user_kicked):
+            self._emit(self._removed(event.chat_id))
+            return
+        if not (event.new_title or event.created or (ours and (event.user_joined or event.user_added))):
+            return
+        message = event.action_message
+        date = message.date if message is not None else getattr(event.original_update, "date", None)
+        record = await self._record(event, date, event.new_title)
+        if record is not None:
+            self._emit(DialogDiff(record, 0))
+
+    async def _channel_changed(self, update):
+        # Sent when we leave a channel or lose access to it elsewhere; the
+        # channel itself rides along in the update's entities.
+        from telethon.tl.types import ChannelForbidden
+        marked_id = marked_peer_id(KIND_CHANNEL, update.channel_id)
+        channel = getattr(update, "_entities", {}).get(marked_id)
+        if isinstance(channel, ChannelForbidden) or getattr(channel, "left", False):
+            self._emit(self._removed(marked_id))
+
+###############################################################################
+# PreviewCache: LRU of recent message previews with single-flight fetching.
+###############################################################################
+
+def message_preview_text(msg):
+    if msg.photo:
+        return "[Image]"
+    if msg.voice:
+        return "[Voice Message]"
+    if msg.document:
+        return "[File Message]"
+    return msg.message or "[No Text]"
+
+def message_preview_item(msg):
+    # (id, text, media): media is kept only when it has a thumbnail to show,
+    # and then the text is just the caption.
+    if smallest_thumb(msg.media) is not None:
+        return msg.id, msg.message or "", msg.media
+    return msg.id, message_preview_text(msg), None
+
+class PreviewCache:
+    # Lives on the asyncio loop; every method must be called from that thread.
+    # Chats are passed as DialogRecords and addressed through their account's
+    # PeerCache.
+    def __init__(self, client, limit=PREVIEW_MESSAGE_LIMIT, capacity=PREVIEW_CACHE_SIZE):
+        self.client = client
+        self.scheduler = get_scheduler(client)
+        self.limit = limit
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.inflight = {}
+
+    async def get(self, key, record, priority=PRIORITY_INTERACTIVE):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        # Awaiting callers are shielded so one of them going away does not
+        # cancel the fetch for the others; only retain() cancels fetches.
+        return await asyncio.shield(self.fetch(key, record, priority))
+
+    def fetch(self, key, record, priority=PRIORITY_LISTING):
+        task = self.inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(key, record, priority))
+            self.inflight[key] = task
+            task.add_done_callback(lambda t: self._fetch_done(key, t))
+        return task
+
+    async def _fetch(self, key, record, priority):
+        # Prefetches have their own budget, so arrowing through the list
+        # cannot leave the preview on screen waiting for rate tokens.
+        budget = "get_messages" if priority == PRIORITY_INTERACTIVE else "prefetch_messages"
+        messages = await get_peer_cache(record.account).call(self.client, record, lambda peer: self.scheduler.call(
+            priority, self.client.get_messages, peer, limit=self.limit, key=budget))
+        # Only (id, text, media) survives; Message objects are not kept.
+        items = [message_preview_item(msg) for msg in reversed(messages)]
+        self.entries[key] = items
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+        return items
+
+    def _fetch_done(self, key, task):
+        if self.inflight.get(key) is task:
+            del self.inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def retain(self, keys):
+        # Cancels fetches for rows the user has already moved away from.
+        for key, task in list(self.inflight.items()):
+            if key not in keys:
+                task.cancel()
+
+    def invalidate(self, keys):
+        for key in keys:
+            self.entries.pop(key, None)
+
+    async def history_page(self, record, offset_id, older, limit=HISTORY_PAGE_SIZE):
+        # One page next to offset_id, oldest first in both directions.
+        return await get_peer_cache(record.account).call(self.client, record, lambda peer: self.scheduler.call(
+            PRIORITY_INTERACTIVE, self._history_page, peer, offset_id, older, limit, key="iter_messages"))
+
+    async def _history_page(self, peer, offset_id, older, limit):
+        messages = self.client.iter_messages(peer, limit=limit, offset_id=offset_id, reverse=not older)
+        items = [message_preview_item(msg) async for msg in messages]
+        if older:
+            items.reverse()
+        return items
+
+    async def show(self, key, record, neighbours):
+        # neighbours: (key, record) pairs to warm up around the current row.
+        self.retain({key} | {k for k, _ in neighbours})
+        for neighbour_key, neighbour_record in neighbours:
+            if neighbour_key not in self.entries:
+                self.fetch(neighbour_key, neighbour_record, PRIORITY_LISTING)
+        return await self.get(key, record, PRIORITY_INTERACTIVE)
+
+###############################################################################
+# ThumbnailCache: Photo and document thumbnails kept on disk, LRU by bytes.
+###############################################################################
+
+def thumb_sizes(media):
+    # (photo or document id, its thumbnail sizes) for media that has them.
+    from telethon.tl.types import MessageMediaPhoto, MessageMediaDocument, Photo, Document
+    if isinstance(media, MessageMediaPhoto) and isinstance(media.photo, Photo):
+        return media.photo.id, media.photo.sizes
+    if isinstance(media, MessageMediaDocument) and isinstance(media.document, Document):
+        return media.document.id, media.document.thumbs or []
+    return None, []
+
+def smallest_thumb(media):
+    # Real images only: a stripped size is a blurred placeholder and a path
+    # size is a sticker outline.
+    from telethon.tl.types import PhotoSize, PhotoCachedSize, PhotoSizeProgressive
+    def size_bytes(size):
+        if isinstance(size, PhotoCachedSize):
+            return len(size.bytes)
+        if isinstance(size, PhotoSizeProgressive):
+            return max(size.sizes)
+        return size.size
+    sizes = [s for s in thumb_sizes(media)[1] if isinstance(s, (PhotoSize, PhotoCachedSize, PhotoSizeProgressive))]
+    return min(sizes, key=size_bytes) if sizes else None
+
+class ThumbnailCache:
+    # Image bytes per (media id, size) in sessions/<name>.thumbs; once the
+    # cache holds more than capacity bytes, the least recently shown go
+    # first. The order lives in memory and in the "used" column, so it
+    # survives restarts. Used on the asyncio loop only; callers decode.
+    def __init__(self, client, path, capacity=THUMB_CACHE_BYTES):
+        self.client = client
+        self.scheduler = get_scheduler(client)
+        self.path = path
+        self.capacity = capacity
+        self.sizes = OrderedDict()   # key -> bytes, least recently used first
+        self.total = 0
+        try:
+            _sqlite_execute(self.path, lambda db: db.execute(
+                "CREATE TABLE IF NOT EXISTS thumbs (key TEXT PRIMARY KEY, data BLOB, used REAL)"))
+            rows = _sqlite_execute(self.path, lambda db: db.execute(
+                "SELECT key, length(data) FROM thumbs ORDER BY used").fetchall())
+            self.sizes.update(rows)
+            self.total = sum(self.sizes.values())
+        except sqlite3.Error as e:
+            print(f"Error opening thumbnail cache: {e}")
+            self.path = None
+
+    async def get(self, record, message_id, media):
+        # Image bytes of the smallest thumbnail, or None if there is none.
+        size = smallest_thumb(media)
+        if size is None:
+            return None
+        key = f"{thumb_sizes(media)[0]}:{size.type}"
+        data = self._load(key)
+        if data is None:
+            data = await self._download(record, message_id, media, size)
+            if data:
+                self._store(key, data)
+        return data or None
+
+    async def _download(self, record, message_id, media, size):
+        from telethon import errors
+        try:
+            return await self.scheduler.call(PRIORITY_LISTING, self.client.download_media, media, bytes,
+                                             thumb=size.type, key="download_media")
+        except errors.FileReferenceExpiredError:
+            # Cached previews outlive file references; the message itself
+            # carries a fresh one.
+            msg = await get_peer_cache(record.account).call(self.client, record, lambda peer: self.scheduler.call(
+                PRIORITY_LISTING, self.client.get_messages, peer, ids=message_id))
+            if msg is None or smallest_thumb(msg.media) is None:
+                return None
+            return await self.scheduler.call(PRIORITY_LISTING, self.client.download_media, msg.media, bytes,
+                                             thumb=smallest_thumb(msg.media).type, key="download_media")
+
+    def _load(self, key):
+        if self.path is None or key not in self.sizes:
+            return None
+        self.sizes.move_to_end(key)
+        def read(db):
+            db.execute("UPDATE thumbs SET used = ? WHERE key = ?", (time.time(), key))
+            return db.execute("SELECT data FROM thumbs WHERE key = ?", (key,)).fetchone()
+        try:
+            row = _sqlite_execute(self.path, read)
+        except sqlite3.Error as e:
+            print(f"Error reading thumbnail cache: {e}")
+            return None
+        return row[0] if row else None
+
+    def _store(self, key, data):
+        if self.path is None or len(data) > self.capacity:
+            return
+        self.total += len(data) - self.sizes.pop(key, 0)
+        self.sizes[key] = len(data)
+        evicted = []
+        while self.total > self.capacity:
+            old_key, old_size = self.sizes.popitem(last=False)
+            self.total -= old_size
+            evicted.append((old_key,))
+        def write(db):
+            db.executemany("DELETE FROM thumbs WHERE key = ?", evicted)
+            db.execute("INSERT OR REPLACE INTO thumbs (key, data, used) VALUES (?, ?, ?)", (key, data, time.time()))
+        try:
+            _sqlite_execute(self.path, write)
+        except sqlite3.Error as e:
+            print(f"Error updating thumbnail cache: {e}")
+
+###############################################################################
+# ImpactEstimator: Message counts for a selection, without reading histories.
+###############################################################################
+
+class ImpactEstimate:
+    def __init__(self):
+        self.chats = 0
+        self.messages = 0
+        self.own_messages = 0
+        self.types = {}      # record_type_name -> chats
+        self.unknown = 0     # Chats whose counts could not be fetched.
+
+    def add(self, record, counts):
+        self.chats += 1
+        kind = record_type_name(record)
+        self.types[kind] = self.types.get(kind, 0) + 1
+        if counts is None:
+            self.unknown += 1
+        else:
+            self.messages += counts[0]
+            self.own_messages += counts[1]
+
+class ImpactEstimator:
+    # A history request with limit=0 returns just the message count, and a
+    # search from ourselves with limit=0 just the count of our own messages.
+    # IMPACT_BATCH_SIZE chats' worth of those go to Telegram as one container,
+    # batches run side by side through the scheduler, and counts are kept for
+    # IMPACT_CACHE_TTL so re-opening the confirmation costs nothing.
+    def __init__(self, pool):
+        self.pool = pool
+        self.counts = {}   # record key -> (time, messages, own messages)
+
+    def invalidate(self, keys=None):
+        if keys is None:
+            self.counts.clear()
+        for key in keys or ():
+            self.counts.pop(key, None)
+
+    async def estimate(self, records, on_progress=None):
+        now = time.monotonic()
+        missing = [r for r in records if r.key not in self.counts or now - self.counts[r.key][0] > IMPACT_CACHE_TTL]
+        batches = {}
+        for record in missing:
+            batches.setdefault(record.account, []).append(record)
+        jobs = [(account, group[i:i + IMPACT_BATCH_SIZE])
+                for account, group in batches.items() for i in range(0, len(group), IMPACT_BATCH_SIZE)]
+        done = len(records) - len(missing)
+        if on_progress:
+            on_progress(done, len(records))
+
+        async def run(account, batch):
+            nonlocal done
+            client = self.pool.get(account)
+            try:
+                results = await get_scheduler(client).call(
+                    PRIORITY_LISTING, self._count_batch, client, batch, key="count_messages")
+            except Exception as e:
+                print(f"Error estimating message counts: {e}")
+                results = [None] * len(batch) * 2
+            stamp = time.monotonic()
+            for i, record in enumerate(batch):
+                total, own = results[2 * i], results[2 * i + 1]
+                if total is not None and own is not None:
+                    self.counts[record.key] = (stamp, message_count(total), message_count(own))
+            done += len(batch)
+            if on_progress:
+                on_progress(done, len(records))
+
+        await asyncio.gather(*(run(account, batch) for account, batch in jobs))
+        estimate = ImpactEstimate()
+        for record in records:
+            entry = self.counts.get(record.key)
+            estimate.add(record, entry[1:] if entry is not None else None)
+        return estimate
+
+    @staticmethod
+    async def _count_batch(client, records):
+        from telethon.tl.functions.messages import GetHistoryRequest, SearchRequest
+        from telethon.tl.types import InputMessagesFilterEmpty, InputPeerSelf
+        requests = []
+        for record in records:
+            peer = get_peer_cache(record.account).input_peer(record)
+            requests.append(GetHistoryRequest(peer=peer, offset_id=0, offset_date=None, add_offset=0, limit=0,
+                                              max_id=0, min_id=0, hash=0))
+            requests.append(SearchRequest(peer=peer, q="", filter=InputMessagesFilterEmpty(), min_date=None,
+                                          max_date=None, offset_id=0, add_offset=0, limit=0, max_id=0, min_id=0,
+                                          hash=0, from_id=InputPeerSelf()))
+        return await send_container(client, requests)
+
+async def send_container(client, requests):
+    # Many requests in one round trip; results in order, None where one failed.
+    from telethon import errors
+    try:
+        return await client(requests)
+    except errors.MultiError as e:
+        # Some chats failed (left, banned, ...): keep the rest, but let a
+        # FloodWait through so the scheduler backs off and retries.
+        flood = next((x for x in e.exceptions if isinstance(x, errors.FloodWaitError)), None)
+        if flood is not None:
+            raise flood
+        return e.results
+
+def message_count(result):
+    # messages.Messages (everything fit) has no count field.
+    return getattr(result, "count", None) or len(getattr(result, "messages", ()))
+
+###############################################################################
+# ActivityAnalyzer: Per-chat activity for ranking purge candidates.
+###############################################################################
+
+class ChatActivity:
+    __slots__ = ("last_date", "my_date", "unread", "muted", "members")
+
+    def __init__(self, last_date=0, my_date=0, unread=0, muted=False, members=0):
+        self.last_date = last_date   # Unix time of the newest message; 0 if none.
+        self.my_date = my_date       # Unix time of our newest message; 0 if none.
+        self.unread = unread
+        self.muted = muted
+        self.members = members       # 0 where Telegram does not say (private chats, some channels).
+
+    def staleness(self, now):
+        # Roughly days: since anyone wrote, plus half of since we did, plus
+        # extra for being muted and for an ignored pile of unread messages.
+        # Higher is staler.
+        def days(date):
+            return (now - date) / 86400 if date else STALE_NEVER_DAYS
+        score = days(self.last_date) + days(self.my_date) / 2
+        if self.muted:
+            score += STALE_MUTED_DAYS
+        return score + min(self.unread / STALE_UNREAD_PER_DAY, STALE_UNREAD_MAX_DAYS)
+
+class ActivityCache:
+    # Activity per chat in a table of the session's .cache file, so ranking
+    # a session again within ACTIVITY_CACHE_TTL sends nothing. Used on the
+    # asyncio loop only.
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}   # marked id -> (fetched, ChatActivity)
+        try:
+            _sqlite_execute(self.path, lambda db: db.execute(
+                "CREATE TABLE IF NOT EXISTS activity (marked_id INTEGER PRIMARY KEY, fetched INTEGER, "
+                "last_date INTEGER, my_date INTEGER, unread INTEGER, muted INTEGER, members INTEGER)"))
+            rows = _sqlite_execute(self.path, lambda db: db.execute(
+                "SELECT marked_id, fetched, last_date, my_date, unread, muted, members FROM activity").fetchall())
+            self.entries = {row[0]: (row[1], ChatActivity(row[2], row[3] or 0, row[4], bool(row[5]), row[6]))
+                            for row in rows}
+        except sqlite3.Error as e:
+            print(f"Error opening activity cache: {e}")
+            self.path = None
+
+    def get(self, marked_id, now):
+        entry = self.entries.get(marked_id)
+        if entry is None or now - entry[0] > ACTIVITY_CACHE_TTL:
+            return None
+        return entry[1]
+
+    def put(self, found, now):
+        fetched = int(now)
+        self.entries.update((marked_id, (fetched, activity)) for marked_id, activity in found.items())
+        if self.path is None or not found:
+            return
+        rows = [(marked_id, fetched, a.last_date, a.my_date or 0, a.unread, int(a.muted), a.members)
+                for marked_id, a in found.items()]
+        try:
+            _sqlite_execute(self.path, lambda db: db.executemany(
+                "INSERT OR REPLACE INTO activity (marked_id, fetched, last_date, my_date, unread, muted, members) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)", rows))
+        except sqlite3.Error as e:
+            print(f"Error updating activity cache: {e}")
+
+class ActivityAnalyzer:
+    # GetPeerDialogs answers for up to ACTIVITY_BATCH_SIZE chats at once with
+    # each one's top message, unread count, notify settings and entity
+    # (member count). Our own newest message is only looked for where the
+    # top message is not ours and we could have written at all, with one
+    # container of search requests per batch. Batches of every account run
+    # side by side through the schedulers.
+    def __init__(self, pool):
+        self.pool = pool
+        self.caches = {}   # account -> ActivityCache
+
+    def cache(self, account):
+        if account not in self.caches:
+            self.caches[account] = ActivityCache(get_cache_path(account))
+        return self.caches[account]
+
+    async def analyze(self, records, on_progress=None):
+        # Returns record key -> ChatActivity; chats that could not be
+        # queried are left out.
+        now = time.time()
+        activity = {}
+        missing = {}
+        for record in records:
+            cached = self.cache(record.account).get(record.marked_id, now)
+            if cached is not None:
+                activity[record.key] = cached
+            else:
+                missing.setdefault(record.account, []).append(record)
+        jobs = [(account, group[i:i + ACTIVITY_BATCH_SIZE])
+                for account, group in missing.items() for i in range(0, len(group), ACTIVITY_BATCH_SIZE)]
+        done = len(activity)
+        if on_progress:
+            on_progress(done, len(records))
+
+        async def run(account, batch):
+            nonlocal done
+            try:
+                found = await self._analyze_batch(self.pool.get(account), batch, now)
+            except Exception as e:
+                print(f"Error analyzing chat activity: {e}")
+                found = {}
+            self.cache(account).put(found, now)
+            for record in batch:
+                if record.marked_id in found:
+                    activity[record.key] = found[record.marked_id]
+            done += len(batch)
+            if on_progress:
+                on_progress(done, len(records))
+
+        await asyncio.gather(*(run(account, batch) for account, batch in jobs))
+        return activity
+
+    async def _analyze_batch(self, client, records, now):
+        from itertools import chain
+        from telethon import utils
+        from telethon.tl.functions.messages import SearchRequest
+        from telethon.tl.types import Channel, InputMessagesFilterEmpty, InputPeerSelf
+        found = {}
+        entities = {}
+        wanted = {r.marked_id for r in records}
+        for result in await self._peer_dialogs(client, records):
+            messages = {(utils.get_peer_id(m.peer_id), m.id): m for m in result.messages}
+            entities.update((utils.get_peer_id(e), e) for e in chain(result.chats, result.users))
+            for dialog in result.dialogs:
+                marked_id = utils.get_peer_id(dialog.peer)
+                if marked_id not in wanted:
+                    continue   # e.g. the supergroup a requested chat migrated to.
+                top = messages.get((marked_id, dialog.top_message))
+                last_date = int(top.date.timestamp()) if top is not None and top.date else 0
+                mute_until = getattr(dialog.notify_settings, "mute_until", None)
+                found[marked_id] = ChatActivity(
+                    last_date=last_date,
+                    my_date=last_date if top is not None and top.out else None,
+                    unread=dialog.unread_count,
+                    muted=bool(mute_until and mute_until.timestamp() > now),
+                    members=getattr(entities.get(marked_id), "participants_count", None) or 0
+                )
+        search = []
+        for record in records:
+            activity = found.get(record.marked_id)
+            if activity is None or activity.my_date is not None:
+                continue
+            entity = entities.get(record.marked_id)
+            if (isinstance(entity, Channel) and entity.broadcast and not entity.creator
+                    and entity.admin_rights is None):
+                activity.my_date = 0   # Only admins post in a channel.
+                continue
+            search.append(record)
+        if search:
+            requests = [SearchRequest(peer=get_peer_cache(r.account).input_peer(r), q="",
+                                      filter=InputMessagesFilterEmpty(), min_date=None, max_date=None, offset_id=0,
+                                      add_offset=0, limit=1, max_id=0, min_id=0, hash=0, from_id=InputPeerSelf())
+                        for r in search]
+            results = await get_scheduler(client).call(PRIORITY_LISTING, send_container, client, requests,
+                                                       key="last_own_message")
+            for record, result in zip(search, results):
+                mine = getattr(result, "messages", None)
+                found[record.marked_id].my_date = int(mine[0].date.timestamp()) if mine else 0
+        return found
+
+    async def _peer_dialogs(self, client, records):
+        # One GetPeerDialogs for the batch. A single stale or inaccessible
+        # peer fails the whole call, so halve the batch until it is alone;
+        # the peer cache then retries a stale one with a fresh hash, and an
+        # inaccessible one is left out.
+        from telethon import errors
+        from telethon.tl.functions.messages import GetPeerDialogsRequest
+        from telethon.tl.types import InputDialogPeer
+        scheduler = get_scheduler(client)
+        try:
+            if len(records) == 1:
+                record = records[0]
+                return [await get_peer_cache(record.account).call(client, record, lambda peer: scheduler.request(
+                    PRIORITY_LISTING, GetPeerDialogsRequest([InputDialogPeer(peer)])))]
+            return [await scheduler.request(PRIORITY_LISTING, GetPeerDialogsRequest(
+                [InputDialogPeer(get_peer_cache(r.account).input_peer(r)) for r in records]))]
+        except errors.FloodWaitError:
+            raise
+        except errors.RPCError as e:
+            if len(records) == 1:
+                print(f"Error analyzing {records[0].name}: {e}")
+                return []
+        half = len(records) // 2
+        return await self._peer_dialogs(client, records[:half]) + await self._peer_dialogs(client, records[half:])
+
+###############################################################################
+# PurgeJournal: Append-only per-session log of purge jobs, for resuming.
+###############################################################################
+
+# A journal bigger than this drops its finished jobs when the next job starts.
+JOURNAL_COMPACT_BYTES = 1 << 20
+
+class PurgeJob:
+    def __init__(self, job_id):
+        self.id = job_id
+        self.records = []
+        self.steps_done = {}   # marked id -> {"export", "delete", "leave"}
+        self.export = set()    # marked ids whose history is exported first
+        self.results = {}      # marked id -> "done", "failed" or "cancelled"
+        self.errors = {}       # marked id -> [messages]
+        self.finished = False
+
+    def remaining(self):
+        # Everything not known to be done; a resumed run skips finished steps.
+        return [r for r in self.records if self.results.get(r.marked_id) != "done"]
+
+    def failed(self):
+        return [r for r in self.records if self.results.get(r.marked_id) == "failed"]
+
+class PurgeJournal:
+    # sessions/<name>.jobs, one JSON object per line:
+    #   {"job": id, "event": "plan", "time": t, "targets": [[record fields], ...],
+    #    "export": [marked_id, ...]}
+    #   {"job": id, "event": "step", "peer": marked_id, "step": "export"|"delete"|"leave",
+    #    "status": "started"|"done"|"failed", "error": "..."}
+    #   {"job": id, "event": "result", "peer": marked_id, "status": "done"|"failed"|"cancelled",
+    #    "messages_deleted": n}
+    #   {"job": id, "event": "end", "time": t}
+    # Each line is flushed and fsynced before the step it describes goes on,
+    # so after a crash the file says what was already done.
+    def __init__(self, path):
+        self.path = path
+
+    def _append(self, entry):
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with open(self.path, "a+b") as f:
+            # A line cut short by a crash is ended first, so this entry does
+            # not join it and get skipped along with it.
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _parse(line):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # A line cut short by a crash; everything before it stands.
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def jobs(self):
+        jobs = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        for line in lines:
+            entry = self._parse(line)
+            if entry is None:
+                continue
+            event = entry.get("event")
+            if event == "plan":
+                job = jobs[entry["job"]] = PurgeJob(entry["job"])
+                job.records = [DialogRecord(*fields) for fields in entry["targets"]]
+                job.export = set(entry.get("export", ()))
+                continue
+            job = jobs.get(entry.get("job"))
+            if job is None:
+                continue
+            if event == "step" and entry["status"] == "done":
+                job.steps_done.setdefault(entry["peer"], set()).add(entry["step"])
+            elif event == "step" and entry["status"] == "failed":
+                job.errors.setdefault(entry["peer"], []).append(f"{entry['step']}: {entry.get('error', '')}")
+            elif event == "result":
+                job.results[entry["peer"]] = entry["status"]
+            elif event == "end":
+                job.finished = True
+        return list(jobs.values())
+
+    def unfinished(self):
+        return [job for job in self.jobs() if not job.finished]
+
+    def last_job(self):
+        jobs = self.jobs()
+        return jobs[-1] if jobs else None
+
+    def start_job(self, records, export=()):
+        self._compact()
+        job = PurgeJob(f"{int(time.time() * 1000)}")
+        job.records = list(records)
+        job.export = set(export)
+        entry = {"job": job.id, "event": "plan", "time": int(time.time()),
+                 "targets": [[getattr(r, field) for field in DialogRecord.__slots__] for r in records]}
+        if job.export:
+            entry["export"] = sorted(job.export)
+        self._append(entry)
+        return job
+
+    def step(self, job, record, step, status, error=None):
+        entry = {"job": job.id, "event": "step", "peer": record.marked_id, "step": step, "status": status}
+        if error is not None:
+            entry["error"] = error
+        self._append(entry)
+        if status == "done":
+            job.steps_done.setdefault(record.marked_id, set()).add(step)
+
+    def result(self, job, result):
+        self._append({"job": job.id, "event": "result", "peer": result.target.record.marked_id,
+                      "status": result.status, "messages_deleted": result.messages_deleted})
+        job.results[result.target.record.marked_id] = result.status
+
+    def finish(self, job):
+        self._append({"job": job.id, "event": "end", "time": int(time.time())})
+        job.finished = True
+
+    def merge(self, unfinished):
+        # Several unfinished jobs are resumed as one new job, written with
+        # the steps already done before the old jobs are closed, so a crash
+        # in the resumed run still leaves every chat in an unfinished job.
+        merged = merge_jobs(unfinished)
+        if len(unfinished) == 1:
+            return merged
+        job = self.start_job(merged.records, merged.export & {r.marked_id for r in merged.records})
+        for record in merged.records:
+            for step in sorted(merged.steps_done.get(record.marked_id, ())):
+                self.step(job, record, step, "done")
+        for older in unfinished:
+            self.finish(older)
+        return job
+
+    def _compact(self):
+        try:
+            if os.path.getsize(self.path) < JOURNAL_COMPACT_BYTES:
+                return
+        except OSError:
+            return
+        keep = {job.id for job in self.unfinished()}
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = [line for line in f if (self._parse(line) or {}).get("job") in keep]
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+def merge_jobs(unfinished):
+    # Fold unfinished jobs into one under the newest id: it carries on with
+    # whatever any of them left undone and knows every step already done.
+    # Only in memory; PurgeJournal.merge writes the fold down.
+    job = PurgeJob(unfinished[-1].id)
+    records = {}
+    for older in unfinished:
+        for marked_id, steps in older.steps_done.items():
+            job.steps_done.setdefault(marked_id, set()).update(steps)
+        job.export |= older.export
+        for record in older.remaining():
+            records[record.marked_id] = record
+    job.records = list(records.values())
+    return job
+
+###############################################################################
+# HistoryExporter: Streams chat histories to compressed JSONL before a purge.
+###############################################################################
+
+def message_export(msg):
+    # One JSON object per message; media is named, not downloaded.
+    item = {"id": msg.id, "date": int(msg.date.timestamp()) if msg.date else 0,
+            "from_id": getattr(msg, "sender_id", None), "out": bool(msg.out),
+            "text": getattr(msg, "message", None) or ""}
+    reply_to = getattr(msg, "reply_to_msg_id", None)
+    if reply_to:
+        item["reply_to"] = reply_to
+    if getattr(msg, "fwd_from", None) is not None:
+        item["forwarded"] = True
+    if getattr(msg, "media", None) is not None:
+        item["media"] = type(msg.media).__name__.replace("MessageMedia", "").lower()
+    if getattr(msg, "action", None) is not None:
+        item["action"] = type(msg.action).__name__.replace("MessageAction", "")
+    return item
+
+class HistoryExporter:
+    # exports/<session>/<marked id>.jsonl.gz holds a chat's messages, oldest
+    # first, one gzip member per page; <marked id>.state says how far it got:
+    #   {"id": marked_id, "name": ..., "type": ..., "last_id": n, "messages": n,
+    #    "size": bytes, "finished": bool}
+    # The state is replaced only after its page is fsynced, so a run that
+    # stops anywhere resumes after the last page it wrote. Exporting a chat
+    # again only appends what is newer. Lives on the asyncio loop; the caller
+    # fetches pages (through its own slots and the scheduler) with page().
+    def __init__(self, client):
+        self.client = client
+        self.scheduler = get_scheduler(client)
+        self.reader = None
+        self._stack = None
+        self._lock = asyncio.Lock()
+
+    async def open(self):
+        # A takeout session has gentler limits for reading whole histories.
+        # Telegram may want it allowed from another device first; until then
+        # the plain client reads instead.
+        from telethon import errors
+        async with self._lock:
+            if self.reader is not None:
+                return self.reader
+            self.reader = self.client
+            if hasattr(self.client, "takeout"):
+                stack = AsyncExitStack()
+                try:
+                    self.reader = await self.scheduler.call(
+                        PRIORITY_BULK, stack.enter_async_context, self.client.takeout(
+                            finalize=True, contacts=False, users=True, chats=True, megagroups=True,
+                            channels=True, files=False), key="takeout")
+                    self._stack = stack
+                except (errors.RPCError, ValueError) as e:
+                    print(f"Takeout unavailable, exporting without it: {e}")
+            return self.reader
+
+    async def close(self, success=True):
+        # Telegram is told whether the takeout ended well; a cancelled or
+        # failed run says not.
+        stack, self._stack = self._stack, None
+        reader, self.reader = self.reader, None
+        if stack is not None:
+            reader.success = success
+            try:
+                await stack.aclose()
+            except Exception as e:
+                print(f"Error finishing takeout session: {e}")
+
+    def paths(self, record):
+        base = os.path.join(get_export_dir(record.account), str(record.marked_id))
+        return base + ".jsonl.gz", base + ".state"
+
+    def resume(self, record):
+        # Bytes past the saved size are a page cut short; they are dropped.
+        data_path, state_path = self.paths(record)
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        state = None
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            pass
+        except ValueError as e:
+            print(f"Error reading export state, starting over: {e}")
+        if state is None:
+            state = {"id": record.marked_id, "name": record.name, "type": record_type_name(record),
+                     "last_id": 0, "messages": 0, "size": 0, "finished": False}
+        with open(data_path, "ab") as f:
+            f.truncate(state["size"])
+        state["finished"] = False
+        return state
+
+    async def page(self, peer, offset_id):
+        messages = self.reader.iter_messages(peer, limit=EXPORT_PAGE_SIZE, offset_id=offset_id, reverse=True)
+        return [message_export(msg) async for msg in messages]
+
+    def write(self, record, state, items):
+        data_path, state_path = self.paths(record)
+        if items:
+            with open(data_path, "ab") as f:
+                with gzip.GzipFile(fileobj=f, mode="wb") as gz:
+                    gz.write("".join(json.dumps(item, ensure_ascii=False) + "\n" for item in items).encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                state["size"] = f.tell()
+            state["last_id"] = items[-1]["id"]
+            state["messages"] += len(items)
+        state["finished"] = len(items) < EXPORT_PAGE_SIZE
+        tmp_path = state_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, state_path)
+
+###############################################################################
+# PurgeEngine: Runs export/delete/leave steps for many chats on the asyncio loop.
+###############################################################################
+
+class PurgeCancelled(Exception):
+    pass
+
+class PurgeTarget:
+    def __init__(self, record, export=False):
+        self.record = record
+        self.name = record.name
+        self.is_saved = record.is_saved
+        self.account = record.account
+        self.export = export   # Save the history with HistoryExporter before deleting it.
+
+class PurgeResult:
+    def __init__(self, target):
+        self.target = target
+        self.status = "pending"   # "done", "failed" or "cancelled"
+        self.deleted = False
+        self.left = False
+        self.messages_deleted = 0   # As reported by the server; channels report none.
+        self.messages_exported = 0
+        self.errors = []
+
+class PurgeEngine:
+    def __init__(self, client, loop, concurrency=PURGE_CONCURRENCY,
+                 on_result=None, on_progress=None, on_flood_wait=None, on_deleted=None, on_exported=None,
+                 journal=None):
+        self.client = client
+        self.loop = loop
+        self.scheduler = get_scheduler(client)
+        self.concurrency = concurrency
+        self.journal = journal
+        self._journal_writer = None
+        self.job = None
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.on_flood_wait = on_flood_wait
+        self.on_deleted = on_deleted
+        self.on_exported = on_exported
+        self.exporter = None
+        self._cancel_event = None
+        self._cancel_requested = False
+
+    def start(self, targets, job=None):
+        # Called from the GUI thread; returns a concurrent future for the batch.
+        return asyncio.run_coroutine_threadsafe(self.run(targets, job), self.loop)
+
+    def cancel(self):
+        self._cancel_requested = True
+        self.loop.call_soon_threadsafe(self._set_cancelled)
+
+    def _set_cancelled(self):
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def plan_steps(self, target, peer=None):
+        # Each chat type has its own way out; LeaveChannelRequest only applies
+        # to channels and supergroups.
+        from telethon.tl.functions.messages import DeleteHistoryRequest, DeleteChatUserRequest
+        from telethon.tl.functions.channels import LeaveChannelRequest
+        from telethon.tl.functions.channels import DeleteHistoryRequest as DeleteChannelHistoryRequest
+        from telethon.tl.types import InputUserSelf
+        record = target.record
+        peer = peer or record.input_peer()
+        # The export goes first: nothing is deleted until the history is saved.
+        steps = [("export", None)] if target.export else []
+        if record.kind == KIND_CHANNEL:
+            # Broadcast channels have no per-user history to delete.
+            if record.flags & FLAG_MEGAGROUP:
+                steps.append(("delete", DeleteChannelHistoryRequest(channel=peer, max_id=0, for_everyone=False)))
+            if not record.flags & FLAG_LEFT:
+                steps.append(("leave", LeaveChannelRequest(peer)))
+        elif record.kind == KIND_CHAT:
+            steps.append(("delete", DeleteHistoryRequest(peer=peer, max_id=0, revoke=True)))
+            if not record.flags & (FLAG_LEFT | FLAG_INACTIVE):
+                steps.append(("leave", DeleteChatUserRequest(chat_id=record.peer_id, user_id=InputUserSelf())))
+        else:
+            # Private chats and Saved Messages: deleting the history removes the dialog.
+            steps.append(("delete", DeleteHistoryRequest(peer=peer, max_id=0, revoke=True)))
+        return steps
+
+    async def run(self, targets, job=None):
+        # Pass a PurgeJob from the journal to resume it: steps it already
+        # finished are skipped.
+        self._cancel_event = asyncio.Event()
+        if self._cancel_requested:
+            self._cancel_event.set()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._journal_writer = ThreadPoolExecutor(max_workers=1)
+        try:
+            return await self._run(targets, job)
+        finally:
+            self._journal_writer.shutdown(wait=False)
+
+    async def _run(self, targets, job):
+        self.job = job or await self._log("start_job", [t.record for t in targets],
+                                          [t.record.marked_id for t in targets if t.export])
+        if any(t.export for t in targets):
+            self.exporter = HistoryExporter(self.client)
+        results = [PurgeResult(t) for t in targets]
+        total = len(results)
+        completed = 0
+
+        async def worker(result):
+            nonlocal completed
+            try:
+                await self._process(result)
+            except PurgeCancelled:
+                result.status = "cancelled"
+            except Exception as e:
+                result.errors.append(str(e))
+                result.status = "failed"
+            completed += 1
+            await self._log("result", self.job, result)
+            if self.on_result:
+                self.on_result(result)
+            if self.on_progress:
+                self.on_progress(completed, total)
+
+        success = False
+        try:
+            await asyncio.gather(*(worker(r) for r in results))
+            success = not self._cancel_event.is_set() and all(r.status == "done" for r in results)
+        finally:
+            if self.exporter is not None:
+                await self.exporter.close(success)
+        if not self._cancel_event.is_set():
+            await self._log("finish", self.job)
+        return results
+
+    async def _log(self, event, *args):
+        # The journal must never be the reason a purge stops. Each write
+        # fsyncs, so it runs on the engine's one writer thread: off the loop,
+        # and still in the order the workers made them.
+        if self.journal is None or (event != "start_job" and self.job is None):
+            return None
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._journal_writer, getattr(self.journal, event), *args)
+        except (OSError, ValueError) as e:
+            print(f"Error writing purge journal: {e}")
+            return None
+
+    async def _process(self, result):
+        from telethon import errors
+        record = result.target.record
+        done = self.job.steps_done.get(record.marked_id, ()) if self.job is not None else ()
+        peers = get_peer_cache(record.account)
+        for kind, _ in self.plan_steps(result.target):
+            if kind not in done:
+                await self._log("step", self.job, record, kind, "started")
+                try:
+                    await peers.call(self.client, record, lambda peer: self._step(kind, peer, result))
+                except PurgeCancelled:
+                    raise
+                except (errors.UserNotParticipantError, errors.ChannelPrivateError) as e:
+                    # Already out of the chat (say, a resumed step that went
+                    # through before a crash): the leave has nothing left to do.
+                    if kind != "leave":
+                        await self._log("step", self.job, record, kind, "failed", str(e))
+                        result.errors.append(f"{kind}: {e}")
+                        if kind == "export":
+                            break
+                        continue
+                except Exception as e:
+                    # A failed delete should not keep us in the chat, but a
+                    # failed export keeps the history where it is.
+                    await self._log("step", self.job, record, kind, "failed", str(e))
+                    result.errors.append(f"{kind}: {e}")
+                    if kind == "export":
+                        break
+                    continue
+                await self._log("step", self.job, record, kind, "done")
+            if kind == "delete":
+                result.deleted = True
+            elif kind == "leave":
+                result.left = True
+        result.status = "failed" if result.errors else "done"
+
+    async def _step(self, kind, peer, result):
+        # Rebuilt from the peer each time, so a refreshed access_hash is used.
+        request = dict(self.plan_steps(result.target, peer))[kind]
+        if kind == "export":
+            await self._export(peer, result)
+        elif kind == "delete":
+            await self._delete_history(request, result)
+        else:
+            await self._call(request)
+
+    async def _export(self, peer, result):
+        # Each page is on disk before the next is asked for, so memory holds
+        # one page whatever the history length. Pages queue for slots like
+        # deletes do and share the iter_messages budget with the preview.
+        record = result.target.record
+        exporter = self.exporter
+        await exporter.open()
+        state = exporter.resume(record)
+        while not state["finished"]:
+            items = await self._in_slot(lambda: self.scheduler.call(
+                PRIORITY_BULK, exporter.page, peer, state["last_id"], key="iter_messages", retry_flood=False))
+            exporter.write(record, state, items)
+            result.messages_exported = state["messages"]
+            if self.on_exported:
+                self.on_exported(result)
+
+    async def _delete_history(self, request, result):
+        # messages.DeleteHistory removes one chunk per call and returns the
+        # offset still to go; repeat it until the offset runs out. Each page
+        # goes back through _call and queues behind the other chats' calls, so
+        # a huge chat takes turns with the rest of the batch instead of
+        # holding its slot until it is empty.
+        from telethon.tl.types.messages import AffectedHistory
+        while True:
+            affected = await self._call(request)
+            if not isinstance(affected, AffectedHistory):
+                # channels.DeleteHistory clears the whole history in one call.
+                return
+            result.messages_deleted += affected.pts_count
+            if self.on_deleted:
+                self.on_deleted(result)
+            if affected.offset <= 0 or not affected.pts_count:
+                return
+
+    async def _call(self, request):
+        return await self._in_slot(lambda: self.scheduler.request(PRIORITY_BULK, request, retry_flood=False))
+
+    async def _in_slot(self, call):
+        from telethon import errors
+        while True:
+            if self._cancel_event.is_set():
+                raise PurgeCancelled()
+            async with self._slots:
+                if self._cancel_event.is_set():
+                    raise PurgeCancelled()
+                try:
+                    return await call()
+                except errors.FloodWaitError as e:
+                    wait = e.seconds
+            # The slot is free again while this chat is parked, so the rest
+            # of the batch keeps going.
+            if self.on_flood_wait:
+                self.on_flood_wait(wait)
+            try:
+                await asyncio.wait_for(self._cancel_event.wait(), timeout=wait + 1)
+            except asyncio.TimeoutError:
+                pass
+
+class PoolPurge:
+    # Same interface as PurgeEngine for targets spread over several accounts:
+    # one engine per account, run side by side, each with that account's
+    # client and concurrency limit. Progress counts the whole batch.
+    def __init__(self, pool, loop, on_result=None, on_progress=None, on_flood_wait=None, on_deleted=None,
+                 on_exported=None, journals=None):
+        self.pool = pool
+        self.loop = loop
+        self.journals = journals or {}
+        self.on_result = on_result
+        self.on_progress = on_progress
+        self.on_flood_wait = on_flood_wait
+        self.on_deleted = on_deleted
+        self.on_exported = on_exported
+        self.engines = []
+        self._cancel_requested = False
+
+    def start(self, targets, jobs=None):
+        return asyncio.run_coroutine_threadsafe(self.run(targets, jobs), self.loop)
+
+    def cancel(self):
+        self._cancel_requested = True
+        for engine in list(self.engines):
+            engine.cancel()
+
+    async def run(self, targets, jobs=None):
+        # jobs maps account -> PurgeJob when resuming journalled work.
+        jobs = jobs or {}
+        groups = {}
+        for target in targets:
+            groups.setdefault(target.account, []).append(target)
+        total = len(targets)
+        completed = 0
+
+        def on_result(result):
+            nonlocal completed
+            completed += 1
+            if self.on_result:
+                self.on_result(result)
+            if self.on_progress:
+                self.on_progress(completed, total)
+
+        for account in groups:
+            self.engines.append(PurgeEngine(
+                self.pool.get(account), self.loop, concurrency=self.pool.concurrency(account),
+                on_result=on_result, on_flood_wait=self.on_flood_wait, on_deleted=self.on_deleted,
+                on_exported=self.on_exported, journal=self.journals.get(account)))
+        if self._cancel_requested:
+            self.cancel()
+        batches = await asyncio.gather(*(engine.run(group, jobs.get(account))
+                                         for engine, (account, group) in zip(self.engines, groups.items())))
+        return [result for batch in batches for result in batch]
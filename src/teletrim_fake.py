@@ -0,0 +1,388 @@
+import zlib
+import struct
+import random
+import asyncio
+import datetime
+
+from telethon import errors, events, utils
+from telethon.tl import functions
+from telethon.tl.types import (
+    User, Chat, Channel, ChatPhotoEmpty, Dialog, InputPeerSelf, Message, MessageMediaPhoto, PeerChat,
+    PeerNotifySettings, Photo, PhotoSize, PhotoStrippedSize, Updates, UpdateChannel
+)
+from telethon.tl.types.messages import AffectedHistory, MessagesSlice, PeerDialogs
+from telethon.tl.types.updates import State
+
+# Stand-in for TelegramClient that never touches the network: synthetic
+# dialogs and messages, with configurable latency, jitter and FloodWait rate.
+# Imported lazily by teletrim_core.create_client when TELETRIM_FAKE is set,
+# so it may import Telethon at the top. For benchmarks and trying the GUI
+# without an account:
+#
+#   TELETRIM_FAKE="dialogs=10000,latency=0.08,jitter=0.03,flood_rate=0.01" python src/teletrim.py
+#
+# Only the client methods Teletrim calls are implemented.
+
+FAKE_DEFAULTS = {
+    "dialogs": 1000,
+    "messages": 200,          # History length of every chat.
+    "latency": 0.05,          # Seconds per API call...
+    "jitter": 0.02,           # ...plus up to this much, uniformly.
+    "flood_rate": 0.0,        # Chance that a call raises FloodWaitError.
+    "flood_seconds": 3,
+    "updates": 0.0,           # Incoming messages per second, in random chats.
+    "seed": 0,
+}
+FAKE_PAGE_SIZE = 100          # Dialogs per GetDialogs call, as Telegram does.
+FAKE_USER_ID = 1
+FAKE_DELETE_CHUNK = 100       # Messages removed per DeleteHistory call.
+FAKE_PHOTO_EVERY = 5          # Every fifth message is a photo.
+FAKE_THUMB_SIZES = (("s", 90, 90), ("m", 320, 320))
+
+def fake_png(width, height, rgb):
+    # A solid-colour PNG, so the thumbnails decode without any image library.
+    raw = b"".join(b"\x00" + bytes(rgb) * width for _ in range(height))
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+def parse_fake_options(spec):
+    # "dialogs=10000,latency=0.1" -> dict with FAKE_DEFAULTS filled in.
+    options = dict(FAKE_DEFAULTS)
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        key, _, value = part.partition("=")
+        if key not in FAKE_DEFAULTS:
+            raise ValueError(f"Unknown fake client option '{key}'.")
+        options[key] = type(FAKE_DEFAULTS[key])(value)
+    return options
+
+class FakeDialog:
+    def __init__(self, entity, name, date, pinned=False, unread_count=0):
+        self.entity = entity
+        self.id = utils.get_peer_id(entity)
+        self.name = name
+        self.date = date
+        self.pinned = pinned
+        self.unread_count = unread_count
+
+class FakeDialogIterator:
+    def __init__(self, client, dialogs):
+        self.client = client
+        self.dialogs = dialogs
+        self.total = len(dialogs)
+        self.position = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.position >= len(self.dialogs):
+            raise StopAsyncIteration
+        if self.position % FAKE_PAGE_SIZE == 0:
+            await self.client._rpc()
+        self.position += 1
+        return self.dialogs[self.position - 1]
+
+class FakeEvent:
+    # Just enough of a Telethon event for the handlers Teletrim registers.
+    def __init__(self, entity, message, **fields):
+        self.chat = entity
+        self.chat_id = utils.get_peer_id(entity)
+        self.message = self.action_message = message
+        self.out = bool(message is not None and message.out)
+        self.original_update = None
+        self.user_ids = None   # As Telethon: None, not [], when no users are involved.
+        self.new_title = None
+        self.created = self.user_joined = self.user_added = self.user_left = self.user_kicked = False
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+    async def get_chat(self):
+        return self.chat
+
+class FakeTelegramClient:
+    def __init__(self, dialogs=FAKE_DEFAULTS["dialogs"], messages=FAKE_DEFAULTS["messages"],
+                 latency=FAKE_DEFAULTS["latency"], jitter=FAKE_DEFAULTS["jitter"],
+                 flood_rate=FAKE_DEFAULTS["flood_rate"], flood_seconds=FAKE_DEFAULTS["flood_seconds"],
+                 updates=FAKE_DEFAULTS["updates"], seed=FAKE_DEFAULTS["seed"]):
+        self.messages = messages
+        self.latency = latency
+        self.jitter = jitter
+        self.flood_rate = flood_rate
+        self.flood_seconds = flood_seconds
+        self.update_rate = updates
+        self.handlers = []
+        self.update_task = None
+        self.random = random.Random(seed)
+        self.flood_sleep_threshold = 60
+        self.connected = False
+        self.calls = 0
+        self.downloads = 0
+        self.me = User(id=FAKE_USER_ID, is_self=True, access_hash=1, first_name="Fake", last_name="Account",
+                       username="fake_account")
+        self.dialogs = self._make_dialogs(dialogs)
+        # Kept after a dialog is dropped, as Telegram still knows the peer.
+        self.entities = {d.id: d.entity for d in self.dialogs}
+        self.history = {}   # marked id -> messages left, once some were deleted
+
+    def _make_dialogs(self, count):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        dialogs = [FakeDialog(self.me, "Saved Messages", now, pinned=True)]
+        for i in range(2, count + 1):
+            # Mostly users, then channels, supergroups and basic groups.
+            kind = i % 10
+            if kind < 5:
+                entity = User(id=i, access_hash=i * 7919, first_name=f"User {i}", username=f"user{i}")
+                name = entity.first_name
+            elif kind < 7:
+                entity = Channel(id=i, title=f"Channel {i}", photo=ChatPhotoEmpty(), date=None,
+                                 access_hash=i * 104729, broadcast=True, participants_count=i * 37 % 5000,
+                                 creator=i % 20 == 5)
+                name = entity.title
+            elif kind < 9:
+                entity = Channel(id=i, title=f"Supergroup {i}", photo=ChatPhotoEmpty(), date=None,
+                                 access_hash=i * 104729, megagroup=True, participants_count=i * 37 % 5000)
+                name = entity.title
+            else:
+                entity = Chat(id=i, title=f"Group {i}", photo=ChatPhotoEmpty(), participants_count=i % 200,
+                              date=None, version=1)
+                name = entity.title
+            # Roughly one dialog per hour going back, so age filters have a spread.
+            date = now - datetime.timedelta(hours=i, minutes=self.random.randrange(60))
+            unread = self.random.choice((0, 0, 1, 7))
+            dialogs.append(FakeDialog(entity, name, date, pinned=i <= 3, unread_count=unread))
+        return dialogs
+
+    async def _rpc(self):
+        self.calls += 1
+        await asyncio.sleep(self.latency + self.random.uniform(0, self.jitter))
+        if self.flood_rate and self.random.random() < self.flood_rate:
+            raise errors.FloodWaitError(None, capture=self.flood_seconds)
+
+    # Connection and login.
+
+    async def connect(self):
+        await asyncio.sleep(self.latency)
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    def is_connected(self):
+        return self.connected
+
+    async def is_user_authorized(self):
+        await self._rpc()
+        return True
+
+    async def get_me(self):
+        await self._rpc()
+        return self.me
+
+    async def start(self, phone=None, password=None):
+        await self.connect()
+        return self
+
+    async def send_code_request(self, phone):
+        await self._rpc()
+
+    async def sign_in(self, phone=None, code=None, password=None):
+        await self._rpc()
+        return self.me
+
+    # Updates. Handlers get FakeEvents, or the raw update for events.Raw.
+
+    def add_event_handler(self, callback, event=None):
+        self.handlers.append((callback, event))
+        if self.update_rate and self.update_task is None:
+            self.update_task = asyncio.ensure_future(self._send_updates())
+
+    def remove_event_handler(self, callback, event=None):
+        self.handlers = [(c, e) for c, e in self.handlers if c != callback]
+
+    async def dispatch(self, builder_type, event):
+        for callback, builder in list(self.handlers):
+            if isinstance(builder, builder_type) and (builder_type is not events.Raw or builder.filter(event)):
+                await callback(event)
+
+    async def receive_message(self, marked_id, out=False):
+        # A new message in a chat, as if sent from another device or by
+        # someone else; the dialog moves up like it would on the server.
+        dialog = next(d for d in self.dialogs if d.id == marked_id)
+        top = self._history_ids(marked_id) + 1
+        self.history[marked_id] = top
+        dialog.date = datetime.datetime.now(datetime.timezone.utc)
+        self.dialogs.remove(dialog)
+        pinned = sum(1 for d in self.dialogs if d.pinned)
+        self.dialogs.insert(0 if dialog.pinned else pinned, dialog)
+        peer, _ = self._peer(utils.get_input_peer(dialog.entity))
+        message = Message(id=top, peer_id=peer, date=dialog.date, message=f"Message {top} in {marked_id}", out=out)
+        await self.dispatch(events.NewMessage, FakeEvent(dialog.entity, message))
+
+    async def _send_updates(self):
+        while self.handlers:
+            await asyncio.sleep(1 / self.update_rate)
+            if len(self.dialogs) > 1:
+                await self.receive_message(self.random.choice(self.dialogs[1:]).id)
+
+    def _notify_left(self, marked_id):
+        # The server confirms a leave with UpdateChannel; the channel in its
+        # entities now has left set.
+        entity = self.entities[marked_id]
+        channel = Channel(id=entity.id, title=entity.title, photo=ChatPhotoEmpty(), date=None,
+                          access_hash=entity.access_hash, broadcast=entity.broadcast, megagroup=entity.megagroup,
+                          left=True)
+        update = UpdateChannel(channel_id=entity.id)
+        update._entities = {marked_id: channel}
+        asyncio.ensure_future(self.dispatch(events.Raw, update))
+
+    # Dialogs and messages.
+
+    def iter_dialogs(self):
+        return FakeDialogIterator(self, list(self.dialogs))
+
+    def _marked_id(self, peer):
+        # Saved Messages comes in as InputPeerSelf, which has no id of its own;
+        # anything else must carry the access_hash we handed out.
+        if isinstance(peer, InputPeerSelf):
+            return FAKE_USER_ID
+        marked_id = utils.get_peer_id(peer)
+        entity = self.entities.get(marked_id)
+        if entity is not None and getattr(peer, "access_hash", None) not in (None, getattr(entity, "access_hash", None)):
+            if isinstance(entity, Channel):
+                raise errors.ChannelInvalidError(None)
+            raise errors.PeerIdInvalidError(None)
+        return marked_id
+
+    async def get_input_entity(self, peer):
+        await self._rpc()
+        entity = self.entities.get(peer if isinstance(peer, int) else utils.get_peer_id(peer))
+        if entity is None:
+            raise ValueError(f"Could not find the input entity for {peer!r}.")
+        return utils.get_input_peer(entity)
+
+    def _peer(self, entity):
+        marked_id = self._marked_id(entity)
+        peer_id, peer_type = utils.resolve_id(marked_id)
+        return peer_type(peer_id), marked_id
+
+    def _message(self, peer, marked_id, message_id):
+        date = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(minutes=self.messages - message_id)
+        text = f"Message {message_id} in {marked_id}" + " lorem ipsum" * (message_id % 7) * 4
+        media = None
+        if message_id % FAKE_PHOTO_EVERY == 0:
+            # Sizes as Telegram sends them; byte counts only need to order them.
+            sizes = [PhotoStrippedSize(type="i", bytes=b"\x01\x28\x28")]
+            sizes += [PhotoSize(type=t, w=w, h=h, size=w * h // 10) for t, w, h in FAKE_THUMB_SIZES]
+            photo = Photo(id=abs(marked_id) * 100000 + message_id, access_hash=1, file_reference=b"",
+                          date=date, sizes=sizes, dc_id=2)
+            media = MessageMediaPhoto(photo=photo)
+            text = f"Photo {message_id}" if message_id % 2 else ""
+        return Message(id=message_id, peer_id=peer, date=date, message=text, out=message_id % 3 == 0, media=media)
+
+    async def download_media(self, media, file=None, thumb=None):
+        # Thumbnails only, as bytes; the colour comes from the photo id.
+        await self._rpc()
+        self.downloads += 1
+        size = next(s for s in media.photo.sizes if s.type == thumb)
+        photo_id = media.photo.id
+        return fake_png(size.w, size.h, (photo_id * 37 % 256, photo_id * 91 % 256, photo_id * 53 % 256))
+
+    def _history_ids(self, marked_id):
+        return self.history.get(marked_id, self.messages)
+
+    async def get_messages(self, entity, limit=10):
+        await self._rpc()
+        peer, marked_id = self._peer(entity)
+        top = self._history_ids(marked_id)
+        return [self._message(peer, marked_id, i) for i in range(top, max(0, top - limit), -1)]
+
+    async def iter_messages(self, entity, limit=None, offset_id=0, reverse=False):
+        await self._rpc()
+        peer, marked_id = self._peer(entity)
+        top = self._history_ids(marked_id)
+        limit = top if limit is None else limit
+        if reverse:
+            ids = range(offset_id + 1, min(top, offset_id + limit) + 1)
+        else:
+            start = offset_id - 1 if offset_id else top
+            ids = range(start, max(0, start - limit), -1)
+        for message_id in ids:
+            yield self._message(peer, marked_id, message_id)
+
+    async def __call__(self, request, ordered=False):
+        await self._rpc()
+        if isinstance(request, list):
+            # A container: one round trip, results in order.
+            return [self._answer(r) for r in request]
+        return self._answer(request)
+
+    def _answer(self, request):
+        if isinstance(request, (functions.messages.GetHistoryRequest, functions.messages.SearchRequest)):
+            # Count queries (limit=0), and our own newest message (a search
+            # from ourselves); every third message is ours.
+            marked_id = self._marked_id(request.peer)
+            count = self._history_ids(marked_id)
+            messages = []
+            if isinstance(request, functions.messages.SearchRequest):
+                if request.limit and count >= 3:
+                    peer, _ = self._peer(request.peer)
+                    messages = [self._message(peer, marked_id, count - count % 3)]
+                count //= 3
+            return MessagesSlice(count=count, messages=messages, chats=[], users=[])
+        if isinstance(request, functions.messages.GetPeerDialogsRequest):
+            return self._peer_dialogs([p.peer for p in request.peers])
+        if isinstance(request, functions.messages.DeleteHistoryRequest):
+            # Like the server, one chunk per call; offset says how much is left.
+            marked_id = self._marked_id(request.peer)
+            left = self._history_ids(marked_id)
+            removed = min(left, FAKE_DELETE_CHUNK)
+            self.history[marked_id] = left - removed
+            if not self.history[marked_id] and marked_id != FAKE_USER_ID:
+                self._drop(marked_id)
+            return AffectedHistory(pts=self.calls, pts_count=removed, offset=self.history[marked_id])
+        if isinstance(request, functions.channels.DeleteHistoryRequest):
+            self.history[self._marked_id(request.channel)] = 0
+            return Updates(updates=[], users=[], chats=[], date=datetime.datetime.now(), seq=0)
+        if isinstance(request, functions.channels.LeaveChannelRequest):
+            marked_id = self._marked_id(request.channel)
+            if not self._drop(marked_id):
+                raise errors.UserNotParticipantError(request)
+            self._notify_left(marked_id)
+            return Updates(updates=[], users=[], chats=[], date=datetime.datetime.now(), seq=0)
+        if isinstance(request, functions.messages.DeleteChatUserRequest):
+            self._drop(utils.get_peer_id(PeerChat(request.chat_id)))
+            return Updates(updates=[], users=[], chats=[], date=datetime.datetime.now(), seq=0)
+        raise NotImplementedError(f"The fake client does not handle {type(request).__name__}.")
+
+    def _peer_dialogs(self, peers):
+        # Every fourth chat is muted; the top message is dated like the dialog.
+        now = datetime.datetime.now(datetime.timezone.utc)
+        dialogs = {d.id: d for d in self.dialogs}
+        result = PeerDialogs(dialogs=[], messages=[], chats=[], users=[],
+                             state=State(pts=self.calls, qts=0, date=now, seq=0, unread_count=0))
+        for input_peer in peers:
+            marked_id = self._marked_id(input_peer)
+            dialog = dialogs.get(marked_id)
+            if dialog is None:
+                if isinstance(self.entities.get(marked_id), Channel):
+                    raise errors.ChannelPrivateError(None)
+                continue
+            peer, _ = self._peer(input_peer)
+            top = self._history_ids(marked_id)
+            mute_until = now + datetime.timedelta(days=365) if marked_id % 4 == 0 else None
+            result.dialogs.append(Dialog(peer=peer, top_message=top, read_inbox_max_id=top, read_outbox_max_id=top,
+                                         unread_count=dialog.unread_count, unread_mentions_count=0,
+                                         unread_reactions_count=0,
+                                         notify_settings=PeerNotifySettings(mute_until=mute_until)))
+            if top:
+                result.messages.append(Message(id=top, peer_id=peer, date=dialog.date, message=f"Message {top}",
+                                               out=top % 3 == 0))
+            (result.users if isinstance(dialog.entity, User) else result.chats).append(dialog.entity)
+        return result
+
+    def _drop(self, marked_id):
+        before = len(self.dialogs)
+        self.dialogs = [d for d in self.dialogs if d.id != marked_id]
+        return len(self.dialogs) != before
@@ -0,0 +1,185 @@
+import os
+import time
+import sqlite3
+import datetime
+
+from telethon import utils
+from telethon.crypto import AuthKey
+from telethon.sessions import MemorySession
+from telethon.tl import types
+from telethon.tl.types import PeerUser, PeerChat, PeerChannel
+
+# Telethon session that lives in memory and writes behind to
+# sessions/<name>.session. Imported lazily by teletrim_core.create_client, so
+# it may import Telethon at the top.
+#
+# Telethon's SQLiteSession keeps one connection open for the life of the
+# client and writes on every response, so a second client or process on the
+# same file hits "database is locked". Here:
+#   - reads (entity lookups, auth key, update state) never touch the file;
+#   - changes are batched and written in one short transaction on save(),
+#     close(), or once enough rows or time have piled up;
+#   - the file is in WAL mode, so readers never wait for a writer, and a
+#     writer waits on SQLite's own busy handler instead of a sleep/retry loop.
+# The file keeps Telethon's schema and version, so either session class can
+# open it.
+
+SESSION_VERSION = 7
+# Write pending entity rows once this many are queued or this many seconds
+# have passed since the last write, even if Telethon has not called save().
+SESSION_FLUSH_ROWS = 500
+SESSION_FLUSH_INTERVAL = 10.0
+# How long a write waits for another process holding the write lock.
+SESSION_LOCK_TIMEOUT = 30.0
+
+SESSION_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS version (version INTEGER PRIMARY KEY)",
+    "CREATE TABLE IF NOT EXISTS sessions (dc_id INTEGER PRIMARY KEY, server_address TEXT, port INTEGER, "
+    "auth_key BLOB, takeout_id INTEGER)",
+    "CREATE TABLE IF NOT EXISTS entities (id INTEGER PRIMARY KEY, hash INTEGER NOT NULL, username TEXT, "
+    "phone INTEGER, name TEXT, date INTEGER)",
+    "CREATE TABLE IF NOT EXISTS sent_files (md5_digest BLOB, file_size INTEGER, type INTEGER, id INTEGER, "
+    "hash INTEGER, PRIMARY KEY(md5_digest, file_size, type))",
+    "CREATE TABLE IF NOT EXISTS update_state (id INTEGER PRIMARY KEY, pts INTEGER, qts INTEGER, date INTEGER, "
+    "seq INTEGER)",
+)
+
+class BufferedSession(MemorySession):
+    def __init__(self, path):
+        super().__init__()
+        self.filename = path if path.endswith(".session") else path + ".session"
+        self.save_entities = True
+        # id -> (id, hash, username, phone, name); replaces MemorySession's set
+        # so lookups by id are a dict hit.
+        self._entities = {}
+        self._dirty_entities = {}
+        self._dirty_states = {}
+        self._dirty_session = False
+        self._last_flush = time.monotonic()
+        self._load()
+
+    def _connect(self):
+        db = sqlite3.connect(self.filename, timeout=SESSION_LOCK_TIMEOUT)
+        db.execute("PRAGMA journal_mode=WAL")
+        return db
+
+    def _load(self):
+        db = self._connect()
+        try:
+            with db:
+                for statement in SESSION_SCHEMA:
+                    db.execute(statement)
+                row = db.execute("SELECT version FROM version").fetchone()
+                if row is None:
+                    db.execute("INSERT INTO version VALUES (?)", (SESSION_VERSION,))
+            if row is not None and row[0] < SESSION_VERSION:
+                # Let Telethon run its own migrations on older files.
+                from telethon.sessions import SQLiteSession
+                SQLiteSession(self.filename).close()
+            session = db.execute("SELECT dc_id, server_address, port, auth_key, takeout_id FROM sessions").fetchone()
+            if session:
+                self._dc_id, self._server_address, self._port, key, self._takeout_id = session
+                self._auth_key = AuthKey(data=key) if key else None
+            for row in db.execute("SELECT id, hash, username, phone, name FROM entities"):
+                self._entities[row[0]] = row
+            for entity_id, pts, qts, date, seq in db.execute("SELECT id, pts, qts, date, seq FROM update_state"):
+                self._update_states[entity_id] = types.updates.State(
+                    pts, qts, datetime.datetime.fromtimestamp(date, tz=datetime.timezone.utc), seq, unread_count=0)
+        finally:
+            db.close()
+
+    def flush(self):
+        if not (self._dirty_session or self._dirty_entities or self._dirty_states):
+            return
+        now = int(time.time())
+        entities = [row + (now,) for row in self._dirty_entities.values()]
+        states = [(entity_id, state.pts, state.qts, int(state.date.timestamp()), state.seq)
+                  for entity_id, state in self._dirty_states.items()]
+        db = self._connect()
+        try:
+            with db:
+                if self._dirty_session:
+                    db.execute("DELETE FROM sessions")
+                    db.execute("INSERT INTO sessions VALUES (?, ?, ?, ?, ?)", (
+                        self._dc_id, self._server_address, self._port,
+                        self._auth_key.key if self._auth_key else b"", self._takeout_id))
+                db.executemany("INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?)", entities)
+                db.executemany("INSERT OR REPLACE INTO update_state VALUES (?, ?, ?, ?, ?)", states)
+        except sqlite3.Error as e:
+            # Keep everything queued; the next save() tries again.
+            print(f"Error writing session file: {e}")
+            return
+        finally:
+            db.close()
+        self._dirty_session = False
+        self._dirty_entities.clear()
+        self._dirty_states.clear()
+        self._last_flush = time.monotonic()
+
+    def set_dc(self, dc_id, server_address, port):
+        super().set_dc(dc_id, server_address, port)
+        self._dirty_session = True
+
+    @MemorySession.auth_key.setter
+    def auth_key(self, value):
+        self._auth_key = value
+        self._dirty_session = True
+        # Losing a fresh auth key means logging in again, so never buffer it.
+        self.flush()
+
+    @MemorySession.takeout_id.setter
+    def takeout_id(self, value):
+        self._takeout_id = value
+        self._dirty_session = True
+
+    def set_update_state(self, entity_id, state):
+        self._update_states[entity_id] = state
+        self._dirty_states[entity_id] = state
+
+    def save(self):
+        self.flush()
+
+    def close(self):
+        self.flush()
+
+    def delete(self):
+        removed = False
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.filename + suffix)
+                removed = True
+            except OSError:
+                pass
+        return removed
+
+    def process_entities(self, tlo):
+        if not self.save_entities:
+            return
+        for row in self._entities_to_rows(tlo):
+            if self._entities.get(row[0]) != row:
+                self._entities[row[0]] = row
+                self._dirty_entities[row[0]] = row
+        if self._dirty_entities and (len(self._dirty_entities) >= SESSION_FLUSH_ROWS
+                                     or time.monotonic() - self._last_flush >= SESSION_FLUSH_INTERVAL):
+            self.flush()
+
+    def get_entity_rows_by_phone(self, phone):
+        return next(((row[0], row[1]) for row in self._entities.values() if row[3] == phone), None)
+
+    def get_entity_rows_by_username(self, username):
+        return next(((row[0], row[1]) for row in self._entities.values() if row[2] == username), None)
+
+    def get_entity_rows_by_name(self, name):
+        return next(((row[0], row[1]) for row in self._entities.values() if row[4] == name), None)
+
+    def get_entity_rows_by_id(self, id, exact=True):
+        if exact:
+            ids = (id,)
+        else:
+            ids = (utils.get_peer_id(PeerUser(id)), utils.get_peer_id(PeerChat(id)),
+                   utils.get_peer_id(PeerChannel(id)))
+        for marked_id in ids:
+            row = self._entities.get(marked_id)
+            if row is not None:
+                return row[0], row[1]
+        return None
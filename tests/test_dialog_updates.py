@@ -0,0 +1,42 @@
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import teletrim_core
+import teletrim_fake
+from teletrim_fake import FakeEvent, FakeTelegramClient, events
+
+# Telegram update events against the simulated client, through DialogUpdates.
+
+def run_updates(send):
+    async def main():
+        client = FakeTelegramClient(dialogs=20, latency=0, jitter=0)
+        await client.connect()
+        diffs = []
+        updates = teletrim_core.DialogUpdates(client, "fake", diffs.append)
+        await updates.start()
+        try:
+            await send(client)
+        finally:
+            updates.stop()
+        return diffs
+    return asyncio.run(main())
+
+def group(client):
+    return next(d.entity for d in client.dialogs if isinstance(d.entity, teletrim_fake.Chat))
+
+def test_title_change_renames_chat():
+    # Title changes carry no users; Telethon reports user_ids as None.
+    async def send(client):
+        await client.dispatch(events.ChatAction, FakeEvent(group(client), None, new_title="Renamed"))
+    diffs = run_updates(send)
+    assert [(d.record.name, d.removed) for d in diffs] == [("Renamed", False)]
+
+def test_kick_removes_chat():
+    async def send(client):
+        await client.dispatch(events.ChatAction, FakeEvent(group(client), None, user_ids=[teletrim_fake.FAKE_USER_ID],
+                                                            user_kicked=True))
+    diffs = run_updates(send)
+    assert len(diffs) == 1 and diffs[0].removed